@@ -0,0 +1,64 @@
+"""
+Saves DB Sync
+=============
+
+Both ends of the saves database's trip to the cross-sport hub
+(quarterback/vroomtv) and back:
+
+  - ``changes_response`` streams a changeset (engine.db CHANGESET SYNC)
+    as NDJSON for ``/export/db/changes``: the rows written or deleted since
+    the hub's cursor, so a pull costs what changed rather than the whole
+    file ``/export/db`` copies.
+  - ``restore_db`` re-seeds a wiped disk from the hub after a deploy.  The
+    hub answers with either format — a reset changeset (NDJSON) rebuilt
+    into a fresh database, or the SQLite snapshot it kept from
+    ``/export/db`` — and the result only replaces ``path`` when complete.
+"""
+
+from __future__ import annotations
+
+import urllib.request
+from pathlib import Path
+from typing import Optional
+
+from fastapi.responses import StreamingResponse
+
+from api.streaming import NDJSON_MEDIA_TYPE, iter_ndjson
+from engine import db as _vdb
+from engine import serialization
+
+
+def changes_response(since: int = 0, db_id: Optional[str] = None) -> StreamingResponse:
+    """The changeset bringing the hub's copy at (``db_id``, ``since``) up to date."""
+    return StreamingResponse(iter_ndjson(_vdb.iter_changeset(since, db_id)),
+                             media_type=NDJSON_MEDIA_TYPE)
+
+
+def restore_db(url: str, token: Optional[str], path: Path, timeout: float = 120) -> Optional[str]:
+    """Download the hub's copy of the saves DB into ``path``.
+
+    Returns the format restored (``"changeset"`` or ``"snapshot"``), or
+    None when ``path`` appeared while downloading — someone simmed
+    meanwhile, and their fresh data beats the hub's copy.
+    """
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    req = urllib.request.Request(url, headers=headers)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".restore")
+    for leftover in (tmp, tmp.with_name(tmp.name + "-journal")):
+        leftover.unlink(missing_ok=True)
+    with urllib.request.urlopen(req, timeout=timeout) as resp:
+        if resp.headers.get_content_type() == NDJSON_MEDIA_TYPE:
+            kind = "changeset"
+            _vdb.apply_changeset((serialization.loads(line) for line in resp if line.strip()),
+                                 path=tmp)
+        else:
+            kind = "snapshot"
+            with open(tmp, "wb") as out:
+                while chunk := resp.read(1 << 20):
+                    out.write(chunk)
+    if path.exists():
+        tmp.unlink()
+        return None
+    tmp.replace(path)
+    return kind
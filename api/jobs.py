@@ -0,0 +1,263 @@
+"""
+Background Jobs
+===============
+
+Long simulations — simulate-rest, dynasty advance, the WVL season
+rollover, pro and FIV sim-all — used to hold their HTTP request open for
+the whole run.  They run as jobs on the sim executor instead:
+
+  - ``submit`` queues a job and returns at once.  Endpoints hand back the
+    job id (``?background=true``, 202) or await the job themselves, so
+    existing clients get the same response as before.
+  - Jobs report progress through the engine's ``progress_callback`` hooks:
+    ``Job.progress`` has the ``callable(done, total)`` signature.  Clients
+    poll ``/api/jobs/{id}`` or follow ``/api/jobs/{id}/events`` (server-
+    sent events, ``iter_events``).
+  - ``cancel`` drops a queued job.  A running job stops at its next
+    progress report only if it was submitted ``interruptible`` (a season
+    sim between weeks); others run to the end — stopping half way through
+    an offseason would leave the dynasty inconsistent.
+  - Each owner may have ``per_user`` jobs queued or running; more are
+    refused with JobLimitError.  A job may be keyed by the state it works
+    on (a session, a league): submitting the same kind of job for a key
+    with one already active returns that job rather than running twice
+    on the same state, and another kind is refused with JobConflictError.
+  - Finished jobs are kept ``keep_seconds`` for polling, then dropped.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Executor, Future
+from typing import Any, AsyncIterator, Callable, Dict, Hashable, List, Optional
+
+from engine import serialization
+
+_log = logging.getLogger("viperball.jobs")
+
+QUEUED, RUNNING, SUCCEEDED, FAILED, CANCELLED = "queued", "running", "succeeded", "failed", "cancelled"
+FINISHED = frozenset({SUCCEEDED, FAILED, CANCELLED})
+
+
+class JobCancelled(Exception):
+    """Raised from ``Job.progress`` to stop a cancelled interruptible job."""
+
+
+class JobLimitError(Exception):
+    """The owner already has as many active jobs as allowed."""
+
+
+class JobConflictError(Exception):
+    """Another kind of job is already working on the same key."""
+
+
+class Job:
+    """One submitted run; its fields are read by the status endpoints."""
+
+    def __init__(self, job_id: str, kind: str, owner: str, key: Optional[Hashable],
+                 interruptible: bool):
+        self.id = job_id
+        self.kind = kind
+        self.owner = owner
+        self.key = key
+        self.interruptible = interruptible
+        self.status = QUEUED
+        self.done = 0
+        self.total: Optional[int] = None
+        self.message = ""
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.error_status: Optional[int] = None
+        self.exception: Optional[BaseException] = None
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.future: Optional[Future] = None
+        self.version = 0  # bumped on every change; event streams watch it
+        self._cancel = threading.Event()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED
+
+    @property
+    def cancel_requested(self) -> bool:
+        return self._cancel.is_set()
+
+    def progress(self, done: int, total: Optional[int] = None, message: Optional[str] = None):
+        """Record progress; usable directly as an engine ``progress_callback``."""
+        self.done = done
+        if total is not None:
+            self.total = total
+        if message is not None:
+            self.message = message
+        self.version += 1
+        if self.interruptible and self._cancel.is_set():
+            raise JobCancelled()
+
+    def to_dict(self) -> Dict[str, Any]:
+        out = {
+            "id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "progress": {"done": self.done, "total": self.total, "message": self.message},
+            "interruptible": self.interruptible,
+            "cancel_requested": self.cancel_requested,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+        if self.status == SUCCEEDED:
+            out["result"] = self.result
+        elif self.status == FAILED:
+            out["error"] = self.error
+            out["error_status"] = self.error_status
+        return out
+
+
+class JobManager:
+    """Runs jobs on ``executor`` and keeps their status for polling."""
+
+    def __init__(self, executor: Executor, per_user: int = 2, keep_seconds: float = 3600,
+                 max_finished: int = 500):
+        self.executor = executor
+        self.per_user = per_user
+        self.keep_seconds = keep_seconds
+        self.max_finished = max_finished
+        self._lock = threading.Lock()
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._active: Dict[Hashable, Job] = {}
+        self._counters = dict.fromkeys(
+            ("submitted", "joined", "refused", "succeeded", "failed", "cancelled"), 0)
+
+    # ── Producer side ────────────────────────────────────────
+
+    def submit(self, kind: str, fn: Callable[[Job], Any], *, owner: str = "anonymous",
+               key: Optional[Hashable] = None, interruptible: bool = False) -> Job:
+        """Queue ``fn(job)``; its return value becomes the job's result."""
+        with self._lock:
+            self._prune()
+            existing = self._active.get(key) if key is not None else None
+            if existing is not None:
+                if existing.kind != kind:
+                    self._counters["refused"] += 1
+                    raise JobConflictError(f"A {existing.kind} job is already running here")
+                self._counters["joined"] += 1
+                return existing
+            active = sum(1 for j in self._jobs.values() if j.owner == owner and not j.finished)
+            if active >= self.per_user:
+                self._counters["refused"] += 1
+                raise JobLimitError(f"Too many jobs in progress ({active}); wait for one to finish")
+            job = Job(uuid.uuid4().hex, kind, owner, key, interruptible)
+            self._jobs[job.id] = job
+            if key is not None:
+                self._active[key] = job
+            self._counters["submitted"] += 1
+            job.future = self.executor.submit(self._run, job, fn)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list(self, owner: Optional[str] = None) -> List[Job]:
+        with self._lock:
+            return [j for j in self._jobs.values() if owner is None or j.owner == owner]
+
+    def is_active(self, key: Hashable) -> bool:
+        """Whether a job keyed ``key`` is queued or running (its state is in use)."""
+        with self._lock:
+            return key in self._active
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        """Cancel a job: queued ones never start, interruptible running ones stop."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.finished:
+                return job
+            job._cancel.set()
+            if job.status == QUEUED:
+                self._finish(job, CANCELLED)
+            else:
+                job.version += 1
+            return job
+
+    # ── Metrics ──────────────────────────────────────────────
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            statuses = [j.status for j in self._jobs.values()]
+            return {
+                "queued": statuses.count(QUEUED),
+                "running": statuses.count(RUNNING),
+                "kept": len(statuses),
+                **self._counters,
+            }
+
+    # ── Worker ───────────────────────────────────────────────
+
+    def _run(self, job: Job, fn: Callable[[Job], Any]):
+        with self._lock:
+            if job.status != QUEUED:  # cancelled while queued
+                return
+            job.status = RUNNING
+            job.started_at = time.time()
+            job.version += 1
+        status = SUCCEEDED
+        try:
+            job.result = fn(job)
+        except JobCancelled:
+            status = CANCELLED
+        except Exception as exc:
+            status = FAILED
+            job.exception = exc
+            # HTTPException carries the status and message meant for clients.
+            job.error_status = getattr(exc, "status_code", 500)
+            job.error = str(getattr(exc, "detail", "") or exc)
+            if job.error_status >= 500:
+                _log.warning("Job %s (%s) failed", job.id, job.kind, exc_info=True)
+        with self._lock:
+            self._finish(job, status)
+
+    def _finish(self, job: Job, status: str):
+        job.status = status
+        job.finished_at = time.time()
+        job.version += 1
+        if self._active.get(job.key) is job:
+            del self._active[job.key]
+        self._counters[status] += 1
+
+    def _prune(self):
+        cutoff = time.time() - self.keep_seconds
+        finished = [j for j in self._jobs.values() if j.finished]
+        excess = len(finished) - self.max_finished
+        for j in finished:
+            if j.finished_at < cutoff or excess > 0:
+                del self._jobs[j.id]
+                excess -= 1
+
+
+async def iter_events(job: Job, interval: float = 0.5,
+                      keepalive: float = 15.0) -> AsyncIterator[str]:
+    """Server-sent events for ``job``: ``progress`` on every change, then one
+    ``done`` event carrying the final status (and result or error)."""
+    seen = -1
+    last_sent = time.monotonic()
+    while True:
+        if job.finished:
+            yield f"event: done\ndata: {serialization.dumps(job.to_dict())}\n\n"
+            return
+        if job.version != seen:
+            seen = job.version
+            state = job.to_dict()
+            yield f"event: progress\ndata: {serialization.dumps(state)}\n\n"
+            last_sent = time.monotonic()
+        elif time.monotonic() - last_sent >= keepalive:
+            yield ": keepalive\n\n"  # proxies close idle connections
+            last_sent = time.monotonic()
+        await asyncio.sleep(interval)
@@ -3,9 +3,13 @@ Viperball Simulation API
 FastAPI wrapper around the Viperball engine
 """
 
+import functools
+import ipaddress
 import json
 import sys
 import os
+import pickle
+import re
 import uuid
 import time
 import random
@@ -15,6 +19,7 @@ from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 from dataclasses import asdict
 from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
@@ -35,6 +40,7 @@ from engine.season import (
     fast_generate_history,
 )
 from engine.dynasty import create_dynasty, Dynasty
+from engine import serialization
 from engine.player_card import player_to_card
 from engine.ai_coach import auto_assign_all_teams, get_scheme_label, load_team_identity
 from engine.game_engine import WEATHER_CONDITIONS, DEFENSE_STYLES, POSITION_TAGS, Player, assign_archetype, ST_SCHEMES
@@ -46,21 +52,30 @@ from engine.game_engine import WEATHER_CONDITIONS, DEFENSE_STYLES, POSITION_TAGS
 # scripts.generate_rosters — all imported inside endpoint functions.
 
 
-app = FastAPI(title="Viperball Simulation API", version="1.0.0")
+class _JSONResponse(JSONResponse):
+    """JSON responses rendered by engine.serialization (orjson when installed)."""
+
+    def render(self, content) -> bytes:
+        return serialization.dumpb(content)
+
+
+app = FastAPI(title="Viperball Simulation API", version="1.0.0",
+              default_response_class=_JSONResponse)
 
 
 def _restore_db_from_hub():
-    """Re-seed the saves DB from the hub's snapshot after a deploy.
+    """Re-seed the saves DB from the hub's copy after a deploy.
 
     This app has no volume, so every deploy wipes data/viperball.db with
-    the rootfs. The cross-sport hub (quarterback/vroomtv) pulls a snapshot
-    of it every sync interval and serves it back at /download/viperball —
-    so on boot, if the DB file is missing, we pull the latest snapshot
-    and saved leagues / box scores survive the deploy. No-op when the
-    file exists (plain machine restarts keep the disk) or when
-    RESTORE_DB_URL / RESTORE_TOKEN aren't configured.
+    the rootfs. The cross-sport hub (quarterback/vroomtv) keeps a copy —
+    synced from /export/db/changes, or a snapshot pulled from /export/db
+    — and serves it back at /download/viperball, so on boot, if the DB
+    file is missing, we pull it and saved leagues / box scores survive the
+    deploy (see api/db_sync.py). No-op when the file exists (plain machine
+    restarts keep the disk) or when RESTORE_DB_URL / RESTORE_TOKEN aren't
+    configured.
     """
-    import urllib.request
+    from api import db_sync
     from engine import db as _vdb
 
     url = os.environ.get("RESTORE_DB_URL")
@@ -72,46 +87,44 @@ def _restore_db_from_hub():
         return
     log = logging.getLogger("viperball.restore")
     try:
-        headers = {"Authorization": f"Bearer {token}"} if token else {}
-        req = urllib.request.Request(url, headers=headers)
-        with urllib.request.urlopen(req, timeout=120) as resp:
-            path.parent.mkdir(parents=True, exist_ok=True)
-            tmp = path.with_suffix(".restore")
-            with open(tmp, "wb") as out:
-                while chunk := resp.read(1 << 20):
-                    out.write(chunk)
-        if path.exists():
-            # Someone simmed while we were downloading — their fresh data
-            # beats our old snapshot.
-            tmp.unlink()
-            return
-        tmp.replace(path)
-        log.info("Restored saves DB from hub (%d bytes)", path.stat().st_size)
+        kind = db_sync.restore_db(url, token, path)
+        if kind:
+            log.info("Restored saves DB from hub %s (%d bytes)", kind, path.stat().st_size)
+            # Older hub copies may still carry a session_spill table, and
+            # local spills point at box scores the restore replaced.
+            _vdb.init_db()
+            _vdb.clear_spilled_sessions()
     except Exception:
         log.warning("Saves DB restore skipped (hub unreachable or no snapshot)",
                     exc_info=True)
 
 
+def _prepare_db():
+    """Restore from the hub if needed, then bring older rows up to date:
+    whole-document history versions become chunk manifests, and rows still
+    stored as plain JSON (or under an older codec) are compressed — see
+    engine.db BLOB ENCODING and SAVE HISTORY."""
+    _restore_db_from_hub()
+    from engine import db as _vdb
+    try:
+        _vdb.chunk_legacy_history(pause=0.05)
+        _vdb.migrate_blob_encodings(pause=0.05)
+    except Exception:
+        logging.getLogger("viperball.db").warning(
+            "Saves DB migration failed", exc_info=True)
+
+
 # Run in the background so the port opens immediately — a blocking 34MB+
 # download before bind() looks like "app not listening" to Fly's checks.
 import threading as _threading  # noqa: E402
-_threading.Thread(target=_restore_db_from_hub, daemon=True,
+_threading.Thread(target=_prepare_db, daemon=True,
                   name="db-restore").start()
 
 
-@app.get("/export/db")
-def export_db(request: Request):
-    """Stream a consistent snapshot of the saves DB.
-
-    Token-protected feed for the cross-sport hub (quarterback/vroomtv).
-    Responds 404 unless EXPORT_TOKEN is configured and matched, so the
-    route is invisible on instances that haven't opted in.
-    """
+def _exportable_db(request: Request) -> str:
+    """Path of the saves DB, ready to export; 404s where /export/db* must stay hidden."""
     import sqlite3
-    import tempfile
     from engine import db as _vdb
-    from starlette.background import BackgroundTask
-    from starlette.responses import FileResponse
 
     # Open by default — this data is already public on the site itself.
     # Setting EXPORT_TOKEN locks the route to requests carrying it.
@@ -123,15 +136,17 @@ def export_db(request: Request):
     src_path = str(_vdb.get_db_path())
     if not os.path.exists(src_path):
         raise HTTPException(status_code=404)
-    # Drop box_score rows for sessions that no longer live in memory so
+    # Land queued box scores/autosaves so the export is current.
+    persistence.flush(timeout=30)
+    # Drop box_scores rows for sessions that no longer live in memory so
     # the hub never sees ghost college leagues from abandoned runs.
     try:
         _vdb.prune_orphan_box_scores(sessions.keys())
     except Exception:
         logger.debug("box_score prune skipped", exc_info=True)
     # Never export an empty store: after a deploy wipes the (volume-less)
-    # disk, a fresh DB must not overwrite the hub's last good snapshot —
-    # that snapshot is what restores us.
+    # disk, a fresh DB must not overwrite the hub's last good copy —
+    # that copy is what restores us.
     try:
         chk = sqlite3.connect(f"file:{src_path}?mode=ro", uri=True)
         n = chk.execute("SELECT COUNT(*) FROM saves").fetchone()[0]
@@ -140,6 +155,23 @@ def export_db(request: Request):
         raise HTTPException(status_code=404)
     if n == 0:
         raise HTTPException(status_code=404)
+    return src_path
+
+
+@app.get("/export/db")
+def export_db(request: Request):
+    """Stream a consistent snapshot of the saves DB.
+
+    Token-protected feed for the cross-sport hub (quarterback/vroomtv).
+    Responds 404 unless EXPORT_TOKEN is configured and matched, so the
+    route is invisible on instances that haven't opted in.
+    """
+    import sqlite3
+    import tempfile
+    from starlette.background import BackgroundTask
+    from starlette.responses import FileResponse
+
+    src_path = _exportable_db(request)
     # Cheap change detection so the hub can skip unchanged downloads
     # (DB + WAL sidecar; writes land in the WAL first).
     from starlette.responses import Response as StarletteResponse
@@ -165,6 +197,24 @@ def export_db(request: Request):
                         background=BackgroundTask(os.unlink, snap_path))
 
 
+@app.get("/export/db/changes")
+def export_db_changes(request: Request, since: int = 0, db: Optional[str] = None):
+    """Stream the saves DB rows changed since the hub's last pull (NDJSON).
+
+    Incremental counterpart of /export/db, same token rules.  The hub
+    passes back the ``db`` and ``version`` of the last changeset it
+    applied as ``db`` and ``since``; it gets a reset changeset (every row)
+    on its first pull or when its cursor no longer fits this database.
+    See engine.db CHANGESET SYNC for the record format.
+    """
+    from api import db_sync
+    from engine import db as _vdb
+
+    _exportable_db(request)
+    _vdb.prune_sync_tombstones()
+    return db_sync.changes_response(since, db)
+
+
 from starlette.responses import RedirectResponse as StarletteRedirect
 
 
@@ -194,6 +244,7 @@ app.add_middleware(DomainRedirectMiddleware)
 # individual APIRoutes were checked first but /stats (no trailing slash)
 # fell through to NiceGUI before the redirect-slashes logic could fire.
 from stats_site.router import router as stats_router
+from stats_site.cache import season_cache as stats_season_cache
 from fastapi.responses import RedirectResponse, StreamingResponse
 
 # Redirect /stats → /stats/ (this APIRoute is checked before the Mount below)
@@ -201,7 +252,7 @@ from fastapi.responses import RedirectResponse, StreamingResponse
 def _stats_redirect():
     return RedirectResponse("/stats/", status_code=301)
 
-_stats_app = FastAPI()
+_stats_app = FastAPI(default_response_class=_JSONResponse)
 _stats_app.include_router(stats_router)
 
 # Serve generated pixel-art face images at /stats/static/faces/<player_id>.png
@@ -260,6 +311,39 @@ MAX_SESSIONS = 50                # hard cap per session type
 _sim_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="sim")
 logger = logging.getLogger("viperball.api")
 
+# Global budget for estimated session memory (0 disables enforcement).
+# MAX_SESSIONS caps how many sessions exist; this caps how big they get.
+SESSION_MEMORY_BUDGET_MB = int(os.environ.get("SESSION_MEMORY_BUDGET_MB", "1536"))
+SESSION_MEMORY_MIN_IDLE_SECONDS = 300
+
+from api.session_memory import SessionMemoryAccountant  # noqa: E402
+
+memory_accountant = SessionMemoryAccountant(
+    budget_bytes=SESSION_MEMORY_BUDGET_MB * 1024 * 1024,
+    min_idle_seconds=SESSION_MEMORY_MIN_IDLE_SECONDS,
+)
+
+from api.write_behind import WriteBehindQueue  # noqa: E402
+
+# Box scores and college autosaves are written off the request path.
+persistence = WriteBehindQueue(max_pending=int(os.environ.get("PERSIST_QUEUE_MAX", "256")))
+
+from api.jobs import JobConflictError, JobLimitError, JobManager, iter_events  # noqa: E402
+
+# Long sims run as background jobs on the sim executor (see api/jobs.py).
+jobs = JobManager(_sim_executor, per_user=int(os.environ.get("JOBS_PER_USER", "2")))
+
+from api.sim_pool import GameBatch, GameRequest, SimPool, SimWorkerError, team_path  # noqa: E402
+
+# Stateless game sims run on worker processes (see api/sim_pool.py);
+# session sims stay on _sim_executor.  SIM_WORKERS=0 keeps them in-process.
+sim_pool = SimPool(
+    workers=int(os.environ.get("SIM_WORKERS", str(min(2, os.cpu_count() or 1)))),
+    fallback=_sim_executor,
+    teams_dir=TEAMS_DIR,
+    start_method=os.environ.get("SIM_START_METHOD", "spawn"),
+)
+
 _league_configs: dict | None = None
 
 
@@ -277,6 +361,8 @@ def health_check():
 
     Avoids calling get_available_teams() which reads ~199 JSON files from disk,
     blocking the single uvicorn worker and causing request timeouts.
+    Session memory comes from the accountant's cached estimates (refreshed by
+    the cleanup loop), so this never walks a session graph itself.
     """
     import resource
     mem_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
@@ -286,34 +372,395 @@ def health_check():
         "pro_sessions": len(pro_sessions),
         "wvl_sessions": len(wvl_sessions),
         "memory_mb": round(mem_kb / 1024, 1),
+        "session_memory": memory_accountant.summary(),
+        "stats_cache": stats_season_cache.stats(),
+        "persistence": persistence.stats(),
+        "jobs": jobs.stats(),
+        "sim_pool": sim_pool.stats(),
+    }
+
+
+# ── Background jobs ───────────────────────────────────────────────────
+
+# Header carrying the client address, trusted only when a proxy in front
+# of the app always overwrites it (Fly-Client-IP on Fly).  X-Forwarded-For
+# is never read here: clients can prepend to it.
+_CLIENT_IP_HEADER = os.environ.get("CLIENT_IP_HEADER", "").strip().lower()
+
+
+def _is_loopback(host: Optional[str]) -> bool:
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def _job_owner(request: Request, key=None) -> str:
+    """Who a job counts against for the per-user limit.
+
+    Remote clients are identified by address.  The NiceGUI app calls the
+    API over loopback on behalf of every browser, so its requests (loopback,
+    nothing forwarded) are charged to the session the job runs on instead
+    of all sharing one address.
+    """
+    if _CLIENT_IP_HEADER:
+        client_ip = request.headers.get(_CLIENT_IP_HEADER, "").strip()
+        if client_ip:
+            return f"ip:{client_ip}"
+    host = request.client.host if request.client else None
+    if _is_loopback(host) and "x-forwarded-for" not in request.headers:
+        return "ui" if key is None else "ui:" + ":".join(map(str, key))
+    return f"ip:{host or 'anonymous'}"
+
+
+async def _run_job(request: Request, kind: str, fn, *, key, background: bool,
+                   interruptible: bool = False):
+    """Run ``fn(job)`` as a job: 202 with the job if ``background``, else
+    wait for it and answer as the endpoint always has."""
+    try:
+        job = jobs.submit(kind, fn, owner=_job_owner(request, key), key=key,
+                          interruptible=interruptible)
+    except JobLimitError as exc:
+        raise HTTPException(status_code=429, detail=str(exc))
+    except JobConflictError as exc:
+        raise HTTPException(status_code=409, detail=str(exc))
+    if background:
+        return JSONResponse(status_code=202, content=job.to_dict(),
+                            headers={"Location": f"/api/jobs/{job.id}"})
+    await asyncio.wrap_future(job.future)
+    if job.exception is not None:
+        raise job.exception
+    if job.status == "cancelled":
+        raise HTTPException(status_code=409, detail=f"{kind} was cancelled")
+    return job.result
+
+
+def _require_job(job_id: str):
+    job = jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+@app.get("/api/jobs")
+def list_jobs(request: Request):
+    """The caller's jobs (queued, running, and recently finished), newest first."""
+    owner = _job_owner(request)
+    if owner == "ui":  # the UI's jobs are charged per session
+        mine = [j for j in jobs.list() if j.owner.startswith("ui:")]
+    else:
+        mine = jobs.list(owner=owner)
+    return {"jobs": [j.to_dict() for j in reversed(mine)]}
+
+
+@app.get("/api/jobs/{job_id}")
+def job_status(job_id: str):
+    """Status and progress of a job; ``result`` once it has succeeded."""
+    return _require_job(job_id).to_dict()
+
+
+@app.get("/api/jobs/{job_id}/events")
+def job_events(job_id: str):
+    """Server-sent events: ``progress`` as the job advances, then ``done``."""
+    job = _require_job(job_id)
+    return StreamingResponse(iter_events(job), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+
+@app.post("/api/jobs/{job_id}/cancel")
+def cancel_job(job_id: str):
+    """Cancel a job.  Queued jobs never start; a running season sim stops
+    after its current week; other running jobs finish (``cancel_requested``)."""
+    _require_job(job_id)
+    return jobs.cancel(job_id).to_dict()
+
+
+# While a job works on a session or league, every other request that would
+# change it (or, like an archive, read it mid-sim) gets 409.  The endpoints
+# that start that job themselves go through _run_job, which joins the
+# running job or refuses another kind.
+_JOB_KEYED_PATHS = (
+    (re.compile(r"^/sessions/([^/]+)(?:/|$)"), lambda m: ("college", m[1])),
+    (re.compile(r"^/archives/college/([^/]+)$"), lambda m: ("college", m[1])),
+    (re.compile(r"^/api/pro/([^/]+)/([^/]+)/"), lambda m: ("pro", f"{m[1].lower()}_{m[2]}")),
+    (re.compile(r"^/api/wvl/([^/]+)/"), lambda m: ("wvl", m[1])),
+    (re.compile(r"^/api/fiv/"), lambda m: ("fiv",)),
+)
+_JOB_STARTING_PATHS = re.compile(
+    r"^(?:/sessions/[^/]+/(?:season/simulate-rest|dynasty/advance)"
+    r"|/api/pro/[^/]+/[^/]+/sim-all|/api/wvl/[^/]+/advance-season"
+    r"|/api/fiv/(?:continental(?:/[^/]+)?|playoff)/sim-all)$"
+)
+_READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def _busy_job_key(method: str, path: str):
+    """The active job key a ``method`` request to ``path`` would collide with."""
+    if method in _READ_METHODS or _JOB_STARTING_PATHS.match(path):
+        return None
+    for pattern, key_for in _JOB_KEYED_PATHS:
+        m = pattern.match(path)
+        if m is not None:
+            key = key_for(m)
+            return key if jobs.is_active(key) else None
+    return None
+
+
+class JobGuardMiddleware:
+    """409 for requests that would change state a running job owns."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and _busy_job_key(scope["method"], scope["path"]) is not None:
+            response = JSONResponse(
+                status_code=409,
+                content={"detail": "A simulation job is running on this session; "
+                                   "wait for it to finish or cancel it"},
+            )
+            await response(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+
+app.add_middleware(JobGuardMiddleware)
+
+
+# ── Session memory pools ──────────────────────────────────────────────
+# Each pool lists (session_id, root object, last_accessed) and knows how to
+# spill one session.  Every evict path persists first, so eviction under
+# memory pressure never costs more than an in-memory cache.
+
+def _cvl_memory_entries():
+    for sid, s in list(sessions.items()):
+        busy = jobs.is_active(("college", sid))
+        yield sid, s, time.time() if busy else s.get("last_accessed", s.get("created_at", 0))
+
+
+def _evict_cvl_session(session_id: str) -> bool:
+    session = sessions.get(session_id)
+    if session is None:
+        return False
+    persistence.discard(("autosave", session_id))
+    _autosave_college(session_id)
+    spilled = _spill_cvl_session(session_id, session)
+    sessions.pop(session_id, None)
+    if not spilled:
+        # Nothing to come back to: the session's box scores go with it.
+        persistence.discard(("box_scores", session_id))
+        try:
+            from engine.db import delete_box_scores_for_session
+            delete_box_scores_for_session(session_id)
+        except Exception:
+            pass
+    return True
+
+
+# College sessions have no JSON form (the dynasty serializer leaves out
+# Season objects, and offseason state has none), so an evicted session is
+# spilled whole as a pickle and rehydrated by _get_session on next access.
+# Box scores queued for it stay queued and are kept in the DB meanwhile.
+_rehydrate_lock = _threading.Lock()
+
+
+def _spill_cvl_session(session_id: str, session: dict) -> bool:
+    # A pickle is only good for the build that wrote it: after a deploy that
+    # changes the session classes it may not load, and rehydration falls
+    # back to the session's saves (_cvl_session_from_saves).
+    from engine.db import spill_session
+    try:
+        payload = pickle.dumps(session, protocol=pickle.HIGHEST_PROTOCOL)
+        spill_session("college", session_id, payload, meta=_college_session_summary(session_id, session))
+    except Exception:
+        logger.warning("Could not spill session %s; dropping it", session_id, exc_info=True)
+        return False
+    return True
+
+
+def _rehydrate_cvl_session(session_id: str) -> Optional[dict]:
+    from engine.db import delete_spilled_session, load_spilled_session
+    with _rehydrate_lock:
+        if session_id in sessions:
+            return sessions[session_id]
+        try:
+            payload = load_spilled_session("college", session_id)
+            if payload is None:
+                return None
+            session = pickle.loads(payload)
+        except Exception:
+            # Spilled by a build whose classes no longer match.  The row is
+            # kept (a build that can read it may still come back) and the
+            # session comes back from what it last saved instead.
+            logger.warning("Could not rehydrate session %s; falling back to its saves",
+                           session_id, exc_info=True)
+            session = _cvl_session_from_saves(session_id)
+            if session is None:
+                return None
+        else:
+            delete_spilled_session("college", session_id)
+        _make_cvl_room()
+        session["last_accessed"] = time.time()
+        sessions[session_id] = session
+        logger.info("Rehydrated spilled session %s", session_id)
+        return session
+
+
+def _cvl_session_from_saves(session_id: str) -> Optional[dict]:
+    """Rebuild a session that can't be unpickled from its durable saves.
+
+    The dynasty is reloaded from its save (dynasties are saved under the
+    session id); the season has no loadable form, so the session points at
+    its ``college_<id>`` autosave archive instead.  None if neither exists.
+    """
+    from engine.db import load_dynasty, load_season_archive_meta
+    archive_key = f"college_{session_id}"
+    try:
+        dynasty = load_dynasty(save_key=session_id)
+        has_autosave = load_season_archive_meta(archive_key) is not None
+    except Exception:
+        logger.warning("Could not load saves for session %s", session_id, exc_info=True)
+        return None
+    if dynasty is None and not has_autosave:
+        return None
+    now = time.time()
+    session = {
+        "season": None,
+        "dynasty": dynasty,
+        "injury_tracker": None,
+        "dq_manager": None,
+        "phase": "setup",
+        "config": {},
+        "created_at": now,
+        "last_accessed": now,
+    }
+    if dynasty is not None:
+        session["human_teams"] = [dynasty.coach.team_name]
+        _ensure_hs_pipeline(dynasty)
+    if has_autosave:
+        session["archive_key"] = archive_key
+    return session
+
+
+def _make_cvl_room():
+    """Spill the least recently used sessions until one more fits under MAX_SESSIONS."""
+    while len(sessions) >= MAX_SESSIONS:
+        idle = [(ts, sid) for sid, _, ts in _cvl_memory_entries() if not jobs.is_active(("college", sid))]
+        if not idle:
+            return
+        oldest_sid = min(idle)[1]
+        _evict_cvl_session(oldest_sid)
+        logger.info("Evicted oldest session %s (cap=%d)", oldest_sid, MAX_SESSIONS)
+
+
+def _pro_memory_entries():
+    for key, season in list(pro_sessions.items()):
+        busy = jobs.is_active(("pro", key))
+        yield key, season, time.time() if busy else _pro_session_accessed.get(key, 0)
+
+
+def _evict_pro_session(key: str) -> bool:
+    # Pro seasons are saved after every sim; _get_pro_session reloads them.
+    if key not in pro_sessions:
+        return False
+    # Keys are f"{league}_{session_id}"; session ids never contain "_".
+    league, session_id = key.rsplit("_", 1)
+    _auto_save_pro(league, session_id)
+    pro_sessions.pop(key, None)
+    _pro_session_accessed.pop(key, None)
+    return True
+
+
+def _wvl_memory_entries():
+    for sid, s in list(wvl_sessions.items()):
+        busy = jobs.is_active(("wvl", sid))
+        yield sid, s, time.time() if busy else s.get("last_accessed", s.get("created_at", 0))
+
+
+def _evict_wvl_session(league_id: str) -> bool:
+    # Career leagues are saved after every mutation; the cache just reloads.
+    return wvl_sessions.pop(league_id, None) is not None
+
+
+def _fiv_memory_entries():
+    if _fiv_active_cycle is None and not _fiv_active_cycle_data:
+        return
+    # FIV has no access timestamps.  A completed cycle never changes again,
+    # so it counts as idle; a cycle in progress is always treated as active.
+    done = _fiv_active_cycle is None or _fiv_active_cycle.phase == "completed"
+    yield "active", (_fiv_active_cycle, _fiv_active_cycle_data), 0.0 if done else time.time()
+
+
+def _evict_fiv_cycle(_key: str) -> bool:
+    global _fiv_active_cycle, _fiv_active_cycle_data
+    # An in-progress cycle can't be rebuilt from its saved dict, so only a
+    # completed one is released (the data view reloads from the DB).
+    if _fiv_active_cycle is not None:
+        if _fiv_active_cycle.phase != "completed":
+            return False
+        save_fiv_cycle(_fiv_active_cycle)
+    _fiv_active_cycle = None
+    _fiv_active_cycle_data = None
+    return True
+
+
+memory_accountant.register_pool("cvl", _cvl_memory_entries, _evict_cvl_session)
+memory_accountant.register_pool("pro", _pro_memory_entries, _evict_pro_session)
+memory_accountant.register_pool("wvl", _wvl_memory_entries, _evict_wvl_session)
+memory_accountant.register_pool("fiv", _fiv_memory_entries, _evict_fiv_cycle)
+
+
+@app.get("/api/memory/sessions")
+def session_memory(refresh: bool = False):
+    """Per-session retained-size estimates, largest first."""
+    estimates = memory_accountant.measure(force=refresh)
+    return {
+        **memory_accountant.summary(),
+        "sessions": [e.to_dict() for e in estimates],
+    }
+
+
+@app.post("/api/memory/enforce")
+def session_memory_enforce(budget_mb: Optional[int] = None):
+    """Evict the largest idle sessions until estimated usage fits the budget."""
+    budget = budget_mb * 1024 * 1024 if budget_mb is not None else None
+    evicted = memory_accountant.enforce(budget)
+    return {
+        "evicted": [e.to_dict() for e in evicted],
+        **memory_accountant.summary(),
     }
 
 
+def _expire_idle_sessions():
+    """Spill sessions that have not been accessed within the TTL."""
+    cutoff = time.time() - SESSION_TTL_SECONDS
+    counts = {}
+    for pool, entries, evict in (("cvl", _cvl_memory_entries, _evict_cvl_session),
+                                 ("pro", _pro_memory_entries, _evict_pro_session),
+                                 ("wvl", _wvl_memory_entries, _evict_wvl_session)):
+        expired = [key for key, _, ts in entries() if ts < cutoff]
+        counts[pool] = sum(1 for key in expired if evict(key))
+    if any(counts.values()):
+        logger.info("Session cleanup: spilled %(cvl)d cvl, %(pro)d pro, %(wvl)d wvl", counts)
+    from engine.db import prune_spilled_sessions
+    prune_spilled_sessions()
+
+
 async def _session_cleanup_loop():
-    """Periodically evict sessions that have not been accessed within the TTL."""
+    """Periodically spill idle sessions (TTL), then enforce the memory budget."""
     while True:
         await asyncio.sleep(SESSION_CLEANUP_INTERVAL)
-        now = time.time()
-        # CVL sessions
-        expired = [sid for sid, s in sessions.items()
-                   if now - s.get("last_accessed", s.get("created_at", 0)) > SESSION_TTL_SECONDS]
-        for sid in expired:
-            del sessions[sid]
-        # Pro sessions
-        expired_pro = [key for key, ts in _pro_session_accessed.items()
-                       if now - ts > SESSION_TTL_SECONDS]
-        for key in expired_pro:
-            pro_sessions.pop(key, None)
-            _pro_session_accessed.pop(key, None)
-        # WVL sessions
-        expired_wvl = [sid for sid, s in wvl_sessions.items()
-                       if now - s.get("last_accessed", s.get("created_at", 0)) > SESSION_TTL_SECONDS]
-        for sid in expired_wvl:
-            del wvl_sessions[sid]
-        total = len(expired) + len(expired_pro) + len(expired_wvl)
-        if total:
-            logger.info("Session cleanup: evicted %d cvl, %d pro, %d wvl",
-                        len(expired), len(expired_pro), len(expired_wvl))
+        # Spilling pickles whole sessions and walking session graphs is
+        # CPU-bound; keep both off the event loop.
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(None, _expire_idle_sessions)
+        except Exception:
+            logger.warning("Session cleanup failed", exc_info=True)
+        try:
+            await loop.run_in_executor(None, memory_accountant.enforce)
+        except Exception:
+            logger.warning("Session memory enforcement failed", exc_info=True)
 
 
 @app.on_event("startup")
@@ -321,6 +768,22 @@ async def _start_session_cleanup():
     asyncio.create_task(_session_cleanup_loop())
 
 
+@app.on_event("startup")
+def _start_sim_pool():
+    sim_pool.start()
+
+
+@app.on_event("shutdown")
+def _flush_persistence():
+    if not persistence.close(timeout=60):
+        logger.warning("Shutdown with %d queued writes unflushed", persistence.stats()["depth"])
+
+
+@app.on_event("shutdown")
+def _stop_sim_pool():
+    sim_pool.close()
+
+
 class SimulateRequest(BaseModel):
     home: str
     away: str
@@ -493,18 +956,20 @@ class MyTeamRecruitOfferRequest(BaseModel):
 
 
 def _load_team(key: str):
-    filepath = os.path.join(TEAMS_DIR, f"{key}.json")
-    if not os.path.exists(filepath):
-        cleaned = key.lower().replace(" ", "_").replace("-", "_")
-        filepath = os.path.join(TEAMS_DIR, f"{cleaned}.json")
-    return load_team_from_json(filepath)
+    return load_team_from_json(team_path(TEAMS_DIR, key))
+
+
+def _find_session(session_id: str) -> Optional[dict]:
+    """The session, rehydrated if it was spilled; None if there is none."""
+    return sessions.get(session_id) or _rehydrate_cvl_session(session_id)
 
 
 def _get_session(session_id: str) -> dict:
-    if session_id not in sessions:
+    session = _find_session(session_id)
+    if session is None:
         raise HTTPException(status_code=404, detail="Session not found")
-    sessions[session_id]["last_accessed"] = time.time()
-    return sessions[session_id]
+    session["last_accessed"] = time.time()
+    return session
 
 
 def _require_season(session: dict) -> Season:
@@ -970,32 +1435,25 @@ def bowl_tiers():
 
 @app.post("/simulate")
 async def simulate(req: SimulateRequest):
+    for key in (req.home, req.away):
+        if not os.path.exists(team_path(TEAMS_DIR, key)):
+            raise HTTPException(status_code=400, detail=f"Unknown team: {req.home!r} or {req.away!r}")
+    game = GameRequest(req.home, req.away, req.seed, req.styles, req.weather)
     try:
-        home_team = _load_team(req.home)
-        away_team = _load_team(req.away)
-    except (FileNotFoundError, OSError):
-        raise HTTPException(status_code=400, detail=f"Unknown team: {req.home!r} or {req.away!r}")
-    engine = ViperballEngine(home_team, away_team, seed=req.seed, style_overrides=req.styles, weather=req.weather)
-    loop = asyncio.get_event_loop()
-    result = await loop.run_in_executor(_sim_executor, engine.simulate_game)
-    return result
+        batch = await sim_pool.run(GameBatch.single(game))
+    except SimWorkerError as exc:
+        raise HTTPException(status_code=503, detail=str(exc))
+    return batch.results[0]
 
 
 @app.post("/simulate_many")
 async def simulate_many(req: SimulateManyRequest):
-    def _do_sim():
-        results = []
-        for i in range(req.count):
-            home_team = _load_team(req.home)
-            away_team = _load_team(req.away)
-            game_seed = (req.seed + i) if req.seed is not None else None
-            engine = ViperballEngine(home_team, away_team, seed=game_seed, style_overrides=req.styles, weather=req.weather)
-            result = engine.simulate_game()
-            results.append(result)
-        return results
-
-    loop = asyncio.get_event_loop()
-    results = await loop.run_in_executor(_sim_executor, _do_sim)
+    seeds = tuple((req.seed + i) if req.seed is not None else None for i in range(req.count))
+    try:
+        results = await sim_pool.run_many(
+            GameBatch(req.home, req.away, seeds, req.styles, req.weather))
+    except SimWorkerError as exc:
+        raise HTTPException(status_code=503, detail=str(exc))
 
     home_scores = [r["final_score"]["home"]["score"] for r in results]
     away_scores = [r["final_score"]["away"]["score"] for r in results]
@@ -1182,16 +1640,22 @@ def wvl_sim_all(league_id: str):
 
 
 @app.post("/api/wvl/{league_id}/advance-season")
-def wvl_advance_season(league_id: str):
-    """Close the season, age/retire players, import the next CVL class."""
+async def wvl_advance_season(league_id: str, request: Request, background: bool = False):
+    """Close the season, age/retire players, import the next CVL class.
+    Runs as a job; ``background=true`` returns the job (202)."""
     league = _get_career_league(league_id)
-    try:
-        res = league.advance_season()
-    except Exception as exc:
-        logger.exception("WVL advance-season failed")
-        raise HTTPException(status_code=400, detail=f"Advance failed: {exc}")
-    league.save()
-    return {"result": res, "status": league.status()}
+
+    def _advance(job):
+        try:
+            res = league.advance_season(progress_callback=job.progress)
+        except Exception as exc:
+            logger.exception("WVL advance-season failed")
+            raise HTTPException(status_code=400, detail=f"Advance failed: {exc}")
+        league.save()
+        return {"result": res, "status": league.status()}
+
+    return await _run_job(request, "wvl_advance_season", _advance, key=("wvl", league_id),
+                          background=background)
 
 
 @app.post("/api/wvl/{league_id}/import-graduates")
@@ -1222,34 +1686,47 @@ def debug_play(req: DebugPlayRequest):
 
 
 def _persist_box_scores(session_id: str, games):
-    """Save full_result data for completed games to the database.
+    """Queue full_result data for completed games, and a college autosave.
 
     Called after simulation endpoints so box scores survive server restarts.
-    Runs synchronously (SQLite writes are fast) and is safe to call with
-    games that have no full_result — they are skipped.
+    Both writes go through the write-behind queue, so the endpoint returns
+    once the sim is done and the autosave snapshot built; games simmed
+    before the queue catches up are merged into one bulk write and their
+    autosaves into one.  Safe to call with games that have no full_result —
+    they are skipped.
     """
+    played = {(g.week, g.home_team, g.away_team): g for g in games
+              if getattr(g, "completed", False) and getattr(g, "full_result", None)}
+    if played:
+        persistence.submit(("box_scores", session_id),
+                           functools.partial(_save_box_scores, session_id), played)
+    # Also upsert a durable, reloadable college save so experiments survive
+    # restarts/deploys and appear in the Saves Library.  The snapshot is
+    # taken here, on the thread that just simmed; only the write is queued.
+    snapshot = _college_autosave_snapshot(session_id)
+    if snapshot is not None:
+        persistence.submit(("autosave", session_id),
+                           functools.partial(_write_college_autosave, session_id, snapshot))
+
+
+def _save_box_scores(session_id: str, games):
     try:
         from engine.db import save_box_scores_bulk
         save_box_scores_bulk(session_id, games)
     except Exception:
         logger.debug("Box score persistence skipped (db unavailable)", exc_info=True)
-    # Also upsert a durable, reloadable college save so experiments survive
-    # restarts/deploys and appear in the Saves Library.
-    _autosave_college(session_id)
+
+
+def _discard_pending_writes(session_id: str):
+    """Drop queued writes for a session that is being deleted."""
+    persistence.discard(("box_scores", session_id))
+    persistence.discard(("autosave", session_id))
 
 
 @app.post("/sessions")
 def create_session():
-    # Evict oldest session if at capacity
-    if len(sessions) >= MAX_SESSIONS:
-        oldest_sid = min(sessions, key=lambda s: sessions[s].get("last_accessed", sessions[s].get("created_at", 0)))
-        del sessions[oldest_sid]
-        try:
-            from engine.db import delete_box_scores_for_session
-            delete_box_scores_for_session(oldest_sid)
-        except Exception:
-            pass
-        logger.info("Evicted oldest session %s (cap=%d)", oldest_sid, MAX_SESSIONS)
+    # Spill the oldest session if at capacity
+    _make_cvl_room()
 
     session_id = str(uuid.uuid4())
     now = time.time()
@@ -1275,9 +1752,11 @@ def create_session():
 
 @app.delete("/sessions/{session_id}")
 def delete_session(session_id: str):
-    if session_id not in sessions:
+    from engine.db import delete_spilled_session
+    spilled = delete_spilled_session("college", session_id)
+    if sessions.pop(session_id, None) is None and not spilled:
         raise HTTPException(status_code=404, detail="Session not found")
-    del sessions[session_id]
+    _discard_pending_writes(session_id)
     # Clean up persisted box scores for this session
     try:
         from engine.db import delete_box_scores_for_session
@@ -1302,6 +1781,9 @@ def get_session(session_id: str):
         result["season_status"] = _serialize_season_status(session)
     if session["dynasty"] is not None:
         result["dynasty_status"] = _serialize_dynasty_status(session)
+    if session.get("archive_key"):
+        # Rebuilt from its saves; the season it had is in this archive
+        result["archive_key"] = session["archive_key"]
     return result
 
 
@@ -1499,33 +1981,38 @@ class SimulateRestRequest(BaseModel):
 
 
 @app.post("/sessions/{session_id}/season/simulate-rest")
-async def simulate_rest(session_id: str, req: SimulateRestRequest = SimulateRestRequest()):
+async def simulate_rest(session_id: str, request: Request,
+                        req: SimulateRestRequest = SimulateRestRequest(),
+                        background: bool = False):
+    """Simulate the rest of the regular season as a job.  With
+    ``background=true`` the job is returned (202); cancelling it stops after
+    the current week and leaves the season mid-way, still in 'regular'."""
     session = _get_session(session_id)
     season = _require_season(session)
 
     if session["phase"] not in ("regular",):
         raise HTTPException(status_code=400, detail=f"Cannot simulate rest in phase '{session['phase']}'")
 
-    def _do_sim():
+    def _do_sim(job):
         games_before = sum(1 for g in season.schedule if g.completed)
-        season.simulate_season(generate_polls=True, use_fast_sim=req.fast_sim)
-        return sum(1 for g in season.schedule if g.completed) - games_before
+        try:
+            season.simulate_season(generate_polls=True, use_fast_sim=req.fast_sim,
+                                   progress_callback=job.progress)
+        finally:
+            _persist_box_scores(session_id, season.schedule)
 
-    loop = asyncio.get_event_loop()
-    games_simulated = await loop.run_in_executor(_sim_executor, _do_sim)
+        bowl_count = session["config"].get("bowl_count", 4)
+        session["phase"] = "bowls_pending" if bowl_count > 0 else "playoffs_pending"
+        return {
+            "games_simulated": sum(1 for g in season.schedule if g.completed) - games_before,
+            "total_games": len(season.schedule),
+            "phase": session["phase"],
+            "status": _serialize_season_status(session),
+            "engine": "fast_sim" if req.fast_sim else "full",
+        }
 
-    _persist_box_scores(session_id, season.schedule)
-
-    bowl_count = session["config"].get("bowl_count", 4)
-    session["phase"] = "bowls_pending" if bowl_count > 0 else "playoffs_pending"
-
-    return {
-        "games_simulated": games_simulated,
-        "total_games": len(season.schedule),
-        "phase": session["phase"],
-        "status": _serialize_season_status(session),
-        "engine": "fast_sim" if req.fast_sim else "full",
-    }
+    return await _run_job(request, "simulate_rest", _do_sim, key=("college", session_id),
+                          background=background, interruptible=True)
 
 
 @app.post("/sessions/{session_id}/season/bowls")
@@ -1602,29 +2089,36 @@ def list_college_sessions():
     College seasons live in memory (only box scores / archives persist), so
     this lists what's currently loaded and playable, newest first.
     """
-    out = []
-    for sid, sess in sessions.items():
-        season = sess.get("season")
-        if season is None:
-            continue
-        try:
-            out.append({
-                "session_id": sid,
-                "name": getattr(season, "name", "Season"),
-                "phase": sess.get("phase", "setup"),
-                "current_week": season.get_last_completed_week(),
-                "total_weeks": season.get_total_weeks(),
-                "team_count": len(season.teams),
-                "champion": season.champion,
-                "human_teams": sess.get("human_teams", []),
-                "created_at": sess.get("created_at", 0),
-            })
-        except Exception:
-            continue
+    from engine.db import list_spilled_sessions
+    out = [summary for sid, sess in list(sessions.items())
+           if (summary := _college_session_summary(sid, sess))]
+    # Spilled sessions are still playable; they rehydrate when opened.
+    out.extend(row["meta"] for row in list_spilled_sessions("college")
+               if row["meta"] and row["session_key"] not in sessions)
     out.sort(key=lambda s: s.get("created_at", 0), reverse=True)
     return {"sessions": out}
 
 
+def _college_session_summary(sid: str, sess: dict) -> Optional[dict]:
+    season = sess.get("season")
+    if season is None:
+        return None
+    try:
+        return {
+            "session_id": sid,
+            "name": getattr(season, "name", "Season"),
+            "phase": sess.get("phase", "setup"),
+            "current_week": season.get_last_completed_week(),
+            "total_weeks": season.get_total_weeks(),
+            "team_count": len(season.teams),
+            "champion": season.champion,
+            "human_teams": sess.get("human_teams", []),
+            "created_at": sess.get("created_at", 0),
+        }
+    except Exception:
+        return None
+
+
 @app.get("/sessions/{session_id}/season/status")
 def season_status(session_id: str):
     session = _get_session(session_id)
@@ -1952,6 +2446,8 @@ def update_team_roster(session_id: str, team_name: str, updates: List[UpdatePlay
                 continue
             player.position = upd.position
         updated.append(upd.player_name)
+    if updated:
+        season.mark_mutated()
 
     result = {"updated": updated, "roster": [_serialize_player(p) for p in team.players]}
     if errors:
@@ -2012,6 +2508,8 @@ def edit_player(session_id: str, team_name: str, player_name: str, req: EditPlay
                 applied.append(k)
             except Exception:
                 pass
+    if applied:
+        season.mark_mutated()
     return {"updated": applied, "player": _serialize_player(player)}
 
 
@@ -2032,6 +2530,7 @@ def move_player(session_id: str, req: MovePlayerRequest):
     if player.number in used:
         player.number = next((n for n in range(1, 100) if n not in used), player.number)
     dst.players.append(player)
+    season.mark_mutated()
     return {"moved": True, "to_team": req.to_team}
 
 
@@ -2062,6 +2561,7 @@ def add_player(session_id: str, req: AddPlayerRequest):
     except Exception:
         pass
     team.players.append(player)
+    season.mark_mutated()
     return {"added": True, "player": _serialize_player(player)}
 
 
@@ -2097,6 +2597,11 @@ def _rename_team_everywhere(season, old: str, new: str):
     rec = getattr(team, "record", None)
     if rec is not None and hasattr(rec, "team_name"):
         rec.team_name = new
+    # Season totals and the game index are keyed by team name: rebuild them
+    # under the new one
+    season._aggregates = None
+    season._index = None
+    season.mark_mutated()
 
 
 @app.patch("/sessions/{session_id}/season/team/{team_name}/rename")
@@ -2117,6 +2622,47 @@ def rename_team(session_id: str, team_name: str, req: RenameTeamRequest):
     return {"renamed": True, "old_name": team_name, "new_name": new}
 
 
+# Counting stats reported by /season/player-stats, in response order.
+_SEASON_PLAYER_STATS = (
+    "touches", "rush_carries", "yards", "rushing_yards",
+    "rushing_tds", "lateral_yards",
+    "tds", "fumbles", "laterals_thrown", "lateral_receptions",
+    "lateral_assists", "lateral_tds", "kick_att", "kick_made",
+    "pk_att", "pk_made", "dk_att", "dk_made",
+    "kick_deflections",
+    "kick_passes_thrown", "kick_passes_completed",
+    "kick_pass_yards", "kick_pass_tds",
+    "kick_pass_interceptions_thrown",
+    "kick_pass_receptions", "kick_pass_ints",
+    "keeper_bells", "coverage_snaps",
+    "keeper_tackles", "kick_returns", "kick_return_yards",
+    "kick_return_tds", "punt_returns", "punt_return_yards",
+    "punt_return_tds", "muffs", "st_tackles",
+    "tackles", "tfl", "sacks", "hurries",
+)
+
+
+def _season_player_row(rec: dict, conference: str) -> dict:
+    r = {
+        "name": rec["name"],
+        "team": rec["team"],
+        "conference": conference,
+        "tag": rec["tag"],
+        "archetype": rec["archetype"],
+        "games_played": rec["games"],
+    }
+    for stat in _SEASON_PLAYER_STATS:
+        r[stat] = rec[stat]
+    r["yards_per_touch"] = round(r["yards"] / max(1, r["touches"]), 1)
+    r["yards_per_carry"] = round(r["rushing_yards"] / max(1, r["rush_carries"]), 1)
+    r["kick_pct"] = round(r["kick_made"] / max(1, r["kick_att"]) * 100, 1)
+    r["pk_pct"] = round(r["pk_made"] / max(1, r["pk_att"]) * 100, 1)
+    r["dk_pct"] = round(r["dk_made"] / max(1, r["dk_att"]) * 100, 1)
+    r["total_return_yards"] = r["kick_return_yards"] + r["punt_return_yards"]
+    r["total_return_tds"] = r["kick_return_tds"] + r["punt_return_tds"]
+    return r
+
+
 @app.get("/sessions/{session_id}/season/player-stats")
 def season_player_stats(
     session_id: str,
@@ -2124,119 +2670,49 @@ def season_player_stats(
     team: Optional[str] = Query(None),
     position: Optional[str] = Query(None),
     min_touches: int = Query(0),
+    format: str = Query("json"),
+    limit: Optional[int] = Query(None),
+    cursor: Optional[str] = Query(None),
+    fields: Optional[str] = Query(None),
 ):
-    session = _get_session(session_id)
-    season = _require_season(session)
+    """Regular-season player totals, sorted by yards.
 
-    player_agg: dict = {}
+    Streams from the season aggregate store.  ``format=ndjson`` emits one
+    player per line; ``limit``/``cursor`` page through the ranking and
+    ``fields`` trims each row to the listed keys.
+    """
+    from api.streaming import paginate, parse_fields, stream_records
+    from engine.season_aggregates import PHASE_REGULAR, season_aggregates
 
-    for game in season.schedule:
-        if not game.completed or not getattr(game, "full_result", None):
+    session = _get_session(session_id)
+    season = _require_season(session)
+    store = season_aggregates(season)
+    phases = (PHASE_REGULAR,)
+    pos_upper = position.upper() if position else None
+
+    # Rank on (yards, key) only; rows are built one at a time as they stream.
+    ranked = []
+    for (team_name, name), rec in store.iter_player_totals(phases):
+        conf = season.team_conferences.get(team_name, "")
+        if conference and conf != conference:
             continue
-        fr = game.full_result
-        ps = fr.get("player_stats", {})
-        for side, team_name in [("home", game.home_team), ("away", game.away_team)]:
-            conf = season.team_conferences.get(team_name, "")
-            if conference and conf != conference:
-                continue
-            if team and team_name != team:
-                continue
-            for p in ps.get(side, []):
-                key = f"{team_name}|{p['name']}"
-                if key not in player_agg:
-                    player_agg[key] = {
-                        "name": p["name"],
-                        "team": team_name,
-                        "conference": conf,
-                        "tag": p.get("tag", ""),
-                        "archetype": p.get("archetype", ""),
-                        "games_played": 0,
-                        "touches": 0,
-                        "rush_carries": 0,
-                        "yards": 0,
-                        "rushing_yards": 0,
-                        "rushing_tds": 0,
-                        "lateral_yards": 0,
-                        "tds": 0,
-                        "fumbles": 0,
-                        "laterals_thrown": 0,
-                        "lateral_receptions": 0,
-                        "lateral_assists": 0,
-                        "lateral_tds": 0,
-                        "kick_att": 0,
-                        "kick_made": 0,
-                        "pk_att": 0,
-                        "pk_made": 0,
-                        "dk_att": 0,
-                        "dk_made": 0,
-                        "kick_deflections": 0,
-                        "kick_passes_thrown": 0,
-                        "kick_passes_completed": 0,
-                        "kick_pass_yards": 0,
-                        "kick_pass_tds": 0,
-                        "kick_pass_interceptions_thrown": 0,
-                        "kick_pass_receptions": 0,
-                        "kick_pass_ints": 0,
-                        "keeper_bells": 0,
-                        "coverage_snaps": 0,
-                        "keeper_tackles": 0,
-                        "kick_returns": 0,
-                        "kick_return_yards": 0,
-                        "kick_return_tds": 0,
-                        "punt_returns": 0,
-                        "punt_return_yards": 0,
-                        "punt_return_tds": 0,
-                        "muffs": 0,
-                        "st_tackles": 0,
-                        "tackles": 0,
-                        "tfl": 0,
-                        "sacks": 0,
-                        "hurries": 0,
-                    }
-                agg = player_agg[key]
-                agg["games_played"] += 1
-                if not agg["tag"]:
-                    agg["tag"] = p.get("tag", "")
-                if not agg["archetype"] or agg["archetype"] == "—":
-                    agg["archetype"] = p.get("archetype", "")
-                for stat in [
-                    "touches", "rush_carries", "yards", "rushing_yards",
-                    "rushing_tds", "lateral_yards",
-                    "tds", "fumbles", "laterals_thrown", "lateral_receptions",
-                    "lateral_assists", "lateral_tds", "kick_att", "kick_made",
-                    "pk_att", "pk_made", "dk_att", "dk_made",
-                    "kick_deflections",
-                    "kick_passes_thrown", "kick_passes_completed",
-                    "kick_pass_yards", "kick_pass_tds",
-                    "kick_pass_interceptions_thrown",
-                    "kick_pass_receptions", "kick_pass_ints",
-                    "keeper_bells", "coverage_snaps",
-                    "keeper_tackles", "kick_returns", "kick_return_yards",
-                    "kick_return_tds", "punt_returns", "punt_return_yards",
-                    "punt_return_tds", "muffs", "st_tackles",
-                    "tackles", "tfl", "sacks", "hurries",
-                ]:
-                    agg[stat] += p.get(stat, 0)
-
-    results = list(player_agg.values())
-    if position:
-        pos_upper = position.upper()
-        results = [r for r in results if pos_upper in r["tag"].upper()]
-    if min_touches > 0:
-        results = [r for r in results if r["touches"] >= min_touches or r.get("tackles", 0) > 0 or r.get("sacks", 0) > 0 or r.get("st_tackles", 0) > 0]
-
-    for r in results:
-        r["yards_per_touch"] = round(r["yards"] / max(1, r["touches"]), 1)
-        r["yards_per_carry"] = round(r["rushing_yards"] / max(1, r["rush_carries"]), 1)
-        r["kick_pct"] = round(r["kick_made"] / max(1, r["kick_att"]) * 100, 1)
-        r["pk_pct"] = round(r["pk_made"] / max(1, r["pk_att"]) * 100, 1)
-        r["dk_pct"] = round(r["dk_made"] / max(1, r["dk_att"]) * 100, 1)
-        r["total_return_yards"] = r["kick_return_yards"] + r["punt_return_yards"]
-        r["total_return_tds"] = r["kick_return_tds"] + r["punt_return_tds"]
-
-    results.sort(key=lambda x: x["yards"], reverse=True)
+        if team and team_name != team:
+            continue
+        if pos_upper and pos_upper not in rec["tag"].upper():
+            continue
+        if min_touches > 0 and not (rec["touches"] >= min_touches or rec["tackles"] > 0
+                                    or rec["sacks"] > 0 or rec["st_tackles"] > 0):
+            continue
+        ranked.append((rec["yards"], team_name, name, conf))
+    ranked.sort(key=lambda r: r[0], reverse=True)
 
-    return {"players": results, "count": len(results)}
+    page, next_cursor = paginate(ranked, len(ranked), cursor, limit)
+    rows = (_season_player_row(store.player(t, n, phases), conf) for _, t, n, conf in page)
+    tail = {"count": len(ranked)}
+    if limit is not None:
+        tail["next_cursor"] = next_cursor
+    return stream_records(rows, fmt=format, key="players", tail=tail,
+                          next_cursor=next_cursor, fields=parse_fields(fields))
 
 
 @app.get("/sessions/{session_id}/season/schedule")
@@ -2525,7 +3001,7 @@ def archive_college_season(session_id: str):
     session = _get_session(session_id)
     snapshot = _build_college_archive(session, session_id)
     archive_key = f"college_{session_id}_{int(time.time())}"
-    save_season_archive(archive_key, snapshot)
+    save_season_archive(archive_key, snapshot, immutable=True)
     return {"archive_key": archive_key, "label": snapshot["label"], "message": "Season archived successfully"}
 
 
@@ -2537,13 +3013,32 @@ def _autosave_college(session_id: str):
     piling up snapshots. Light (no embedded play-by-play; box scores live in
     their own table), so it's cheap to write after every sim.
     """
-    from engine.db import save_season_archive
+    snapshot = _college_autosave_snapshot(session_id)
+    if snapshot is not None:
+        _write_college_autosave(session_id, snapshot)
+
+
+def _college_autosave_snapshot(session_id: str) -> Optional[dict]:
+    """The autosave document for a live session, or None if there is none.
+
+    Built by whoever mutates the session (request or job thread), so the
+    season is never read while another thread sims it.
+    """
     session = sessions.get(session_id)
     if not session or session.get("season") is None:
-        return
+        return None
     try:
         snapshot = _build_college_archive(session, session_id, include_full_result=False)
-        snapshot["auto"] = True
+    except Exception:
+        logger.debug("college autosave skipped", exc_info=True)
+        return None
+    snapshot["auto"] = True
+    return snapshot
+
+
+def _write_college_autosave(session_id: str, snapshot: dict):
+    from engine.db import save_season_archive
+    try:
         save_season_archive(f"college_{session_id}", snapshot)
     except Exception:
         logger.debug("college autosave skipped", exc_info=True)
@@ -2555,7 +3050,7 @@ def archive_fiv_cycle():
     from engine.db import save_season_archive
     snapshot = _build_fiv_archive()
     archive_key = f"fiv_cycle_{snapshot['cycle_number']}_{int(time.time())}"
-    save_season_archive(archive_key, snapshot)
+    save_season_archive(archive_key, snapshot, immutable=True)
     return {"archive_key": archive_key, "label": snapshot["label"], "message": "FIV cycle archived successfully"}
 
 
@@ -3112,6 +3607,7 @@ def edit_team_meta(session_id: str, team_name: str, req: TeamMetaRequest):
             setattr(team, field, v)
     if req.prestige is not None and hasattr(team, "prestige"):
         team.prestige = int(req.prestige)
+    season.mark_mutated()
     return {
         "team": team_name,
         "city": getattr(team, "city", ""),
@@ -3122,11 +3618,9 @@ def edit_team_meta(session_id: str, team_name: str, req: TeamMetaRequest):
 
 
 @app.post("/sessions/{session_id}/dynasty/advance")
-def dynasty_advance(session_id: str):
-    from engine.nil_system import NILProgram, auto_nil_program, generate_nil_budget, assess_retention_risks, estimate_market_tier, compute_team_prestige
-    from engine.transfer_portal import TransferPortal, populate_portal
-    from engine.recruiting import generate_recruit_class, RecruitingBoard
-    from engine.db import save_dynasty as db_save_dynasty
+async def dynasty_advance(session_id: str, request: Request, background: bool = False):
+    """Close the season and open the offseason.  Runs as a job; with
+    ``background=true`` the job is returned (202) instead of awaited."""
     session = _get_session(session_id)
     dynasty = _require_dynasty(session)
     season = _require_season(session)
@@ -3134,6 +3628,20 @@ def dynasty_advance(session_id: str):
     if session["phase"] not in ("complete",):
         raise HTTPException(status_code=400, detail=f"Cannot advance dynasty in phase '{session['phase']}'. Season must be complete.")
 
+    return await _run_job(
+        request, "dynasty_advance",
+        lambda job: _advance_dynasty(session_id, session, dynasty, season, job),
+        key=("college", session_id), background=background,
+    )
+
+
+def _advance_dynasty(session_id: str, session: dict, dynasty, season, job):
+    from engine.nil_system import NILProgram, auto_nil_program, generate_nil_budget, assess_retention_risks, estimate_market_tier, compute_team_prestige
+    from engine.transfer_portal import TransferPortal, populate_portal
+    from engine.recruiting import generate_recruit_class, RecruitingBoard
+    from engine.db import save_dynasty as db_save_dynasty
+
+    job.progress(0, 4, "Closing the season")
     player_cards = {}
     for t_name, t_obj in season.teams.items():
         player_cards[t_name] = [player_to_card(p, t_name) for p in t_obj.players]
@@ -3145,6 +3653,7 @@ def dynasty_advance(session_id: str):
     dq_team_boosts_map = None
     dynasty.advance_season(season, injury_tracker=tracker, player_cards=player_cards, rng=rng,
                            dq_team_boosts=dq_team_boosts_map)
+    job.progress(1, message="NIL programs")
 
     year = dynasty.current_year
     prev_year = year - 1
@@ -3205,6 +3714,7 @@ def dynasty_advance(session_id: str):
             )
         dynasty._nil_programs[team_name] = program
 
+    job.progress(2, message="Transfer portal")
     last_season = dynasty.seasons.get(prev_year, season)
     offseason_player_cards = {}
     for t_name, t_obj in last_season.teams.items():
@@ -3244,6 +3754,7 @@ def dynasty_advance(session_id: str):
     populate_portal(portal, offseason_player_cards, team_records, rng=rng)
 
     # ── HS Recruiting Pipeline (run before recruit pool so graduates feed the pool) ──
+    job.progress(3, message="Recruiting class")
     from engine.recruiting import HSRecruitingPipeline
     num_teams = len(season.teams) if hasattr(season, "teams") else 200
     pool_size = max(300, num_teams * 8)
@@ -3295,6 +3806,7 @@ def dynasty_advance(session_id: str):
 
     # Persist dynasty after advancing
     db_save_dynasty(dynasty, save_key=session_id)
+    job.progress(4, message="Saved")
 
     return {
         "dynasty": _serialize_dynasty_status(session),
@@ -5260,6 +5772,7 @@ def _get_pro_session(league: str, session_id: str) -> "ProLeagueSeason":
 def _auto_save_pro(league: str, session_id: str):
     """Save pro league state to database after mutations."""
     from engine.db import save_pro_league as db_save_pro_league
+    from engine.draftyqueenz import DraftyQueenzManager
     key = f"{league.lower()}_{session_id}"
     season = pro_sessions.get(key)
     if season:
@@ -5272,11 +5785,13 @@ def _auto_save_pro(league: str, session_id: str):
 
 @app.post("/api/pro/{league}/new")
 def pro_league_new(league: str):
+    from engine.pro_league import ProLeagueSeason
     config = _get_league_config(league)
     session_id = str(uuid.uuid4())[:8]
     key = f"{league.lower()}_{session_id}"
     season = ProLeagueSeason(config)
     pro_sessions[key] = season
+    _pro_session_accessed[key] = time.time()
     _auto_save_pro(league, session_id)
     return {
         "league": league.lower(),
@@ -5310,12 +5825,21 @@ async def pro_league_sim_week(league: str, session_id: str):
 
 
 @app.post("/api/pro/{league}/{session_id}/sim-all")
-async def pro_league_sim_all(league: str, session_id: str):
+async def pro_league_sim_all(league: str, session_id: str, request: Request,
+                             background: bool = False):
+    """Simulate the rest of the regular season as a job (cancellable between
+    weeks); ``background=true`` returns the job (202)."""
     season = _get_pro_session(league, session_id)
-    loop = asyncio.get_event_loop()
-    result = await loop.run_in_executor(_sim_executor, season.sim_all)
-    _auto_save_pro(league, session_id)
-    return result
+
+    def _sim_all(job):
+        try:
+            return season.sim_all(progress_callback=job.progress)
+        finally:
+            _auto_save_pro(league, session_id)
+
+    return await _run_job(request, "pro_sim_all", _sim_all,
+                          key=("pro", f"{league.lower()}_{session_id}"),
+                          background=background, interruptible=True)
 
 
 @app.get("/api/pro/{league}/{session_id}/game/{week}/{matchup}")
@@ -5418,8 +5942,8 @@ def fiv_new_cycle(req: FIVCycleRequest):
 
     # Pull CVL players from a completed college season if one exists
     cvl_players = None
-    if req.cvl_session_id and req.cvl_session_id in sessions:
-        session = sessions[req.cvl_session_id]
+    session = _find_session(req.cvl_session_id) if req.cvl_session_id else None
+    if session is not None:
         season = session.get("season")
         if season and hasattr(season, "teams"):
             cvl_players = []
@@ -5499,10 +6023,9 @@ def fiv_rankings():
 
 
 @app.post("/api/fiv/continental/{conf}/sim-all")
-async def fiv_sim_continental(conf: str):
-    """Sim remaining games in a continental championship."""
-    global _fiv_active_cycle, _fiv_active_cycle_data
-
+async def fiv_sim_continental(conf: str, request: Request, background: bool = False):
+    """Sim remaining games in a continental championship (a job;
+    ``background=true`` returns it, 202)."""
     if _fiv_active_cycle is None:
         data = load_fiv_cycle()
         if data is None:
@@ -5515,50 +6038,52 @@ async def fiv_sim_continental(conf: str):
     from engine.fiv import run_continental_championship
     cc = _fiv_active_cycle.confederations_data[conf]
 
-    loop = asyncio.get_event_loop()
-    await loop.run_in_executor(
-        _sim_executor,
-        lambda: run_continental_championship(cc, _fiv_active_cycle.national_teams, _fiv_active_cycle.rankings),
-    )
+    cycle = _fiv_active_cycle
 
-    _fiv_active_cycle.phase = "continental"
-    save_fiv_cycle(_fiv_active_cycle)
-    _fiv_active_cycle_data = _fiv_active_cycle.to_dict()
+    def _sim(job):
+        global _fiv_active_cycle_data
+        run_continental_championship(cc, cycle.national_teams, cycle.rankings)
+        cycle.phase = "continental"
+        save_fiv_cycle(cycle)
+        _fiv_active_cycle_data = cycle.to_dict()
+        return {
+            "confederation": conf,
+            "champion": cc.champion,
+            "qualifiers": cc.qualifiers,
+            "phase": cc.phase,
+            "total_matches": len(cc.all_results),
+        }
 
-    return {
-        "confederation": conf,
-        "champion": cc.champion,
-        "qualifiers": cc.qualifiers,
-        "phase": cc.phase,
-        "total_matches": len(cc.all_results),
-    }
+    return await _run_job(request, "fiv_continental", _sim, key=("fiv",), background=background)
 
 
 @app.post("/api/fiv/continental/sim-all")
-async def fiv_sim_all_continental():
-    """Sim all 5 continental championships."""
-    global _fiv_active_cycle, _fiv_active_cycle_data
-
+async def fiv_sim_all_continental(request: Request, background: bool = False):
+    """Sim all 5 continental championships (a job, with progress per
+    championship; ``background=true`` returns it, 202)."""
     if _fiv_active_cycle is None:
         raise HTTPException(status_code=404, detail="No active FIV cycle")
+    cycle = _fiv_active_cycle
 
-    loop = asyncio.get_event_loop()
-    await loop.run_in_executor(_sim_executor, lambda: run_continental_phase(_fiv_active_cycle))
-    # Persist rankings after continental phase so Rankings tab works
-    if _fiv_active_cycle.rankings:
-        save_fiv_rankings(_fiv_active_cycle.rankings)
-    save_fiv_cycle(_fiv_active_cycle)
-    _fiv_active_cycle_data = _fiv_active_cycle.to_dict()
-
-    results = {}
-    for conf_id, cc in _fiv_active_cycle.confederations_data.items():
-        results[conf_id] = {
-            "champion": cc.champion,
-            "qualifiers": cc.qualifiers,
-            "total_matches": len(cc.all_results),
-        }
+    def _sim(job):
+        global _fiv_active_cycle_data
+        run_continental_phase(cycle, progress_callback=job.progress)
+        # Persist rankings after continental phase so Rankings tab works
+        if cycle.rankings:
+            save_fiv_rankings(cycle.rankings)
+        save_fiv_cycle(cycle)
+        _fiv_active_cycle_data = cycle.to_dict()
+
+        results = {}
+        for conf_id, cc in cycle.confederations_data.items():
+            results[conf_id] = {
+                "champion": cc.champion,
+                "qualifiers": cc.qualifiers,
+                "total_matches": len(cc.all_results),
+            }
+        return {"confederations": results, "phase": cycle.phase}
 
-    return {"confederations": results, "phase": _fiv_active_cycle.phase}
+    return await _run_job(request, "fiv_continental", _sim, key=("fiv",), background=background)
 
 
 @app.get("/api/fiv/continental/{conf}/standings")
@@ -5592,25 +6117,27 @@ def fiv_continental_game(conf: str, match_id: str):
 
 
 @app.post("/api/fiv/playoff/sim-all")
-async def fiv_sim_playoff():
-    """Sim the cross-confederation playoff."""
-    global _fiv_active_cycle, _fiv_active_cycle_data
-
+async def fiv_sim_playoff(request: Request, background: bool = False):
+    """Sim the cross-confederation playoff (a job; ``background=true``
+    returns it, 202)."""
     if _fiv_active_cycle is None:
         raise HTTPException(status_code=404, detail="No active FIV cycle")
+    cycle = _fiv_active_cycle
 
-    loop = asyncio.get_event_loop()
-    await loop.run_in_executor(_sim_executor, lambda: run_playoff_phase(_fiv_active_cycle))
-    # Persist rankings after playoff phase
-    if _fiv_active_cycle.rankings:
-        save_fiv_rankings(_fiv_active_cycle.rankings)
-    save_fiv_cycle(_fiv_active_cycle)
-    _fiv_active_cycle_data = _fiv_active_cycle.to_dict()
+    def _sim(job):
+        global _fiv_active_cycle_data
+        run_playoff_phase(cycle)
+        # Persist rankings after playoff phase
+        if cycle.rankings:
+            save_fiv_rankings(cycle.rankings)
+        save_fiv_cycle(cycle)
+        _fiv_active_cycle_data = cycle.to_dict()
+        return {
+            "qualifiers": cycle.playoff.qualifiers if cycle.playoff else [],
+            "phase": cycle.phase,
+        }
 
-    return {
-        "qualifiers": _fiv_active_cycle.playoff.qualifiers if _fiv_active_cycle.playoff else [],
-        "phase": _fiv_active_cycle.phase,
-    }
+    return await _run_job(request, "fiv_playoff", _sim, key=("fiv",), background=background)
 
 
 @app.post("/api/fiv/worldcup/draw")
@@ -5707,9 +6234,9 @@ async def fiv_sim_world_cup_stage():
 def _auto_sync_fiv_to_dynasty(cycle):
     """Auto-sync completed FIV cycle stats to the linked CVL dynasty."""
     sid = cycle.cvl_season_id
-    if sid not in sessions:
+    sess = _find_session(sid) if sid else None
+    if sess is None:
         return
-    sess = sessions[sid]
     dynasty = sess.get("dynasty")
     if not dynasty:
         return
@@ -6326,9 +6853,8 @@ def _get_my_team_session(session_id: str = ""):
     If session_id is empty, uses the first session with a season.
     Returns (session, session_id, team_name, season).
     """
-    if session_id and session_id in sessions:
-        sess = sessions[session_id]
-    else:
+    sess = _find_session(session_id) if session_id else None
+    if sess is None:
         # Find first session with a season
         for sid, sess in sessions.items():
             if sess.get("season") is not None:
@@ -7067,6 +7593,11 @@ def my_team_run_it_back(session_id: str):
         season.bowl_games = []
     if hasattr(season, "polls"):
         season.polls = {}
+    # Derived season state (stat totals, game index, cache version) restarts too
+    if hasattr(season, "mark_mutated"):
+        season._aggregates = None
+        season._index = None
+        season.mark_mutated()
 
     # Regenerate schedule
     if hasattr(season, "generate_schedule"):
@@ -0,0 +1,188 @@
+"""
+Session Memory Accounting
+=========================
+
+Estimates how much memory each live session retains (schedule, full game
+results, rosters, dynasty histories) and enforces a global budget by
+evicting the largest idle sessions first.
+
+``/api/health`` used to report only process ``ru_maxrss`` and
+``MAX_SESSIONS`` caps the *number* of sessions, not their size — one
+100-year dynasty can starve every other user.  This module fixes the
+accounting half of that; api/main.py wires the pools (CVL, pro, WVL, FIV)
+and decides how each one is spilled.
+
+Design:
+  - Each session type registers a ``SessionPool``: a callable listing
+    ``(session_id, root_object, last_accessed)`` and an evict callable.
+  - Sizes come from ``engine.object_size.estimate_size``, a deep
+    ``sys.getsizeof`` walk over the session's object graph.
+  - Walks are cached per session and only redone when the session has been
+    touched since it was last measured (idle sessions don't change).
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from engine.object_size import estimate_size
+
+_log = logging.getLogger("viperball.memory")
+
+
+@dataclass
+class SessionMemoryEstimate:
+    """Retained-size estimate for one session."""
+    pool: str
+    session_id: str
+    bytes: int
+    objects: int
+    truncated: bool
+    last_accessed: float
+    measured_at: float
+
+    @property
+    def mb(self) -> float:
+        return round(self.bytes / (1024 * 1024), 2)
+
+    def to_dict(self) -> dict:
+        return {
+            "pool": self.pool,
+            "session_id": self.session_id,
+            "bytes": self.bytes,
+            "mb": self.mb,
+            "objects": self.objects,
+            "truncated": self.truncated,
+            "idle_seconds": round(max(0.0, time.time() - self.last_accessed), 1),
+            "measured_at": self.measured_at,
+        }
+
+
+@dataclass
+class SessionPool:
+    """One kind of session (CVL, pro, WVL, FIV) as seen by the accountant.
+
+    ``entries`` lists ``(session_id, root, last_accessed)`` for every live
+    session.  ``evict`` spills/drops one session and returns True if memory
+    was actually released.
+    """
+    name: str
+    entries: Callable[[], Iterable[Tuple[str, object, float]]]
+    evict: Callable[[str], bool]
+
+
+@dataclass
+class SessionMemoryAccountant:
+    """Per-session memory estimates plus budget enforcement."""
+    budget_bytes: int = 0
+    min_idle_seconds: float = 300.0
+    pools: Dict[str, SessionPool] = field(default_factory=dict)
+    _estimates: Dict[Tuple[str, str], SessionMemoryEstimate] = field(default_factory=dict)
+    evictions: int = 0
+    evicted_bytes: int = 0
+
+    def register_pool(self, name: str, entries, evict) -> None:
+        self.pools[name] = SessionPool(name=name, entries=entries, evict=evict)
+
+    def measure(self, force: bool = False) -> List[SessionMemoryEstimate]:
+        """Refresh estimates for sessions touched since their last walk.
+
+        Returns every live estimate, largest first.
+        """
+        live = set()
+        for pool in self.pools.values():
+            try:
+                entries = list(pool.entries())
+            except Exception:
+                _log.debug("memory pool %s listing failed", pool.name, exc_info=True)
+                continue
+            for sid, root, last_accessed in entries:
+                key = (pool.name, sid)
+                live.add(key)
+                cached = self._estimates.get(key)
+                if (not force and cached is not None
+                        and last_accessed <= cached.measured_at):
+                    cached.last_accessed = last_accessed
+                    continue
+                size, objects, truncated = estimate_size(root)
+                self._estimates[key] = SessionMemoryEstimate(
+                    pool=pool.name, session_id=sid, bytes=size, objects=objects,
+                    truncated=truncated, last_accessed=last_accessed,
+                    measured_at=time.time(),
+                )
+        for key in list(self._estimates):
+            if key not in live:
+                del self._estimates[key]
+        return sorted(self._estimates.values(), key=lambda e: e.bytes, reverse=True)
+
+    def total_bytes(self) -> int:
+        return sum(e.bytes for e in self._estimates.values())
+
+    def enforce(self, budget_bytes: Optional[int] = None,
+                protect: Iterable[Tuple[str, str]] = ()) -> List[SessionMemoryEstimate]:
+        """Evict the largest idle sessions until the total fits the budget.
+
+        Sessions accessed within ``min_idle_seconds`` are never evicted, and
+        neither is anything in ``protect`` (``(pool, session_id)`` pairs).
+        Returns the estimates of sessions that were evicted.
+        """
+        budget = self.budget_bytes if budget_bytes is None else budget_bytes
+        if budget <= 0:
+            return []
+        estimates = self.measure()
+        total = sum(e.bytes for e in estimates)
+        if total <= budget:
+            return []
+
+        now = time.time()
+        protected = set(protect)
+        evicted: List[SessionMemoryEstimate] = []
+        for est in estimates:
+            if total <= budget:
+                break
+            if (est.pool, est.session_id) in protected:
+                continue
+            if now - est.last_accessed < self.min_idle_seconds:
+                continue
+            pool = self.pools.get(est.pool)
+            if pool is None:
+                continue
+            try:
+                released = pool.evict(est.session_id)
+            except Exception:
+                _log.warning("memory eviction of %s/%s failed",
+                             est.pool, est.session_id, exc_info=True)
+                continue
+            if not released:
+                continue
+            total -= est.bytes
+            self._estimates.pop((est.pool, est.session_id), None)
+            self.evictions += 1
+            self.evicted_bytes += est.bytes
+            evicted.append(est)
+            _log.info("Memory budget: evicted %s/%s (%.1f MB)",
+                      est.pool, est.session_id, est.mb)
+        if total > budget:
+            _log.warning("Memory budget still exceeded after eviction: %.1f MB > %.1f MB",
+                         total / 1048576, budget / 1048576)
+        return evicted
+
+    def summary(self) -> dict:
+        by_pool: Dict[str, dict] = {}
+        for est in self._estimates.values():
+            p = by_pool.setdefault(est.pool, {"sessions": 0, "bytes": 0})
+            p["sessions"] += 1
+            p["bytes"] += est.bytes
+        for p in by_pool.values():
+            p["mb"] = round(p["bytes"] / 1048576, 2)
+        total = self.total_bytes()
+        return {
+            "budget_mb": round(self.budget_bytes / 1048576, 1) if self.budget_bytes else None,
+            "estimated_mb": round(total / 1048576, 2),
+            "pools": by_pool,
+            "evictions": self.evictions,
+            "evicted_mb": round(self.evicted_bytes / 1048576, 2),
+        }
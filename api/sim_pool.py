@@ -0,0 +1,262 @@
+"""
+Simulation Worker Pool
+======================
+
+Game simulation is CPU-bound pure Python, so on the two-thread sim
+executor two concurrent users saturated the GIL and the UI served from
+the same process stuttered.  Stateless simulation — work that starts
+from team files rather than a live session: ``/simulate`` and
+``/simulate_many`` — runs here on worker processes instead.  Stateful
+session sims (seasons, dynasties, jobs) stay on the in-process executor,
+since they mutate objects that live in this process.
+
+  - Requests and responses are plain picklable dataclasses
+    (``GameRequest``, ``GameBatch``, ``BatchResult``); workers run the
+    module-level ``simulate_batch`` and never import the web app.
+  - Workers are warm: the initializer imports the engine and loads every
+    team in ``data/teams`` once (lazy imports, name data, OS file cache)
+    and indexes team keys to files.  Teams are still built per game — a
+    load rolls fresh personality traits, as it always has.
+  - ``SIM_WORKERS`` sets the pool size; 0 runs batches on the fallback
+    (in-process) executor instead, e.g. where processes are unavailable.
+    A worker that dies (OOM kill) breaks the pool: the pool is replaced
+    and the requests in flight fail with ``SimWorkerError``.
+  - ``stats()`` reports queue depth (batches in flight beyond the worker
+    count), how long the last batches waited for a worker and ran, and
+    counters for the health endpoint.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import glob
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+_log = logging.getLogger("viperball.sim_pool")
+
+DEFAULT_TEAMS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "teams")
+
+
+class SimWorkerError(RuntimeError):
+    """A worker process died while running the batch."""
+
+
+# ── Picklable request / response types ──────────────────────
+
+@dataclass(frozen=True)
+class GameRequest:
+    home: str
+    away: str
+    seed: Optional[int] = None
+    styles: Optional[Dict[str, str]] = None
+    weather: str = "clear"
+
+
+@dataclass(frozen=True)
+class GameBatch:
+    """Games between the same two teams, one per seed."""
+    home: str
+    away: str
+    seeds: Tuple[Optional[int], ...] = (None,)
+    styles: Optional[Dict[str, str]] = None
+    weather: str = "clear"
+
+    @classmethod
+    def single(cls, req: GameRequest) -> "GameBatch":
+        return cls(req.home, req.away, (req.seed,), req.styles, req.weather)
+
+
+@dataclass
+class BatchResult:
+    results: List[dict]
+    worker: int            # pid of the process that ran the batch
+    started_at: float      # wall clock, for queue-wait metrics
+    elapsed: float
+
+
+# ── Worker side ──────────────────────────────────────────────
+
+_teams_dir = DEFAULT_TEAMS_DIR
+_team_index: Dict[str, str] = {}
+
+
+def team_path(teams_dir: str, key: str) -> str:
+    """The team file for ``key`` ("Air Force", "air-force" or "air_force")."""
+    filepath = os.path.join(teams_dir, f"{key}.json")
+    if not os.path.exists(filepath):
+        cleaned = key.lower().replace(" ", "_").replace("-", "_")
+        filepath = os.path.join(teams_dir, f"{cleaned}.json")
+    return filepath
+
+
+def warm_worker(teams_dir: str = DEFAULT_TEAMS_DIR):
+    """Process initializer: import the engine and load every team once."""
+    global _teams_dir
+    from engine.game_engine import load_team_from_json
+
+    _teams_dir = teams_dir
+    for path in sorted(glob.glob(os.path.join(teams_dir, "*.json"))):
+        try:
+            load_team_from_json(path)
+        except Exception:
+            _log.warning("Could not preload %s", path, exc_info=True)
+            continue
+        _team_index[os.path.splitext(os.path.basename(path))[0]] = path
+
+
+def _load(key: str):
+    from engine.game_engine import load_team_from_json
+
+    path = _team_index.get(key) or _team_index.get(key.lower().replace(" ", "_").replace("-", "_"))
+    return load_team_from_json(path or team_path(_teams_dir, key))
+
+
+def simulate_batch(batch: GameBatch) -> BatchResult:
+    """Run ``batch`` (in a worker process, or in-process as the fallback)."""
+    from engine.game_engine import ViperballEngine
+
+    started = time.time()
+    results = []
+    for seed in batch.seeds:
+        engine = ViperballEngine(_load(batch.home), _load(batch.away), seed=seed,
+                                 style_overrides=batch.styles, weather=batch.weather)
+        results.append(engine.simulate_game())
+    return BatchResult(results, os.getpid(), started, time.time() - started)
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+# ── Pool ─────────────────────────────────────────────────────
+
+class SimPool:
+    """Process pool for stateless sims, with queue metrics."""
+
+    def __init__(self, workers: int, fallback: Executor, teams_dir: str = DEFAULT_TEAMS_DIR,
+                 start_method: str = "spawn"):
+        self.workers = max(0, workers)
+        self.fallback = fallback
+        self.teams_dir = teams_dir
+        self.start_method = start_method
+        self._lock = threading.Lock()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._in_flight = 0
+        self._peak = 0
+        self._waits: deque = deque(maxlen=100)  # seconds queued, last batches
+        self._runs: deque = deque(maxlen=100)
+        self._counters = dict.fromkeys(("submitted", "completed", "failed", "restarts"), 0)
+
+    @property
+    def mode(self) -> str:
+        return "process" if self.workers else "thread"
+
+    def start(self):
+        """Start (and warm) the workers now rather than on the first request."""
+        if not self.workers:
+            return
+        with self._lock:
+            pool = self._ensure_pool()
+        for _ in range(self.workers):
+            pool.submit(_ping)
+
+    def _ensure_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context(self.start_method),
+                initializer=warm_worker, initargs=(self.teams_dir,),
+            )
+        return self._pool
+
+    def submit(self, batch: GameBatch) -> Future:
+        submitted_at = time.time()
+        with self._lock:
+            if self.workers:
+                pool = self._ensure_pool()
+                try:
+                    future = pool.submit(simulate_batch, batch)
+                except BrokenProcessPool:
+                    self._replace_broken(pool)
+                    pool = self._ensure_pool()
+                    future = pool.submit(simulate_batch, batch)
+            else:
+                pool = None
+                future = self.fallback.submit(simulate_batch, batch)
+            self._in_flight += 1
+            self._peak = max(self._peak, self._in_flight)
+            self._counters["submitted"] += 1
+        future.add_done_callback(lambda f: self._done(f, pool, submitted_at))
+        return future
+
+    def _done(self, future: Future, pool: Optional[ProcessPoolExecutor], submitted_at: float):
+        exc = None if future.cancelled() else future.exception()
+        with self._lock:
+            self._in_flight -= 1
+            if exc is None and not future.cancelled():
+                res = future.result()
+                self._counters["completed"] += 1
+                self._waits.append(max(0.0, res.started_at - submitted_at))
+                self._runs.append(res.elapsed)
+                return
+            self._counters["failed"] += 1
+            if isinstance(exc, BrokenProcessPool) and pool is not None:
+                self._replace_broken(pool)
+
+    def _replace_broken(self, pool: ProcessPoolExecutor):
+        # A worker died; every later submit to this pool would fail.
+        if self._pool is not pool:
+            return
+        _log.warning("Simulation worker died; restarting the pool")
+        self._pool = None
+        self._counters["restarts"] += 1
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    async def run(self, batch: GameBatch) -> BatchResult:
+        try:
+            return await asyncio.wrap_future(self.submit(batch))
+        except BrokenProcessPool as exc:
+            raise SimWorkerError("Simulation worker crashed; please retry") from exc
+
+    async def run_many(self, batch: GameBatch) -> List[dict]:
+        """Split ``batch`` across the workers; results keep the seed order."""
+        if not batch.seeds:
+            return []
+        parts = max(1, min(self.workers or 1, len(batch.seeds)))
+        size = -(-len(batch.seeds) // parts)
+        chunks = [batch.seeds[i:i + size] for i in range(0, len(batch.seeds), size)]
+        done = await asyncio.gather(*(
+            self.run(GameBatch(batch.home, batch.away, seeds, batch.styles, batch.weather))
+            for seeds in chunks
+        ))
+        return [r for res in done for r in res.results]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            waits, runs = list(self._waits), list(self._runs)
+            return {
+                "mode": self.mode,
+                "workers": self.workers,
+                "in_flight": self._in_flight,
+                "queued": max(0, self._in_flight - (self.workers or 1)),
+                "peak_in_flight": self._peak,
+                "avg_wait_ms": round(1000 * sum(waits) / len(waits), 1) if waits else 0.0,
+                "max_wait_ms": round(1000 * max(waits), 1) if waits else 0.0,
+                "avg_run_ms": round(1000 * sum(runs) / len(runs), 1) if runs else 0.0,
+                **self._counters,
+            }
+
+    def close(self):
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,163 @@
+"""
+Streaming Exports
+=================
+
+Helpers for export endpoints that hand large datasets (season player
+totals, standings, whole dynasty saves) to the vroomtv hub and other
+external tools without building the full response in memory first.
+
+Two wire formats:
+  - ``ndjson``: one JSON record per line (``application/x-ndjson``).  The
+    cursor for the next page travels in the ``X-Next-Cursor`` header.
+  - ``json``:   the endpoint's usual JSON object, written out incrementally —
+    the record array is streamed element by element and ``next_cursor``
+    is appended after it.
+
+Records come from generators over season data, so memory stays flat in
+the number of records.  Chunks are coalesced to ``CHUNK_BYTES`` so a
+100k-record export isn't 100k tiny writes.
+
+Pagination is by opaque cursor (an encoded offset into a stable ordering;
+sources must know their total so the next cursor is known before the first
+byte is sent).  ``fields`` projects each record down to a comma-separated
+list of keys.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import itertools
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+
+from engine import serialization
+
+# Bytes buffered before a chunk is yielded to the client.
+CHUNK_BYTES = 64 * 1024
+
+# Page size ceiling for cursor pagination.
+MAX_PAGE_SIZE = 10_000
+
+FORMATS = ("json", "ndjson")
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def parse_fields(fields: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """``"a,b, c"`` -> ``("a", "b", "c")``; empty/None means every field."""
+    if not fields:
+        return None
+    names = tuple(f.strip() for f in fields.split(",") if f.strip())
+    return names or None
+
+
+def project(record: Dict[str, Any], fields: Optional[Tuple[str, ...]]) -> Dict[str, Any]:
+    """Keep only ``fields`` of ``record`` (in the requested order)."""
+    if fields is None:
+        return record
+    return {f: record[f] for f in fields if f in record}
+
+
+def encode_cursor(offset: int) -> str:
+    return base64.urlsafe_b64encode(f"o:{offset}".encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> int:
+    """Offset encoded in ``cursor`` (0 for None); 400 if malformed."""
+    if not cursor:
+        return 0
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        tag, _, value = raw.partition(":")
+        offset = int(value)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(400, "Invalid cursor")
+    if tag != "o" or offset < 0:
+        raise HTTPException(400, "Invalid cursor")
+    return offset
+
+
+def paginate(records: Iterable, total: int, cursor: Optional[str] = None,
+             limit: Optional[int] = None) -> Tuple[Iterator, Optional[str]]:
+    """Slice a page out of ``records`` (``total`` long).
+
+    Returns ``(page_iterator, next_cursor)``; ``next_cursor`` is None on
+    the last page or when no ``limit`` was asked for.
+    """
+    offset = decode_cursor(cursor)
+    if limit is None:
+        return itertools.islice(records, offset, None), None
+    if limit < 1 or limit > MAX_PAGE_SIZE:
+        raise HTTPException(400, f"limit must be between 1 and {MAX_PAGE_SIZE}")
+    end = offset + limit
+    next_cursor = encode_cursor(end) if end < total else None
+    return itertools.islice(records, offset, end), next_cursor
+
+
+def _coalesce(pieces: Iterable[str]) -> Iterator[bytes]:
+    buf = []
+    size = 0
+    for piece in pieces:
+        buf.append(piece)
+        size += len(piece)
+        if size >= CHUNK_BYTES:
+            yield "".join(buf).encode()
+            buf = []
+            size = 0
+    if buf:
+        yield "".join(buf).encode()
+
+
+def iter_ndjson(records: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+    dumps = serialization.dumps
+    return _coalesce(dumps(r) + "\n" for r in records)
+
+
+def iter_json_object(head: Dict[str, Any], key: str, records: Iterable[Dict[str, Any]],
+                     tail: Optional[Dict[str, Any]] = None) -> Iterator[bytes]:
+    """``{**head, key: [records...], **tail}`` as a chunked byte stream."""
+    def pieces():
+        dumps = serialization.dumps
+        yield "{"
+        for k, v in head.items():
+            yield f"{dumps(k)}:{dumps(v)},"
+        yield f"{dumps(key)}:["
+        first = True
+        for r in records:
+            yield dumps(r) if first else "," + dumps(r)
+            first = False
+        yield "]"
+        for k, v in (tail or {}).items():
+            yield f",{dumps(k)}:{dumps(v)}"
+        yield "}"
+    return _coalesce(pieces())
+
+
+def iter_json_document(data: Any, indent: Optional[int] = None) -> Iterator[bytes]:
+    """Encode ``data`` incrementally; the text is never held in full."""
+    return _coalesce(serialization.iterencode(data, indent=indent))
+
+
+def stream_records(records: Iterable[Dict[str, Any]], *, fmt: str, key: str,
+                   head: Optional[Dict[str, Any]] = None,
+                   tail: Optional[Dict[str, Any]] = None,
+                   next_cursor: Optional[str] = None,
+                   fields: Optional[Tuple[str, ...]] = None) -> StreamingResponse:
+    """Stream ``records`` as NDJSON or as a JSON object keyed by ``key``.
+
+    ``head``/``tail`` are the JSON object's other keys, written before and
+    after the record array (NDJSON carries records only).  ``next_cursor``
+    goes out as the ``X-Next-Cursor`` header in both formats.
+    """
+    if fmt not in FORMATS:
+        raise HTTPException(400, f"format must be one of {', '.join(FORMATS)}")
+    if fields is not None:
+        records = (project(r, fields) for r in records)
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else {}
+    if fmt == "ndjson":
+        return StreamingResponse(iter_ndjson(records), media_type=NDJSON_MEDIA_TYPE,
+                                 headers=headers)
+    return StreamingResponse(iter_json_object(head or {}, key, records, tail),
+                             media_type="application/json", headers=headers)
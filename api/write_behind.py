@@ -0,0 +1,184 @@
+"""
+Write-Behind Persistence Queue
+==============================
+
+Simulate endpoints used to persist on the request path: every sim wrote
+its box scores and then serialized the whole season for the college
+autosave before returning.  This queue moves the writes — encoding,
+compression and the transaction — onto one background thread.
+
+Design:
+  - Jobs are keyed.  Submitting a key that is already pending coalesces
+    into the pending job instead of queueing another one: the newest
+    autosave snapshot replaces the one still waiting, so five quick sims
+    cost one season write.  Jobs only touch what they were handed, never
+    the live session, which the request threads may be simming.  Jobs
+    may carry an ``items`` dict that merges across submissions (box
+    scores for the weeks simmed since the last write), handed to the job
+    as one bulk batch.
+  - The queue is bounded by pending keys.  When it is full the submitting
+    thread runs the job inline — slower for that request, never lost and
+    never blocked on the worker.
+  - ``flush()`` waits for everything queued so far; the app calls it on
+    shutdown and before ``/export/db`` snapshots the database.
+  - ``stats()`` reports depth, lag (how long the oldest pending job has
+    waited, and how long the last jobs waited before running) and
+    counters for the health endpoint.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+_log = logging.getLogger("viperball.persist")
+
+
+class _Job:
+    __slots__ = ("fn", "items", "enqueued_at")
+
+    def __init__(self, fn: Callable, items: Optional[Dict], enqueued_at: float):
+        self.fn = fn
+        self.items = items
+        self.enqueued_at = enqueued_at
+
+    def run(self):
+        if self.items is None:
+            self.fn()
+        else:
+            self.fn(list(self.items.values()))
+
+
+class WriteBehindQueue:
+    """Keyed, coalescing job queue drained by one daemon thread."""
+
+    def __init__(self, max_pending: int = 256, name: str = "write-behind"):
+        self.max_pending = max_pending
+        self.name = name
+        self._cond = threading.Condition()
+        self._pending: "OrderedDict[Hashable, _Job]" = OrderedDict()
+        self._running: Optional[Hashable] = None
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self._counters = dict.fromkeys(
+            ("submitted", "coalesced", "completed", "failed", "inline"), 0)
+        self._last_lag = 0.0
+        self._max_lag = 0.0
+
+    # ── Producer side ────────────────────────────────────────
+
+    def submit(self, key: Hashable, fn: Callable, items: Optional[Dict] = None):
+        """Queue ``fn`` under ``key``.
+
+        If ``key`` is already pending, ``fn`` replaces the pending callable
+        and ``items`` are merged into its batch.  With ``items`` the job is
+        called as ``fn(list_of_items)``, otherwise as ``fn()``.
+        """
+        now = time.time()
+        with self._cond:
+            self._counters["submitted"] += 1
+            job = self._pending.get(key)
+            if job is not None:
+                job.fn = fn
+                if items:
+                    if job.items is None:
+                        job.items = {}
+                    job.items.update(items)
+                self._counters["coalesced"] += 1
+                return
+            if self._closed or len(self._pending) >= self.max_pending:
+                self._counters["inline"] += 1
+                inline = _Job(fn, dict(items) if items is not None else None, now)
+            else:
+                inline = None
+                self._pending[key] = _Job(fn, dict(items) if items is not None else None, now)
+                self._ensure_worker()
+                self._cond.notify_all()
+        if inline is not None:
+            self._execute(key, inline)
+
+    def discard(self, key: Hashable) -> bool:
+        """Drop a pending job (e.g. its session was deleted)."""
+        with self._cond:
+            return self._pending.pop(key, None) is not None
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every job queued so far has run. False on timeout."""
+        deadline = None if timeout is None else time.time() + timeout
+        with self._cond:
+            while self._pending or self._running is not None:
+                if self._thread is None or not self._thread.is_alive():
+                    break
+                remaining = None if deadline is None else deadline - time.time()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            leftovers = list(self._pending.items())
+            self._pending.clear()
+        # No worker to hand them to (never started, or closed): run here.
+        for key, job in leftovers:
+            self._execute(key, job)
+        return True
+
+    def close(self, timeout: Optional[float] = 30.0) -> bool:
+        """Flush, stop the worker, and run any later submits inline."""
+        done = self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        return done
+
+    # ── Metrics ──────────────────────────────────────────────
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            oldest = next(iter(self._pending.values()), None)
+            return {
+                "depth": len(self._pending),
+                "running": self._running is not None,
+                "oldest_pending_seconds": round(time.time() - oldest.enqueued_at, 3) if oldest else 0.0,
+                "last_lag_seconds": round(self._last_lag, 3),
+                "max_lag_seconds": round(self._max_lag, 3),
+                **self._counters,
+            }
+
+    # ── Worker ───────────────────────────────────────────────
+
+    def _ensure_worker(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._work, daemon=True, name=self.name)
+            self._thread.start()
+
+    def _work(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+                key, job = self._pending.popitem(last=False)
+                self._running = key
+            try:
+                self._execute(key, job)
+            finally:
+                with self._cond:
+                    self._running = None
+                    self._cond.notify_all()
+
+    def _execute(self, key: Hashable, job: _Job):
+        lag = time.time() - job.enqueued_at
+        try:
+            job.run()
+        except Exception:
+            _log.warning("Write-behind job %r failed", key, exc_info=True)
+            with self._cond:
+                self._counters["failed"] += 1
+        else:
+            with self._cond:
+                self._counters["completed"] += 1
+        with self._cond:
+            self._last_lag = lag
+            self._max_lag = max(self._max_lag, lag)
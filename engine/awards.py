@@ -277,46 +277,22 @@ def _pos_group(position: str) -> str:
 # ──────────────────────────────────────────────
 
 def _aggregate_player_season_stats(season) -> Dict[str, Dict[str, dict]]:
-    """Aggregate individual player stats from completed games.
+    """Aggregate individual player stats from completed regular-season and
+    playoff games (bowls excluded), via the season aggregate store.
 
     Returns: {team_name: {player_name: {stat_dict}}}
     """
-    agg: Dict[str, Dict[str, dict]] = {}
+    from engine.season_aggregates import PHASE_PLAYOFF, PHASE_REGULAR, season_aggregates
 
-    for game in season.schedule:
-        if not game.completed or not getattr(game, "full_result", None):
-            continue
-        fr = game.full_result
-        ps = fr.get("player_stats", {})
-        for side, team_name in [("home", game.home_team), ("away", game.away_team)]:
-            if team_name not in agg:
-                agg[team_name] = {}
-            for p in ps.get(side, []):
-                name = p.get("name", "")
-                if not name:
-                    continue
-                if name not in agg[team_name]:
-                    agg[team_name][name] = _init_player_stats(p)
-                a = agg[team_name][name]
-                _accumulate_player_stats(a, p)
-
-    # Also check playoff games
-    for game in getattr(season, 'playoff_bracket', []):
-        if not getattr(game, 'completed', False) or not getattr(game, "full_result", None):
-            continue
-        fr = game.full_result
-        ps = fr.get("player_stats", {})
-        for side, team_name in [("home", game.home_team), ("away", game.away_team)]:
-            if team_name not in agg:
-                agg[team_name] = {}
-            for p in ps.get(side, []):
-                name = p.get("name", "")
-                if not name:
-                    continue
-                if name not in agg[team_name]:
-                    agg[team_name][name] = _init_player_stats(p)
-                a = agg[team_name][name]
-                _accumulate_player_stats(a, p)
+    agg: Dict[str, Dict[str, dict]] = {}
+    totals = season_aggregates(season).player_totals((PHASE_REGULAR, PHASE_PLAYOFF))
+    for (team_name, name), rec in totals.items():
+        a = _init_player_stats(rec)
+        a["games"] = rec["games"]
+        a["wpa"] = rec["wpa"]
+        for stat in _AGG_COUNTING_STATS:
+            a[stat] = rec[stat]
+        agg.setdefault(team_name, {})[name] = a
 
     return agg
 
@@ -350,17 +326,6 @@ def _init_player_stats(p: dict) -> dict:
     return d
 
 
-def _accumulate_player_stats(a: dict, p: dict):
-    a["games"] += 1
-    if not a["tag"]:
-        a["tag"] = p.get("tag", "")
-    if not a.get("position"):
-        a["position"] = p.get("position", "")
-    for stat in _AGG_COUNTING_STATS:
-        a[stat] += p.get(stat, 0)
-    a["wpa"] += p.get("wpa", 0.0)
-
-
 def _stat_score_for_group(stats: dict, group: str, team_perf_mult: float = 1.0) -> float:
     """Score a player for All-League selection using season statistics.
 
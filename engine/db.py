@@ -5,10 +5,14 @@ Viperball Persistence Layer
 SQLite-backed JSON blob store for saving and restoring session state.
 
 Design:
-  - Each "save" is a JSON document stored in a single row
+  - Each "save" is a JSON document stored in a single row; dynasties and
+    WVL seasons keep their bulky parts in separate, lazily loaded sections
+    (see SECTIONED SAVES below)
   - Tables are keyed by (user_id, save_type, save_key)
   - No ORM — pure sqlite3 + json for zero-dependency operation
-  - Thread-safe via WAL mode and connection-per-call pattern
+  - Thread-safe via WAL mode and a small pool of reused connections
+  - Rows are compressed; each row's ``encoding`` column names its codec
+    (see BLOB ENCODING below) and ``load_blob`` decodes transparently
 
 Save types:
   - "pro_league"   → ProLeagueSeason state blob
@@ -21,12 +25,20 @@ Save types:
 
 from __future__ import annotations
 
+import base64
+import hashlib
 import json
 import logging
+import lzma
 import sqlite3
+import threading
 import time
+import uuid
+import zlib
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Iterator, Optional
+
+from engine import serialization
 
 _log = logging.getLogger("viperball.db")
 
@@ -53,59 +65,412 @@ def get_db_path() -> Path:
     return _db_path
 
 
-def _connect() -> sqlite3.Connection:
-    """Open a connection with WAL mode for concurrent read safety."""
-    _db_path.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(str(_db_path), timeout=10)
-    conn.execute("PRAGMA journal_mode=WAL")
-    conn.execute("PRAGMA foreign_keys=ON")
+# ── Connection pool ──────────────────────────────────────────
+#
+# Every call site here follows ``conn = _connect(); try: ... finally:
+# conn.close()``.  ``_connect`` checks a connection out of a small pool and
+# ``close()`` hands it back, so the pragmas below run once per connection
+# rather than once per call, and sqlite3's per-connection prepared-
+# statement cache survives between calls.  The pool never blocks: when
+# every pooled connection is checked out (nested calls, a burst of
+# threads) an overflow connection is opened and closed again on release.
+# A pool size of 0 means open-per-call.
+
+_POOL_SIZE = int(_os.environ.get("VIPERBALL_DB_POOL_SIZE", "4"))
+_STATEMENT_CACHE_SIZE = 256
+
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA foreign_keys=ON",
+    # In WAL mode NORMAL can lose the last commits on power loss, never
+    # corrupt the file — and skips an fsync per transaction.
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-16384",  # KiB, i.e. 16 MiB of page cache per connection
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+def _open_connection(path: Path) -> sqlite3.Connection:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(path), timeout=10, check_same_thread=False,
+                           cached_statements=_STATEMENT_CACHE_SIZE)
+    for pragma in _PRAGMAS:
+        conn.execute(pragma)
     conn.row_factory = sqlite3.Row
     return conn
 
 
+class _PooledConnection:
+    """A checked-out connection; ``close()`` returns it to the pool."""
+
+    __slots__ = ("_conn", "_path")
+
+    def __init__(self, conn: sqlite3.Connection, path: Path):
+        self._conn = conn
+        self._path = path
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def close(self):
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            _pool.release(conn, self._path)
+
+
+class _ConnectionPool:
+    """Bounded set of idle connections to the current database file."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self._lock = threading.Lock()
+        self._idle: list[sqlite3.Connection] = []
+        self._path: Optional[Path] = None
+        self._in_use = 0
+        self._counters = dict.fromkeys(
+            ("opened", "reused", "overflow", "closed", "peak_in_use"), 0)
+
+    def acquire(self, path: Path) -> sqlite3.Connection:
+        with self._lock:
+            if path != self._path:
+                self._close_idle()
+                self._path = path
+            self._in_use += 1
+            self._counters["peak_in_use"] = max(self._counters["peak_in_use"], self._in_use)
+            if self._idle:
+                self._counters["reused"] += 1
+                return self._idle.pop()
+            self._counters["opened"] += 1
+            if 0 < self.size < self._in_use:
+                self._counters["overflow"] += 1
+        try:
+            return _open_connection(path)
+        except Exception:
+            with self._lock:
+                self._in_use -= 1
+            raise
+
+    def release(self, conn: sqlite3.Connection, path: Path):
+        keep = False
+        with self._lock:
+            self._in_use -= 1
+            if path == self._path and len(self._idle) < self.size:
+                keep = True
+        if keep:
+            try:
+                if conn.in_transaction:
+                    conn.rollback()
+            except sqlite3.Error:
+                keep = False
+        with self._lock:
+            if keep and path == self._path and len(self._idle) < self.size:
+                self._idle.append(conn)
+                return
+            self._counters["closed"] += 1
+        conn.close()
+
+    def resize(self, size: int):
+        with self._lock:
+            self.size = size
+            extra, self._idle = self._idle[max(size, 0):], self._idle[:max(size, 0)]
+            self._counters["closed"] += len(extra)
+        for conn in extra:
+            conn.close()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"size": self.size, "idle": len(self._idle),
+                    "in_use": self._in_use, **self._counters}
+
+    def _close_idle(self):
+        for conn in self._idle:
+            conn.close()
+        self._counters["closed"] += len(self._idle)
+        self._idle = []
+
+    def _after_fork(self):
+        # Connections must not cross a fork; drop (don't close) the parent's.
+        self._lock = threading.Lock()
+        self._idle = []
+        self._in_use = 0
+
+
+_pool = _ConnectionPool(_POOL_SIZE)
+if hasattr(_os, "register_at_fork"):
+    _os.register_at_fork(after_in_child=_pool._after_fork)
+
+
+def set_pool_size(size: int):
+    """Number of idle connections kept open (0 = open a connection per call)."""
+    _pool.resize(size)
+
+
+def pool_stats() -> dict:
+    """Connection pool counters: size, idle, in_use, opened, reused,
+    overflow (opened beyond the pool size), closed, peak_in_use."""
+    return _pool.stats()
+
+
+def _connect() -> _PooledConnection:
+    """Check out a connection (WAL mode, pragmas applied) for the current DB path."""
+    path = _db_path
+    return _PooledConnection(_pool.acquire(path), path)
+
+
 def init_db():
     """Create tables if they don't exist. Safe to call multiple times."""
     conn = _connect()
     try:
-        conn.executescript("""
-            CREATE TABLE IF NOT EXISTS saves (
-                id          INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id     TEXT    NOT NULL DEFAULT 'default',
-                save_type   TEXT    NOT NULL,
-                save_key    TEXT    NOT NULL,
-                label       TEXT    NOT NULL DEFAULT '',
-                data        TEXT    NOT NULL,
-                created_at  REAL    NOT NULL,
-                updated_at  REAL    NOT NULL,
-                UNIQUE(user_id, save_type, save_key)
-            );
-
-            CREATE INDEX IF NOT EXISTS idx_saves_user_type
-                ON saves(user_id, save_type);
-
-            CREATE INDEX IF NOT EXISTS idx_saves_updated
-                ON saves(updated_at DESC);
-
-            CREATE TABLE IF NOT EXISTS save_history (
-                id          INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id     TEXT    NOT NULL DEFAULT 'default',
-                save_type   TEXT    NOT NULL,
-                save_key    TEXT    NOT NULL,
-                label       TEXT    NOT NULL DEFAULT '',
-                data        TEXT    NOT NULL,
-                saved_at    REAL    NOT NULL,
-                superseded_at REAL  NOT NULL
-            );
-
-            CREATE INDEX IF NOT EXISTS idx_history_lookup
-                ON save_history(user_id, save_type, save_key, superseded_at DESC);
-        """)
+        _create_schema(conn)
         conn.commit()
         _log.info(f"Database initialized at {_db_path}")
     finally:
         conn.close()
 
 
+def _create_schema(conn):
+    conn.executescript("""
+        CREATE TABLE IF NOT EXISTS saves (
+            id          INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id     TEXT    NOT NULL DEFAULT 'default',
+            save_type   TEXT    NOT NULL,
+            save_key    TEXT    NOT NULL,
+            label       TEXT    NOT NULL DEFAULT '',
+            data        TEXT    NOT NULL,
+            encoding    TEXT    NOT NULL DEFAULT 'json',
+            created_at  REAL    NOT NULL,
+            updated_at  REAL    NOT NULL,
+            UNIQUE(user_id, save_type, save_key)
+        );
+
+        CREATE INDEX IF NOT EXISTS idx_saves_user_type
+            ON saves(user_id, save_type);
+
+        CREATE INDEX IF NOT EXISTS idx_saves_updated
+            ON saves(updated_at DESC);
+
+        CREATE TABLE IF NOT EXISTS save_history (
+            id          INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id     TEXT    NOT NULL DEFAULT 'default',
+            save_type   TEXT    NOT NULL,
+            save_key    TEXT    NOT NULL,
+            label       TEXT    NOT NULL DEFAULT '',
+            data        TEXT    NOT NULL,
+            encoding    TEXT    NOT NULL DEFAULT 'json',
+            saved_at    REAL    NOT NULL,
+            superseded_at REAL  NOT NULL
+        );
+
+        CREATE INDEX IF NOT EXISTS idx_history_lookup
+            ON save_history(user_id, save_type, save_key, superseded_at DESC);
+
+        CREATE TABLE IF NOT EXISTS history_chunks (
+            id          INTEGER PRIMARY KEY AUTOINCREMENT,
+            hash        TEXT    NOT NULL UNIQUE,
+            data        BLOB    NOT NULL,
+            encoding    TEXT    NOT NULL DEFAULT 'json',
+            refs        INTEGER NOT NULL DEFAULT 0
+        );
+
+        CREATE TABLE IF NOT EXISTS box_scores (
+            id          INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id     TEXT    NOT NULL DEFAULT 'default',
+            session_id  TEXT    NOT NULL,
+            league      TEXT    NOT NULL DEFAULT 'college',
+            week        INTEGER NOT NULL,
+            home_team   TEXT    NOT NULL,
+            away_team   TEXT    NOT NULL,
+            data        BLOB    NOT NULL,
+            encoding    TEXT    NOT NULL DEFAULT 'json',
+            created_at  REAL    NOT NULL,
+            updated_at  REAL    NOT NULL,
+            UNIQUE(user_id, session_id, week, home_team, away_team)
+        );
+
+        CREATE INDEX IF NOT EXISTS idx_box_scores_session
+            ON box_scores(session_id, week);
+
+        CREATE TABLE IF NOT EXISTS save_sections (
+            digest      TEXT    PRIMARY KEY,
+            data        BLOB    NOT NULL,
+            encoding    TEXT    NOT NULL DEFAULT 'json',
+            created_at  REAL    NOT NULL
+        );
+
+        -- Spilled sessions moved to their own file (SESSION SPILL)
+        DROP TABLE IF EXISTS session_spill;
+    """)
+    # Databases created before per-row encodings: every existing row is JSON.
+    for table in ("saves", "save_history"):
+        cols = {r["name"] for r in conn.execute(f"PRAGMA table_info({table})")}
+        if "encoding" not in cols:
+            conn.execute(
+                f"ALTER TABLE {table} ADD COLUMN encoding TEXT NOT NULL DEFAULT 'json'"
+            )
+    _migrate_legacy_box_scores(conn)
+    _create_sync_log(conn)
+
+
+# ═══════════════════════════════════════════════════════════════
+# BLOB ENCODING
+# ═══════════════════════════════════════════════════════════════
+#
+# Saves are JSON text compressed with a pluggable codec.  Each row records
+# its codec in the ``encoding`` column, so reads decode whatever a row says
+# and the write codec can change at any time; ``migrate_blob_encodings``
+# re-encodes older rows in the background.
+#
+#   json — plain JSON text (every row written before encodings existed)
+#   zlib — deflate; always available, ~10x on box-score JSON
+#   lzma — xz; smallest output, several times slower to write
+#   zstd — Zstandard; zlib-sized output at a fraction of the CPU, used
+#          by default when the ``zstandard`` package is installed
+#
+# Small documents (metadata rows, prefs) stay plain JSON — compressing
+# them saves nothing and keeps them readable in the sqlite shell.
+
+try:
+    import zstandard as _zstd
+except ImportError:  # zlib/lzma remain available
+    _zstd = None
+
+# Documents shorter than this (in bytes of JSON) are stored uncompressed.
+_COMPRESS_MIN_BYTES = 1024
+
+
+def _encode_zstd(raw: bytes) -> bytes:
+    return _zstd.ZstdCompressor(level=3).compress(raw)
+
+
+def _decode_zstd(data: bytes) -> bytes:
+    return _zstd.ZstdDecompressor().decompress(data)
+
+
+# name → (compress, decompress) over UTF-8 JSON bytes
+_CODECS = {
+    "zlib": (lambda raw: zlib.compress(raw, 6), zlib.decompress),
+    "lzma": (lambda raw: lzma.compress(raw, preset=6), lzma.decompress),
+}
+if _zstd is not None:
+    _CODECS["zstd"] = (_encode_zstd, _decode_zstd)
+
+BLOB_ENCODINGS = ("json",) + tuple(_CODECS)
+
+_blob_codec = _os.environ.get("VIPERBALL_DB_CODEC") or ("zstd" if _zstd is not None else "zlib")
+if _blob_codec not in BLOB_ENCODINGS:
+    _log.warning(f"Unknown VIPERBALL_DB_CODEC {_blob_codec!r}; using zlib")
+    _blob_codec = "zlib"
+
+
+def set_blob_codec(name: str):
+    """Choose the codec new writes use ("json" disables compression)."""
+    global _blob_codec
+    if name not in BLOB_ENCODINGS:
+        raise ValueError(f"Unknown blob encoding {name!r} (have {', '.join(BLOB_ENCODINGS)})")
+    _blob_codec = name
+
+
+def get_blob_codec() -> str:
+    return _blob_codec
+
+
+def _encode_text(text: str, codec: str | None = None) -> tuple[Any, str]:
+    """Encode JSON text for storage; returns ``(data, encoding)``."""
+    return _encode_raw(text.encode("utf-8"), codec)
+
+
+def _encode_raw(raw: bytes, codec: str | None = None) -> tuple[Any, str]:
+    """Encode UTF-8 JSON bytes for storage; returns ``(data, encoding)``."""
+    codec = codec or _blob_codec
+    if codec == "json" or len(raw) < _COMPRESS_MIN_BYTES:
+        return raw.decode("utf-8"), "json"
+    return _CODECS[codec][0](raw), codec
+
+
+def _encode_blob(data: dict, codec: str | None = None) -> tuple[Any, str]:
+    return _encode_raw(serialization.dumpb(data), codec)
+
+
+def _decode_text(data, encoding: str) -> str:
+    if encoding == "json":
+        return data if isinstance(data, str) else bytes(data).decode("utf-8")
+    codec = _CODECS.get(encoding)
+    if codec is None:
+        raise ValueError(f"Row stored with unavailable encoding {encoding!r}")
+    return codec[1](data).decode("utf-8")
+
+
+def _decode_blob(data, encoding: str):
+    if encoding == "json":
+        return serialization.loads(data)
+    codec = _CODECS.get(encoding)
+    if codec is None:
+        raise ValueError(f"Row stored with unavailable encoding {encoding!r}")
+    return serialization.loads(codec[1](data))
+
+
+def migrate_blob_encodings(codec: str | None = None, batch_size: int = 100,
+                           pause: float = 0.0) -> int:
+    """Re-encode stored rows (saves, history, sections, box scores) written with another codec.
+
+    Walks each table by rowid in batches of ``batch_size`` rows, committing per
+    batch (and sleeping ``pause`` seconds between batches) so live writers
+    are never blocked for long.  ``updated_at`` is left alone — stats-page
+    ETags derive from it and the content hasn't changed.  A row rewritten
+    by ``save_blob`` mid-batch is skipped; it was already written with the
+    current codec.  Returns the number of rows re-encoded.
+    """
+    codec = codec or _blob_codec
+    if codec not in BLOB_ENCODINGS:
+        raise ValueError(f"Unknown blob encoding {codec!r}")
+    total = 0
+    for table, stamp in (("saves", "updated_at"), ("save_history", "superseded_at"),
+                         ("save_sections", "created_at"), ("box_scores", "updated_at"),
+                         ("history_chunks", "refs")):
+        last_id = 0
+        while True:
+            conn = _connect()
+            try:
+                rows = conn.execute(
+                    f"SELECT rowid AS id, data, encoding, {stamp} AS stamp FROM {table} "
+                    f"WHERE rowid > ? ORDER BY rowid LIMIT ?",
+                    (last_id, batch_size),
+                ).fetchall()
+                if not rows:
+                    break
+                last_id = rows[-1]["id"]
+                updates = []
+                for row in rows:
+                    try:
+                        text = _decode_text(row["data"], row["encoding"])
+                    except ValueError:
+                        continue  # chunk manifest, or codec not installed here
+                    blob, encoding = _encode_text(text, codec)
+                    if encoding != row["encoding"]:
+                        updates.append((blob, encoding, row["id"], row["encoding"], row["stamp"]))
+                if updates:
+                    cur = conn.executemany(
+                        f"UPDATE {table} SET data=?, encoding=? "
+                        f"WHERE rowid=? AND encoding=? AND {stamp}=?",
+                        updates,
+                    )
+                    conn.commit()
+                    total += cur.rowcount
+            finally:
+                conn.close()
+            if pause:
+                time.sleep(pause)
+    if total:
+        # Hand the freed pages back to the filesystem.
+        conn = _connect()
+        try:
+            conn.execute("VACUUM")
+        finally:
+            conn.close()
+        _log.info(f"Re-encoded {total} saved blobs as {codec}")
+    return total
+
+
 # ═══════════════════════════════════════════════════════════════
 # CORE CRUD
 # ═══════════════════════════════════════════════════════════════
@@ -123,36 +488,46 @@ def save_blob(
 ):
     """Upsert a JSON blob. Snapshots the old version to save_history before overwriting."""
     now = time.time()
-    blob = json.dumps(data, default=str)
+    blob, encoding = _encode_blob(data)
     conn = _connect()
     try:
-        # Snapshot the existing row into save_history before overwriting
-        # (skip for high-volume types like box scores)
-        if save_type not in _NO_HISTORY_TYPES:
-            conn.execute(
-                """
-                INSERT INTO save_history (user_id, save_type, save_key, label, data, saved_at, superseded_at)
-                SELECT user_id, save_type, save_key, label, data, created_at, ?
-                FROM saves
-                WHERE user_id=? AND save_type=? AND save_key=?
-                """,
-                (now, user_id, save_type, save_key),
-            )
-        conn.execute(
-            """
-            INSERT INTO saves (user_id, save_type, save_key, label, data, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(user_id, save_type, save_key)
-            DO UPDATE SET data=excluded.data, label=excluded.label, updated_at=excluded.updated_at
-            """,
-            (user_id, save_type, save_key, label, blob, now, now),
-        )
+        # Chunk the version being superseded before taking the write lock;
+        # under it, only the inserts run.
+        prepared = _prepare_snapshot(conn, user_id, save_type, save_key)
+        conn.execute("BEGIN IMMEDIATE")
+        _write_blob(conn, user_id, save_type, save_key, label, blob, encoding, now, prepared)
         conn.commit()
-        _log.debug(f"Saved {save_type}/{save_key} for user={user_id} ({len(blob)} bytes)")
+        _log.debug(f"Saved {save_type}/{save_key} for user={user_id} "
+                   f"({len(blob)} bytes, {encoding})")
     finally:
         conn.close()
 
 
+def _write_blob(conn, user_id, save_type, save_key, label, blob, encoding, now,
+                prepared=None):
+    # Snapshot the existing row into save_history before overwriting
+    # (skip for high-volume types like box scores)
+    if save_type not in _NO_HISTORY_TYPES:
+        prev = conn.execute(
+            "SELECT label, data, encoding, created_at FROM saves "
+            "WHERE user_id=? AND save_type=? AND save_key=?",
+            (user_id, save_type, save_key),
+        ).fetchone()
+        if prev is not None:
+            _snapshot_history(conn, user_id, save_type, save_key, prev, now, prepared)
+    conn.execute(
+        """
+        INSERT INTO saves (user_id, save_type, save_key, label, data, encoding,
+                           created_at, updated_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(user_id, save_type, save_key)
+        DO UPDATE SET data=excluded.data, encoding=excluded.encoding,
+                      label=excluded.label, updated_at=excluded.updated_at
+        """,
+        (user_id, save_type, save_key, label, blob, encoding, now, now),
+    )
+
+
 def load_blob(
     save_type: str,
     save_key: str,
@@ -162,12 +537,29 @@ def load_blob(
     conn = _connect()
     try:
         row = conn.execute(
-            "SELECT data FROM saves WHERE user_id=? AND save_type=? AND save_key=?",
+            "SELECT data, encoding FROM saves WHERE user_id=? AND save_type=? AND save_key=?",
             (user_id, save_type, save_key),
         ).fetchone()
         if row is None:
             return None
-        return json.loads(row["data"])
+        return _expand_sections(conn, _decode_blob(row["data"], row["encoding"]))
+    finally:
+        conn.close()
+
+
+def blob_updated_at(
+    save_type: str,
+    save_key: str,
+    user_id: str = "default",
+) -> Optional[float]:
+    """Last-write timestamp of a blob without loading its data (None if missing)."""
+    conn = _connect()
+    try:
+        row = conn.execute(
+            "SELECT updated_at FROM saves WHERE user_id=? AND save_type=? AND save_key=?",
+            (user_id, save_type, save_key),
+        ).fetchone()
+        return None if row is None else row["updated_at"]
     finally:
         conn.close()
 
@@ -260,14 +652,14 @@ def fork_save(
     """Duplicate a save's blob under a new key — branches an experiment.
 
     Pure row copy, so it works for any save_type without engine deserialization.
-    For college saves, also clones the session's box_score rows (re-keyed to the
+    For college saves, also clones the session's box_scores rows (under the
     new session id) so the forked league keeps its played games.
     """
     now = time.time()
     conn = _connect()
     try:
         row = conn.execute(
-            "SELECT label, data FROM saves WHERE user_id=? AND save_type=? AND save_key=?",
+            "SELECT label, data, encoding FROM saves WHERE user_id=? AND save_type=? AND save_key=?",
             (user_id, save_type, save_key),
         ).fetchone()
         if row is None:
@@ -275,31 +667,27 @@ def fork_save(
         label = new_label if new_label is not None else f"{row['label']} (fork)"
         conn.execute(
             """
-            INSERT INTO saves (user_id, save_type, save_key, label, data, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
+            INSERT INTO saves (user_id, save_type, save_key, label, data, encoding,
+                               created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
             ON CONFLICT(user_id, save_type, save_key)
-            DO UPDATE SET data=excluded.data, label=excluded.label, updated_at=excluded.updated_at
+            DO UPDATE SET data=excluded.data, encoding=excluded.encoding,
+                          label=excluded.label, updated_at=excluded.updated_at
             """,
-            (user_id, save_type, new_key, label, row["data"], now, now),
+            (user_id, save_type, new_key, label, row["data"], row["encoding"], now, now),
         )
-        # College sessions store box scores keyed "{session_id}__w{week}__...".
-        # Clone them under the new session id so the fork keeps its game history.
+        # Clone the session's box scores so the fork keeps its game history.
         if save_type == "college":
-            box_rows = conn.execute(
-                "SELECT save_key, label, data FROM saves "
-                "WHERE user_id=? AND save_type=? AND save_key LIKE ?",
-                (user_id, _BOX_SCORE_TYPE, f"{save_key}__%"),
-            ).fetchall()
-            for b in box_rows:
-                cloned_key = b["save_key"].replace(save_key, new_key, 1)
-                conn.execute(
-                    """
-                    INSERT INTO saves (user_id, save_type, save_key, label, data, created_at, updated_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                    ON CONFLICT(user_id, save_type, save_key) DO NOTHING
-                    """,
-                    (user_id, _BOX_SCORE_TYPE, cloned_key, b["label"], b["data"], now, now),
-                )
+            conn.execute(
+                """
+                INSERT INTO box_scores (user_id, session_id, league, week, home_team, away_team,
+                                        data, encoding, created_at, updated_at)
+                SELECT user_id, ?, league, week, home_team, away_team, data, encoding, ?, ?
+                FROM box_scores WHERE user_id=? AND session_id=?
+                ON CONFLICT(user_id, session_id, week, home_team, away_team) DO NOTHING
+                """,
+                (new_key, now, now, user_id, save_key),
+            )
         conn.commit()
         return True
     finally:
@@ -310,6 +698,297 @@ def fork_save(
 # SAVE HISTORY — browse and restore previous versions
 # ═══════════════════════════════════════════════════════════════
 
+# Versions in save_history are stored as a manifest of content-addressed
+# chunks rather than a full copy.  A document is split into sections — runs
+# of a large dict's entries, or fixed-size runs of a large list's elements —
+# down to _CHUNK_SPLIT_DEPTH levels, and each section's JSON is stored once
+# in history_chunks, found by its SHA-256.  Successive autosaves of a
+# dynasty or season mostly differ in a handful of sections (this week's
+# games, one team's history), so each new version costs a manifest plus
+# those sections.  Chunks are reference-counted and dropped when
+# prune_save_history removes the last version that uses them.  A save
+# chunks, hashes and compresses the version it supersedes before taking
+# the write lock, which it holds only to upsert chunks and insert rows.
+# Rows written before chunking keep their whole document and are read as
+# before.
+#
+# Manifest nodes: a chunk id (int) holding a JSON value; {"d": [node, ...]}
+# for a split dict, each child a chunk holding a run of its entries or
+# {"k": key, "v": node} for one large entry split further; {"l": [node,
+# ...]} for a split list, each child holding a run of elements.  Dict runs
+# end after keys whose hash ends a run, so a changed value never moves
+# the boundaries of the runs around it; list runs are fixed-size.
+
+_CHUNKED = "chunks"
+_CHUNK_SPLIT_BYTES = 8 * 1024
+_CHUNK_SPLIT_DEPTH = 3
+_DICT_RUN_MASK = 7  # a dict run ends after ~1 key in 8
+
+
+def _list_run(length: int) -> int:
+    """Elements per chunk for a list of ``length``: a power of two, so run
+    boundaries only move when the list doubles, and at most ~64 runs."""
+    run = 8
+    while run * 64 < length:
+        run *= 2
+    return run
+
+
+def _ends_run(key: str) -> bool:
+    return zlib.crc32(key.encode("utf-8")) & _DICT_RUN_MASK == 0
+
+
+def _chunk_document(doc) -> tuple[Any, dict[str, str]]:
+    """Split ``doc`` into ``(manifest, {hash: section JSON})``.
+
+    Leaves of the returned manifest are hashes; ``_store_chunks`` swaps
+    them for chunk ids.
+    """
+    chunks: dict[str, str] = {}
+    dumps = serialization.dumps
+
+    def leaf(text):
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        chunks[digest] = text
+        return digest
+
+    def split_dict(value, depth):
+        children, run, run_bytes = [], {}, 0
+        for k, v in value.items():
+            text = dumps(v)
+            if len(text) > _CHUNK_SPLIT_BYTES and depth + 1 < _CHUNK_SPLIT_DEPTH \
+                    and isinstance(v, (dict, list)) and len(v) > 1:
+                if run:
+                    children.append(leaf(dumps(run)))
+                    run, run_bytes = {}, 0
+                children.append({"k": k, "v": node(v, depth + 1, text)})
+                continue
+            run[k] = v
+            run_bytes += len(text)
+            if _ends_run(k) or run_bytes > 4 * _CHUNK_SPLIT_BYTES:
+                children.append(leaf(dumps(run)))
+                run, run_bytes = {}, 0
+        if run:
+            children.append(leaf(dumps(run)))
+        return {"d": children}
+
+    def node(value, depth, text=None):
+        if text is None:
+            text = dumps(value)
+        if depth >= _CHUNK_SPLIT_DEPTH or len(text) <= _CHUNK_SPLIT_BYTES \
+                or not isinstance(value, (dict, list)) or len(value) < 2:
+            return leaf(text)
+        if isinstance(value, dict):
+            return split_dict(value, depth)
+        run = _list_run(len(value))
+        return {"l": [leaf(dumps(value[i:i + run]))
+                      for i in range(0, len(value), run)]}
+
+    return node(doc, 0), chunks
+
+
+def _manifest_children(node):
+    if "l" in node:
+        return node["l"]
+    return [c["v"] if isinstance(c, dict) else c for c in node["d"]]
+
+
+def _manifest_leaves(node, out: list) -> list:
+    if isinstance(node, dict):
+        for child in _manifest_children(node):
+            _manifest_leaves(child, out)
+    else:
+        out.append(node)
+    return out
+
+
+def _map_manifest(node, fn):
+    if not isinstance(node, dict):
+        return fn(node)
+    if "l" in node:
+        return {"l": [fn(c) for c in node["l"]]}
+    return {"d": [{"k": c["k"], "v": _map_manifest(c["v"], fn)} if isinstance(c, dict)
+                  else fn(c) for c in node["d"]]}
+
+
+def _prepare_chunks(conn, doc) -> tuple[Any, list[tuple]]:
+    """Chunk, hash and encode ``doc`` for ``_store_chunks``.
+
+    Does no writes, so callers run it before taking the write lock.  Only
+    chunks not stored yet are compressed; the rest carry their JSON as-is,
+    which is kept only if prune_save_history drops the chunk before the
+    insert lands.
+    """
+    manifest, chunks = _chunk_document(doc)
+    counts: dict[str, int] = {}
+    for digest in _manifest_leaves(manifest, []):
+        counts[digest] = counts.get(digest, 0) + 1
+    digests = list(counts)
+    have: set[str] = set()
+    for i in range(0, len(digests), 500):
+        batch = digests[i:i + 500]
+        have.update(r["hash"] for r in conn.execute(
+            f"SELECT hash FROM history_chunks WHERE hash IN ({','.join('?' * len(batch))})",
+            batch,
+        ))
+    rows = []
+    for d in digests:
+        blob, encoding = (chunks[d], "json") if d in have else _encode_text(chunks[d])
+        rows.append((d, blob, encoding, counts[d]))
+    return manifest, rows
+
+
+def _store_chunks(conn, manifest, rows: list[tuple]):
+    """Insert or take references on prepared chunks (under the write lock)
+    and return the manifest with hashes replaced by chunk ids."""
+    conn.executemany(
+        "INSERT INTO history_chunks (hash, data, encoding, refs) VALUES (?, ?, ?, ?) "
+        "ON CONFLICT(hash) DO UPDATE SET refs=refs+excluded.refs",
+        rows,
+    )
+    ids: dict[str, int] = {}
+    for i in range(0, len(rows), 500):
+        batch = [r[0] for r in rows[i:i + 500]]
+        ids.update((r["hash"], r["id"]) for r in conn.execute(
+            f"SELECT id, hash FROM history_chunks WHERE hash IN ({','.join('?' * len(batch))})",
+            batch,
+        ))
+    return _map_manifest(manifest, ids.__getitem__)
+
+
+def _release_chunks(conn, manifests):
+    """Drop one reference per use in each manifest; delete unreferenced chunks."""
+    counts: dict[int, int] = {}
+    for manifest in manifests:
+        for chunk_id in _manifest_leaves(manifest, []):
+            counts[chunk_id] = counts.get(chunk_id, 0) + 1
+    if not counts:
+        return
+    conn.executemany("UPDATE history_chunks SET refs=refs-? WHERE id=?",
+                     [(n, c) for c, n in counts.items()])
+    conn.execute("DELETE FROM history_chunks WHERE refs <= 0")
+
+
+def _assemble_document(conn, manifest):
+    order = list(set(_manifest_leaves(manifest, [])))
+    values: dict[int, Any] = {}
+    for i in range(0, len(order), 500):
+        batch = order[i:i + 500]
+        for r in conn.execute(
+            f"SELECT id, data, encoding FROM history_chunks "
+            f"WHERE id IN ({','.join('?' * len(batch))})",
+            batch,
+        ):
+            values[r["id"]] = _decode_text(r["data"], r["encoding"])
+
+    def build(node):
+        if not isinstance(node, dict):
+            return serialization.loads(values[node])
+        if "l" in node:
+            return [item for child in node["l"] for item in build(child)]
+        out = {}
+        for child in node["d"]:
+            if isinstance(child, dict):
+                out[child["k"]] = build(child["v"])
+            else:
+                out.update(build(child))
+        return out
+
+    return build(manifest)
+
+
+def _history_document(conn, row):
+    """The document a save_history row holds, chunked or whole."""
+    if row["encoding"] == _CHUNKED:
+        return _assemble_document(conn, serialization.loads(row["data"]))
+    return _decode_blob(row["data"], row["encoding"])
+
+
+def _prepare_snapshot(conn, user_id, save_type, save_key):
+    """Read and chunk the row a save is about to supersede, before the
+    write lock is taken; ``_write_blob`` stores it if the row is unchanged."""
+    if save_type in _NO_HISTORY_TYPES:
+        return None
+    prev = conn.execute(
+        "SELECT data, encoding FROM saves WHERE user_id=? AND save_type=? AND save_key=?",
+        (user_id, save_type, save_key),
+    ).fetchone()
+    if prev is None:
+        return None
+    doc = serialization.loads(_decode_text(prev["data"], prev["encoding"]))
+    return prev["data"], prev["encoding"], _prepare_chunks(conn, doc)
+
+
+def _snapshot_history(conn, user_id, save_type, save_key, prev, superseded_at, prepared=None):
+    """Record the ``saves`` row ``prev`` as a chunked save_history version.
+
+    ``prepared`` is ``_prepare_snapshot``'s result; it is used when it was
+    read from the same row contents, else ``prev`` is chunked here.
+    """
+    if prepared is not None and prepared[:2] == (prev["data"], prev["encoding"]):
+        chunked = prepared[2]
+    else:
+        chunked = _prepare_chunks(
+            conn, serialization.loads(_decode_text(prev["data"], prev["encoding"])))
+    manifest = serialization.dumps(_store_chunks(conn, *chunked))
+    conn.execute(
+        """
+        INSERT INTO save_history (user_id, save_type, save_key, label, data, encoding,
+                                  saved_at, superseded_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        (user_id, save_type, save_key, prev["label"], manifest, _CHUNKED,
+         prev["created_at"], superseded_at),
+    )
+
+
+def chunk_legacy_history(batch_size: int = 50, pause: float = 0.0) -> int:
+    """Convert save_history rows holding a whole document to chunk manifests.
+
+    Runs in id order with a commit per batch, like migrate_blob_encodings.
+    Returns the number of rows converted.
+    """
+    converted = 0
+    last_id = 0
+    while True:
+        conn = _connect()
+        try:
+            rows = conn.execute(
+                "SELECT id, data, encoding FROM save_history "
+                "WHERE id > ? AND encoding != ? ORDER BY id LIMIT ?",
+                (last_id, _CHUNKED, batch_size),
+            ).fetchall()
+            if not rows:
+                break
+            last_id = rows[-1]["id"]
+            prepared = {}
+            for row in rows:
+                try:
+                    doc = serialization.loads(_decode_text(row["data"], row["encoding"]))
+                except ValueError:
+                    continue
+                prepared[row["id"]] = _prepare_chunks(conn, doc)
+            # Chunked outside the lock; skip rows pruned in the meantime.
+            conn.execute("BEGIN IMMEDIATE")
+            for history_id, chunked in prepared.items():
+                if conn.execute("SELECT 1 FROM save_history WHERE id=? AND encoding != ?",
+                                (history_id, _CHUNKED)).fetchone() is None:
+                    continue
+                conn.execute(
+                    "UPDATE save_history SET data=?, encoding=? WHERE id=?",
+                    (serialization.dumps(_store_chunks(conn, *chunked)), _CHUNKED, history_id),
+                )
+                converted += 1
+            conn.commit()
+        finally:
+            conn.close()
+        if pause:
+            time.sleep(pause)
+    if converted:
+        _log.info(f"Chunked {converted} save_history versions")
+    return converted
+
+
 def list_save_history(
     save_type: str,
     save_key: str,
@@ -340,12 +1019,12 @@ def load_save_history_entry(history_id: int) -> Optional[dict]:
     conn = _connect()
     try:
         row = conn.execute(
-            "SELECT data FROM save_history WHERE id=?",
+            "SELECT data, encoding FROM save_history WHERE id=?",
             (history_id,),
         ).fetchone()
         if row is None:
             return None
-        return json.loads(row["data"])
+        return _expand_sections(conn, _history_document(conn, row))
     finally:
         conn.close()
 
@@ -360,12 +1039,12 @@ def restore_save_from_history(history_id: int) -> bool:
     conn = _connect()
     try:
         row = conn.execute(
-            "SELECT user_id, save_type, save_key, label, data FROM save_history WHERE id=?",
+            "SELECT user_id, save_type, save_key, label, data, encoding FROM save_history WHERE id=?",
             (history_id,),
         ).fetchone()
         if row is None:
             return False
-        data = json.loads(row["data"])
+        data = _history_document(conn, row)
     finally:
         conn.close()
     # save_blob will snapshot the current version before overwriting
@@ -422,6 +1101,7 @@ def prune_save_history(
     """
     conn = _connect()
     try:
+        conn.execute("BEGIN IMMEDIATE")
         # Find distinct (save_type, save_key) combos
         combos = conn.execute(
             "SELECT DISTINCT save_type, save_key FROM save_history WHERE user_id=?",
@@ -430,9 +1110,10 @@ def prune_save_history(
         total_deleted = 0
         for combo in combos:
             # Keep the newest `keep_per_key` rows, delete the rest
-            deleted = conn.execute(
+            doomed = conn.execute(
                 """
-                DELETE FROM save_history
+                SELECT id, encoding, CASE WHEN encoding=? THEN data END AS data
+                FROM save_history
                 WHERE user_id=? AND save_type=? AND save_key=?
                   AND id NOT IN (
                     SELECT id FROM save_history
@@ -441,16 +1122,498 @@ def prune_save_history(
                     LIMIT ?
                   )
                 """,
-                (user_id, combo["save_type"], combo["save_key"],
+                (_CHUNKED, user_id, combo["save_type"], combo["save_key"],
                  user_id, combo["save_type"], combo["save_key"],
                  keep_per_key),
-            ).rowcount
-            total_deleted += deleted
+            ).fetchall()
+            if not doomed:
+                continue
+            _release_chunks(conn, [serialization.loads(r["data"]) for r in doomed
+                                   if r["encoding"] == _CHUNKED])
+            conn.executemany("DELETE FROM save_history WHERE id=?",
+                             [(r["id"],) for r in doomed])
+            total_deleted += len(doomed)
         conn.commit()
         if total_deleted:
             _log.info(f"Pruned {total_deleted} old history entries for user={user_id}")
     finally:
         conn.close()
+    if total_deleted:
+        prune_save_sections()
+
+
+# ═══════════════════════════════════════════════════════════════
+# SECTIONED SAVES — large documents stored and loaded in parts
+# ═══════════════════════════════════════════════════════════════
+
+# Dynasties and WVL seasons gain a year of histories, awards and recruiting
+# archives every season, and opening one used to parse all of it.  They
+# are saved as a small core document in ``saves`` plus sections in
+# ``save_sections``: the core lists its sections' SHA-256 digests under
+# _SECTIONS_KEY, and each section (the JSON of a group of the document's
+# top-level keys) is stored once per distinct content.  A save rewrites
+# only the sections that changed; history versions and forks share the
+# rest.  load_blob reassembles the whole document, so generic readers see
+# no difference.  load_dynasty / load_wvl_season attach the sections to
+# the restored object unloaded (engine/lazy_sections.py) and decode each
+# one on first access.  prune_save_sections drops sections that no save
+# or history version refers to.
+
+_SECTIONS_KEY = "_sections"
+_SECTIONED_TYPES = ("dynasty", "wvl_season")
+
+
+def _section_rows(conn, digests) -> dict[str, tuple]:
+    digests = list(set(digests))
+    rows = {}
+    for i in range(0, len(digests), 500):
+        batch = digests[i:i + 500]
+        for r in conn.execute(
+            f"SELECT digest, data, encoding FROM save_sections "
+            f"WHERE digest IN ({','.join('?' * len(batch))})", batch,
+        ):
+            rows[r["digest"]] = (r["digest"], r["data"], r["encoding"])
+    return rows
+
+
+def _expand_sections(conn, doc):
+    """Inline a sectioned document's sections (other documents pass through)."""
+    if not isinstance(doc, dict) or _SECTIONS_KEY not in doc:
+        return doc
+    digests = doc.pop(_SECTIONS_KEY)
+    rows = _section_rows(conn, digests.values())
+    for name, digest in digests.items():
+        if digest not in rows:
+            raise ValueError(f"Save section {name!r} ({digest[:12]}) is missing")
+        doc.update(_decode_blob(rows[digest][1], rows[digest][2]))
+    return doc
+
+
+def save_sectioned_blob(
+    save_type: str,
+    save_key: str,
+    core: dict,
+    sections: dict[str, Any],
+    label: str = "",
+    user_id: str = "default",
+):
+    """Save a document as ``core`` plus independently stored sections.
+
+    Each value of ``sections`` is either the section's document (a dict of
+    top-level keys) or the stored-section token a lazily restored object
+    holds for a section it never loaded — unchanged, so it is neither
+    re-serialized nor re-encoded.  The core row goes through the same
+    history snapshot as save_blob.
+    """
+    now = time.time()
+    digests, fresh = {}, {}
+    for name, part in sections.items():
+        if isinstance(part, tuple):
+            digests[name] = part[0]
+            fresh.setdefault(part[0], part)
+        else:
+            raw = serialization.dumpb(part)
+            digest = hashlib.sha256(raw).hexdigest()
+            digests[name] = digest
+            fresh.setdefault(digest, raw)
+    doc = dict(core)
+    doc[_SECTIONS_KEY] = digests
+    blob, encoding = _encode_blob(doc)
+    conn = _connect()
+    try:
+        prepared = _prepare_snapshot(conn, user_id, save_type, save_key)
+        # Take the write lock before the section existence check so
+        # prune_save_sections can't drop one before the core row lands.
+        conn.execute("BEGIN IMMEDIATE")
+        have = _section_rows(conn, fresh)
+        new_rows = []
+        for digest, part in fresh.items():
+            if digest in have:
+                continue
+            data, enc = part[1:] if isinstance(part, tuple) else _encode_raw(part)
+            new_rows.append((digest, data, enc, now))
+        conn.executemany(
+            "INSERT INTO save_sections (digest, data, encoding, created_at) VALUES (?, ?, ?, ?)",
+            new_rows,
+        )
+        _write_blob(conn, user_id, save_type, save_key, label, blob, encoding, now, prepared)
+        conn.commit()
+        _log.debug(f"Saved {save_type}/{save_key} for user={user_id} "
+                   f"({len(blob)} byte core, {len(new_rows)}/{len(digests)} sections written)")
+    finally:
+        conn.close()
+
+
+def load_sectioned_blob(
+    save_type: str,
+    save_key: str,
+    user_id: str = "default",
+) -> Optional[tuple[dict, dict[str, tuple]]]:
+    """Load a save's core document and its sections' stored rows, undecoded.
+
+    Returns ``(core, {name: token})`` — tokens are what save_sectioned_blob
+    accepts for unchanged sections — or None if the save doesn't exist.
+    Documents saved whole come back as ``(document, {})``.
+    """
+    conn = _connect()
+    try:
+        row = conn.execute(
+            "SELECT data, encoding FROM saves WHERE user_id=? AND save_type=? AND save_key=?",
+            (user_id, save_type, save_key),
+        ).fetchone()
+        if row is None:
+            return None
+        doc = _decode_blob(row["data"], row["encoding"])
+        digests = doc.pop(_SECTIONS_KEY, None) or {}
+        rows = _section_rows(conn, digests.values())
+    finally:
+        conn.close()
+    missing = [name for name, digest in digests.items() if digest not in rows]
+    if missing:
+        raise ValueError(f"Save sections missing for {save_type}/{save_key}: {', '.join(missing)}")
+    return doc, {name: rows[digest] for name, digest in digests.items()}
+
+
+def _attach_sections(obj, spec: dict, tokens: dict[str, tuple]):
+    """Attach stored sections to a restored object for loading on first access.
+
+    ``spec`` maps section name → (attributes, serialize, restore); sections
+    the save doesn't have keep the object's defaults.
+    """
+    for name, (attrs, _, restore) in spec.items():
+        token = tokens.get(name)
+        if token is None:
+            continue
+        obj.attach_section(
+            name, attrs,
+            lambda o, t=token, fn=restore: fn(o, _decode_blob(t[1], t[2])),
+            token,
+        )
+
+
+def _serialize_sections(obj, spec: dict) -> dict[str, Any]:
+    """Section documents for a save, reusing the token of any never-loaded section."""
+    return {name: obj.pending_section(name) or serialize(obj)
+            for name, (_, serialize, _) in spec.items()}
+
+
+def _section_refs(doc) -> list[str]:
+    if isinstance(doc, dict) and isinstance(doc.get(_SECTIONS_KEY), dict):
+        return list(doc[_SECTIONS_KEY].values())
+    return []
+
+
+def prune_save_sections() -> int:
+    """Delete save_sections rows no save or history version refers to.
+
+    Runs after prune_save_history drops versions.  Returns the number of
+    sections deleted.
+    """
+    marks = ",".join("?" * len(_SECTIONED_TYPES))
+    conn = _connect()
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        live = set()
+        for row in conn.execute(
+            f"SELECT data, encoding FROM saves WHERE save_type IN ({marks})", _SECTIONED_TYPES,
+        ).fetchall():
+            live.update(_section_refs(_decode_blob(row["data"], row["encoding"])))
+        for row in conn.execute(
+            f"SELECT data, encoding FROM save_history WHERE save_type IN ({marks})", _SECTIONED_TYPES,
+        ).fetchall():
+            live.update(_section_refs(_history_document(conn, row)))
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS live_sections (digest TEXT PRIMARY KEY)")
+        conn.executemany("INSERT OR IGNORE INTO live_sections VALUES (?)", [(d,) for d in live])
+        deleted = conn.execute(
+            "DELETE FROM save_sections WHERE digest NOT IN (SELECT digest FROM live_sections)"
+        ).rowcount
+        conn.execute("DROP TABLE temp.live_sections")
+        conn.commit()
+        if deleted:
+            _log.info(f"Pruned {deleted} unreferenced save sections")
+        return deleted
+    finally:
+        conn.close()
+
+
+# ═══════════════════════════════════════════════════════════════
+# CHANGESET SYNC — incremental export to the hub
+# ═══════════════════════════════════════════════════════════════
+
+# /export/db hands the hub a full copy of the database; a changeset
+# carries only the rows written or deleted since the hub's last pull.
+# Every insert, update and delete on a synced table takes the next value
+# of one database-wide counter (sync_state.version), and triggers record
+# it in sync_log against the row's key — with a tombstone flag for
+# deletes.  The versions live in that side table rather than a column of
+# each row because stamping a column from a trigger rewrites the row: a
+# second write of every multi-megabyte save.
+#
+# A changeset is a sequence of records in version order, read from one
+# snapshot:
+#
+#   {"op": "begin", "db": lineage, "since": n, "version": v, "reset": bool}
+#   {"op": "put", "t": table, "k": key, "v": version, "row": {column: value}}
+#   {"op": "del", "t": table, "k": key, "v": version}
+#   {"op": "end", "version": v, "count": number of put/del records}
+#
+# ``db`` is a random id minted with the database.  A cursor from another
+# lineage (the disk was wiped), ahead of this database, or older than the
+# oldest tombstone still kept gets a reset changeset — every live row, to
+# replace whatever the receiver holds.  BLOB values travel as {"b64": ...}.
+# history_chunks reference counts aren't synced (they change on every
+# save); apply_changeset recounts them from the manifests.
+
+_SYNC_TABLES = {  # table → key column
+    "save_sections": "digest",
+    "history_chunks": "id",
+    "save_history": "id",
+    "saves": "id",
+    "box_scores": "id",
+}
+_SYNC_SKIP_COLUMNS = {"history_chunks": ("refs",)}
+_SYNC_NOW = "(julianday('now') - 2440587.5) * 86400.0"
+
+# Tombstones are kept this long; a receiver further behind gets a reset.
+SYNC_TOMBSTONE_MAX_AGE = 7 * 86400
+
+
+def _table_columns(conn, table: str) -> list[str]:
+    return [r[1] for r in conn.execute(f"PRAGMA table_info({table})")]
+
+
+def _create_sync_log(conn):
+    conn.executescript("""
+        CREATE TABLE IF NOT EXISTS sync_state (
+            id              INTEGER PRIMARY KEY CHECK (id = 1),
+            db_id           TEXT    NOT NULL,
+            version         INTEGER NOT NULL DEFAULT 0,
+            pruned_through  INTEGER NOT NULL DEFAULT 0
+        );
+
+        CREATE TABLE IF NOT EXISTS sync_log (
+            tbl         TEXT    NOT NULL,
+            row_key             NOT NULL,
+            version     INTEGER NOT NULL,
+            deleted     INTEGER NOT NULL DEFAULT 0,
+            changed_at  REAL    NOT NULL,
+            PRIMARY KEY (tbl, row_key)
+        ) WITHOUT ROWID;
+
+        CREATE INDEX IF NOT EXISTS idx_sync_log_version
+            ON sync_log(version);
+
+        CREATE INDEX IF NOT EXISTS idx_sync_log_tombstones
+            ON sync_log(changed_at) WHERE deleted = 1;
+    """)
+    # Upserts, not INSERT OR REPLACE: an UPSERT firing the trigger would
+    # impose its own conflict policy on a trigger's OR REPLACE.
+    for table, key in _SYNC_TABLES.items():
+        skip = _SYNC_SKIP_COLUMNS.get(table)
+        update = "UPDATE"
+        if skip:
+            update += " OF " + ", ".join(c for c in _table_columns(conn, table) if c not in skip)
+        for event, ref, deleted in (("INSERT", "NEW", 0), (update, "NEW", 0), ("DELETE", "OLD", 1)):
+            conn.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS sync_{table}_{event.split()[0].lower()}
+                AFTER {event} ON {table} BEGIN
+                    UPDATE sync_state SET version = version + 1 WHERE id = 1;
+                    INSERT INTO sync_log (tbl, row_key, version, deleted, changed_at)
+                    VALUES ('{table}', {ref}.{key}, (SELECT version FROM sync_state WHERE id = 1),
+                            {deleted}, {_SYNC_NOW})
+                    ON CONFLICT(tbl, row_key) DO UPDATE SET version=excluded.version,
+                        deleted=excluded.deleted, changed_at=excluded.changed_at;
+                END
+            """)
+    if conn.execute("INSERT OR IGNORE INTO sync_state (id, db_id) VALUES (1, ?)",
+                    (uuid.uuid4().hex,)).rowcount:
+        # First run on this database: version the rows it already holds.
+        for table, key in _SYNC_TABLES.items():
+            conn.execute(
+                f"INSERT OR IGNORE INTO sync_log (tbl, row_key, version, changed_at) "
+                f"SELECT ?, {key}, (SELECT version FROM sync_state) + rowid, {_SYNC_NOW} FROM {table}",
+                (table,),
+            )
+            conn.execute(f"UPDATE sync_state SET version = version + "
+                         f"(SELECT COALESCE(MAX(rowid), 0) FROM {table})")
+
+
+def _sync_value(value):
+    return {"b64": base64.b64encode(value).decode("ascii")} if isinstance(value, bytes) else value
+
+
+def _unsync_value(value):
+    return base64.b64decode(value["b64"]) if isinstance(value, dict) else value
+
+
+def sync_state() -> dict:
+    """This database's lineage id, current version and tombstone horizon."""
+    conn = _connect()
+    try:
+        row = conn.execute("SELECT db_id, version, pruned_through FROM sync_state WHERE id = 1").fetchone()
+        return dict(row)
+    finally:
+        conn.close()
+
+
+def iter_changeset(since: int = 0, db_id: str | None = None,
+                   batch_size: int = 200) -> Iterator[dict]:
+    """Yield the changeset bringing a copy at version ``since`` of lineage
+    ``db_id`` up to date (a reset changeset if it can't be).
+
+    Reads one snapshot on a connection of its own, so a long stream
+    neither holds a pooled connection nor sees writes made meanwhile.
+    """
+    conn = _open_connection(_db_path)
+    try:
+        conn.execute("BEGIN")
+        state = conn.execute(
+            "SELECT db_id, version, pruned_through FROM sync_state WHERE id = 1").fetchone()
+        reset = (since <= 0 or db_id != state["db_id"] or since > state["version"]
+                 or since < state["pruned_through"])
+        if reset:
+            since = 0
+        yield {"op": "begin", "db": state["db_id"], "since": since,
+               "version": state["version"], "reset": reset}
+        count = 0
+        log = conn.execute(
+            "SELECT tbl, row_key, version, deleted FROM sync_log "
+            "WHERE version > ? AND NOT (? AND deleted) ORDER BY version",
+            (since, reset),
+        )
+        while batch := log.fetchmany(batch_size):
+            by_table: dict[str, list] = {}
+            for entry in batch:
+                if not entry["deleted"]:
+                    by_table.setdefault(entry["tbl"], []).append(entry["row_key"])
+            rows = {}
+            for table, keys in by_table.items():
+                key, skip = _SYNC_TABLES[table], _SYNC_SKIP_COLUMNS.get(table, ())
+                for r in conn.execute(
+                    f"SELECT * FROM {table} WHERE {key} IN ({','.join('?' * len(keys))})", keys,
+                ):
+                    rows[table, r[key]] = {c: _sync_value(r[c]) for c in r.keys() if c not in skip}
+            for entry in batch:
+                table, key = entry["tbl"], entry["row_key"]
+                if entry["deleted"]:
+                    yield {"op": "del", "t": table, "k": key, "v": entry["version"]}
+                else:
+                    yield {"op": "put", "t": table, "k": key, "v": entry["version"],
+                           "row": rows[table, key]}
+                count += 1
+        yield {"op": "end", "version": state["version"], "count": count}
+    finally:
+        conn.close()
+
+
+def apply_changeset(records: Iterable[dict], path: str | Path | None = None) -> dict:
+    """Apply a changeset from iter_changeset to this database (or the one at ``path``).
+
+    All or nothing: the records go in one transaction that commits only
+    when the closing ``end`` record arrives, so a truncated stream leaves
+    the database as it was.  Afterwards the database carries the source's
+    lineage and version, so the hub's next pull from it is incremental.
+    Returns the begin record's ``db``, ``version`` and ``reset`` plus the
+    number of records ``applied``.
+    """
+    if path is None:
+        conn = _connect()
+    else:
+        conn = sqlite3.connect(str(path), timeout=10)
+        conn.row_factory = sqlite3.Row
+    try:
+        _create_schema(conn)
+        conn.commit()
+        records = iter(records)
+        begin = next(records, None)
+        if not isinstance(begin, dict) or begin.get("op") != "begin":
+            raise ValueError("Changeset does not start with a begin record")
+        conn.execute("BEGIN IMMEDIATE")
+        state = conn.execute("SELECT db_id, version FROM sync_state WHERE id = 1").fetchone()
+        if not begin["reset"] and (begin["db"] != state["db_id"] or begin["since"] > state["version"]):
+            raise ValueError(f"Changeset from {begin['db']}@{begin['since']} doesn't follow "
+                             f"this database ({state['db_id']}@{state['version']})")
+        if begin["reset"]:
+            for table in _SYNC_TABLES:
+                conn.execute(f"DELETE FROM {table}")
+            conn.execute("DELETE FROM sync_log")
+        columns = {t: set(_table_columns(conn, t)) for t in _SYNC_TABLES}
+        now = time.time()
+        applied, history_changed, end = 0, False, None
+        for rec in records:
+            op, table = rec.get("op"), rec.get("t")
+            if op == "end":
+                end = rec
+                break
+            if table not in _SYNC_TABLES or op not in ("put", "del"):
+                raise ValueError(f"Unexpected changeset record {op!r} for {table!r}")
+            if op == "del":
+                conn.execute(f"DELETE FROM {table} WHERE {_SYNC_TABLES[table]} = ?", (rec["k"],))
+            else:
+                row = {c: _unsync_value(v) for c, v in rec["row"].items()}
+                unknown = set(row) - columns[table]
+                if unknown:
+                    raise ValueError(f"Changeset row for {table} has unknown columns {sorted(unknown)}")
+                conn.execute(
+                    f"INSERT OR REPLACE INTO {table} ({', '.join(row)}) "
+                    f"VALUES ({', '.join('?' * len(row))})",
+                    list(row.values()),
+                )
+            # Keep the source's version, not the one the trigger just took.
+            conn.execute(
+                "INSERT OR REPLACE INTO sync_log (tbl, row_key, version, deleted, changed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (table, rec["k"], rec["v"], op == "del", now),
+            )
+            applied += 1
+            history_changed = history_changed or table in ("save_history", "history_chunks")
+        if end is None or end.get("count") != applied:
+            raise ValueError("Changeset stream ended early")
+        if history_changed:
+            _recount_chunk_refs(conn)
+        conn.execute("UPDATE sync_state SET db_id = ?, version = MAX(?, ?) WHERE id = 1",
+                     (begin["db"], state["version"], end["version"]))
+        conn.commit()
+    finally:
+        conn.close()
+    _log.info(f"Applied {applied} changes from {begin['db']}@{end['version']}"
+              f"{' (reset)' if begin['reset'] else ''}")
+    return {"db": begin["db"], "version": end["version"], "reset": begin["reset"],
+            "applied": applied}
+
+
+def _recount_chunk_refs(conn):
+    counts: dict[int, int] = {}
+    for row in conn.execute("SELECT data FROM save_history WHERE encoding = ?", (_CHUNKED,)):
+        for chunk_id in _manifest_leaves(serialization.loads(row["data"]), []):
+            counts[chunk_id] = counts.get(chunk_id, 0) + 1
+    conn.execute("UPDATE history_chunks SET refs = 0")
+    conn.executemany("UPDATE history_chunks SET refs = ? WHERE id = ?",
+                     [(n, c) for c, n in counts.items()])
+
+
+def prune_sync_tombstones(max_age: float = SYNC_TOMBSTONE_MAX_AGE) -> int:
+    """Forget deletes older than ``max_age`` seconds.
+
+    A receiver whose cursor predates a forgotten delete gets a reset
+    changeset on its next pull.  Returns the number of tombstones dropped.
+    """
+    cutoff = time.time() - max_age
+    conn = _connect()
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        last = conn.execute("SELECT MAX(version) FROM sync_log WHERE deleted = 1 AND changed_at < ?",
+                            (cutoff,)).fetchone()[0]
+        if last is None:
+            return 0
+        deleted = conn.execute("DELETE FROM sync_log WHERE deleted = 1 AND changed_at < ?",
+                               (cutoff,)).rowcount
+        conn.execute("UPDATE sync_state SET pruned_through = MAX(pruned_through, ?) WHERE id = 1",
+                     (last,))
+        conn.commit()
+        return deleted
+    finally:
+        conn.close()
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -1091,13 +2254,19 @@ def load_all_league_archives(user_id: str = "default") -> dict[str, dict]:
 # SEASON ARCHIVE (persisted snapshots of completed seasons)
 # ═══════════════════════════════════════════════════════════════
 
-def save_season_archive(archive_key: str, snapshot: dict, user_id: str = "default"):
+def save_season_archive(archive_key: str, snapshot: dict, user_id: str = "default",
+                        immutable: bool = False):
     """Save a completed season snapshot (college or FIV) to the database.
 
     Also saves a lightweight summary blob (season_archive_meta) so the
     archive index page can display champion / team-count / games-played
     without loading the full 50+ MB snapshot.
+
+    ``immutable`` marks a key its writer never saves again (timestamped
+    and random keys); the stats site lets browsers cache those pages.  A
+    key that already exists is being rewritten, so it is never marked.
     """
+    immutable = immutable and season_archive_updated_at(archive_key, user_id=user_id) is None
     save_blob("season_archive", archive_key, snapshot,
               label=snapshot.get("label", archive_key), user_id=user_id)
     # Save lightweight summary for fast listing
@@ -1108,6 +2277,7 @@ def save_season_archive(archive_key: str, snapshot: dict, user_id: str = "defaul
         "team_count": snapshot.get("team_count", 0),
         "games_played": snapshot.get("games_played", 0),
         "total_games": snapshot.get("total_games", 0),
+        "immutable": immutable,
     }
     save_blob("season_archive_meta", archive_key, meta,
               label=snapshot.get("label", archive_key), user_id=user_id)
@@ -1124,6 +2294,11 @@ def load_season_archive_meta(archive_key: str, user_id: str = "default") -> Opti
     return load_blob("season_archive_meta", archive_key, user_id=user_id)
 
 
+def season_archive_updated_at(archive_key: str, user_id: str = "default") -> Optional[float]:
+    """When the archive was last written; stats pages derive ETags from it."""
+    return blob_updated_at("season_archive", archive_key, user_id=user_id)
+
+
 def list_season_archives(user_id: str = "default") -> list[dict]:
     """List all season archives (metadata only, no full data)."""
     return list_saves("season_archive", user_id=user_id)
@@ -1144,19 +2319,18 @@ def serialize_wvl_season(wvl_season) -> dict:
 
     Reuses serialize_pro_league_season for each tier's ProLeagueSeason,
     plus WVL-specific fields (tier_assignments, phase, promotion_result).
+    The tier seasons form the "tiers" section; save_wvl_season stores them
+    apart from the rest.
     """
-    tier_data = {}
-    for tier_num, season in wvl_season.tier_seasons.items():
-        tier_data[str(tier_num)] = serialize_pro_league_season(season)
-        # Also serialize the injury tracker if present
-        if getattr(season, 'injury_tracker', None) is not None:
-            tracker = season.injury_tracker
-            tier_data[str(tier_num)]["injury_tracker"] = _serialize_injury_tracker(tracker)
+    result = _serialize_wvl_core(wvl_season)
+    result.update(_serialize_wvl_tiers(wvl_season))
+    return result
 
+
+def _serialize_wvl_core(wvl_season) -> dict:
     result = {
         "version": 1,
         "tier_assignments": {k: v for k, v in wvl_season.tier_assignments.items()},
-        "tier_seasons": tier_data,
         "phase": wvl_season.phase,
         "current_week": wvl_season.current_week,
     }
@@ -1167,6 +2341,17 @@ def serialize_wvl_season(wvl_season) -> dict:
     return result
 
 
+def _serialize_wvl_tiers(wvl_season) -> dict:
+    tier_data = {}
+    for tier_num, season in wvl_season.tier_seasons.items():
+        tier_data[str(tier_num)] = serialize_pro_league_season(season)
+        # Also serialize the injury tracker if present
+        if getattr(season, 'injury_tracker', None) is not None:
+            tracker = season.injury_tracker
+            tier_data[str(tier_num)]["injury_tracker"] = _serialize_injury_tracker(tracker)
+    return {"tier_seasons": tier_data}
+
+
 def _serialize_injury_tracker(tracker) -> dict:
     """Serialize an InjuryTracker to a JSON-safe dict."""
     active = {}
@@ -1198,19 +2383,14 @@ def _deserialize_injury_tracker(data: dict):
 
 def deserialize_wvl_season(data: dict):
     """Reconstruct a WVLMultiTierSeason from a serialized dict."""
-    from engine.wvl_season import WVLMultiTierSeason
-    from engine.promotion_relegation import (
-        PromotionRelegationResult, TierMovement, PromotionPlayoff,
-    )
+    wvl = _deserialize_wvl_core(data)
+    _restore_wvl_tiers(wvl, data)
+    return wvl
 
-    # Build without __init__ to avoid re-loading all teams
-    wvl = WVLMultiTierSeason.__new__(WVLMultiTierSeason)
-    wvl.tier_assignments = data["tier_assignments"]
-    wvl.phase = data.get("phase", "regular_season")
-    wvl.current_week = data.get("current_week", 0)
 
+def _restore_wvl_tiers(wvl, data: dict):
     # Deserialize each tier's ProLeagueSeason
-    wvl.tier_seasons = {}
+    tier_seasons = {}
     for tier_str, season_data in data.get("tier_seasons", {}).items():
         tier_num = int(tier_str)
         season = deserialize_pro_league_season(season_data)
@@ -1243,7 +2423,22 @@ def deserialize_wvl_season(data: dict):
                     if key in all_wvl_teams:
                         season.teams[key] = all_wvl_teams[key]
 
-        wvl.tier_seasons[tier_num] = season
+        tier_seasons[tier_num] = season
+    wvl.tier_seasons = tier_seasons
+
+
+def _deserialize_wvl_core(data: dict):
+    from engine.wvl_season import WVLMultiTierSeason
+    from engine.promotion_relegation import (
+        PromotionRelegationResult, TierMovement, PromotionPlayoff,
+    )
+
+    # Build without __init__ to avoid re-loading all teams
+    wvl = WVLMultiTierSeason.__new__(WVLMultiTierSeason)
+    wvl.tier_assignments = data["tier_assignments"]
+    wvl.phase = data.get("phase", "regular_season")
+    wvl.current_week = data.get("current_week", 0)
+    wvl.tier_seasons = {}
 
     # Restore promotion result if present
     prom_data = data.get("promotion_result")
@@ -1288,23 +2483,37 @@ def deserialize_wvl_season(data: dict):
 
 def save_wvl_season(wvl_season, user_id: str = "default"):
     """Save a WVL multi-tier season to the database."""
-    data = serialize_wvl_season(wvl_season)
-    save_blob("wvl_season", "current", data, label="WVL Season", user_id=user_id)
+    save_sectioned_blob("wvl_season", "current", _serialize_wvl_core(wvl_season),
+                        _serialize_sections(wvl_season, _WVL_SECTIONS),
+                        label="WVL Season", user_id=user_id)
     _log.info(f"Saved WVL season for user={user_id}")
 
 
 def load_wvl_season(user_id: str = "default"):
-    """Load a WVL multi-tier season. Returns the season or None."""
-    data = load_blob("wvl_season", "current", user_id=user_id)
-    if data is None:
+    """Load a WVL multi-tier season. Returns the season or None.
+
+    The tier seasons load on first access to ``tier_seasons``.
+    """
+    loaded = load_sectioned_blob("wvl_season", "current", user_id=user_id)
+    if loaded is None:
         return None
+    core, sections = loaded
     try:
-        return deserialize_wvl_season(data)
+        if not sections:
+            return deserialize_wvl_season(core)  # saved whole, before sections
+        wvl = _deserialize_wvl_core(core)
+        _attach_sections(wvl, _WVL_SECTIONS, sections)
+        return wvl
     except Exception as e:
         _log.warning(f"Failed to deserialize WVL season: {e}")
         return None
 
 
+_WVL_SECTIONS = {
+    "tiers": (("tier_seasons",), _serialize_wvl_tiers, _restore_wvl_tiers),
+}
+
+
 def delete_wvl_season(user_id: str = "default"):
     """Delete a saved WVL season."""
     delete_blob("wvl_season", "current", user_id=user_id)
@@ -1320,7 +2529,16 @@ def serialize_dynasty(dynasty) -> dict:
     Follows the same pattern as Dynasty.save() but captures additional
     fields (prestige, histories, rivalries) that the file-based save skips.
     Does NOT serialize Season objects (too large) — only metadata/summaries.
+    The whole document is the core plus every section in _DYNASTY_SECTIONS;
+    save_dynasty stores those parts separately.
     """
+    data = _serialize_dynasty_core(dynasty)
+    for _, serialize, _ in _DYNASTY_SECTIONS.values():
+        data.update(serialize(dynasty))
+    return data
+
+
+def _serialize_dynasty_core(dynasty) -> dict:
     from dataclasses import asdict
 
     data = {
@@ -1328,43 +2546,13 @@ def serialize_dynasty(dynasty) -> dict:
         "coach": asdict(dynasty.coach),
         "current_year": dynasty.current_year,
         "conferences": {name: asdict(conf) for name, conf in dynasty.conferences.items()},
-        "team_histories": {name: asdict(h) for name, h in dynasty.team_histories.items()},
-        "awards_history": {str(year): asdict(a) for year, a in dynasty.awards_history.items()},
-        "record_book": asdict(dynasty.record_book),
         "team_prestige": dict(dynasty.team_prestige) if dynasty.team_prestige else {},
         "games_per_team": dynasty.games_per_team,
         "playoff_size": dynasty.playoff_size,
         "bowl_count": dynasty.bowl_count,
         "rivalries": dynasty.rivalries if dynasty.rivalries else {},
-        "rivalry_ledger": dynasty.rivalry_ledger if dynasty.rivalry_ledger else {},
-        "player_stats": {
-            name: asdict(ps) for name, ps in dynasty.player_stats.items()
-        } if dynasty.player_stats else {},
-        "honors_history": {str(k): v for k, v in dynasty.honors_history.items()} if dynasty.honors_history else {},
-        "injury_history": {str(k): v for k, v in dynasty.injury_history.items()} if dynasty.injury_history else {},
-        "development_history": {str(k): v for k, v in dynasty.development_history.items()} if dynasty.development_history else {},
-        "recruiting_history": {str(k): v for k, v in dynasty.recruiting_history.items()} if dynasty.recruiting_history else {},
-        "portal_history": {str(k): v for k, v in dynasty.portal_history.items()} if dynasty.portal_history else {},
-        "nil_history": {str(k): v for k, v in dynasty.nil_history.items()} if dynasty.nil_history else {},
-        "coaching_history": {str(k): v for k, v in dynasty.coaching_history.items()} if dynasty.coaching_history else {},
     }
 
-    # Coaching staffs — CoachCard objects need .to_dict()
-    if dynasty._coaching_staffs:
-        try:
-            from engine.coaching import CoachCard
-            staffs = {}
-            for team_name, staff in dynasty._coaching_staffs.items():
-                staffs[team_name] = {
-                    role: (card.to_dict() if isinstance(card, CoachCard) else card)
-                    for role, card in staff.items()
-                }
-            data["coaching_staffs"] = staffs
-        except Exception:
-            data["coaching_staffs"] = {}
-    else:
-        data["coaching_staffs"] = {}
-
     # Next-season rosters (persisted by offseason_complete for roster continuity)
     next_rosters = getattr(dynasty, '_next_season_rosters', None)
     if next_rosters:
@@ -1373,20 +2561,74 @@ def serialize_dynasty(dynasty) -> dict:
     # Program registry: custom (added) programs + retired (frozen) program names.
     data["custom_programs"] = list(getattr(dynasty, "custom_programs", []) or [])
     data["retired_programs"] = list(getattr(dynasty, "retired_programs", []) or [])
+    return data
+
+
+def _serialize_dynasty_staffs(dynasty) -> dict:
+    # Coaching staffs — CoachCard objects need .to_dict()
+    if not dynasty._coaching_staffs:
+        return {"coaching_staffs": {}}
+    try:
+        from engine.coaching import CoachCard
+        staffs = {}
+        for team_name, staff in dynasty._coaching_staffs.items():
+            staffs[team_name] = {
+                role: (card.to_dict() if isinstance(card, CoachCard) else card)
+                for role, card in staff.items()
+            }
+        return {"coaching_staffs": staffs}
+    except Exception:
+        return {"coaching_staffs": {}}
+
+
+def _serialize_dynasty_histories(dynasty) -> dict:
+    from dataclasses import asdict
+
+    return {
+        "team_histories": {name: asdict(h) for name, h in dynasty.team_histories.items()},
+        "record_book": asdict(dynasty.record_book),
+        "rivalry_ledger": dynasty.rivalry_ledger if dynasty.rivalry_ledger else {},
+        "player_stats": {
+            name: asdict(ps) for name, ps in dynasty.player_stats.items()
+        } if dynasty.player_stats else {},
+        "coaching_history": {str(k): v for k, v in dynasty.coaching_history.items()} if dynasty.coaching_history else {},
+    }
+
 
+def _serialize_dynasty_awards(dynasty) -> dict:
+    from dataclasses import asdict
+
+    return {
+        "awards_history": {str(year): asdict(a) for year, a in dynasty.awards_history.items()},
+        "honors_history": {str(k): v for k, v in dynasty.honors_history.items()} if dynasty.honors_history else {},
+    }
+
+
+def _serialize_dynasty_archives(dynasty) -> dict:
+    return {
+        name: {str(k): v for k, v in getattr(dynasty, name).items()} if getattr(dynasty, name) else {}
+        for name in _DYNASTY_ARCHIVES
+    }
+
+
+def _serialize_dynasty_careers(dynasty) -> dict:
     # Career tracker (alumni / hall-of-fame data)
     tracker = getattr(dynasty, 'career_tracker', None)
     if tracker and tracker.careers:
-        data["career_tracker"] = {
-            k: v.to_dict() for k, v in tracker.careers.items()
-        }
-
-    return data
+        return {"career_tracker": {k: v.to_dict() for k, v in tracker.careers.items()}}
+    return {}
 
 
 def deserialize_dynasty(data: dict):
     """Reconstruct a Dynasty from a serialized dict."""
-    from engine.dynasty import Dynasty, Coach, Conference, TeamHistory, SeasonAwards, RecordBook, PlayerCareerStats
+    dynasty = _deserialize_dynasty_core(data)
+    for _, _, restore in _DYNASTY_SECTIONS.values():
+        restore(dynasty, data)
+    return dynasty
+
+
+def _deserialize_dynasty_core(data: dict):
+    from engine.dynasty import Dynasty, Coach, Conference
 
     dynasty = Dynasty(
         dynasty_name=data["dynasty_name"],
@@ -1398,53 +2640,12 @@ def deserialize_dynasty(data: dict):
     for name, conf_data in data.get("conferences", {}).items():
         dynasty.conferences[name] = Conference(**conf_data)
 
-    # Team histories
-    for name, h_data in data.get("team_histories", {}).items():
-        # Convert string year keys back to int in season_records
-        if "season_records" in h_data:
-            h_data["season_records"] = {int(k): v for k, v in h_data["season_records"].items()}
-        dynasty.team_histories[name] = TeamHistory(**h_data)
-
-    # Awards history
-    for year_str, a_data in data.get("awards_history", {}).items():
-        dynasty.awards_history[int(year_str)] = SeasonAwards(**a_data)
-
-    # Record book
-    if "record_book" in data:
-        dynasty.record_book = RecordBook(**data["record_book"])
-
     # Simple dict fields
     dynasty.team_prestige = data.get("team_prestige", {})
     dynasty.games_per_team = data.get("games_per_team", 12)
     dynasty.playoff_size = data.get("playoff_size", 8)
     dynasty.bowl_count = data.get("bowl_count", 4)
     dynasty.rivalries = data.get("rivalries", {})
-    dynasty.rivalry_ledger = data.get("rivalry_ledger", {})
-
-    # Int-keyed history dicts
-    dynasty.honors_history = {int(k): v for k, v in data.get("honors_history", {}).items()}
-    dynasty.injury_history = {int(k): v for k, v in data.get("injury_history", {}).items()}
-    dynasty.development_history = {int(k): v for k, v in data.get("development_history", {}).items()}
-    dynasty.recruiting_history = {int(k): v for k, v in data.get("recruiting_history", {}).items()}
-    dynasty.portal_history = {int(k): v for k, v in data.get("portal_history", {}).items()}
-    dynasty.nil_history = {int(k): v for k, v in data.get("nil_history", {}).items()}
-    dynasty.coaching_history = {int(k): v for k, v in data.get("coaching_history", {}).items()}
-
-    # Player career stats
-    for name, ps_data in data.get("player_stats", {}).items():
-        dynasty.player_stats[name] = PlayerCareerStats(**ps_data)
-
-    # Coaching staffs
-    if data.get("coaching_staffs"):
-        try:
-            from engine.coaching import CoachCard
-            for team_name, staff_data in data["coaching_staffs"].items():
-                dynasty._coaching_staffs[team_name] = {
-                    role: CoachCard.from_dict(card_data)
-                    for role, card_data in staff_data.items()
-                }
-        except Exception:
-            pass
 
     # Coach season_records int keys
     if dynasty.coach.season_records:
@@ -1462,16 +2663,88 @@ def deserialize_dynasty(data: dict):
 
     dynasty.custom_programs = list(data.get("custom_programs", []) or [])
     dynasty.retired_programs = list(data.get("retired_programs", []) or [])
+    return dynasty
 
-    # Career tracker (alumni / hall-of-fame data)
-    if data.get("career_tracker"):
-        from engine.player_career_tracker import PlayerCareerTracker, PlayerCareerRecord
-        tracker = PlayerCareerTracker()
-        for key, record_data in data["career_tracker"].items():
-            tracker.careers[key] = PlayerCareerRecord.from_dict(record_data)
-        dynasty.career_tracker = tracker
 
-    return dynasty
+def _restore_dynasty_staffs(dynasty, data: dict):
+    staffs = {}
+    if data.get("coaching_staffs"):
+        try:
+            from engine.coaching import CoachCard
+            for team_name, staff_data in data["coaching_staffs"].items():
+                staffs[team_name] = {
+                    role: CoachCard.from_dict(card_data)
+                    for role, card_data in staff_data.items()
+                }
+        except Exception:
+            pass
+    dynasty._coaching_staffs = staffs
+
+
+def _restore_dynasty_histories(dynasty, data: dict):
+    from engine.dynasty import TeamHistory, RecordBook, PlayerCareerStats
+
+    # Team histories
+    histories = {}
+    for name, h_data in data.get("team_histories", {}).items():
+        # Convert string year keys back to int in season_records
+        if "season_records" in h_data:
+            h_data["season_records"] = {int(k): v for k, v in h_data["season_records"].items()}
+        histories[name] = TeamHistory(**h_data)
+    dynasty.team_histories = histories
+
+    # Record book
+    dynasty.record_book = RecordBook(**data["record_book"]) if "record_book" in data else RecordBook()
+    dynasty.rivalry_ledger = data.get("rivalry_ledger", {})
+
+    # Player career stats
+    dynasty.player_stats = {
+        name: PlayerCareerStats(**ps_data) for name, ps_data in data.get("player_stats", {}).items()
+    }
+    dynasty.coaching_history = {int(k): v for k, v in data.get("coaching_history", {}).items()}
+
+
+def _restore_dynasty_awards(dynasty, data: dict):
+    from engine.dynasty import SeasonAwards
+
+    dynasty.awards_history = {
+        int(year_str): SeasonAwards(**a_data)
+        for year_str, a_data in data.get("awards_history", {}).items()
+    }
+    dynasty.honors_history = {int(k): v for k, v in data.get("honors_history", {}).items()}
+
+
+def _restore_dynasty_archives(dynasty, data: dict):
+    # Int-keyed history dicts
+    for name in _DYNASTY_ARCHIVES:
+        setattr(dynasty, name, {int(k): v for k, v in data.get(name, {}).items()})
+
+
+def _restore_dynasty_careers(dynasty, data: dict):
+    # Career tracker (alumni / hall-of-fame data)
+    from engine.player_career_tracker import PlayerCareerTracker, PlayerCareerRecord
+    tracker = PlayerCareerTracker()
+    for key, record_data in (data.get("career_tracker") or {}).items():
+        tracker.careers[key] = PlayerCareerRecord.from_dict(record_data)
+    dynasty.career_tracker = tracker
+
+
+# Per-year archives that only grow; int-keyed, stored with str keys.
+_DYNASTY_ARCHIVES = ("recruiting_history", "portal_history", "nil_history",
+                     "development_history", "injury_history")
+
+# Section name → (Dynasty attributes, serialize, restore).  Everything else
+# is core state, restored eagerly on load.
+_DYNASTY_SECTIONS = {
+    "season": (("_coaching_staffs",), _serialize_dynasty_staffs, _restore_dynasty_staffs),
+    "histories": (("team_histories", "record_book", "rivalry_ledger", "player_stats",
+                   "coaching_history"),
+                  _serialize_dynasty_histories, _restore_dynasty_histories),
+    "awards": (("awards_history", "honors_history"),
+               _serialize_dynasty_awards, _restore_dynasty_awards),
+    "archives": (_DYNASTY_ARCHIVES, _serialize_dynasty_archives, _restore_dynasty_archives),
+    "careers": (("career_tracker",), _serialize_dynasty_careers, _restore_dynasty_careers),
+}
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -1479,20 +2752,29 @@ def deserialize_dynasty(data: dict):
 # ═══════════════════════════════════════════════════════════════
 
 def save_dynasty(dynasty, save_key: str = "current", user_id: str = "default"):
-    """Save a dynasty to the database."""
-    data = serialize_dynasty(dynasty)
-    save_blob("dynasty", save_key, data,
-              label=dynasty.dynasty_name, user_id=user_id)
+    """Save a dynasty to the database as a core row plus sections."""
+    save_sectioned_blob("dynasty", save_key, _serialize_dynasty_core(dynasty),
+                        _serialize_sections(dynasty, _DYNASTY_SECTIONS),
+                        label=dynasty.dynasty_name, user_id=user_id)
     _log.info(f"Saved dynasty '{dynasty.dynasty_name}' (key={save_key}) for user={user_id}")
 
 
 def load_dynasty(save_key: str = "current", user_id: str = "default"):
-    """Load a dynasty from the database. Returns the Dynasty or None."""
-    data = load_blob("dynasty", save_key, user_id=user_id)
-    if data is None:
+    """Load a dynasty from the database. Returns the Dynasty or None.
+
+    Only the core is restored up front; histories, awards, archives and
+    the career tracker load on first access.
+    """
+    loaded = load_sectioned_blob("dynasty", save_key, user_id=user_id)
+    if loaded is None:
         return None
+    core, sections = loaded
     try:
-        return deserialize_dynasty(data)
+        if not sections:
+            return deserialize_dynasty(core)  # saved whole, before sections
+        dynasty = _deserialize_dynasty_core(core)
+        _attach_sections(dynasty, _DYNASTY_SECTIONS, sections)
+        return dynasty
     except Exception as e:
         _log.warning(f"Failed to deserialize dynasty: {e}")
         return None
@@ -1512,12 +2794,62 @@ def delete_dynasty(save_key: str, user_id: str = "default"):
 # BOX SCORES — persist full game results for the stats site
 # ═══════════════════════════════════════════════════════════════
 
+# One row per game in the ``box_scores`` table, keyed by session, week and
+# matchup.  Sessions are pruned and deleted by index on session_id rather
+# than by matching save_key strings.  (Older databases kept these as
+# save_type="box_score" rows in ``saves``; init_db moves them across.)
+
 _BOX_SCORE_TYPE = "box_score"
 
+_UPSERT_BOX_SCORE = """
+    INSERT INTO box_scores (user_id, session_id, league, week, home_team, away_team,
+                            data, encoding, created_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(user_id, session_id, week, home_team, away_team)
+    DO UPDATE SET data=excluded.data, encoding=excluded.encoding,
+                  league=excluded.league, updated_at=excluded.updated_at
+"""
+
+
+def _parse_box_key(key: str) -> Optional[tuple[str, int, str, str]]:
+    """Inverse of the legacy ``{session}__w{week}__{away}_at_{home}`` save_key."""
+    session_id, sep, rest = key.partition("__w")
+    week, sep2, matchup = rest.partition("__")
+    away, sep3, home = matchup.partition("_at_")
+    if not (sep and sep2 and sep3) or not week.isdigit():
+        return None
+    return session_id, int(week), home, away
 
-def _box_key(session_id: str, week: int, home_team: str, away_team: str) -> str:
-    """Deterministic save_key for a single box score."""
-    return f"{session_id}__w{week}__{away_team}_at_{home_team}"
+
+def _migrate_legacy_box_scores(conn: sqlite3.Connection, batch_size: int = 500) -> int:
+    """Move save_type="box_score" rows from ``saves`` into ``box_scores``."""
+    moved = 0
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            "SELECT id, user_id, save_key, data, encoding, created_at, updated_at "
+            "FROM saves WHERE save_type=? AND id > ? ORDER BY id LIMIT ?",
+            (_BOX_SCORE_TYPE, last_id, batch_size),
+        ).fetchall()
+        if not rows:
+            break
+        last_id = rows[-1]["id"]
+        batch, ids = [], []
+        for r in rows:
+            parsed = _parse_box_key(r["save_key"])
+            if parsed is None:
+                _log.warning(f"Leaving unparseable box score key {r['save_key']!r} in saves")
+                continue
+            session_id, week, home, away = parsed
+            batch.append((r["user_id"], session_id, "college", week, home, away,
+                          r["data"], r["encoding"], r["created_at"], r["updated_at"]))
+            ids.append((r["id"],))
+        conn.executemany(_UPSERT_BOX_SCORE, batch)
+        conn.executemany("DELETE FROM saves WHERE id=?", ids)
+        moved += len(ids)
+    if moved:
+        _log.info(f"Moved {moved} box scores into the box_scores table")
+    return moved
 
 
 def save_box_score(
@@ -1527,11 +2859,18 @@ def save_box_score(
     away_team: str,
     full_result: dict,
     user_id: str = "default",
+    league: str = "college",
 ):
     """Persist a single game's full_result to the database."""
-    key = _box_key(session_id, week, home_team, away_team)
-    label = f"W{week} {away_team} @ {home_team}"
-    save_blob(_BOX_SCORE_TYPE, key, full_result, label=label, user_id=user_id)
+    now = time.time()
+    blob, encoding = _encode_blob(full_result)
+    conn = _connect()
+    try:
+        conn.execute(_UPSERT_BOX_SCORE, (user_id, session_id, league, week, home_team,
+                                         away_team, blob, encoding, now, now))
+        conn.commit()
+    finally:
+        conn.close()
 
 
 def load_box_score(
@@ -1542,8 +2881,18 @@ def load_box_score(
     user_id: str = "default",
 ) -> Optional[dict]:
     """Load a single box score from the database. Returns None if not found."""
-    key = _box_key(session_id, week, home_team, away_team)
-    return load_blob(_BOX_SCORE_TYPE, key, user_id=user_id)
+    conn = _connect()
+    try:
+        row = conn.execute(
+            "SELECT data, encoding FROM box_scores "
+            "WHERE user_id=? AND session_id=? AND week=? AND home_team=? AND away_team=?",
+            (user_id, session_id, week, home_team, away_team),
+        ).fetchone()
+        if row is None:
+            return None
+        return _decode_blob(row["data"], row["encoding"])
+    finally:
+        conn.close()
 
 
 def delete_box_scores_for_session(session_id: str, user_id: str = "default"):
@@ -1551,8 +2900,8 @@ def delete_box_scores_for_session(session_id: str, user_id: str = "default"):
     conn = _connect()
     try:
         conn.execute(
-            "DELETE FROM saves WHERE user_id=? AND save_type=? AND save_key LIKE ?",
-            (user_id, _BOX_SCORE_TYPE, f"{session_id}__%"),
+            "DELETE FROM box_scores WHERE user_id=? AND session_id=?",
+            (user_id, session_id),
         )
         conn.commit()
     finally:
@@ -1560,32 +2909,29 @@ def delete_box_scores_for_session(session_id: str, user_id: str = "default"):
 
 
 def prune_orphan_box_scores(active_session_ids, user_id: str = "default") -> int:
-    """Delete box_score rows whose session_id isn't in active_session_ids.
+    """Delete box_scores rows whose session_id isn't in active_session_ids.
 
     Box scores survive in the DB until their session is explicitly deleted
     or evicted, so abandoned sessions accumulate stale rows that downstream
     consumers (the vroomtv hub) surface as ghost college leagues. Run after
     create_session and before /export/db to keep the snapshot honest.
+    Spilled college sessions (SESSION SPILL) count as live.
     """
-    active = set(active_session_ids)
+    live = set(active_session_ids)
+    live.update(row["session_key"] for row in list_spilled_sessions("college", user_id=user_id))
     conn = _connect()
     try:
-        rows = conn.execute(
-            "SELECT save_key FROM saves WHERE user_id=? AND save_type=?",
-            (user_id, _BOX_SCORE_TYPE),
-        ).fetchall()
-        stale = []
-        for (key,) in rows:
-            sid = key.split("__w", 1)[0]
-            if sid not in active:
-                stale.append(key)
-        if stale:
-            conn.executemany(
-                "DELETE FROM saves WHERE user_id=? AND save_type=? AND save_key=?",
-                [(user_id, _BOX_SCORE_TYPE, k) for k in stale],
-            )
-            conn.commit()
-        return len(stale)
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS live_sessions (session_id TEXT PRIMARY KEY)")
+        conn.executemany("INSERT OR IGNORE INTO live_sessions VALUES (?)",
+                         [(sid,) for sid in live])
+        deleted = conn.execute(
+            "DELETE FROM box_scores WHERE user_id=? "
+            "AND session_id NOT IN (SELECT session_id FROM live_sessions)",
+            (user_id,),
+        ).rowcount
+        conn.execute("DROP TABLE temp.live_sessions")
+        conn.commit()
+        return deleted
     finally:
         conn.close()
 
@@ -1594,6 +2940,7 @@ def save_box_scores_bulk(
     session_id: str,
     games: list,
     user_id: str = "default",
+    league: str = "college",
 ):
     """Save box scores for a list of completed Game objects in one transaction."""
     now = time.time()
@@ -1604,26 +2951,161 @@ def save_box_scores_bulk(
             fr = getattr(game, "full_result", None)
             if not fr or not getattr(game, "completed", False):
                 continue
-            key = _box_key(session_id, game.week, game.home_team, game.away_team)
-            label = f"W{game.week} {game.away_team} @ {game.home_team}"
-            blob = json.dumps(fr, default=str)
-            rows.append((user_id, _BOX_SCORE_TYPE, key, label, blob, now, now))
+            blob, encoding = _encode_blob(fr)
+            rows.append((user_id, session_id, league, game.week, game.home_team,
+                         game.away_team, blob, encoding, now, now))
         if rows:
-            conn.executemany(
-                """
-                INSERT INTO saves (user_id, save_type, save_key, label, data, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(user_id, save_type, save_key)
-                DO UPDATE SET data=excluded.data, label=excluded.label, updated_at=excluded.updated_at
-                """,
-                rows,
-            )
+            conn.executemany(_UPSERT_BOX_SCORE, rows)
             conn.commit()
             _log.debug(f"Bulk-saved {len(rows)} box scores for session {session_id}")
     finally:
         conn.close()
 
 
+# ═══════════════════════════════════════════════════════════════
+# SESSION SPILL — evicted in-memory sessions, parked until next access
+# ═══════════════════════════════════════════════════════════════
+
+# The API evicts idle sessions (session cap, TTL, memory budget) and parks
+# them here as opaque payloads; the next request for the session loads the
+# row, rehydrates it and only then deletes it.  Payloads are pickles of
+# live process state, not saves, so they live in their own database file
+# beside the saves DB (``spill_db_path()``): /export/db snapshots,
+# changeset sync and the hub never see them, and a restore from the hub
+# starts with none.  Old ones are pruned.  ``meta`` is a small JSON
+# summary for listings that shouldn't load the payload.
+
+SESSION_SPILL_MAX_AGE = 7 * 86400
+
+
+def spill_db_path() -> Path:
+    """The spill store for the current DB path (viperball.db → viperball.spill.db)."""
+    return _db_path.with_name(f"{_db_path.stem}.spill{_db_path.suffix}")
+
+
+def _spill_connect() -> sqlite3.Connection:
+    # Spills are rare (evictions), so no pool: a connection per call.
+    conn = _open_connection(spill_db_path())
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS session_spill (
+            user_id     TEXT    NOT NULL DEFAULT 'default',
+            kind        TEXT    NOT NULL,
+            session_key TEXT    NOT NULL,
+            meta        TEXT    NOT NULL DEFAULT '{}',
+            data        BLOB    NOT NULL,
+            encoding    TEXT    NOT NULL,
+            spilled_at  REAL    NOT NULL,
+            PRIMARY KEY (user_id, kind, session_key)
+        )
+    """)
+    return conn
+
+
+def _encode_payload(raw: bytes) -> tuple[bytes, str]:
+    codec = _CODECS.get(_blob_codec)
+    return (codec[0](raw), _blob_codec) if codec else (raw, "raw")
+
+
+def _decode_payload(data, encoding: str) -> bytes:
+    if encoding == "raw":
+        return bytes(data)
+    codec = _CODECS.get(encoding)
+    if codec is None:
+        raise ValueError(f"Row stored with unavailable encoding {encoding!r}")
+    return codec[1](data)
+
+
+def spill_session(kind: str, session_key: str, payload: bytes,
+                  meta: Optional[dict] = None, user_id: str = "default"):
+    """Park an evicted session's payload (replacing any earlier spill)."""
+    data, encoding = _encode_payload(payload)
+    conn = _spill_connect()
+    try:
+        conn.execute(
+            "INSERT OR REPLACE INTO session_spill "
+            "(user_id, kind, session_key, meta, data, encoding, spilled_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (user_id, kind, session_key, serialization.dumps(meta or {}),
+             data, encoding, time.time()),
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def load_spilled_session(kind: str, session_key: str,
+                         user_id: str = "default") -> Optional[bytes]:
+    """A spilled session's payload, or None.
+
+    The row stays until the caller has rehydrated the payload and calls
+    ``delete_spilled_session``, so a payload that fails to load is not lost.
+    """
+    conn = _spill_connect()
+    try:
+        row = conn.execute(
+            "SELECT data, encoding FROM session_spill "
+            "WHERE user_id=? AND kind=? AND session_key=?",
+            (user_id, kind, session_key),
+        ).fetchone()
+        return None if row is None else _decode_payload(row["data"], row["encoding"])
+    finally:
+        conn.close()
+
+
+def list_spilled_sessions(kind: str, user_id: str = "default") -> list[dict]:
+    """``[{"session_key", "spilled_at", "meta"}]`` for one kind, newest first."""
+    conn = _spill_connect()
+    try:
+        rows = conn.execute(
+            "SELECT session_key, meta, spilled_at FROM session_spill "
+            "WHERE user_id=? AND kind=? ORDER BY spilled_at DESC",
+            (user_id, kind),
+        ).fetchall()
+        return [{"session_key": r["session_key"], "spilled_at": r["spilled_at"],
+                 "meta": serialization.loads(r["meta"])} for r in rows]
+    finally:
+        conn.close()
+
+
+def delete_spilled_session(kind: str, session_key: str, user_id: str = "default") -> bool:
+    conn = _spill_connect()
+    try:
+        deleted = conn.execute(
+            "DELETE FROM session_spill WHERE user_id=? AND kind=? AND session_key=?",
+            (user_id, kind, session_key),
+        ).rowcount
+        conn.commit()
+        return deleted > 0
+    finally:
+        conn.close()
+
+
+def prune_spilled_sessions(max_age: float = SESSION_SPILL_MAX_AGE) -> int:
+    """Drop spills older than ``max_age`` seconds; their box scores become
+    orphans for prune_orphan_box_scores."""
+    conn = _spill_connect()
+    try:
+        deleted = conn.execute(
+            "DELETE FROM session_spill WHERE spilled_at < ?", (time.time() - max_age,)
+        ).rowcount
+        conn.commit()
+        return deleted
+    finally:
+        conn.close()
+
+
+def clear_spilled_sessions() -> int:
+    """Drop every spill, e.g. once the saves DB was replaced by a restore
+    and the spilled sessions' box scores are gone with it."""
+    conn = _spill_connect()
+    try:
+        deleted = conn.execute("DELETE FROM session_spill").rowcount
+        conn.commit()
+        return deleted
+    finally:
+        conn.close()
+
+
 # ═══════════════════════════════════════════════════════════════
 # COMMISSIONER MODE PERSISTENCE
 # ═══════════════════════════════════════════════════════════════
@@ -19,7 +19,7 @@ from collections import defaultdict
 
 from engine.season import (
     Season, TeamRecord, Game, load_teams_from_directory, create_season,
-    is_buy_game, BUY_GAME_NIL_BONUS, fast_sim_season,
+    is_buy_game, BUY_GAME_NIL_BONUS, fast_sim_season, _team_avg_overall,
 )
 from engine.awards import SeasonHonors, compute_season_awards
 from engine.injuries import InjuryTracker
@@ -27,6 +27,7 @@ from engine.development import apply_team_development, apply_redshirt_decisions,
 from engine.ai_coach import auto_assign_all_teams
 from engine.player_card import PlayerCard, player_to_card
 from engine.player_career_tracker import PlayerCareerTracker
+from engine.lazy_sections import LazySections
 from engine.recruiting import (
     generate_recruit_class,
     RecruitingBoard,
@@ -256,7 +257,7 @@ class RecordBook:
 # ========================================
 
 @dataclass
-class Dynasty:
+class Dynasty(LazySections):
     """Complete dynasty mode with multi-season tracking"""
     dynasty_name: str
     coach: Coach
@@ -2099,7 +2100,26 @@ class Dynasty:
         original_year = self.current_year
         history_start = original_year - num_years
 
-        rng = random.Random(hash(f"history_{self.dynasty_name}") % 999999)
+        seed = hash(f"history_{self.dynasty_name}") % 999999
+
+        try:
+            from engine.history_sim import simulate_history_arrays
+        except ImportError:
+            simulate_history_arrays = None
+        if simulate_history_arrays is not None and num_years > 0:
+            ratings = {name: _team_avg_overall(t) for name, t in all_teams.items()}
+            arrays = simulate_history_arrays(
+                list(all_teams.keys()), ratings, conf_dict,
+                list(range(history_start, original_year)),
+                games_per_team=games_per_team, playoff_size=playoff_size, seed=seed,
+            )
+            self._apply_history_arrays(arrays)
+            if progress_callback:
+                progress_callback(num_years, num_years)
+            self.current_year = original_year
+            return
+
+        rng = random.Random(seed)
 
         for i, year in enumerate(range(history_start, original_year)):
             result = fast_sim_season(
@@ -2164,6 +2184,69 @@ class Dynasty:
 
         self.current_year = original_year
 
+    def _apply_history_arrays(self, arrays) -> None:
+        """Write a vectorized history run into team_histories in bulk.
+
+        Totals come from column sums over all years; only the per-year
+        season_records dicts and milestone year lists are built per team.
+        """
+        years = arrays.years
+        total_wins = arrays.wins.sum(axis=0)
+        total_losses = arrays.losses.sum(axis=0)
+        total_pf = arrays.points_for.sum(axis=0)
+        total_pa = arrays.points_against.sum(axis=0)
+        total_playoffs = arrays.playoff.sum(axis=0)
+        best_idx = arrays.wins.argmax(axis=0)  # first year with the max
+
+        finals = {int(t): [] for t in set(arrays.runner_up.tolist())}
+        for y, t in enumerate(arrays.runner_up.tolist()):
+            if t >= 0:
+                finals[t].append(years[y])
+        titles: Dict[int, List[int]] = {}
+        for y, t in enumerate(arrays.champion.tolist()):
+            titles.setdefault(t, []).append(years[y])
+        semis: Dict[int, List[int]] = {}
+        for y, row in enumerate(arrays.final_four[:, 2:].tolist()):
+            for t in row:
+                if t >= 0:
+                    semis.setdefault(t, []).append(years[y])
+
+        for t, team_name in enumerate(arrays.team_names):
+            history = self.team_histories.get(team_name)
+            if history is None:
+                continue
+            wins_col = arrays.wins[:, t].tolist()
+            losses_col = arrays.losses[:, t].tolist()
+            pf_col = arrays.points_for[:, t].tolist()
+            pa_col = arrays.points_against[:, t].tolist()
+
+            history.total_wins += int(total_wins[t])
+            history.total_losses += int(total_losses[t])
+            history.total_points_for += float(total_pf[t])
+            history.total_points_against += float(total_pa[t])
+            history.total_playoff_appearances += int(total_playoffs[t])
+            for y, year in enumerate(years):
+                history.season_records[year] = {
+                    "wins": wins_col[y],
+                    "losses": losses_col[y],
+                    "points_for": round(pf_col[y], 1),
+                    "points_against": round(pa_col[y], 1),
+                }
+
+            best = int(best_idx[t])
+            if wins_col[best] > history.best_season_wins:
+                history.best_season_wins = wins_col[best]
+                history.best_season_year = years[best]
+
+            champ_years = titles.get(t, [])
+            history.total_championships += len(champ_years)
+            history.championship_years.extend(champ_years)
+            history.finalist_years.extend(finals.get(t, []))
+            history.final_four_years.extend(semis.get(t, []))
+            history.conference_title_years.extend(
+                years[y] for y in arrays.conf_champ[:, t].nonzero()[0]
+            )
+
     def get_team_history(self, team_name: str) -> Optional[TeamHistory]:
         """Get historical record for a team"""
         return self.team_histories.get(team_name)
@@ -257,6 +257,30 @@ def _generate_scoring_events(total_points: float, team, opp_def_str: float,
     }
 
 
+# Share of regulation scoring that lands in each quarter (end-of-half
+# urgency makes Q2 and Q4 a little busier).
+QUARTER_SCORING_WEIGHTS = (0.23, 0.27, 0.23, 0.27)
+
+
+def _generate_quarter_scores(scoring: Dict, overtime_td: bool,
+                             rng: random.Random) -> List[float]:
+    """Spread a side's scoring events over Q1-Q4.
+
+    The overtime tiebreaker TD, if this side got it, stays out of the
+    quarters — same convention as the full engine's ``quarter_scores``.
+    """
+    events = ([SCORING["td"]] * (scoring["touchdowns"] - (1 if overtime_td else 0))
+              + [SCORING["dk"]] * scoring["dk_made"]
+              + [SCORING["pk"]] * scoring["pk_made"]
+              + [SCORING["safety"]] * scoring["safeties"]
+              + [SCORING["rouge"]] * (scoring["rouges"] + scoring["pindowns"] + scoring["bells"]))
+    quarters = [0.0, 0.0, 0.0, 0.0]
+    if events:
+        for pts, q in zip(events, rng.choices(range(4), weights=QUARTER_SCORING_WEIGHTS, k=len(events))):
+            quarters[q] += pts
+    return quarters
+
+
 def _generate_dye_data(total_yards: int, total_plays: int,
                        scoring: Dict, rng: random.Random) -> Dict:
     """Generate plausible DYE (Delta Yards Efficiency) data for fast sim."""
@@ -983,7 +1007,8 @@ def fast_sim_game(home_team, away_team,
 
     Returns a result dict compatible with the full engine's output,
     suitable for standings updates, metrics calculation, and UI display.
-    Play-by-play and drive logs are empty (fast-sim marker).
+    Play-by-play and drive logs are empty (fast-sim marker); per-quarter
+    points are synthesized from the scoring events.
 
     Args:
         home_team: Team object for home side
@@ -1035,6 +1060,7 @@ def fast_sim_game(home_team, away_team,
     home_scoring = _generate_scoring_events(home_expected, home_team, away_def, rng)
     away_scoring = _generate_scoring_events(away_expected, away_team, home_def, rng)
 
+    overtime_side = None
     if home_scoring["score"] == away_scoring["score"]:
         # Overtime tiebreaker: award a TD (9 pts) to the winner.
         # In fast-sim, overtime is abstracted — the better team has
@@ -1043,9 +1069,11 @@ def fast_sim_game(home_team, away_team,
         if rng.random() < home_edge:
             home_scoring["score"] += SCORING["td"]
             home_scoring["touchdowns"] += 1
+            overtime_side = "home"
         else:
             away_scoring["score"] += SCORING["td"]
             away_scoring["touchdowns"] += 1
+            overtime_side = "away"
 
     home_stats = _generate_team_stats(home_scoring, home_team, away_def, rng)
     away_stats = _generate_team_stats(away_scoring, away_team, home_def, rng)
@@ -1058,6 +1086,13 @@ def fast_sim_game(home_team, away_team,
     home_metrics = _generate_synthetic_metrics(home_stats, home_scoring, home_str, rng)
     away_metrics = _generate_synthetic_metrics(away_stats, away_scoring, away_str, rng)
 
+    # Drawn after everything else so the quarter splits never shift the
+    # seed's other stats.
+    quarter_scores = {
+        "home": _generate_quarter_scores(home_scoring, overtime_side == "home", rng),
+        "away": _generate_quarter_scores(away_scoring, overtime_side == "away", rng),
+    }
+
     result = {
         "final_score": {
             "home": {
@@ -1090,6 +1125,7 @@ def fast_sim_game(home_team, away_team,
             "home": home_player_stats,
             "away": away_player_stats,
         },
+        "quarter_scores": quarter_scores,
         "drive_summary": [],
         "play_by_play": [],
         "in_game_injuries": [],
@@ -356,12 +356,12 @@ class MatchResult:
 
 
 def _slim_result(result: dict) -> dict:
-    """Keep scores, stats, player_stats, drives, and play-by-play."""
+    """Keep scores, stats, player_stats, quarter lines, drives, and play-by-play."""
     slim: dict = {}
     for key in ("final_score", "stats", "player_stats", "weather",
                 "home_team_name", "away_team_name",
                 "home_team_abbrev", "away_team_abbrev",
-                "drive_summary", "play_by_play",
+                "quarter_scores", "drive_summary", "play_by_play",
                 "in_game_injuries"):
         if key in result:
             slim[key] = result[key]
@@ -1969,20 +1969,27 @@ def create_fiv_cycle(
     return cycle
 
 
-def run_continental_phase(cycle: FIVCycle, rng: Optional[random.Random] = None) -> FIVCycle:
-    """Run all 5 continental championships."""
+def run_continental_phase(cycle: FIVCycle, rng: Optional[random.Random] = None,
+                          progress_callback=None) -> FIVCycle:
+    """Run all 5 continental championships.
+
+    progress_callback: optional callable(done, total) after each championship.
+    """
     if rng is None:
         rng = random.Random()
 
     cycle.phase = "continental"
 
-    for conf_id, cc in cycle.confederations_data.items():
+    total = len(cycle.confederations_data)
+    for i, cc in enumerate(cycle.confederations_data.values()):
         run_continental_championship(
             cc,
             cycle.national_teams,
             cycle.rankings,
             rng=rng,
         )
+        if progress_callback:
+            progress_callback(i + 1, total)
 
     return cycle
 
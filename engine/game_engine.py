@@ -13551,7 +13551,8 @@ class ViperballEngine:
         from .viperball_metrics import (
             calculate_comprehensive_rating,
             calculate_overall_performance_index,
-            calculate_fpv
+            calculate_fpv,
+            quarter_points,
         )
 
         play_dicts = []
@@ -13626,9 +13627,13 @@ class ViperballEngine:
                     assist_player.game_vpa += assist_share  # legacy alias
                     assist_player.game_plays_involved += 1
 
+        # Per-quarter points, recorded once here so rankings and season
+        # totals never re-walk the play-by-play.
+        quarter_scores = quarter_points(play_dicts)
+
         # VIPERBALL ANALYTICS (fan-friendly metrics)
-        home_metrics = calculate_comprehensive_rating(play_dicts, self.drive_log, "home", home_stats)
-        away_metrics = calculate_comprehensive_rating(play_dicts, self.drive_log, "away", away_stats)
+        home_metrics = calculate_comprehensive_rating(play_dicts, self.drive_log, "home", home_stats, quarter_scores)
+        away_metrics = calculate_comprehensive_rating(play_dicts, self.drive_log, "away", away_stats, quarter_scores)
         home_team_rating = calculate_overall_performance_index(home_metrics)
         away_team_rating = calculate_overall_performance_index(away_metrics)
 
@@ -13773,6 +13778,7 @@ class ViperballEngine:
                 "home": home_player_stats,
                 "away": away_player_stats,
             },
+            "quarter_scores": quarter_scores,
             "drive_summary": self.drive_log,
             "play_by_play": play_dicts,
             "in_game_injuries": [
@@ -0,0 +1,82 @@
+"""
+Lazy Sections
+=============
+
+Mixin for state objects restored from sectioned saves (see SECTIONED
+SAVES in engine/db.py).  A large section of a save — a dynasty's team
+histories, its award archives — is attached unloaded and only decoded
+when one of its attributes is first read, so opening a save costs the
+core state plus whatever the caller actually touches.
+
+Only attributes with no class-level default can be deferred: attribute
+lookup finds a class attribute before ``__getattr__`` is consulted, so
+``attach_section`` loads such sections immediately.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Callable, Iterable, Optional
+
+# One lock for every object: loads are rare (once per section per object)
+# and may touch other sections of the same object, hence re-entrant.
+_LOAD_LOCK = threading.RLock()
+
+
+class LazySections:
+    """Defers restoring groups of attributes until first access."""
+
+    def attach_section(self, name: str, attrs: Iterable[str],
+                       loader: Callable[[object], None], token: Optional[str] = None):
+        """Register ``loader`` to set ``attrs`` on first access to any of them.
+
+        ``token`` identifies the stored content (the section's digest) and
+        is handed back by ``pending_section`` while the section is unloaded,
+        so a save can reuse it instead of re-serializing unchanged data.
+        """
+        attrs = tuple(attrs)
+        if any(hasattr(type(self), a) for a in attrs):
+            loader(self)
+            return
+        for a in attrs:
+            self.__dict__.pop(a, None)
+        self.__dict__.setdefault("_lazy_sections", {})[name] = (attrs, loader, token)
+
+    def pending_section(self, name: str) -> Optional[str]:
+        """The token of section ``name`` if it has not been loaded yet."""
+        entry = self.__dict__.get("_lazy_sections", {}).get(name)
+        return None if entry is None else entry[2]
+
+    def load_sections(self):
+        """Load every pending section."""
+        with _LOAD_LOCK:
+            pending = self.__dict__.get("_lazy_sections", {})
+            while pending:
+                name = next(iter(pending))
+                self._load_section(name)
+
+    def _load_section(self, name: str):
+        attrs, loader, _ = self.__dict__["_lazy_sections"][name]
+        loader(self)
+        missing = [a for a in attrs if a not in self.__dict__]
+        del self.__dict__["_lazy_sections"][name]
+        if missing:
+            raise AttributeError(f"Section {name!r} did not restore {', '.join(missing)}")
+
+    def __getattr__(self, attr: str):
+        if not attr.startswith("__"):
+            with _LOAD_LOCK:
+                if attr in self.__dict__:  # another thread loaded it meanwhile
+                    return self.__dict__[attr]
+                for name, (attrs, _, _) in list(self.__dict__.get("_lazy_sections", {}).items()):
+                    if attr in attrs:
+                        self._load_section(name)
+                        return self.__dict__[attr]
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {attr!r}")
+
+    def __getstate__(self):
+        # Copies and pickles carry fully loaded state, never the loaders.
+        self.load_sections()
+        state = dict(self.__dict__)
+        state.pop("_lazy_sections", None)
+        return state
@@ -147,9 +147,16 @@ class PlayerCareerRecord:
 class PlayerCareerTracker:
     """Tracks careers for all players across CVL, WVL, and FIV."""
 
+    # Bumped by every recording method; pages that show career data key on it.
+    mutation_version: int = 0
+
     def __init__(self):
         self.careers: Dict[str, PlayerCareerRecord] = {}
 
+    def mark_mutated(self):
+        """Record a state change; invalidates anything keyed on mutation_version."""
+        self.mutation_version += 1
+
     def _key(self, name: str) -> str:
         """Normalize player name for lookup."""
         return name.strip().lower()
@@ -168,6 +175,7 @@ class PlayerCareerTracker:
 
     def ingest_cvl_graduates(self, graduate_pool: list, year: int):
         """Import CVL graduates from the bridge DB export into career records."""
+        self.mark_mutated()
         for grad in graduate_pool:
             name = f"{grad.get('first_name', '')} {grad.get('last_name', '')}".strip()
             if not name:
@@ -218,6 +226,7 @@ class PlayerCareerTracker:
             year: season year
             team_names: optional team_key -> display name mapping
         """
+        self.mark_mutated()
         names = team_names or {}
         for team_key, cards in team_rosters.items():
             tier = tier_assignments.get(team_key, 0)
@@ -279,6 +288,7 @@ class PlayerCareerTracker:
             player_stats: player_name -> {nation, caps, games, yards, tds, competition...}
             year: cycle year
         """
+        self.mark_mutated()
         for pname, stats in player_stats.items():
             record = self.get_or_create(pname)
             record.national_team = stats.get("nation", record.national_team)
@@ -301,6 +311,7 @@ class PlayerCareerTracker:
         """Mark a player as retired."""
         key = self._key(player_name)
         if key in self.careers:
+            self.mark_mutated()
             self.careers[key].career_status = "retired"
             self.careers[key].retirement_year = year
 
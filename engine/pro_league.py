@@ -501,6 +501,10 @@ class Matchup:
 
 class ProLeagueSeason:
 
+    # Bumped by mark_mutated() on every state change.  A class attribute so
+    # seasons built via __new__ (WVL tiers, saved-season loads) start at 0.
+    mutation_version: int = 0
+
     def __init__(self, config: ProLeagueConfig):
         self.config = config
         self.teams: Dict[str, Team] = {}
@@ -726,6 +730,7 @@ class ProLeagueSeason:
             g["matchup_key"]: g for g in week_results
         }
         self.current_week += 1
+        self.mark_mutated()
 
         return {
             "week": self.current_week,
@@ -741,11 +746,22 @@ class ProLeagueSeason:
             } for g in week_results],
         }
 
-    def sim_all(self, use_fast_sim: bool = True) -> dict:
+    def mark_mutated(self):
+        """Record a state change; invalidates anything keyed on mutation_version."""
+        self.mutation_version += 1
+
+    def sim_all(self, use_fast_sim: bool = True, progress_callback=None) -> dict:
+        """Sim the rest of the regular season.
+
+        progress_callback: optional callable(weeks_done, total) called after each week.
+        """
         results = []
+        total = max(0, self.total_weeks - self.current_week)
         while self.current_week < self.total_weeks:
             week_result = self.sim_week(use_fast_sim=use_fast_sim)
             results.append(week_result)
+            if progress_callback:
+                progress_callback(len(results), total)
         return {"weeks_simulated": len(results), "results": results}
 
     def get_standings(self) -> dict:
@@ -821,6 +837,7 @@ class ProLeagueSeason:
             "away_stats": stats_data.get("away", {}),
             "home_player_stats": player_stats_data.get("home", []),
             "away_player_stats": player_stats_data.get("away", []),
+            "quarter_scores": result.get("quarter_scores"),
             "drive_summary": result.get("drive_summary", []),
             "play_by_play": result.get("play_by_play", []),
             "modifier_stack": result.get("modifier_stack", {}),
@@ -1264,6 +1281,7 @@ class ProLeagueSeason:
             "bye_teams": bye_teams,
             "completed": False,
         }]
+        self.mark_mutated()
 
         return self.get_playoff_bracket()
 
@@ -1295,6 +1313,7 @@ class ProLeagueSeason:
                             "full_result": result,
                         }
             current_round["completed"] = True
+            self.mark_mutated()
 
         winners = []
         for m in current_round["matchups"]:
@@ -1319,6 +1338,7 @@ class ProLeagueSeason:
         if len(advancing) <= 1:
             if advancing:
                 self.champion = advancing[0]["team_key"]
+                self.mark_mutated()
             return self.get_playoff_bracket()
 
         advancing.sort(key=lambda t: (-t.get("wins", 0), t.get("seed", 99)))
@@ -1346,6 +1366,7 @@ class ProLeagueSeason:
             "bye_teams": [],
             "completed": False,
         })
+        self.mark_mutated()
 
         return self.get_playoff_bracket()
 
@@ -87,6 +87,9 @@ from __future__ import annotations
 
 import math
 import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple
 
@@ -227,6 +230,285 @@ class ConferenceRanking:
     method_avg_team_ranks: Dict[str, float] = field(default_factory=dict)
 
 
+# ---------------------------------------------------------------------------
+# Linear-algebra backend
+# ---------------------------------------------------------------------------
+#
+# The matrix and graph methods (Colley, Massey, Sagarin, Keener, O-D, Markov
+# walker, PageRank, LRMC, Park-Newman) were written against plain lists so
+# the module has no hard numpy dependency; every one of them is O(n²) Python
+# per sweep and runs up to 200-300 sweeps.  When numpy is importable the
+# same systems are built once from the game list as index arrays and either
+# solved directly (Colley, Massey) or iterated as matrix-vector products
+# with the original convergence rules.  Dense matrices are fine here: even
+# 500 teams is a 250k-entry system.
+
+try:
+    import numpy as _np
+except ImportError:  # pure-Python solvers below remain the fallback
+    _np = None
+
+LINALG_BACKENDS = ("numpy", "python")
+_linalg_backend = "numpy" if _np is not None else "python"
+
+
+def get_linalg_backend() -> str:
+    """Active solver backend: "numpy" or "python"."""
+    return _linalg_backend
+
+
+def set_linalg_backend(name: str) -> str:
+    """Select the solver backend; returns the previous one."""
+    global _linalg_backend
+    if name not in LINALG_BACKENDS:
+        raise ValueError(f"Unknown linalg backend {name!r}; expected one of {LINALG_BACKENDS}")
+    if name == "numpy" and _np is None:
+        raise ImportError("numpy is not installed")
+    previous, _linalg_backend = _linalg_backend, name
+    return previous
+
+
+def _use_numpy() -> bool:
+    return _linalg_backend == "numpy"
+
+
+@dataclass
+class _GameArrays:
+    """A game list as team-index arrays (teams in first-appearance order)."""
+    teams: List[str]
+    home: "_np.ndarray"
+    away: "_np.ndarray"
+    home_score: "_np.ndarray"
+    away_score: "_np.ndarray"
+
+    @property
+    def n(self) -> int:
+        return len(self.teams)
+
+    def pair_sum(self, home_vals, away_vals=None) -> "_np.ndarray":
+        """n×n matrix with M[h][a] += home_vals and M[a][h] += away_vals."""
+        n = self.n
+        m = _np.zeros((n, n))
+        _np.add.at(m, (self.home, self.away), home_vals)
+        _np.add.at(m, (self.away, self.home), home_vals if away_vals is None else away_vals)
+        return m
+
+    def results(self, values) -> Dict[str, float]:
+        return {t: float(v) for t, v in zip(self.teams, values)}
+
+
+# calculate_composite hands the same list to every method; a few entries
+# cover it plus the filtered list built by calculate_truncated_colley.
+# GameResults are mutable, so an entry is keyed on the games' contents —
+# (home, away, home score, away score) per game — not on the list object:
+# a score corrected in place, or a list reordered or trimmed, misses.
+_GAME_ARRAYS_CACHE: List[Tuple[List[tuple], _GameArrays]] = []
+_GAME_ARRAYS_CACHE_MAX = 4
+
+
+def _game_records(games: List[GameResult]) -> List[tuple]:
+    return [(g.home_team, g.away_team, g.home_score, g.away_score) for g in games]
+
+
+def _game_arrays(games: List[GameResult]) -> _GameArrays:
+    records = _game_records(games)
+    for cached, arrays in _GAME_ARRAYS_CACHE:
+        if cached == records:
+            return arrays
+
+    team_idx: Dict[str, int] = {}
+    home = []
+    away = []
+    for h, a, _, _ in records:
+        home.append(team_idx.setdefault(h, len(team_idx)))
+        away.append(team_idx.setdefault(a, len(team_idx)))
+    arrays = _GameArrays(
+        teams=list(team_idx),
+        home=_np.array(home, dtype=_np.int64),
+        away=_np.array(away, dtype=_np.int64),
+        home_score=_np.array([r[2] for r in records], dtype=float),
+        away_score=_np.array([r[3] for r in records], dtype=float),
+    )
+    _GAME_ARRAYS_CACHE.insert(0, (records, arrays))
+    del _GAME_ARRAYS_CACHE[_GAME_ARRAYS_CACHE_MAX:]
+    return arrays
+
+
+def _np_solve(a: "_np.ndarray", b: "_np.ndarray") -> "_np.ndarray":
+    """Direct solve; least-squares if the system is singular (disconnected
+    schedule graph)."""
+    try:
+        return _np.linalg.solve(a, b)
+    except _np.linalg.LinAlgError:
+        return _np.linalg.lstsq(a, b, rcond=None)[0]
+
+
+def _np_power_iteration(m: "_np.ndarray", max_iterations: int) -> "_np.ndarray":
+    """r ← M r normalized to unit sum, until the max change is < 1e-10."""
+    n = m.shape[0]
+    r = _np.full(n, 1.0 / n)
+    for _ in range(max_iterations):
+        new_r = m @ r
+        total = new_r.sum()
+        if total > 0:
+            new_r = new_r / total
+        max_delta = _np.abs(new_r - r).max()
+        r = new_r
+        if max_delta < 1e-10:
+            break
+    return r
+
+
+def _np_link_walk(ga: _GameArrays, src: "_np.ndarray", dst: "_np.ndarray",
+                  damping: float, max_iterations: int) -> "_np.ndarray":
+    """Damped random walk along src→dst links (PageRank / Markov walker).
+
+    Dangling teams (no out-links) spread their mass uniformly.
+    """
+    n = ga.n
+    out_degree = _np.bincount(src, minlength=n).astype(float)
+    link = _np.zeros((n, n))
+    _np.add.at(link, (dst, src), 1.0 / out_degree[src])
+    dangling = out_degree == 0
+    pr = _np.full(n, 1.0 / n)
+    for _ in range(max_iterations):
+        new_pr = (1.0 - damping) / n + damping * (link @ pr + pr[dangling].sum() / n)
+        max_delta = _np.abs(new_pr - pr).max()
+        pr = new_pr
+        if max_delta < 1e-10:
+            break
+    return pr
+
+
+def _colley_numpy(games: List[GameResult]) -> Dict[str, float]:
+    ga = _game_arrays(games)
+    n = ga.n
+    hs, as_ = ga.home_score, ga.away_score
+    c = -ga.pair_sum(1.0)
+    c[_np.diag_indices(n)] = 2.0 - c.sum(axis=1)
+    # wins - losses; ties count for neither side
+    net = _np.zeros(n)
+    sign = _np.sign(hs - as_)
+    _np.add.at(net, ga.home, sign)
+    _np.add.at(net, ga.away, -sign)
+    b = 1.0 + net / 2.0
+    return ga.results(_np_solve(c, b))
+
+
+def _massey_numpy(games: List[GameResult], max_margin: float,
+                  weights: Optional["_np.ndarray"] = None) -> Dict[str, float]:
+    ga = _game_arrays(games)
+    n = ga.n
+    w = _np.ones(len(games)) if weights is None else weights
+    margin = _np.clip(ga.home_score - ga.away_score, -max_margin, max_margin)
+    ata = -ga.pair_sum(w)
+    ata[_np.diag_indices(n)] = -ata.sum(axis=1)
+    atb = _np.zeros(n)
+    _np.add.at(atb, ga.home, w * margin)
+    _np.add.at(atb, ga.away, -w * margin)
+    # Ratings are relative: replace the last equation with sum(r) = 0
+    ata[n - 1, :] = 1.0
+    atb[n - 1] = 0.0
+    return ga.results(_np_solve(ata, atb))
+
+
+def _keener_numpy(games: List[GameResult], max_iterations: int) -> Dict[str, float]:
+    ga = _game_arrays(games)
+    n = ga.n
+    hs, as_ = ga.home_score, ga.away_score
+    a_sum = ga.pair_sum((hs + 1.0) / (hs + as_ + 2.0), (as_ + 1.0) / (hs + as_ + 2.0))
+    a_cnt = ga.pair_sum(1.0)
+    a = _np.where(a_cnt > 0, a_sum / _np.maximum(a_cnt, 1), 0.5 / n)
+    col_sum = a.sum(axis=0)
+    a = _np.where(col_sum > 0, a / _np.where(col_sum > 0, col_sum, 1.0), a)
+    return ga.results(_np_power_iteration(a, max_iterations))
+
+
+def _od_rating_numpy(games: List[GameResult], max_iterations: int) -> Dict[str, float]:
+    ga = _game_arrays(games)
+    n = ga.n
+    floor = 0.01
+    scored = ga.pair_sum(ga.home_score, ga.away_score)
+    allowed = scored.T
+    offense = _np.ones(n)
+    defense = _np.ones(n)
+    for _ in range(max_iterations):
+        new_off = _np.maximum(scored @ (1.0 / _np.maximum(defense, floor)), floor)
+        new_def = _np.maximum(allowed @ (1.0 / _np.maximum(offense, floor)), floor)
+        off_avg = new_off.mean()
+        def_avg = new_def.mean()
+        if off_avg > 0:
+            new_off = new_off / off_avg
+        if def_avg > 0:
+            new_def = new_def / def_avg
+        max_delta = max(_np.abs(new_off - offense).max(), _np.abs(new_def - defense).max())
+        offense = new_off
+        defense = new_def
+        if max_delta < 1e-10:
+            break
+    return ga.results(offense / _np.maximum(defense, floor))
+
+
+def _win_links(ga: _GameArrays) -> Tuple["_np.ndarray", "_np.ndarray"]:
+    """(winner, loser) index arrays for decided games."""
+    home_won = ga.home_score > ga.away_score
+    decided = home_won | (ga.away_score > ga.home_score)
+    winner = _np.where(home_won, ga.home, ga.away)[decided]
+    loser = _np.where(home_won, ga.away, ga.home)[decided]
+    return winner, loser
+
+
+def _pagerank_numpy(games: List[GameResult], max_iterations: int) -> Dict[str, float]:
+    ga = _game_arrays(games)
+    winner, loser = _win_links(ga)
+    return ga.results(_np_link_walk(ga, loser, winner, _PAGERANK_DAMPING, max_iterations))
+
+
+def _markov_walker_numpy(games: List[GameResult], max_iterations: int) -> Dict[str, float]:
+    ga = _game_arrays(games)
+    winner, loser = _win_links(ga)
+    return ga.results(_np_link_walk(ga, winner, loser, _MARKOV_DAMPING, max_iterations))
+
+
+def _lrmc_numpy(games: List[GameResult], max_iterations: int) -> Dict[str, float]:
+    ga = _game_arrays(games)
+    n = ga.n
+    diff = ga.home_score - ga.away_score
+    m_sum = ga.pair_sum(diff, -diff)
+    m_cnt = ga.pair_sum(1.0)
+    played = m_cnt > 0
+    avg_m = _np.where(played, m_sum / _np.maximum(m_cnt, 1), 0.0)
+    t = _np.where(played, 1.0 / (1.0 + _np.exp(avg_m / 10.0)), 0.5 / n)
+    t[_np.diag_indices(n)] = 0.0
+    row_sum = t.sum(axis=1, keepdims=True)
+    t = _np.where(row_sum > 0, t / _np.where(row_sum > 0, row_sum, 1.0), t)
+    return ga.results(_np_power_iteration(t.T, max_iterations))
+
+
+def _park_newman_numpy(games: List[GameResult], max_iterations: int) -> Dict[str, float]:
+    ga = _game_arrays(games)
+    n = ga.n
+    floor = 1e-6
+    games_pair = ga.pair_sum(1.0)
+    _np.fill_diagonal(games_pair, 0.0)
+    winner, _ = _win_links(ga)
+    total_wins = _np.bincount(winner, minlength=n).astype(float)
+    pi = _np.ones(n)
+    for _ in range(max_iterations):
+        denom = (games_pair / _np.maximum(pi[:, None] + pi[None, :], floor)).sum(axis=1)
+        new_pi = _np.full(n, floor)
+        ok = (total_wins > 0) & (denom > 0)
+        new_pi[ok] = total_wins[ok] / denom[ok]
+        avg = new_pi.mean()
+        if avg > 0:
+            new_pi = new_pi / avg
+        max_delta = _np.abs(new_pi - pi).max()
+        pi = new_pi
+        if max_delta < 1e-10:
+            break
+    return ga.results(pi)
+
+
 # ---------------------------------------------------------------------------
 # 1. Elo Ratings
 # ---------------------------------------------------------------------------
@@ -308,6 +590,8 @@ def calculate_colley(games: List[GameResult]) -> Dict[str, float]:
         C[i][j] = -games_between[i][j]  (i != j)
         b[i] = 1 + (wins[i] - losses[i]) / 2
     """
+    if games and _use_numpy():
+        return _colley_numpy(games)
     # Build team index
     teams: List[str] = []
     team_idx: Dict[str, int] = {}
@@ -385,6 +669,8 @@ def calculate_massey(
     For each game: r_home - r_away ≈ truncated(home_score - away_score)
     Solve the overdetermined system A*r = b via normal equations.
     """
+    if games and _use_numpy():
+        return _massey_numpy(games, max_margin)
     teams: List[str] = []
     team_idx: Dict[str, int] = {}
     for g in games:
@@ -528,6 +814,7 @@ def calculate_sor(
     games: List[GameResult],
     elos: Dict[str, float],
     n_simulations: int = 1000,
+    deadline: Optional[float] = None,
 ) -> Dict[str, float]:
     """Strength of Record — probability a top-25 team gets this record or worse.
 
@@ -536,6 +823,8 @@ def calculate_sor(
     record or worse.  Higher SOR = more impressive record.
 
     Uses current Elo ratings to estimate game-by-game win probabilities.
+    Raises ``MethodTimeout`` once ``time.perf_counter()`` passes
+    ``deadline`` (checked between teams).
     """
     # Build schedule for each team
     team_schedules: Dict[str, List[Tuple[str, bool, bool]]] = {}
@@ -573,22 +862,43 @@ def calculate_sor(
 
     sor: Dict[str, float] = {}
     rng = random.Random(42)  # deterministic for reproducibility
+    # numpy's legacy generator is the same Mersenne Twister with the same
+    # 53-bit doubles: seeded from rng's state it draws the identical stream,
+    # a whole team's simulations at a time.
+    np_rng = None
+    if _use_numpy():
+        _, mt_state, _ = rng.getstate()
+        np_rng = _np.random.RandomState()
+        np_rng.set_state(("MT19937", _np.array(mt_state[:624], dtype=_np.uint32),
+                          mt_state[624]))
 
     for team, schedule in team_schedules.items():
+        _check_deadline(deadline)
         actual_wins, actual_losses = team_records.get(team, (0, 0))
         actual_total = actual_wins + actual_losses
         if actual_total == 0:
             sor[team] = 0.5
             continue
 
+        # Win probabilities don't change between simulations
+        p_wins = []
+        for opp, is_home, neutral in schedule:
+            opp_elo = elos.get(opp, _DEFAULT_ELO)
+            hfa = 0 if neutral else (_ELO_HFA if is_home else -_ELO_HFA)
+            p_wins.append(_elo_expected(top25_elo + hfa, opp_elo))
+
+        if np_rng is not None:
+            draws = np_rng.random_sample((n_simulations, len(p_wins)))
+            sim_wins = (draws < _np.array(p_wins)).sum(axis=1)
+            sor[team] = int((sim_wins <= actual_wins).sum()) / n_simulations
+            continue
+
         worse_or_equal = 0
+        rand = rng.random
         for _ in range(n_simulations):
             sim_wins = 0
-            for opp, is_home, neutral in schedule:
-                opp_elo = elos.get(opp, _DEFAULT_ELO)
-                hfa = 0 if neutral else (_ELO_HFA if is_home else -_ELO_HFA)
-                p_win = _elo_expected(top25_elo + hfa, opp_elo)
-                if rng.random() < p_win:
+            for p_win in p_wins:
+                if rand() < p_win:
                     sim_wins += 1
             if sim_wins <= actual_wins:
                 worse_or_equal += 1
@@ -1299,6 +1609,8 @@ def calculate_pagerank(
     Teams beaten by many highly-ranked teams accumulate authority.
     Standard PageRank with damping factor 0.85.
     """
+    if games and _use_numpy():
+        return _pagerank_numpy(games, max_iterations)
     all_teams: set = set()
     # outlinks[loser] = list of winners (teams they lost to)
     outlinks: Dict[str, List[str]] = {}
@@ -1475,6 +1787,8 @@ def calculate_sagarin_recent(
     Game weight = 2^(game_index / total_games), so the last game is
     weighted ~2× the first game.  Captures late-season trajectory.
     """
+    if games and _use_numpy():
+        return _massey_numpy(games, max_margin, weights=2.0 ** (_np.arange(len(games)) / len(games)))
     teams: List[str] = []
     team_idx: Dict[str, int] = {}
     for g in games:
@@ -1625,6 +1939,8 @@ def calculate_keener(
     Reference: James Keener, "The Perron-Frobenius Theorem and the Ranking
     of Football Teams", SIAM Review 35(1), 1993.
     """
+    if games and _use_numpy():
+        return _keener_numpy(games, max_iterations)
     teams: List[str] = []
     team_idx: Dict[str, int] = {}
     for g in games:
@@ -1706,6 +2022,8 @@ def calculate_od_rating(
 
     Reference: Amy Langville & Carl Meyer, "Who's #1?", Princeton, 2012.
     """
+    if games and _use_numpy():
+        return _od_rating_numpy(games, max_iterations)
     teams: List[str] = []
     team_idx: Dict[str, int] = {}
     for g in games:
@@ -1792,6 +2110,8 @@ def calculate_markov_walker(
     A 1-11 team that beat the champion ranks HIGH in PageRank but LOW here.
     An 11-1 team beating mediocre opponents ranks LOW in PageRank but HIGH here.
     """
+    if games and _use_numpy():
+        return _markov_walker_numpy(games, max_iterations)
     all_teams: set = set()
     # outlinks[winner] = list of teams they beat
     outlinks: Dict[str, List[str]] = {}
@@ -1845,12 +2165,27 @@ def calculate_markov_walker(
 def calculate_least_violations(
     games: List[GameResult],
     max_passes: int = 100,
+    time_budget: Optional[float] = 1.0,
+    deadline: Optional[float] = None,
 ) -> Dict[str, float]:
     """Least Violations — find the ordering that minimizes upsets.
 
     An upset (violation) occurs when a lower-ranked team beat a higher-ranked
-    team.  This is NP-hard in general; we use greedy hill-climbing with
-    adjacent-pair swaps starting from a win-percentage ordering.
+    team.  This is NP-hard in general; we use local search starting from a
+    win-percentage ordering:
+
+      1. Greedy hill-climbing with adjacent-pair swaps (the original
+         method).  A swap only changes the pair's own result, so its delta
+         is read straight off the head-to-head table in O(1).
+      2. Insertion moves: lift a team out and re-insert it at the position
+         that removes the most violations, scanning all positions in one
+         O(n) sweep.  Only strict improvements are taken, so the result is
+         never worse than step 1, and the phase stops at ``time_budget``
+         seconds (None = no limit) or after ``max_passes`` passes.
+
+    ``deadline`` is a hard stop for the composite's method timeout: past
+    it (a ``time.perf_counter()`` value) the search raises
+    ``MethodTimeout`` rather than returning.
 
     The only combinatorial optimization method in the composite.
     """
@@ -1868,19 +2203,24 @@ def calculate_least_violations(
 
     wins_count = [0] * n
     games_count = [0] * n
-    # Store results: results[winner_idx][loser_idx] = count
-    h2h_wins = [[0] * n for _ in range(n)]
+    # net[a][b] = (a's wins over b) - (b's wins over a); only non-zero
+    # pairs are stored.  Ranking a above b saves net[a][b] violations
+    # relative to ranking b above a.
+    net: List[Dict[int, int]] = [{} for _ in range(n)]
 
     for g in games:
         hi, ai = team_idx[g.home_team], team_idx[g.away_team]
         games_count[hi] += 1
         games_count[ai] += 1
         if g.home_score > g.away_score:
-            wins_count[hi] += 1
-            h2h_wins[hi][ai] += 1
+            w, l = hi, ai
         elif g.away_score > g.home_score:
-            wins_count[ai] += 1
-            h2h_wins[ai][hi] += 1
+            w, l = ai, hi
+        else:
+            continue
+        wins_count[w] += 1
+        net[w][l] = net[w].get(l, 0) + 1
+        net[l][w] = net[l].get(w, 0) - 1
 
     # Initial ordering by win pct (best first)
     ordering = list(range(n))
@@ -1889,34 +2229,59 @@ def calculate_least_violations(
         reverse=True,
     )
 
-    def count_violations(order: List[int]) -> int:
-        """Count games where a lower-ranked team beat a higher-ranked."""
-        pos = [0] * n
-        for rank, team_i in enumerate(order):
-            pos[team_i] = rank
-        total = 0
-        for w in range(n):
-            for l in range(n):
-                if h2h_wins[w][l] > 0 and pos[w] > pos[l]:
-                    # winner is ranked lower (higher number) than loser
-                    total += h2h_wins[w][l]
-        return total
-
-    # Greedy hill-climbing: swap adjacent pairs if it reduces violations
+    # 1. Adjacent swaps: moving b above a changes violations by net[a][b]
     for _ in range(max_passes):
+        _check_deadline(deadline)
         improved = False
         for i in range(n - 1):
-            # Try swapping ordering[i] and ordering[i+1]
-            ordering[i], ordering[i + 1] = ordering[i + 1], ordering[i]
-            new_v = count_violations(ordering)
-            ordering[i], ordering[i + 1] = ordering[i + 1], ordering[i]
-            old_v = count_violations(ordering)
-            if new_v < old_v:
-                ordering[i], ordering[i + 1] = ordering[i + 1], ordering[i]
+            a, b = ordering[i], ordering[i + 1]
+            if net[a].get(b, 0) < 0:
+                ordering[i], ordering[i + 1] = b, a
                 improved = True
         if not improved:
             break
 
+    # 2. Insertion moves under the time budget
+    budget_end = None if time_budget is None else time.perf_counter() + time_budget
+    pos = [0] * n
+    for rank, t in enumerate(ordering):
+        pos[t] = rank
+
+    for _ in range(max_passes):
+        improved = False
+        for t in list(ordering):
+            row = net[t]
+            if not row:
+                continue
+            p = pos[t]
+            best_delta = 0
+            best_q = p
+            # Moving t above x changes violations by -net[t][x]; below x by
+            # +net[t][x].  Beyond the farthest opponent nothing changes.
+            lo = min(pos[x] for x in row)
+            hi = max(pos[x] for x in row)
+            delta = 0
+            for q in range(p - 1, lo - 1, -1):
+                delta -= row.get(ordering[q], 0)
+                if delta < best_delta:
+                    best_delta, best_q = delta, q
+            delta = 0
+            for q in range(p + 1, hi + 1):
+                delta += row.get(ordering[q], 0)
+                if delta < best_delta:
+                    best_delta, best_q = delta, q
+            if best_q != p:
+                ordering.pop(p)
+                ordering.insert(best_q, t)
+                for q in range(min(p, best_q), max(p, best_q) + 1):
+                    pos[ordering[q]] = q
+                improved = True
+            _check_deadline(deadline)
+            if budget_end is not None and time.perf_counter() > budget_end:
+                break
+        if not improved or (budget_end is not None and time.perf_counter() > budget_end):
+            break
+
     # Convert to ratings: #1 gets highest rating
     return {teams[ordering[i]]: float(n - i) for i in range(n)}
 
@@ -2027,6 +2392,8 @@ def calculate_lrmc(
 
     Reference: Georgia Tech LRMC (Kvam & Sokol, 2006).
     """
+    if games and _use_numpy():
+        return _lrmc_numpy(games, max_iterations)
     teams: List[str] = []
     team_idx: Dict[str, int] = {}
     for g in games:
@@ -2114,6 +2481,8 @@ def calculate_park_newman(
 
     Reference: Park & Newman, JASA 100(472), 2005.
     """
+    if games and _use_numpy():
+        return _park_newman_numpy(games, max_iterations)
     teams: List[str] = []
     team_idx: Dict[str, int] = {}
     for g in games:
@@ -2406,11 +2775,134 @@ def _rank_by_rating(
     return {t: rank + 1 for rank, t in enumerate(sorted_teams)}
 
 
+@dataclass
+class MethodTiming:
+    """Wall-clock cost of one ranking method in a composite run."""
+    key: str
+    seconds: float
+    status: str = "ok"  # "ok", or "timeout" when dropped from the composite
+
+    def to_dict(self) -> dict:
+        return {"key": self.key, "ms": round(self.seconds * 1000, 1), "status": self.status}
+
+
+class MethodTimeout(Exception):
+    """A method passed the deadline ``calculate_composite`` gave it."""
+
+
+def _check_deadline(deadline: Optional[float]) -> None:
+    if deadline is not None and time.perf_counter() > deadline:
+        raise MethodTimeout
+
+
+# Methods that take a ``deadline`` and stop themselves when it passes; the
+# rest are short enough that an abandoned one finishes soon anyway.
+_DEADLINE_METHODS = frozenset({"sor", "least_violations"})
+
+# One pool for every composite run, rather than one per refresh: an
+# abandoned method no longer leaves a pool's worth of threads behind.
+_method_pool: Optional[ThreadPoolExecutor] = None
+_method_pool_size = 0
+_method_pool_lock = threading.Lock()
+
+
+def _method_pool_for(workers: int) -> ThreadPoolExecutor:
+    """The shared method pool, grown to at least ``workers`` threads.
+
+    Call with ``_method_pool_lock`` held and submit before releasing it, so
+    a concurrent run can't shut the pool down in between.
+    """
+    global _method_pool, _method_pool_size
+    if _method_pool is None or _method_pool_size < workers:
+        old = _method_pool
+        _method_pool = ThreadPoolExecutor(max_workers=workers,
+                                          thread_name_prefix="composite")
+        _method_pool_size = workers
+        if old is not None:
+            old.shutdown(wait=False)  # work already queued there still runs
+    return _method_pool
+
+
+def _execute_methods(
+    tasks: List[Tuple[str, object, tuple, dict]],
+    workers: Optional[int] = None,
+    method_timeout: Optional[float] = None,
+) -> Tuple[Dict[str, Dict[str, float]], Dict[str, MethodTiming]]:
+    """Run ``(key, fn, args, kwargs)`` tasks; return (ratings, timings) by key.
+
+    With no ``workers`` and no ``method_timeout`` the methods run inline.
+    Otherwise they go to the shared thread pool (numpy solvers release the
+    GIL; the pure-Python methods mostly interleave).  A method still
+    running ``method_timeout`` seconds after it *started* is abandoned and
+    left out of the results with status "timeout"; the long-running ones
+    (``_DEADLINE_METHODS``) are handed that deadline and stop themselves.
+    Other exceptions propagate as before.
+    """
+    results: Dict[str, Dict[str, float]] = {}
+    timings: Dict[str, MethodTiming] = {}
+
+    if not workers and method_timeout is None:
+        for key, fn, args, kwargs in tasks:
+            start = time.perf_counter()
+            results[key] = fn(*args, **kwargs)
+            timings[key] = MethodTiming(key, time.perf_counter() - start)
+        return results, timings
+
+    started: Dict[str, float] = {}
+    finished: Dict[str, float] = {}
+
+    def run(key, fn, args, kwargs):
+        started[key] = time.perf_counter()
+        if method_timeout is not None and key in _DEADLINE_METHODS:
+            kwargs = {**kwargs, "deadline": started[key] + method_timeout}
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            finished[key] = time.perf_counter()
+
+    poll = None
+    if method_timeout is not None:
+        poll = min(0.1, max(0.005, method_timeout / 10))
+    with _method_pool_lock:
+        pool = _method_pool_for(max(1, workers or 1))
+        futures = {pool.submit(run, key, fn, args, kwargs): key
+                   for key, fn, args, kwargs in tasks}
+    pending = set(futures)
+    try:
+        while pending:
+            done, pending = wait(pending, timeout=poll, return_when=FIRST_COMPLETED)
+            for fut in done:
+                key = futures[fut]
+                try:
+                    results[key] = fut.result()
+                except MethodTimeout:
+                    timings[key] = MethodTiming(key, finished[key] - started[key],
+                                                status="timeout")
+                    continue
+                timings[key] = MethodTiming(key, finished[key] - started[key])
+            if method_timeout is None:
+                continue
+            now = time.perf_counter()
+            for fut in list(pending):
+                key = futures[fut]
+                start = started.get(key)
+                if start is not None and now - start > method_timeout:
+                    pending.discard(fut)
+                    timings[key] = MethodTiming(key, now - start, status="timeout")
+    finally:
+        for fut in pending:
+            fut.cancel()  # only if it never started
+    return results, timings
+
+
 def calculate_composite(
     games: List[GameResult],
     initial_elos: Optional[Dict[str, float]] = None,
     team_conferences: Optional[Dict[str, str]] = None,
     team_stats: Optional[Dict[str, TeamSeasonStats]] = None,
+    workers: Optional[int] = None,
+    method_timeout: Optional[float] = None,
+    timings: Optional[Dict[str, MethodTiming]] = None,
 ) -> List[CompositeRanking]:
     """Run all ranking methods and produce a composite ranking.
 
@@ -2421,6 +2913,12 @@ def calculate_composite(
         team_stats: Optional per-team season stats for efficiency/Viperball
             methods (15-19, 25-26).  If not provided, those methods are
             excluded from the composite.
+        workers: Run the methods on a pool of this many threads
+            (None = inline, one after another).
+        method_timeout: Seconds a single method may run before it is
+            dropped from the composite (implies a pool).
+        timings: Optional dict filled in place with a MethodTiming per
+            method key.
 
     Returns:
         List of CompositeRanking objects sorted by composite rank.
@@ -2453,112 +2951,87 @@ def calculate_composite(
 
     n_teams = len(all_teams)
 
-    # ── Core Math (1-6) ──────────────────────────────────────────────────
+    # ── Shared inputs ────────────────────────────────────────────────────
+    elo_start = time.perf_counter()
     elos = calculate_elo(games, initial_elos)
-    colley = calculate_colley(games)
-    massey = calculate_massey(games)
-    bt = calculate_bradley_terry(games)
-    sor = calculate_sor(games, elos)
-    srs = calculate_srs(games)
-
-    # ── Simple (7-10) ────────────────────────────────────────────────────
-    win_pct = calculate_win_pct(games)
-    point_diff = calculate_point_diff(games)
-    pythag = calculate_pythagorean(games)
-    sos_win_pct = calculate_sos_adjusted_win_pct(games, elos)
-
-    # ── Elo Variants (11-12) ─────────────────────────────────────────────
-    elo_recent = calculate_elo_recent(games, initial_elos)
-    round_robin = calculate_round_robin(elos)
-
-    # ── Resume (13-14) ───────────────────────────────────────────────────
-    isov = calculate_isov(games)
-    resume = calculate_resume(games, elos)
-
-    # ── Controversial (21-23) ────────────────────────────────────────────
-    billingsley = calculate_billingsley(games)
-    entropy = calculate_entropy(games)
-    pagerank = calculate_pagerank(games)
-
-    # ── Margin Compression (20) ──────────────────────────────────────────
-    margin_comp = calculate_margin_compression(games)
-
-    # ── Meta (24) ────────────────────────────────────────────────────────
-    cfqi = calculate_cfqi(games, team_conferences)
-
-    # ── Sagarin-style (25-26) ────────────────────────────────────────────
-    sagarin_pred = calculate_sagarin_predictor(games)
-    sagarin_recent = calculate_sagarin_recent(games)
-
-    # ── Comeback (19) — computed from game quarter scores ────────────────
-    comeback = calculate_comeback(games, stats if stats else None)
-
-    # ── Game Control (27) — computed from game quarter scores ────────────
-    game_control = calculate_game_control(games, stats if stats else None)
-
-    # ── Eigenvector/Graph (29-31) ─────────────────────────────────────────
-    keener = calculate_keener(games)
-    od_rating = calculate_od_rating(games)
-    markov_walker = calculate_markov_walker(games)
-
-    # ── Eclectic (32-34) ───────────────────────────────────────────────────
-    least_violations = calculate_least_violations(games)
-    truncated_colley = calculate_truncated_colley(games)
-    win_score = calculate_win_score(games)
-
-    # ── Published (35-38) ──────────────────────────────────────────────────
-    lrmc = calculate_lrmc(games)
-    park_newman = calculate_park_newman(games)
-    anderson_hester = calculate_anderson_hester(games)
-    mjs = calculate_mjs(games)
-
-    # ── SOS (metadata, not a ranking method) ─────────────────────────────
+    elo_seconds = time.perf_counter() - elo_start
+    # SOS is metadata (not a ranking method) but FPI consumes it
     sos_data = calculate_sos(games, elos)
 
-    # ── Build ratings dict: key -> {team: rating} ────────────────────────
-    all_ratings: Dict[str, Dict[str, float]] = {
-        "elo": elos,
-        "colley": colley,
-        "massey": massey,
-        "bt": bt,
-        "sor": sor,
-        "srs": srs,
-        "win_pct": win_pct,
-        "point_diff": point_diff,
-        "pythag": pythag,
-        "sos_win_pct": sos_win_pct,
-        "elo_recent": elo_recent,
-        "round_robin": round_robin,
-        "isov": isov,
-        "resume": resume,
-        "billingsley": billingsley,
-        "entropy": entropy,
-        "pagerank": pagerank,
-        "margin_comp": margin_comp,
-        "cfqi": cfqi,
-        "sagarin_pred": sagarin_pred,
-        "sagarin_recent": sagarin_recent,
-        "comeback": comeback,
-        "game_control": game_control,
-        "keener": keener,
-        "od_rating": od_rating,
-        "markov_walker": markov_walker,
-        "least_violations": least_violations,
-        "truncated_colley": truncated_colley,
-        "win_score": win_score,
-        "lrmc": lrmc,
-        "park_newman": park_newman,
-        "anderson_hester": anderson_hester,
-        "mjs": mjs,
-    }
+    # ── Method table, in canonical display order ─────────────────────────
+    tasks: List[Tuple[str, object, tuple, dict]] = [
+        # Core Math (1-6)
+        ("elo", dict, (elos,), {}),
+        ("colley", calculate_colley, (games,), {}),
+        ("massey", calculate_massey, (games,), {}),
+        ("bt", calculate_bradley_terry, (games,), {}),
+        ("sor", calculate_sor, (games, elos), {}),
+        ("srs", calculate_srs, (games,), {}),
+        # Simple (7-10)
+        ("win_pct", calculate_win_pct, (games,), {}),
+        ("point_diff", calculate_point_diff, (games,), {}),
+        ("pythag", calculate_pythagorean, (games,), {}),
+        ("sos_win_pct", calculate_sos_adjusted_win_pct, (games, elos), {}),
+        # Elo Variants (11-12)
+        ("elo_recent", calculate_elo_recent, (games, initial_elos), {}),
+        ("round_robin", calculate_round_robin, (elos,), {}),
+        # Resume (13-14)
+        ("isov", calculate_isov, (games,), {}),
+        ("resume", calculate_resume, (games, elos), {}),
+        # Controversial (21-23)
+        ("billingsley", calculate_billingsley, (games,), {}),
+        ("entropy", calculate_entropy, (games,), {}),
+        ("pagerank", calculate_pagerank, (games,), {}),
+        # Margin Compression (20)
+        ("margin_comp", calculate_margin_compression, (games,), {}),
+        # Meta (24)
+        ("cfqi", calculate_cfqi, (games, team_conferences), {}),
+        # Sagarin-style (25-26)
+        ("sagarin_pred", calculate_sagarin_predictor, (games,), {}),
+        ("sagarin_recent", calculate_sagarin_recent, (games,), {}),
+        # Comeback (19) / Game Control (27) — from game quarter scores
+        ("comeback", calculate_comeback, (games, stats if stats else None), {}),
+        ("game_control", calculate_game_control, (games, stats if stats else None), {}),
+        # Eigenvector/Graph (29-31)
+        ("keener", calculate_keener, (games,), {}),
+        ("od_rating", calculate_od_rating, (games,), {}),
+        ("markov_walker", calculate_markov_walker, (games,), {}),
+        # Eclectic (32-34)
+        ("least_violations", calculate_least_violations, (games,), {}),
+        ("truncated_colley", calculate_truncated_colley, (games,), {}),
+        ("win_score", calculate_win_score, (games,), {}),
+        # Published (35-38)
+        ("lrmc", calculate_lrmc, (games,), {}),
+        ("park_newman", calculate_park_newman, (games,), {}),
+        ("anderson_hester", calculate_anderson_hester, (games,), {}),
+        ("mjs", calculate_mjs, (games,), {}),
+    ]
 
     # ── Season-stats methods (only if team_stats provided) ───────────────
     if stats:
-        all_ratings["off_eff"] = calculate_off_efficiency(stats)
-        all_ratings["def_eff"] = calculate_def_efficiency(stats)
-        all_ratings["fpi"] = calculate_fpi(stats, sos_data)
-        all_ratings["dye_index"] = calculate_dye_index(stats)
-        all_ratings["cvl_official"] = calculate_cvl_official(stats)
+        tasks += [
+            ("off_eff", calculate_off_efficiency, (stats,), {}),
+            ("def_eff", calculate_def_efficiency, (stats,), {}),
+            ("fpi", calculate_fpi, (stats, sos_data), {}),
+            ("dye_index", calculate_dye_index, (stats,), {}),
+            ("cvl_official", calculate_cvl_official, (stats,), {}),
+        ]
+
+    results, method_timings = _execute_methods(tasks, workers, method_timeout)
+    # The "elo" task only copies ratings computed above; charge it the replay
+    method_timings["elo"].seconds += elo_seconds
+    if timings is not None:
+        timings.update(method_timings)
+
+    # ── Build ratings dict: key -> {team: rating} (timed-out methods drop out)
+    all_ratings: Dict[str, Dict[str, float]] = {
+        key: results[key] for key, *_ in tasks if key in results
+    }
+    colley = all_ratings.get("colley", {})
+    massey = all_ratings.get("massey", {})
+    bt = all_ratings.get("bt", {})
+    sor = all_ratings.get("sor", {})
+    srs = all_ratings.get("srs", {})
 
     # ── Convert all ratings to ranks ─────────────────────────────────────
     all_ranks: Dict[str, Dict[str, int]] = {}
@@ -16,7 +16,7 @@ Usage:
     # Assign a crew to a game
     crew = pool.assign_crew(rng, is_playoff=True)
 
-    # After game, record the result
+    # After game, record the result (or a whole week via record_games)
     pool.record_game(crew_names, game_log_data)
 
     # Look up a ref's profile
@@ -28,7 +28,7 @@ from __future__ import annotations
 import random
 import hashlib
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 
 # ──────────────────────────────────────────────────────────────
@@ -236,8 +236,12 @@ class RefereeCard:
 
     def add_game(self, game_log: RefereeGameLog, year: int = 0):
         """Record a game and update the current season stats."""
-        game_log.year = year
-        self.game_log.append(game_log)
+        self.add_games([game_log], year=year)
+
+    def add_games(self, game_logs: List[RefereeGameLog], year: int = 0):
+        """Record several games from one season in a single pass."""
+        if not game_logs:
+            return
 
         # Find or create current season stats
         current_season = None
@@ -249,21 +253,24 @@ class RefereeCard:
             current_season = RefereeSeasonStats(year=year)
             self.career_seasons.append(current_season)
 
-        current_season.games_officiated += 1
-        current_season.total_penalties += game_log.penalties_called
-        current_season.total_penalty_yards += game_log.penalty_yards
-        current_season.penalties_on_home += game_log.penalties_on_home
-        current_season.penalties_on_away += game_log.penalties_on_away
-        current_season.total_blown_calls += game_log.blown_calls
-        current_season.total_phantom_flags += game_log.phantom_flags
-        current_season.total_swallowed_whistles += game_log.swallowed_whistles
-        current_season.total_spot_errors += game_log.spot_errors
-        current_season.total_challenges += game_log.challenges_attempted
-        current_season.total_overturned += game_log.challenges_overturned
-        if game_log.is_playoff:
-            current_season.playoff_games += 1
-        if game_log.is_overtime:
-            current_season.overtime_games += 1
+        for game_log in game_logs:
+            game_log.year = year
+            current_season.total_penalties += game_log.penalties_called
+            current_season.total_penalty_yards += game_log.penalty_yards
+            current_season.penalties_on_home += game_log.penalties_on_home
+            current_season.penalties_on_away += game_log.penalties_on_away
+            current_season.total_blown_calls += game_log.blown_calls
+            current_season.total_phantom_flags += game_log.phantom_flags
+            current_season.total_swallowed_whistles += game_log.swallowed_whistles
+            current_season.total_spot_errors += game_log.spot_errors
+            current_season.total_challenges += game_log.challenges_attempted
+            current_season.total_overturned += game_log.challenges_overturned
+            if game_log.is_playoff:
+                current_season.playoff_games += 1
+            if game_log.is_overtime:
+                current_season.overtime_games += 1
+        current_season.games_officiated += len(game_logs)
+        self.game_log.extend(game_logs)
 
     def to_dict(self) -> dict:
         return {
@@ -327,6 +334,10 @@ class RefereePool:
         self.seed = seed
         self.cards: Dict[str, RefereeCard] = {}  # name -> card
         self._crews: List[List[str]] = []  # cached crew groupings
+        # Per-crew aggregates, rebuilt whenever crews are (see _index_crews)
+        self._crew_profiles: List[Tuple[float, float, float]] = []
+        self._crew_lookup: Dict[Tuple[str, ...], int] = {}
+        self._playoff_crews: List[int] = []
 
     def generate(self, count: int = 360):
         """Generate the referee pool using the name generator."""
@@ -403,41 +414,107 @@ class RefereePool:
             # Sort by accuracy — head ref is the best
             trio.sort(key=lambda n: self.cards[n].accuracy, reverse=True)
             self._crews.append(trio)
+        self._index_crews()
+
+    def _index_crews(self):
+        """Precompute crew aggregates once so per-game lookups are O(1).
+
+        Crews and their members' hidden attributes never change after
+        generation, so the averages and the playoff (top-third accuracy)
+        shortlist only need computing when crews are built or loaded.
+        """
+        self._crew_profiles = [
+            (
+                self._crew_average(crew, "accuracy"),
+                self._crew_average(crew, "home_favor"),
+                self._crew_average(crew, "consistency"),
+            )
+            for crew in self._crews
+        ]
+        self._crew_lookup = {tuple(crew): i for i, crew in enumerate(self._crews)}
+        by_accuracy = sorted(
+            range(len(self._crews)),
+            key=lambda i: self._crew_profiles[i][0],
+            reverse=True,
+        )
+        self._playoff_crews = by_accuracy[:max(1, len(by_accuracy) // 3)]
+
+    def _crew_average(self, crew_names: List[str], attr: str) -> float:
+        vals = [getattr(self.cards[n], attr) for n in crew_names if n in self.cards]
+        return sum(vals) / max(1, len(vals))
+
+    def assign_crew_index(self, rng: random.Random, is_playoff: bool = False) -> int:
+        """Pick a crew index for a game (-1 if no crews).
+
+        Playoff games draw from the top third by average accuracy.  Draws
+        the same random numbers as ``rng.choice`` did, so seeded crew
+        assignments are unchanged.
+        """
+        if not self._crews:
+            return -1
+        if len(self._crew_profiles) != len(self._crews):
+            self._index_crews()
+        if is_playoff:
+            return self._playoff_crews[rng.randrange(len(self._playoff_crews))]
+        return rng.randrange(len(self._crews))
 
     def assign_crew(self, rng: random.Random, is_playoff: bool = False) -> List[str]:
         """Pick a crew for a game. Playoff games get top-tier crews."""
-        if not self._crews:
-            return []
+        idx = self.assign_crew_index(rng, is_playoff=is_playoff)
+        return self._crews[idx] if idx >= 0 else []
 
-        if is_playoff:
-            # Sort crews by average accuracy, pick from top third
-            sorted_crews = sorted(
-                self._crews,
-                key=lambda c: sum(self.cards[n].accuracy for n in c) / len(c),
-                reverse=True,
-            )
-            top = sorted_crews[:max(1, len(sorted_crews) // 3)]
-            return rng.choice(top)
-        else:
-            return rng.choice(self._crews)
+    def crew_names(self, crew_index: int) -> List[str]:
+        return self._crews[crew_index]
+
+    def crew_profile(self, crew_index: int) -> Tuple[float, float, float]:
+        """(accuracy, home_favor, consistency) averages for a crew index."""
+        return self._crew_profiles[crew_index]
+
+    def _profile_for(self, crew_names: List[str]) -> Optional[Tuple[float, float, float]]:
+        if len(self._crew_profiles) != len(self._crews):
+            self._index_crews()
+        idx = self._crew_lookup.get(tuple(crew_names))
+        return self._crew_profiles[idx] if idx is not None else None
 
     def get_crew_accuracy(self, crew_names: List[str]) -> float:
         """Average accuracy of a crew."""
-        accs = [self.cards[n].accuracy for n in crew_names if n in self.cards]
-        return sum(accs) / max(1, len(accs))
+        profile = self._profile_for(crew_names)
+        return profile[0] if profile else self._crew_average(crew_names, "accuracy")
 
     def get_crew_home_favor(self, crew_names: List[str]) -> float:
         """Average home favor of a crew."""
-        favs = [self.cards[n].home_favor for n in crew_names if n in self.cards]
-        return sum(favs) / max(1, len(favs))
+        profile = self._profile_for(crew_names)
+        return profile[1] if profile else self._crew_average(crew_names, "home_favor")
 
     def get_crew_consistency(self, crew_names: List[str]) -> float:
         """Average consistency of a crew."""
-        cons = [self.cards[n].consistency for n in crew_names if n in self.cards]
-        return sum(cons) / max(1, len(cons))
+        profile = self._profile_for(crew_names)
+        return profile[2] if profile else self._crew_average(crew_names, "consistency")
 
     def record_game(self, crew_names: List[str], game_data: dict, year: int = 0):
         """Record a game result for all crew members."""
+        self.record_games([(crew_names, game_data)], year=year)
+
+    def record_games(self, games: List[Tuple[List[str], dict]], year: int = 0):
+        """Record a batch of (crew_names, game_data) results, e.g. a whole week.
+
+        Builds one game log per game and hands each official all of their
+        logs at once, so season stats are resolved once per official per
+        batch instead of once per game.
+        """
+        per_ref: Dict[str, List[RefereeGameLog]] = {}
+        for crew_names, game_data in games:
+            game_log = self._game_log_from_result(game_data, year)
+            for name in crew_names:
+                per_ref.setdefault(name, []).append(game_log)
+        for name, logs in per_ref.items():
+            card = self.cards.get(name)
+            if card:
+                card.add_games(logs, year=year)
+
+    @staticmethod
+    def _game_log_from_result(game_data: dict, year: int = 0) -> RefereeGameLog:
+        """Summarize a game result dict into a RefereeGameLog."""
         ref_data = game_data.get("referee", {})
         blown_call_log = ref_data.get("blown_call_log", [])
 
@@ -446,12 +523,13 @@ class RefereePool:
         swallowed = sum(1 for bc in blown_call_log if bc.get("type") == "swallowed_whistle")
         spot = sum(1 for bc in blown_call_log if bc.get("type") == "spot_error")
 
-        # Count penalties from play-by-play
+        # Count penalties (and spot overtime) in one pass over play-by-play
         plays = game_data.get("play_by_play", [])
         pen_count = 0
         pen_yards = 0
         pen_home = 0
         pen_away = 0
+        is_ot = False
         for p in plays:
             pen = p.get("penalty")
             if pen and not pen.get("declined", False):
@@ -461,6 +539,8 @@ class RefereePool:
                     pen_home += 1
                 else:
                     pen_away += 1
+            if not is_ot and p.get("quarter", 0) > 4:
+                is_ot = True
 
         final = game_data.get("final_score", {})
         home_score = final.get("home", {}).get("score", 0)
@@ -468,10 +548,7 @@ class RefereePool:
         home_team = final.get("home", {}).get("team", "")
         away_team = final.get("away", {}).get("team", "")
 
-        # Determine if overtime occurred
-        is_ot = any(p.get("quarter", 0) > 4 for p in plays)
-
-        game_log = RefereeGameLog(
+        return RefereeGameLog(
             week=game_data.get("week", 0),
             year=year,
             home_team=home_team,
@@ -492,11 +569,6 @@ class RefereePool:
             is_overtime=is_ot,
         )
 
-        for name in crew_names:
-            card = self.cards.get(name)
-            if card:
-                card.add_game(game_log, year=year)
-
     def get_card(self, name: str) -> Optional[RefereeCard]:
         """Look up a referee by full name."""
         return self.cards.get(name)
@@ -520,4 +592,5 @@ class RefereePool:
         for name, card_data in d.get("cards", {}).items():
             pool.cards[name] = RefereeCard.from_dict(card_data)
         pool._crews = d.get("crews", [])
+        pool._index_crews()
         return pool
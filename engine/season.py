@@ -13,6 +13,7 @@ Handles:
 import json
 import random
 import math
+from collections import Counter
 from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -1058,6 +1059,23 @@ def get_recommended_bowl_count(league_size: int, playoff_size: int) -> int:
 MAX_CONFERENCE_GAMES = 8  # hard cap on conference games per team per season
 MIN_CONFERENCE_SIZE = 9   # conferences need ≥9 teams to guarantee 8 conf games
 
+# Schedule templates: pairings over abstract team slots, keyed by conference
+# structure and games-per-team.  A template is built once with the full
+# partial-schedule algorithm, then every later season with the same shape
+# just maps real teams onto slots (shuffled within each conference) and
+# patches in rivalries/pinned games.  Dynasty mode hits the same key every
+# year, so only the first season pays the build cost.
+#   key   → (block sizes, independents, games_per_team)
+#   value → list of (slot_a, slot_b, is_conference)
+_SCHEDULE_TEMPLATE_CACHE: Dict[tuple, List[Tuple[int, int, bool]]] = {}
+_SCHEDULE_TEMPLATE_CACHE_MAX = 32
+_SCHEDULE_TEMPLATE_BUILD_ATTEMPTS = 5
+
+
+def clear_schedule_template_cache():
+    """Drop all cached schedule templates (tests, or after rule changes)."""
+    _SCHEDULE_TEMPLATE_CACHE.clear()
+
 
 def get_non_conference_slots(
     games_per_team: int,
@@ -1261,6 +1279,19 @@ class Season:
     # Referee pool — manages named refs with cards and game logs.
     # Created lazily on first game simulation.
     referee_pool: Optional[object] = None
+    # While a week is being simulated, full-engine games queue their
+    # (crew, result) here and the week is logged in one record_games call.
+    _referee_log_buffer: Optional[list] = field(default=None, init=False, repr=False)
+    # Running player/team season totals (engine.season_aggregates), fed
+    # from _update_standings so stats pages never re-walk every box score.
+    _aggregates: Optional[object] = field(default=None, init=False, repr=False)
+    # Player/team/matchup/referee → games lookups (engine.season_index),
+    # fed alongside the aggregates so profile pages skip full-season scans.
+    _index: Optional[object] = field(default=None, init=False, repr=False)
+    # Bumped by mark_mutated() on every state change (game result, schedule,
+    # poll, award, bracket, bowl).  Readers key caches on it instead of
+    # rescanning the schedule for completed games.
+    mutation_version: int = field(default=0, init=False, repr=False)
 
     def __post_init__(self):
         for team_name, team in self.teams.items():
@@ -1302,6 +1333,12 @@ class Season:
 
         if games_per_team <= 0 or games_per_team >= num_teams - 1:
             self._generate_round_robin(team_names, dynasty_year=dynasty_year)
+        elif len(self.conferences) > 1:
+            self._generate_templated_schedule(
+                team_names, games_per_team, conference_weight,
+                pinned_matchups=pinned_matchups or [],
+                dynasty_year=dynasty_year,
+            )
         else:
             self._generate_partial_schedule(
                 team_names, games_per_team, conference_weight,
@@ -1312,6 +1349,15 @@ class Season:
         self._assign_weeks_by_type(non_conf_weeks)
         self._mark_rivalry_games()
         self._designate_overseas_classics()
+        # A new schedule starts a new set of games: drop stale season totals
+        # and game lookups.
+        self._aggregates = None
+        self._index = None
+        self.mark_mutated()
+
+    def mark_mutated(self):
+        """Record a state change; invalidates anything keyed on mutation_version."""
+        self.mutation_version += 1
 
     @staticmethod
     def _round_robin_rounds(team_list: List[str]) -> List[List[Tuple[str, str]]]:
@@ -1515,20 +1561,19 @@ class Season:
         random.shuffle(non_conf)
         random.shuffle(conf)
 
-        week_teams: dict[int, set] = {}
+        # team → weeks already occupied; probing two small sets per game is
+        # much cheaper than growing a per-week set for every probe.
+        busy: dict[str, set] = {}
 
         def _assign(game, min_week):
+            home_busy = busy.setdefault(game.home_team, set())
+            away_busy = busy.setdefault(game.away_team, set())
             week = min_week
-            while True:
-                if week not in week_teams:
-                    week_teams[week] = set()
-                slot = week_teams[week]
-                if game.home_team not in slot and game.away_team not in slot:
-                    game.week = week
-                    slot.add(game.home_team)
-                    slot.add(game.away_team)
-                    return
+            while week in home_busy or week in away_busy:
                 week += 1
+            game.week = week
+            home_busy.add(week)
+            away_busy.add(week)
 
         for game in non_conf:
             _assign(game, 1)
@@ -1781,6 +1826,269 @@ class Season:
 
         self.schedule = games
 
+    def _schedule_template_blocks(self, team_names: List[str]) -> Tuple[List[List[str]], List[str]]:
+        """Group teams into conference blocks (largest first) plus independents."""
+        blocks = []
+        for conf_name in sorted(self.conferences, key=lambda c: (-len(self.conferences[c]), c)):
+            members = [t for t in self.conferences[conf_name] if t in self.teams]
+            if members:
+                blocks.append(members)
+        in_block = {t for b in blocks for t in b}
+        independents = [t for t in team_names if t not in in_block]
+        return blocks, independents
+
+    @staticmethod
+    def _build_schedule_template(
+        block_sizes: Tuple[int, ...],
+        num_independents: int,
+        games_per_team: int,
+    ) -> List[Tuple[int, int, bool]]:
+        """Run the partial-schedule algorithm on placeholder slots.
+
+        Takes the best of a few attempts (fewest teams off their game count)
+        since the result is reused for every season with this shape.
+        """
+        slot_names = []
+        conferences: Dict[str, List[str]] = {}
+        for b, size in enumerate(block_sizes):
+            members = [f"__slot{len(slot_names) + i}" for i in range(size)]
+            conferences[f"__block{b}"] = members
+            slot_names.extend(members)
+        slot_names.extend(f"__slot{len(slot_names) + i}" for i in range(num_independents))
+        slot_index = {name: i for i, name in enumerate(slot_names)}
+        block_of = {}
+        for b, members in enumerate(conferences.values()):
+            for name in members:
+                block_of[slot_index[name]] = b
+
+        best: List[Tuple[int, int, bool]] = []
+        best_deficit = None
+        for _attempt in range(_SCHEDULE_TEMPLATE_BUILD_ATTEMPTS):
+            scratch = Season(
+                name="__template__",
+                teams={name: None for name in slot_names},
+                conferences={c: list(m) for c, m in conferences.items()},
+                team_conferences={t: c for c, m in conferences.items() for t in m},
+            )
+            scratch._generate_partial_schedule(slot_names, games_per_team, 0.6)
+            template = [
+                (slot_index[g.home_team], slot_index[g.away_team], g.is_conference_game)
+                for g in scratch.schedule
+            ]
+            template = Season._trim_template_overages(template, games_per_team, block_of)
+            counts = Counter()
+            for a, b, _ in template:
+                counts[a] += 1
+                counts[b] += 1
+            deficit = sum(abs(games_per_team - counts[i]) for i in range(len(slot_names)))
+            if best_deficit is None or deficit < best_deficit:
+                best_deficit = deficit
+                best = template
+            if deficit == 0:
+                break
+        return best
+
+    @staticmethod
+    def _trim_template_overages(
+        template: List[Tuple[int, int, bool]],
+        games_per_team: int,
+        block_of: Dict[int, int],
+    ) -> List[Tuple[int, int, bool]]:
+        """Bring slots the fill pass pushed past games_per_team back down.
+
+        The partial-schedule fill lets one side of a pairing go a game over
+        so the other isn't short.  That's acceptable for a one-off schedule
+        but a template is reused every season, so it's worth squaring up:
+        drop a non-conference game between two over slots, or swap two
+        over slots' non-conference games (u–w, v–z  →  w–z).
+        """
+        games = list(template)
+        counts = Counter()
+        pairs = set()
+        for a, b, _ in games:
+            counts[a] += 1
+            counts[b] += 1
+            pairs.add((min(a, b), max(a, b)))
+
+        def _crosses(x: int, y: int) -> bool:
+            bx, by = block_of.get(x), block_of.get(y)
+            return bx is None or by is None or bx != by
+
+        def _drop(game):
+            games.remove(game)
+            a, b, _ = game
+            counts[a] -= 1
+            counts[b] -= 1
+            pairs.discard((min(a, b), max(a, b)))
+
+        for _guard in range(len(games)):
+            over = [s for s, c in counts.items() if c > games_per_team]
+            if not over:
+                break
+            over_set = set(over)
+            nonconf = [g for g in games if not g[2]]
+            direct = next((g for g in nonconf if g[0] in over_set and g[1] in over_set), None)
+            if direct is not None:
+                _drop(direct)
+                continue
+            swapped = False
+            for u in over:
+                u_games = [g for g in nonconf if u in (g[0], g[1])]
+                for v in over:
+                    if v == u or swapped:
+                        continue
+                    v_games = [g for g in nonconf if v in (g[0], g[1])]
+                    for gu in u_games:
+                        w = gu[1] if gu[0] == u else gu[0]
+                        for gv in v_games:
+                            z = gv[1] if gv[0] == v else gv[0]
+                            if w == z or (min(w, z), max(w, z)) in pairs or not _crosses(w, z):
+                                continue
+                            _drop(gu)
+                            _drop(gv)
+                            games.append((w, z, False))
+                            counts[w] += 1
+                            counts[z] += 1
+                            pairs.add((min(w, z), max(w, z)))
+                            swapped = True
+                            break
+                        if swapped:
+                            break
+                if swapped:
+                    break
+            if not swapped:
+                break
+        return games
+
+    def _generate_templated_schedule(
+        self,
+        team_names: List[str],
+        games_per_team: int,
+        conference_weight: float,
+        pinned_matchups: Optional[List[Tuple[str, str]]] = None,
+        dynasty_year: Optional[int] = None,
+    ):
+        """Fill a cached schedule template with this season's teams.
+
+        Equal-sized conferences swap template blocks and teams are shuffled
+        within their block, so pairings still vary year to year.  Rivalry
+        and pinned matchups are then patched in with degree-preserving swaps
+        (a–x, b–y  →  a–b, x–y), which keeps every team's game count intact.
+        """
+        self._consolidate_small_conferences()
+        blocks, independents = self._schedule_template_blocks(team_names)
+        block_sizes = tuple(len(b) for b in blocks)
+        key = (block_sizes, len(independents), games_per_team)
+
+        template = _SCHEDULE_TEMPLATE_CACHE.get(key)
+        if template is None:
+            template = self._build_schedule_template(block_sizes, len(independents), games_per_team)
+            if len(_SCHEDULE_TEMPLATE_CACHE) >= _SCHEDULE_TEMPLATE_CACHE_MAX:
+                _SCHEDULE_TEMPLATE_CACHE.pop(next(iter(_SCHEDULE_TEMPLATE_CACHE)))
+            _SCHEDULE_TEMPLATE_CACHE[key] = template
+
+        # Rotate assignments: shuffle blocks among equal sizes, teams within blocks.
+        by_size: Dict[int, List[List[str]]] = {}
+        for b in blocks:
+            by_size.setdefault(len(b), []).append(list(b))
+        for group in by_size.values():
+            random.shuffle(group)
+            for members in group:
+                random.shuffle(members)
+        slot_team: List[str] = []
+        for size in block_sizes:
+            slot_team.extend(by_size[size].pop())
+        rotated_independents = list(independents)
+        random.shuffle(rotated_independents)
+        slot_team.extend(rotated_independents)
+
+        def _conf_of(t: str) -> str:
+            return self.team_conferences.get(t, "")
+
+        def _is_conf(a: str, b: str) -> bool:
+            ca = _conf_of(a)
+            return ca != "" and ca == _conf_of(b)
+
+        # pair → [home, away, is_conf, locked]
+        pairs: Dict[Tuple[str, str], list] = {}
+        team_pairs: Dict[str, set] = {t: set() for t in team_names}
+
+        def _add(home: str, away: str, is_conf: bool, locked: bool = False):
+            pair = tuple(sorted([home, away]))
+            pairs[pair] = [home, away, is_conf, locked]
+            team_pairs[home].add(pair)
+            team_pairs[away].add(pair)
+
+        def _remove(pair: Tuple[str, str]):
+            del pairs[pair]
+            team_pairs[pair[0]].discard(pair)
+            team_pairs[pair[1]].discard(pair)
+
+        for a, b, is_conf in template:
+            _add(slot_team[a], slot_team[b], is_conf)
+
+        def _require(a: str, b: str, is_conf: bool, preserve: bool):
+            if a not in self.teams or b not in self.teams or a == b:
+                return
+            pair = tuple(sorted([a, b]))
+            if pair in pairs:
+                entry = pairs[pair]
+                if preserve:
+                    entry[0], entry[1] = a, b
+                entry[3] = True
+                return
+            free_a = [p for p in team_pairs[a] if not pairs[p][3] and pairs[p][2] == is_conf]
+            free_b = [p for p in team_pairs[b] if not pairs[p][3] and pairs[p][2] == is_conf]
+            random.shuffle(free_a)
+            for pa in free_a:
+                x = pa[0] if pa[1] == a else pa[1]
+                for pb in free_b:
+                    y = pb[0] if pb[1] == b else pb[1]
+                    if x == y or x == b or y == a:
+                        continue
+                    xy = tuple(sorted([x, y]))
+                    if xy in pairs or _is_conf(x, y) != is_conf:
+                        continue
+                    _remove(pa)
+                    _remove(pb)
+                    _add(a, b, is_conf, locked=True)
+                    _add(x, y, is_conf)
+                    return
+            # No clean swap: the required game still wins, its displaced
+            # opponents simply play one fewer game.
+            if free_a and free_b:
+                _remove(free_a[0])
+                _remove(free_b[0])
+                _add(a, b, is_conf, locked=True)
+            elif len(team_pairs[a]) < games_per_team and len(team_pairs[b]) < games_per_team:
+                _add(a, b, is_conf, locked=True)
+
+        for home, away in (pinned_matchups or []):
+            _require(home, away, _is_conf(home, away), preserve=True)
+        for team, rivals in self.rivalries.items():
+            if team not in self.teams:
+                continue
+            for rival in self._rivalry_list(rivals.get("conference")):
+                _require(team, rival, _is_conf(team, rival), preserve=False)
+            for rival in self._rivalry_list(rivals.get("non_conference")):
+                _require(team, rival, _is_conf(team, rival), preserve=False)
+
+        pinned = {tuple(sorted(p)) for p in (pinned_matchups or [])}
+        games = []
+        for pair, (home, away, is_conf, _locked) in pairs.items():
+            if pair not in pinned:
+                if dynasty_year is not None:
+                    # Deterministic flip: same pair alternates home/away each year
+                    if (hash(pair) + dynasty_year) % 2 == 1:
+                        home, away = pair[1], pair[0]
+                    else:
+                        home, away = pair
+                elif random.random() < 0.5:
+                    home, away = away, home
+            games.append(Game(week=0, home_team=home, away_team=away, is_conference_game=is_conf))
+
+        self.schedule = games
+
     def generate_round_robin_schedule(self):
         """Legacy method - generates full round-robin"""
         self.generate_schedule(games_per_team=0)
@@ -1982,12 +2290,11 @@ class Season:
         ref_crew_names = []
         if self.referee_pool is not None:
             _ref_rng = random.Random(random.randint(0, 2**31))
-            ref_crew_names = self.referee_pool.assign_crew(_ref_rng, is_playoff=is_postseason)
-            if ref_crew_names:
+            crew_idx = self.referee_pool.assign_crew_index(_ref_rng, is_playoff=is_postseason)
+            if crew_idx >= 0:
                 from engine.game_engine import RefereeCrew
-                avg_acc = self.referee_pool.get_crew_accuracy(ref_crew_names)
-                avg_favor = self.referee_pool.get_crew_home_favor(ref_crew_names)
-                avg_con = self.referee_pool.get_crew_consistency(ref_crew_names)
+                ref_crew_names = self.referee_pool.crew_names(crew_idx)
+                avg_acc, avg_favor, avg_con = self.referee_pool.crew_profile(crew_idx)
                 inaccuracy = 1.0 - avg_acc
                 ref_crew_obj = RefereeCrew(
                     name=", ".join(ref_crew_names),
@@ -2021,7 +2328,10 @@ class Season:
         # Record game in referee pool for game log tracking
         if self.referee_pool is not None and ref_crew_names:
             result["week"] = game.week
-            self.referee_pool.record_game(ref_crew_names, result, year=0)
+            if self._referee_log_buffer is not None:
+                self._referee_log_buffer.append((ref_crew_names, result))
+            else:
+                self.referee_pool.record_game(ref_crew_names, result, year=0)
 
         if fcs_side != "home":
             for p in home_team.players:
@@ -2137,6 +2447,17 @@ class Season:
                 opponent_name=game.home_team,
             )
 
+        # ── Season aggregates + game index: fold this game in once ──
+        if self._aggregates is None:
+            from engine.season_aggregates import SeasonAggregates
+            self._aggregates = SeasonAggregates()
+        self._aggregates.apply_game(game)
+        if self._index is None:
+            from engine.season_index import SeasonIndex
+            self._index = SeasonIndex()
+        self._index.apply_game(game)
+        self.mark_mutated()
+
         # ── Dynamic prestige: update after every game ──
         if self.team_prestige is not None and not is_tie:
             from engine.nil_system import adjust_prestige_postgame
@@ -2413,18 +2734,29 @@ class Season:
                 # Extra recovery pass — bye week rest accelerates healing
                 self.injury_tracker.resolve_week_bye(week, team_name)
 
-        for game in week_games:
-            self.simulate_game(game, verbose=verbose, dq_team_boosts=dq_team_boosts,
-                               use_fast_sim=use_fast_sim)
+        self._referee_log_buffer = []
+        try:
+            for game in week_games:
+                self.simulate_game(game, verbose=verbose, dq_team_boosts=dq_team_boosts,
+                                   use_fast_sim=use_fast_sim)
+        finally:
+            self._flush_referee_logs()
 
         if week_games:
             self._compute_weekly_awards(week, week_games)
+            self.mark_mutated()
 
         if generate_polls and week_games:
             self._generate_weekly_poll(week)
 
         return week_games
 
+    def _flush_referee_logs(self):
+        """Log the queued week of full-engine games to the referee pool."""
+        pending, self._referee_log_buffer = self._referee_log_buffer, None
+        if pending and self.referee_pool is not None:
+            self.referee_pool.record_games(pending, year=0)
+
     def simulate_through_week(self, target_week: int, verbose: bool = False,
                               generate_polls: bool = True,
                               use_fast_sim: bool = False) -> List[Game]:
@@ -2471,18 +2803,25 @@ class Season:
         return all(g.completed for g in self.schedule)
 
     def simulate_season(self, verbose: bool = False, generate_polls: bool = True,
-                        use_fast_sim: bool = False):
+                        use_fast_sim: bool = False, progress_callback=None):
         """Simulate all remaining regular season games, optionally generating weekly polls.
 
         Args:
             use_fast_sim: If True, CPU-vs-CPU games use fast statistical model.
                           Human-team games always use the full engine.
+            progress_callback: Optional callable(weeks_done, total) called
+                          after each week.
         """
+        total = len(set(g.week for g in self.schedule if not g.completed))
+        done = 0
         while True:
             games = self.simulate_week(verbose=verbose, generate_polls=generate_polls,
                                         use_fast_sim=use_fast_sim)
             if not games:
                 break
+            done += 1
+            if progress_callback:
+                progress_callback(done, total)
 
     def _win_pct_excluding(self, team_name: str, exclude_team: str) -> float:
         """Win percentage for team_name excluding all games against exclude_team.
@@ -2821,6 +3160,7 @@ class Season:
         full_rank_map = {name: i + 1 for i, (name, _, _) in enumerate(power_rankings)}
         self.weekly_polls.append(WeeklyPoll(week=week, rankings=rankings,
                                             full_ranking_map=full_rank_map))
+        self.mark_mutated()
 
     def get_standings_sorted(self) -> List[TeamRecord]:
         """Get standings sorted by win percentage, then point differential"""
@@ -3147,13 +3487,18 @@ class Season:
             game = Game(week=week, home_team=home, away_team=away)
             self.playoff_bracket.append(game)
             games.append(game)
-        for game in games:
-            self.simulate_game(game, verbose=verbose)
-            mvp = self._pick_game_mvp(game)
-            if mvp:
-                game.mvp_name = mvp[0]
-                game.mvp_team = mvp[1]
-                game.mvp_reason = mvp[2]
+        self._referee_log_buffer = []
+        try:
+            for game in games:
+                self.simulate_game(game, verbose=verbose)
+                mvp = self._pick_game_mvp(game)
+                if mvp:
+                    game.mvp_name = mvp[0]
+                    game.mvp_team = mvp[1]
+                    game.mvp_reason = mvp[2]
+        finally:
+            self._flush_referee_logs()
+        self.mark_mutated()
         return games
 
     def simulate_playoff(self, num_teams: int = 4, verbose: bool = False):
@@ -3161,6 +3506,7 @@ class Season:
         playoff_teams = self.get_playoff_teams(num_teams)
         seeds = [t.team_name for t in playoff_teams]
         self.playoff_seeds = {name: i + 1 for i, name in enumerate(seeds)}
+        self.mark_mutated()
 
         if num_teams == 4:
             semis = self._play_round(
@@ -3273,6 +3619,8 @@ class Season:
             )
             self.champion = self._get_winner(finals[0])
 
+        self.mark_mutated()
+
     def simulate_bowls(self, bowl_count: int = 0, playoff_size: int = 4,
                        bowl_names: Optional[List[str]] = None, verbose: bool = False):
         """Simulate bowl games for non-playoff-bound teams.
@@ -3382,6 +3730,7 @@ class Season:
                 bowl.mvp_team = mvp[1]
                 bowl.mvp_reason = mvp[2]
             self.bowl_games.append(bowl)
+            self.mark_mutated()
 
 
 def _pick_ai_archetype() -> str:
@@ -4071,7 +4420,23 @@ def fast_generate_history(
     """Generate num_years of fast-simulated history.
 
     Returns list of dicts: [{year, champion, runner_up, final_four}, ...]
+
+    All years are simulated together by engine.history_sim when numpy is
+    available; otherwise falls back to one fast_sim_season call per year.
     """
+    years = [2026 - num_years + y for y in range(num_years)]
+    try:
+        from engine.history_sim import simulate_history_arrays
+    except ImportError:
+        simulate_history_arrays = None
+    if simulate_history_arrays is not None and num_years > 0:
+        ratings = {name: _team_avg_overall(t) for name, t in teams.items()}
+        arrays = simulate_history_arrays(
+            list(teams.keys()), ratings, conferences, years,
+            games_per_team=games_per_team, playoff_size=playoff_size, seed=base_seed,
+        )
+        return arrays.year_results()
+
     rng = random.Random(base_seed)
     results = []
     for y in range(num_years):
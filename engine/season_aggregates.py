@@ -0,0 +1,373 @@
+"""
+Season Aggregates — materialized player and team season totals.
+
+Every stats-site page that shows season totals (players, team stats,
+compare, analytics) and the awards selector used to rebuild them by
+re-walking every completed game's ``full_result``.  The store here is fed
+once per game from ``Season._update_standings`` and keeps running raw sums,
+so readers only pay for deriving rates from the totals.
+
+Player sums are bucketed by phase (regular season, playoff, bowl) because
+awards only count regular season + playoff games while the stats site
+counts everything.  Team sums always cover every phase.
+
+Usage:
+    from engine.season_aggregates import season_aggregates
+
+    store = season_aggregates(season)  # created/backfilled on first use
+    players = store.player_totals()    # {(team, name): totals}
+    teams = store.team_totals()        # {team: raw sums}
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from engine.viperball_metrics import game_quarter_scores
+
+PHASE_REGULAR = "regular"
+PHASE_PLAYOFF = "playoff"
+PHASE_BOWL = "bowl"
+PHASES = (PHASE_REGULAR, PHASE_PLAYOFF, PHASE_BOWL)
+
+# Union of every per-game player counter any season-total reader uses.
+PLAYER_COUNTING_STATS = (
+    "touches", "yards", "rushing_yards", "lateral_yards",
+    "tds", "fumbles", "laterals_thrown",
+    "kick_att", "kick_made", "pk_att", "pk_made", "dk_att", "dk_made",
+    "tackles", "tfl", "sacks", "hurries",
+    "kick_pass_yards", "kick_pass_tds",
+    "kick_passes_thrown", "kick_passes_completed",
+    "kick_pass_interceptions", "kick_pass_interceptions_thrown",
+    "kick_pass_receptions", "kick_pass_ints",
+    "kick_return_yards", "punt_return_yards",
+    "kick_returns", "kick_return_tds", "punt_returns", "punt_return_tds",
+    "rush_carries", "rushing_tds",
+    "lateral_receptions", "lateral_assists", "lateral_tds",
+    "muffs", "st_tackles",
+    "keeper_tackles", "keeper_bells", "kick_deflections",
+    "coverage_snaps", "keeper_return_yards",
+    "points_allowed_in_coverage", "completions_allowed_in_coverage",
+    "blocks", "pancakes",
+    "offensive_snaps", "defensive_snaps",
+    "wpa", "plays_involved",
+)
+
+TEAM_COUNTING_FIELDS = {
+    "games": 0,
+    # Scoring
+    "points_for": 0.0, "points_against": 0.0,
+    "q1_pf": 0.0, "q2_pf": 0.0, "q3_pf": 0.0, "q4_pf": 0.0,
+    "q1_pa": 0.0, "q2_pa": 0.0, "q3_pa": 0.0, "q4_pa": 0.0,
+    # Offense
+    "total_yards": 0, "total_plays": 0, "touchdowns": 0,
+    "rushing_yards": 0, "rushing_carries": 0, "rushing_tds": 0,
+    "kp_yards": 0, "kp_att": 0, "kp_comp": 0, "kp_tds": 0, "kp_ints": 0,
+    "lateral_chains": 0, "lateral_yards": 0, "successful_laterals": 0,
+    "dk_made": 0, "dk_att": 0, "pk_made": 0, "pk_att": 0,
+    # Special teams offense
+    "kr_yards": 0, "kr_count": 0, "kr_tds": 0,
+    "pr_yards": 0, "pr_count": 0, "pr_tds": 0,
+    "muffs": 0,
+    # Defense (opponent stats)
+    "opp_total_yards": 0, "opp_total_plays": 0, "opp_touchdowns": 0,
+    "opp_rushing_yards": 0, "opp_rushing_carries": 0, "opp_rushing_tds": 0,
+    "opp_kp_yards": 0, "opp_kp_att": 0, "opp_kp_comp": 0, "opp_kp_tds": 0, "opp_kp_ints": 0,
+    "opp_lateral_yards": 0, "opp_lateral_chains": 0,
+    # Special teams defense (opponent returns)
+    "opp_kr_yards": 0, "opp_kr_count": 0, "opp_kr_tds": 0,
+    "opp_pr_yards": 0, "opp_pr_count": 0, "opp_pr_tds": 0,
+    # Turnovers
+    "fumbles": 0, "tod": 0,
+    "opp_fumbles": 0, "opp_tod": 0,
+    # Penalties
+    "penalties": 0, "penalty_yards": 0,
+    "opp_penalties": 0, "opp_penalty_yards": 0,
+    # Efficiency / Delta / Bonus
+    "delta_yards": 0, "bonus_possessions": 0, "bonus_scores": 0,
+    "bonus_yards": 0, "delta_drives": 0, "delta_scores": 0,
+    "epa": 0, "viper_eff_sum": 0, "team_rating_sum": 0,
+    "viper_eff_n": 0, "team_rating_n": 0,
+    "down_4_att": 0, "down_4_conv": 0,
+    "down_5_att": 0, "down_5_conv": 0,
+    "down_6_att": 0, "down_6_conv": 0,
+}
+
+# (team field, offensive stat key) — summed from the team's own stats and,
+# with an ``opp_`` prefix, from the opponent's.
+_TEAM_OFFENSE_MAP = (
+    ("total_yards", "total_yards"), ("total_plays", "total_plays"),
+    ("touchdowns", "touchdowns"),
+    ("rushing_yards", "rushing_yards"), ("rushing_carries", "rushing_carries"),
+    ("rushing_tds", "rushing_touchdowns"),
+    ("kp_yards", "kick_pass_yards"), ("kp_att", "kick_passes_attempted"),
+    ("kp_comp", "kick_passes_completed"), ("kp_tds", "kick_pass_tds"),
+    ("kp_ints", "kick_pass_interceptions"),
+    ("lateral_chains", "lateral_chains"), ("lateral_yards", "lateral_yards"),
+    ("successful_laterals", "successful_laterals"),
+    ("dk_made", "drop_kicks_made"), ("dk_att", "drop_kicks_attempted"),
+    ("pk_made", "place_kicks_made"), ("pk_att", "place_kicks_attempted"),
+    ("kr_yards", "kick_return_yards"), ("kr_count", "kick_returns"),
+    ("kr_tds", "kick_return_tds"),
+    ("pr_yards", "punt_return_yards"), ("pr_count", "punt_returns"),
+    ("pr_tds", "punt_return_tds"),
+    ("muffs", "muffs"),
+    ("fumbles", "fumbles_lost"), ("tod", "turnovers_on_downs"),
+    ("penalties", "penalties"), ("penalty_yards", "penalty_yards"),
+    ("delta_yards", "delta_yards"), ("delta_drives", "delta_drives"),
+    ("delta_scores", "delta_scores"),
+    ("bonus_possessions", "bonus_possessions"),
+    ("bonus_scores", "bonus_possession_scores"),
+    ("bonus_yards", "bonus_possession_yards"),
+)
+_TEAM_DEFENSE_FIELDS = (
+    "total_yards", "total_plays", "touchdowns",
+    "rushing_yards", "rushing_carries", "rushing_tds",
+    "kp_yards", "kp_att", "kp_comp", "kp_tds", "kp_ints",
+    "lateral_yards", "lateral_chains",
+    "kr_yards", "kr_count", "kr_tds", "pr_yards", "pr_count", "pr_tds",
+    "fumbles", "tod", "penalties", "penalty_yards",
+)
+_TEAM_DEFENSE_MAP = tuple(
+    ("opp_" + f, stat) for f, stat in _TEAM_OFFENSE_MAP if f in _TEAM_DEFENSE_FIELDS
+)
+
+GameKey = Tuple[int, str, str]
+
+# Quarter lines for games with no recorded scoring (fast-sim results from
+# before per-quarter points were recorded).
+_NO_QUARTERS = {"home": [0.0, 0.0, 0.0, 0.0], "away": [0.0, 0.0, 0.0, 0.0]}
+
+
+def game_phase(game) -> str:
+    """Phase a college game belongs to, from its week number.
+
+    Mirrors Season.simulate_game: weeks >= 900 are postseason and bowls are
+    scheduled from week 1001 on.
+    """
+    week = getattr(game, "week", 0) or 0
+    if week > 1000:
+        return PHASE_BOWL
+    if week >= 900:
+        return PHASE_PLAYOFF
+    return PHASE_REGULAR
+
+
+def game_key(game) -> GameKey:
+    return (game.week, game.home_team, game.away_team)
+
+
+class SeasonAggregates:
+    """Running player/team season totals, fed one completed game at a time."""
+
+    def __init__(self):
+        self._applied: set = set()
+        # phase -> {(team, player): totals}
+        self._players: Dict[str, Dict[Tuple[str, str], dict]] = {p: {} for p in PHASES}
+        self._teams: Dict[str, dict] = {}
+
+    def __len__(self) -> int:
+        return len(self._applied)
+
+    def has_game(self, game) -> bool:
+        return game_key(game) in self._applied
+
+    # ── Writes ───────────────────────────────────────────────
+
+    def apply_game(self, game) -> bool:
+        """Add one completed game's player and team lines to the totals.
+
+        Returns False (and changes nothing) for games that are incomplete,
+        have no full result, or were already applied.
+        """
+        if not getattr(game, "completed", False) or not getattr(game, "full_result", None):
+            return False
+        key = game_key(game)
+        if key in self._applied:
+            return False
+        self._applied.add(key)
+
+        fr = game.full_result
+        ps = fr.get("player_stats", {})
+        bucket = self._players[game_phase(game)]
+        for side, t_name in (("home", game.home_team), ("away", game.away_team)):
+            for p in ps.get(side, []):
+                name = p.get("name", "")
+                if not name:
+                    continue
+                rec = bucket.get((t_name, name))
+                if rec is None:
+                    rec = bucket[(t_name, name)] = _new_player_totals(t_name, name)
+                _accumulate_player(rec, p)
+
+        self._apply_team_lines(game, fr)
+        return True
+
+    def sync(self, games: Iterable) -> int:
+        """Apply any completed games not seen yet; returns how many were added.
+
+        Covers seasons restored from saves and any game completed without
+        going through ``Season._update_standings``.
+        """
+        added = 0
+        for game in games:
+            if self.apply_game(game):
+                added += 1
+        return added
+
+    def _apply_team_lines(self, game, fr: dict):
+        stats = fr.get("stats", {})
+        qs = game_quarter_scores(fr) or _NO_QUARTERS
+        for side, opp_side, t_name in (("home", "away", game.home_team),
+                                       ("away", "home", game.away_team)):
+            s = stats.get(side)
+            if not s:
+                continue
+            opp_s = stats.get(opp_side)
+            a = self._teams.get(t_name)
+            if a is None:
+                a = self._teams[t_name] = dict(TEAM_COUNTING_FIELDS)
+            a["games"] += 1
+
+            my_score = game.home_score if side == "home" else game.away_score
+            opp_score = game.away_score if side == "home" else game.home_score
+            a["points_for"] += my_score if my_score else 0
+            a["points_against"] += opp_score if opp_score else 0
+
+            my_q, opp_q = qs[side], qs[opp_side]
+            for q in range(4):
+                a[f"q{q + 1}_pf"] += my_q[q]
+                a[f"q{q + 1}_pa"] += opp_q[q]
+
+            for f, stat in _TEAM_OFFENSE_MAP:
+                a[f] += s.get(stat, 0)
+            if opp_s:
+                for f, stat in _TEAM_DEFENSE_MAP:
+                    a[f] += opp_s.get(stat, 0)
+
+            epa_val = s.get("epa", 0)
+            if isinstance(epa_val, dict):
+                a["epa"] += epa_val.get("total_epa", epa_val.get("wpa", 0))
+            elif isinstance(epa_val, (int, float)):
+                a["epa"] += epa_val
+            ve = s.get("viper_efficiency")
+            if ve is not None:
+                a["viper_eff_sum"] += ve
+                a["viper_eff_n"] += 1
+            vm = s.get("viperball_metrics", {})
+            tr = vm.get("team_rating") if vm else None
+            if tr is not None:
+                a["team_rating_sum"] += tr
+                a["team_rating_n"] += 1
+            dc = s.get("down_conversions", {})
+            for d in (4, 5, 6):
+                dd = dc.get(d, dc.get(str(d), {}))
+                a[f"down_{d}_att"] += dd.get("attempts", 0)
+                a[f"down_{d}_conv"] += dd.get("converted", 0)
+
+    # ── Reads ────────────────────────────────────────────────
+
+    def player_totals(self, phases: Optional[Iterable[str]] = None) -> Dict[Tuple[str, str], dict]:
+        """Season totals per (team, player), merged over ``phases`` (default all).
+
+        Returned dicts are fresh copies; callers may add derived fields.
+        """
+        merged: Dict[Tuple[str, str], dict] = {}
+        for phase in (PHASES if phases is None else phases):
+            for key, rec in self._players[phase].items():
+                out = merged.get(key)
+                if out is None:
+                    merged[key] = dict(rec)
+                else:
+                    _merge_player(out, rec)
+        return merged
+
+    def iter_player_totals(self, phases: Optional[Iterable[str]] = None
+                           ) -> Iterator[Tuple[Tuple[str, str], dict]]:
+        """``player_totals()`` one ``(key, totals)`` pair at a time.
+
+        Same order and values, but only one merged copy is alive at once —
+        for streaming exports over dynasty-sized seasons.
+        """
+        phases = PHASES if phases is None else tuple(phases)
+        seen = set()
+        for phase in phases:
+            for key in self._players[phase]:
+                if key in seen:
+                    continue
+                seen.add(key)
+                yield key, self.player(key[0], key[1], phases)
+
+    def player(self, team_name: str, player_name: str,
+               phases: Optional[Iterable[str]] = None) -> Optional[dict]:
+        out = None
+        for phase in (PHASES if phases is None else phases):
+            rec = self._players[phase].get((team_name, player_name))
+            if rec is None:
+                continue
+            if out is None:
+                out = dict(rec)
+            else:
+                _merge_player(out, rec)
+        return out
+
+    def team_totals(self) -> Dict[str, dict]:
+        """Raw per-team sums over every phase (fresh copies)."""
+        return {t: dict(a) for t, a in self._teams.items()}
+
+
+def _new_player_totals(team_name: str, name: str) -> dict:
+    rec = {"name": name, "team": team_name, "tag": "", "archetype": "",
+           "position": "", "games": 0}
+    for stat in PLAYER_COUNTING_STATS:
+        rec[stat] = 0
+    rec["wpa"] = 0.0
+    rec["points_allowed_in_coverage"] = 0.0
+    return rec
+
+
+def _accumulate_player(rec: dict, p: dict):
+    rec["games"] += 1
+    if not rec["tag"]:
+        rec["tag"] = p.get("tag", "")
+    if not rec["archetype"] or rec["archetype"] == "—":
+        rec["archetype"] = p.get("archetype", "")
+    if not rec["position"]:
+        rec["position"] = p.get("position", "")
+    for stat in PLAYER_COUNTING_STATS:
+        v = p.get(stat)
+        if v:
+            rec[stat] += v
+
+
+def _merge_player(out: dict, rec: dict):
+    out["games"] += rec["games"]
+    for field in ("tag", "position"):
+        if not out[field]:
+            out[field] = rec[field]
+    if not out["archetype"] or out["archetype"] == "—":
+        out["archetype"] = rec["archetype"]
+    for stat in PLAYER_COUNTING_STATS:
+        out[stat] += rec[stat]
+
+
+def season_aggregates(season) -> SeasonAggregates:
+    """The season's aggregate store, created and backfilled on first use."""
+    store = getattr(season, "_aggregates", None)
+    if store is None:
+        store = SeasonAggregates()
+        try:
+            season._aggregates = store
+        except AttributeError:
+            pass
+    store.sync(season_games(season))
+    return store
+
+
+def season_games(season) -> List:
+    """Every game of the season: schedule, then playoff bracket, then bowls."""
+    games = list(getattr(season, "schedule", None) or [])
+    games.extend(getattr(season, "playoff_bracket", None) or [])
+    for bg in (getattr(season, "bowl_games", None) or []):
+        games.append(bg.game)
+    return games
@@ -0,0 +1,130 @@
+"""
+Season Index — inverted lookups from players, teams, matchups and referees
+to the completed games they appear in.
+
+Profile pages (player game logs, head-to-head, referee game logs) used to
+find their games by scanning the whole schedule, playoff bracket and bowl
+list and then every box score's player lines for a name match.  The index
+is fed once per game from ``Season._update_standings`` alongside the
+aggregate store, so a lookup costs O(appearances) instead of O(season).
+
+Entries hold references to the live ``Game`` objects (and, for players, to
+the player's line inside ``full_result``), so nothing is copied.  Lookups
+return games in week order, which is also regular season → playoff → bowl
+order since postseason weeks are numbered 995+.
+
+Usage:
+    from engine.season_index import season_index
+
+    index = season_index(season)            # created/backfilled on first use
+    index.player_games("Gators", "Ann Lee")  # [(game, side, line), ...]
+    index.matchup_games("Gators", "Owls")    # [game, ...]
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Tuple
+
+from engine.season_aggregates import game_key, season_games
+
+# Separator the season uses when naming a referee crew for the engine.
+REFEREE_CREW_SEPARATOR = ", "
+
+
+def referee_crew(game) -> List[str]:
+    """Names of the referees who worked ``game`` (from its box score)."""
+    fr = getattr(game, "full_result", None) or {}
+    crew = (fr.get("referee") or {}).get("name") or ""
+    return [n for n in crew.split(REFEREE_CREW_SEPARATOR) if n]
+
+
+class SeasonIndex:
+    """Inverted game index for one season, fed incrementally."""
+
+    def __init__(self):
+        self._seen: set = set()
+        self._by_team: Dict[str, List] = {}
+        self._by_pair: Dict[Tuple[str, str], List] = {}
+        self._by_player: Dict[Tuple[str, str], List[Tuple[object, str, dict]]] = {}
+        self._by_referee: Dict[str, List] = {}
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def has_game(self, game) -> bool:
+        return game_key(game) in self._seen
+
+    def apply_game(self, game) -> bool:
+        """Index one completed game; returns False if skipped or already seen."""
+        if not getattr(game, "completed", False):
+            return False
+        key = game_key(game)
+        if key in self._seen:
+            return False
+        self._seen.add(key)
+
+        home, away = game.home_team, game.away_team
+        self._by_team.setdefault(home, []).append(game)
+        if away != home:
+            self._by_team.setdefault(away, []).append(game)
+        self._by_pair.setdefault(_pair(home, away), []).append(game)
+
+        fr = getattr(game, "full_result", None)
+        if fr:
+            player_stats = fr.get("player_stats", {})
+            for side, team_name in (("home", home), ("away", away)):
+                named = set()
+                for line in player_stats.get(side, []):
+                    name = line.get("name")
+                    if name and name not in named:
+                        named.add(name)
+                        self._by_player.setdefault((team_name, name), []).append(
+                            (game, side, line))
+            for ref_name in referee_crew(game):
+                self._by_referee.setdefault(ref_name, []).append(game)
+        return True
+
+    def sync(self, games) -> int:
+        """Index any completed games not seen yet; returns how many were added."""
+        added = 0
+        for game in games:
+            if self.apply_game(game):
+                added += 1
+        return added
+
+    # ── Reads ────────────────────────────────────────────────
+
+    def team_games(self, team_name: str) -> List:
+        return sorted(self._by_team.get(team_name, ()), key=_game_week)
+
+    def matchup_games(self, team_a: str, team_b: str) -> List:
+        return sorted(self._by_pair.get(_pair(team_a, team_b), ()), key=_game_week)
+
+    def player_games(self, team_name: str, player_name: str) -> List[Tuple[object, str, dict]]:
+        """``(game, side, line)`` for each game the player has a box-score line in."""
+        return sorted(self._by_player.get((team_name, player_name), ()),
+                      key=lambda entry: entry[0].week)
+
+    def referee_games(self, referee_name: str) -> List:
+        return sorted(self._by_referee.get(referee_name, ()), key=_game_week)
+
+
+def _pair(team_a: str, team_b: str) -> Tuple[str, str]:
+    return (team_a, team_b) if team_a <= team_b else (team_b, team_a)
+
+
+def _game_week(game) -> int:
+    return game.week
+
+
+def season_index(season) -> SeasonIndex:
+    """The season's game index, created and backfilled on first use."""
+    index = getattr(season, "_index", None)
+    if index is None:
+        index = SeasonIndex()
+        try:
+            season._index = index
+        except AttributeError:
+            pass
+    index.sync(season_games(season))
+    return index
@@ -0,0 +1,152 @@
+"""
+JSON Serialization
+==================
+
+One place for encoding saves, box scores, API responses and exports.
+
+Uses ``orjson`` when it is installed — several times faster than the
+stdlib on season-sized documents, and it writes bytes, which is what the
+save store compresses anyway — and falls back to stdlib ``json``
+otherwise (or when ``VIPERBALL_JSON=stdlib``).  Either backend produces
+the same document:
+
+  - Non-JSON values are handled by one hook, shared by both backends.
+    Dataclasses encode as their ``to_dict()`` when they define one (the
+    persisted shape of PlayerCard, Injury, CoachCard, ...), otherwise as
+    their fields; ``register_encoder`` overrides either.  Objects can be
+    handed over as they are — the hook runs as the encoder reaches them,
+    so no to_dict tree is built up front.  Enums encode as their value
+    (what orjson does natively).  Anything else becomes ``str(obj)``,
+    matching the ``default=str`` callers used before.
+  - Non-string keys become strings as the stdlib does.
+  - NaN and infinities, which JSON has no literal for, are written as
+    ``null`` (orjson's behaviour) rather than the stdlib's bare ``NaN``.
+  - Documents orjson rejects (integers beyond 64 bits) are re-encoded
+    with the stdlib; text orjson can't parse (NaN/Infinity in documents
+    the stdlib wrote before) is parsed by the stdlib.
+
+Output is compact (``{"a":1}``) unless ``indent`` is given.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import enum
+import json
+import math
+import os
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import orjson as _orjson
+except ImportError:  # stdlib json is always available
+    _orjson = None
+
+BACKEND = "orjson" if _orjson is not None and os.environ.get("VIPERBALL_JSON") != "stdlib" else "json"
+
+_ENCODERS: Dict[type, Callable[[Any], Any]] = {}
+
+
+def register_encoder(cls: type, encode: Callable[[Any], Any]):
+    """Encode instances of exactly ``cls`` as ``encode(obj)``."""
+    _ENCODERS[cls] = encode
+
+
+def _field_encoder(cls: type) -> Callable[[Any], Any]:
+    names = tuple(f.name for f in dataclasses.fields(cls))
+    return lambda obj: {name: getattr(obj, name) for name in names}
+
+
+def _default(obj):
+    encode = _ENCODERS.get(type(obj))
+    if encode is None:
+        cls = type(obj)
+        if dataclasses.is_dataclass(cls):
+            encode = cls.to_dict if callable(getattr(cls, "to_dict", None)) else _field_encoder(cls)
+            _ENCODERS[cls] = encode
+        elif isinstance(obj, float):  # float subclasses (numpy.float64) are numbers
+            return float(obj)
+        elif isinstance(obj, enum.Enum):
+            return obj.value
+        else:
+            return str(obj)
+    return encode(obj)
+
+
+def _floatstr(value: float) -> str:
+    return float.__repr__(value) if math.isfinite(value) else "null"
+
+
+class _Encoder(json.JSONEncoder):
+    """stdlib encoder that writes non-finite floats as null, like orjson.
+
+    Documents without them take the C encoder (which refuses them, since
+    ``allow_nan`` is off); the rest are re-encoded on the pure-Python path
+    with ``_floatstr``, which streaming and indented output use anyway.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(allow_nan=False, **kwargs)
+
+    def iterencode(self, o, _one_shot=False):
+        if _one_shot and self.indent is None:
+            try:
+                return super().iterencode(o, _one_shot)
+            except ValueError:
+                pass  # a NaN or infinity somewhere in the document
+        markers = {} if self.check_circular else None
+        encoder = (json.encoder.encode_basestring_ascii if self.ensure_ascii
+                   else json.encoder.encode_basestring)
+        return json.encoder._make_iterencode(
+            markers, self.default, encoder, self.indent, _floatstr,
+            self.key_separator, self.item_separator, self.sort_keys,
+            self.skipkeys, _one_shot,
+        )(o, 0)
+
+
+_stdlib_compact = _Encoder(default=_default, separators=(",", ":"))
+
+if _orjson is not None:
+    _OPTIONS = _orjson.OPT_NON_STR_KEYS | _orjson.OPT_PASSTHROUGH_DATACLASS | _orjson.OPT_PASSTHROUGH_DATETIME
+
+
+def dumpb(obj: Any, indent: Optional[int] = None) -> bytes:
+    """Encode ``obj`` as UTF-8 JSON bytes."""
+    if BACKEND == "orjson" and indent in (None, 2):
+        try:
+            return _orjson.dumps(obj, default=_default,
+                                 option=_OPTIONS | (_orjson.OPT_INDENT_2 if indent else 0))
+        except _orjson.JSONEncodeError:
+            pass
+    return _stdlib_dumps(obj, indent).encode("utf-8")
+
+
+def dumps(obj: Any, indent: Optional[int] = None) -> str:
+    """Encode ``obj`` as JSON text."""
+    if BACKEND == "orjson" and indent in (None, 2):
+        return dumpb(obj, indent).decode("utf-8")
+    return _stdlib_dumps(obj, indent)
+
+
+def _stdlib_dumps(obj: Any, indent: Optional[int]) -> str:
+    if indent is None:
+        return _stdlib_compact.encode(obj)
+    return _Encoder(default=_default, indent=indent).encode(obj)
+
+
+def loads(data) -> Any:
+    """Parse JSON from ``str``, ``bytes`` or a buffer."""
+    if BACKEND == "orjson":
+        try:
+            return _orjson.loads(data)
+        except _orjson.JSONDecodeError:
+            pass
+    if not isinstance(data, str):
+        data = bytes(data).decode("utf-8")
+    return json.loads(data)
+
+
+def iterencode(obj: Any, indent: Optional[int] = None):
+    """Encode ``obj`` piece by piece (stdlib; for streaming huge documents)."""
+    return _Encoder(default=_default, indent=indent,
+                    separators=None if indent else (",", ":")).iterencode(obj)
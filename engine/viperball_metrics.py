@@ -539,7 +539,8 @@ def calculate_defensive_impact(plays: List[Dict], drives: List[Dict],
 # ═══════════════════════════════════════════════════════════════
 
 def calculate_comprehensive_rating(plays: List[Dict], drives: List[Dict], team: str,
-                                   game_stats: Optional[Dict] = None) -> Dict:
+                                   game_stats: Optional[Dict] = None,
+                                   quarter_scores: Optional[Dict] = None) -> Dict:
     """Calculate all fan-friendly metrics for one team in a game.
 
     Returns a dict with the new metric names. Also includes legacy
@@ -560,7 +561,7 @@ def calculate_comprehensive_rating(plays: List[Dict], drives: List[Dict], team:
     delta = calculate_delta_profile(plays, drives, team)
 
     # Quarter-by-quarter scoring (tennis set analogy)
-    quarter_scoring = calculate_quarter_scoring(plays, team)
+    quarter_scoring = calculate_quarter_scoring(plays, team, quarter_scores)
 
     metrics = {
         # New fan-friendly metrics
@@ -594,7 +595,48 @@ def calculate_comprehensive_rating(plays: List[Dict], drives: List[Dict], team:
     return metrics
 
 
-def calculate_quarter_scoring(plays: List[Dict], team: str) -> Dict:
+def quarter_points(plays: List[Dict]) -> Dict[str, List[float]]:
+    """Points each side scored in Q1-Q4, from the running score on each play.
+
+    Overtime plays (quarter > 4) are left out, so the four quarters only
+    sum to the final score in regulation games.  The engine stores this in
+    the game result as ``quarter_scores`` so later readers never have to
+    walk the play-by-play again.
+    """
+    home_q = [0.0, 0.0, 0.0, 0.0]
+    away_q = [0.0, 0.0, 0.0, 0.0]
+    prev_home = 0.0
+    prev_away = 0.0
+    for play in plays:
+        q = play.get("quarter", 0)
+        if q < 1 or q > 4:
+            continue
+        cur_home = play.get("home_score", prev_home)
+        cur_away = play.get("away_score", prev_away)
+        home_q[q - 1] += cur_home - prev_home
+        away_q[q - 1] += cur_away - prev_away
+        prev_home = cur_home
+        prev_away = cur_away
+    return {"home": home_q, "away": away_q}
+
+
+def game_quarter_scores(game_result: Dict) -> Optional[Dict[str, List[float]]]:
+    """Per-quarter points for a game result, or None if unknown.
+
+    Uses the ``quarter_scores`` recorded at simulation time; results saved
+    before that was recorded fall back to the play-by-play.
+    """
+    qs = game_result.get("quarter_scores")
+    if qs:
+        return qs
+    plays = game_result.get("play_by_play")
+    if plays and isinstance(plays, list) and "home_score" in plays[0]:
+        return quarter_points(plays)
+    return None
+
+
+def calculate_quarter_scoring(plays: List[Dict], team: str,
+                              quarter_scores: Optional[Dict] = None) -> Dict:
     """Quarter-by-quarter scoring breakdown — the tennis set analogy.
 
     In tennis, you can win more total points but lose the match because
@@ -602,6 +644,9 @@ def calculate_quarter_scoring(plays: List[Dict], team: str) -> Dict:
     the same thing happens: a team can dominate Q1 and Q3 but lose
     the close quarters, and the DYE system amplifies the effect.
 
+    ``quarter_scores`` (from ``quarter_points``) skips the play walk when
+    the caller already has it.
+
     Returns:
       quarters:      dict of Q1-Q4 with team/opponent points per quarter
       quarters_won:  count of quarters where team outscored opponent
@@ -611,61 +656,19 @@ def calculate_quarter_scoring(plays: List[Dict], team: str) -> Dict:
       clutch_quarters:  quarters won by < 5 points (winning the close ones)
       point_spread_by_quarter: per-Q point differential
     """
-    # Accumulate scoring by quarter
-    q_team = {1: 0.0, 2: 0.0, 3: 0.0, 4: 0.0}
-    q_opp = {1: 0.0, 2: 0.0, 3: 0.0, 4: 0.0}
-
-    # Track last known score at end of each quarter
-    prev_home = 0.0
-    prev_away = 0.0
-    last_q = 0
-
-    for play in plays:
-        q = play.get("quarter", 0)
-        if q < 1 or q > 4:
-            continue
-        hs = play.get("home_score", prev_home)
-        aws = play.get("away_score", prev_away)
-
-        # When quarter changes, record the delta
-        if q != last_q and last_q > 0 and last_q <= 4:
-            if play.get("possession") == team or team == "home":
-                q_team[last_q] = hs - (prev_home if last_q == 1 else q_team.get("_base_h", 0))
-                q_opp[last_q] = aws - (prev_away if last_q == 1 else q_team.get("_base_a", 0))
-
-        prev_home = hs
-        prev_away = aws
-        last_q = q
-
-    # Simpler approach: derive from play-by-play score tracking
-    # Find score at end of each quarter
-    q_end_scores = {}
-    for play in plays:
-        q = play.get("quarter", 0)
-        if 1 <= q <= 4:
-            q_end_scores[q] = (play.get("home_score", 0), play.get("away_score", 0))
+    if quarter_scores is None:
+        quarter_scores = quarter_points(plays)
 
     is_home = (team == "home")
+    team_q = quarter_scores["home"] if is_home else quarter_scores["away"]
+    opp_q = quarter_scores["away"] if is_home else quarter_scores["home"]
     quarters = {}
-    prev_team_score = 0.0
-    prev_opp_score = 0.0
-
     for q in range(1, 5):
-        if q not in q_end_scores:
-            quarters[q] = {"team_pts": 0.0, "opp_pts": 0.0, "diff": 0.0}
-            continue
-        hs, aws = q_end_scores[q]
-        team_score = hs if is_home else aws
-        opp_score = aws if is_home else hs
-        team_q_pts = team_score - prev_team_score
-        opp_q_pts = opp_score - prev_opp_score
         quarters[q] = {
-            "team_pts": team_q_pts,
-            "opp_pts": opp_q_pts,
-            "diff": team_q_pts - opp_q_pts,
+            "team_pts": team_q[q - 1],
+            "opp_pts": opp_q[q - 1],
+            "diff": team_q[q - 1] - opp_q[q - 1],
         }
-        prev_team_score = team_score
-        prev_opp_score = opp_score
 
     # Tennis-style analysis
     quarters_won = sum(1 for q in quarters.values() if q["diff"] > 0)
@@ -702,17 +705,31 @@ def calculate_viperball_metrics(game_result: Dict, team: str) -> Dict:
     Returns dict with all metrics plus the composite Team Rating
     stored under both 'team_rating' and legacy 'opi' keys.
     """
+    # Pass game_stats so scoring profile and defensive impact
+    # can access bonus possession data
+    game_stats = game_result.get('stats', {}).get(team, {})
+
+    # The full engine already ran these over the same plays and drives at
+    # simulation time; reuse them rather than re-walking the play-by-play.
+    precomputed = game_stats.get('viperball_metrics')
+    if precomputed:
+        metrics = dict(precomputed)
+        metrics.pop('overall_performance_index', None)
+        team_rating = metrics.get('team_rating')
+        if team_rating is None:
+            team_rating = calculate_team_rating(metrics)
+            metrics['team_rating'] = team_rating
+        metrics['opi'] = team_rating  # legacy alias
+        return metrics
+
     plays = game_result.get('play_by_play', [])
     drives = game_result.get('drives', [])
 
     if not drives:
         drives = game_result.get('drive_summary', [])
 
-    # Pass game_stats so scoring profile and defensive impact
-    # can access bonus possession data
-    game_stats = game_result.get('stats', {}).get(team, {})
-
-    metrics = calculate_comprehensive_rating(plays, drives, team, game_stats)
+    metrics = calculate_comprehensive_rating(plays, drives, team, game_stats,
+                                             game_quarter_scores(game_result))
     team_rating = calculate_team_rating(metrics)
     metrics['team_rating'] = team_rating
     metrics['opi'] = team_rating  # legacy alias
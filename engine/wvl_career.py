@@ -357,12 +357,14 @@ class WVLCareerLeague:
     # ─────────────────────────────────────────────────────────────
     # SEASON ROLLOVER
     # ─────────────────────────────────────────────────────────────
-    def advance_season(self) -> dict:
+    def advance_season(self, progress_callback=None) -> dict:
         """Close the current season, age the league, and start the next one.
 
         Careers persist on the cards (their current SeasonStats stays in
         career_seasons); aging players retire out but keep their history.
         New CVL graduates are pulled in for the new year.
+        progress_callback: optional callable(steps_done, total) after each
+        of aging, the graduate import and the new season's setup.
         """
         champ = self.champion()
         self.history.append({
@@ -387,9 +389,15 @@ class WVLCareerLeague:
                     if pid in pids:
                         pids.remove(pid)
 
+        if progress_callback:
+            progress_callback(1, 3)
         self.year += 1
         imp = self.import_graduates(consume=True)
+        if progress_callback:
+            progress_callback(2, 3)
         self.setup_season()
+        if progress_callback:
+            progress_callback(3, 3)
         return {
             "year": self.year,
             "previous_champion": champ,
@@ -15,6 +15,7 @@ from typing import Dict, List, Optional
 
 from engine.pro_league import ProLeagueConfig, ProLeagueSeason, ProTeamRecord
 from engine.injuries import InjuryTracker
+from engine.lazy_sections import LazySections
 from engine.game_engine import load_team_from_json
 from engine.wvl_config import (
     ALL_WVL_TIERS, TIER_BY_NUMBER, WVLTierConfig, CLUBS_BY_KEY,
@@ -64,9 +65,12 @@ def _tier_to_pro_config(tier: WVLTierConfig, tier_assignments: Dict[str, int]) -
     )
 
 
-class WVLMultiTierSeason:
+class WVLMultiTierSeason(LazySections):
     """Manages a full WVL season across all 4 tiers."""
 
+    # Own state changes (phase, promotion/relegation); see mutation_version.
+    _mutation_version: int = 0
+
     def __init__(self, tier_assignments: Dict[str, int]):
         """Initialize all 4 tier seasons.
 
@@ -133,6 +137,16 @@ class WVLMultiTierSeason:
         if self.tier_seasons:
             self.phase = "regular_season"
 
+    @property
+    def mutation_version(self) -> int:
+        """Monotonic state version: own changes plus every tier season's."""
+        return self._mutation_version + sum(
+            s.mutation_version for s in self.tier_seasons.values()
+        )
+
+    def mark_mutated(self):
+        self._mutation_version += 1
+
     def sim_week_all_tiers(self, use_fast_sim: bool = True) -> Dict[int, dict]:
         """Simulate one week across all tiers. Returns tier_num → week results."""
         results = {}
@@ -156,6 +170,7 @@ class WVLMultiTierSeason:
         )
         if all_done:
             self.phase = "playoffs_pending"
+            self.mark_mutated()
 
         return results
 
@@ -169,6 +184,7 @@ class WVLMultiTierSeason:
             all_results[tier_num] = {"weeks": tier_results}
 
         self.phase = "playoffs_pending"
+        self.mark_mutated()
         return all_results
 
     def start_playoffs_all(self):
@@ -177,6 +193,7 @@ class WVLMultiTierSeason:
             if season.phase != "playoffs":
                 season.start_playoffs()
         self.phase = "playoffs"
+        self.mark_mutated()
 
     def advance_playoffs_all(self) -> Dict[int, dict]:
         """Advance one round of playoffs across all tiers."""
@@ -195,6 +212,7 @@ class WVLMultiTierSeason:
         )
         if all_done:
             self.phase = "season_complete"
+            self.mark_mutated()
 
         return results
 
@@ -368,4 +386,5 @@ class WVLMultiTierSeason:
 
         self.promotion_result = result
         self.tier_assignments = result.new_tier_assignments
+        self.mark_mutated()
         return result
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Save-store latency benchmark.
+
+Times save_blob / load_blob / list_saves round trips against a scratch
+database with the connection pool on (default size) and off (size 0, a
+fresh sqlite3.connect + pragmas per call), for a small prefs-sized
+document and a box-score-sized one.
+
+Usage:
+    python scripts/bench_db.py
+    python scripts/bench_db.py --ops 2000 --pool-size 8
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from engine import db
+
+
+def _documents():
+    small = {"theme": "dark", "favorites": ["Gators", "Owls"]}
+    box = {
+        "player_stats": {
+            side: [{"name": f"Player {i}", "yards": i * 3, "tds": i % 3, "tag": "ZB1"}
+                   for i in range(40)]
+            for side in ("home", "away")
+        },
+        "play_by_play": [{"quarter": 1 + i // 60, "description": "run up the middle " * 3}
+                         for i in range(240)],
+    }
+    return {"small": small, "box score": box}
+
+
+def _latency_us(fn, ops: int) -> tuple:
+    samples = []
+    for i in range(ops):
+        start = time.perf_counter()
+        fn(i)
+        samples.append((time.perf_counter() - start) * 1e6)
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.95)]
+
+
+def run(ops: int, pool_size: int):
+    original_path = db.get_db_path()
+    original_size = db.pool_stats()["size"]
+    docs = _documents()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            db.set_db_path(Path(tmp) / "bench.db")
+            db.init_db()
+            print(f"{ops} ops each; median / p95 latency in µs")
+            print(f"  {'operation':<22}{'per-call':>20}{'pooled':>20}{'speedup':>10}")
+            for label, doc in docs.items():
+                rows = [
+                    (f"save_blob ({label})", lambda i, d=doc: db.save_blob("bench", f"k{i % 50}", d)),
+                    (f"load_blob ({label})", lambda i: db.load_blob("bench", f"k{i % 50}")),
+                ]
+                if label == "small":
+                    rows.append(("list_saves", lambda i: db.list_saves("bench")))
+                for name, fn in rows:
+                    timings = {}
+                    for mode, size in (("per-call", 0), ("pooled", pool_size)):
+                        db.set_pool_size(size)
+                        fn(0)  # warm up (and seed rows for loads)
+                        timings[mode] = _latency_us(fn, ops)
+                    cells = "".join(f"{m:>11.0f} / {p:>6.0f}" for m, p in timings.values())
+                    speedup = timings["per-call"][0] / max(timings["pooled"][0], 1e-9)
+                    print(f"  {name:<22}{cells}{speedup:>9.1f}x")
+                db.prune_save_history(keep_per_key=0)
+            print(f"\npool: {db.pool_stats()}")
+    finally:
+        db.set_pool_size(original_size)
+        db.set_db_path(original_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--ops", type=int, default=1000)
+    parser.add_argument("--pool-size", type=int, default=4)
+    args = parser.parse_args()
+    run(args.ops, args.pool_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Ranking composite solver benchmark.
+
+Times the matrix/graph ranking methods (and a full calculate_composite run)
+on the numpy and pure-Python linear-algebra backends for synthetic leagues
+of 24 (pro), 187 (CVL) and 500 teams.
+
+Usage:
+    python scripts/bench_ranking_composite.py
+    python scripts/bench_ranking_composite.py --teams 24 187 --games 12 --skip-python-above 200
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from engine import ranking_composite as rc
+
+SOLVERS = [
+    ("colley", rc.calculate_colley),
+    ("massey", rc.calculate_massey),
+    ("sagarin_pred", rc.calculate_sagarin_predictor),
+    ("sagarin_recent", rc.calculate_sagarin_recent),
+    ("truncated_colley", rc.calculate_truncated_colley),
+    ("keener", rc.calculate_keener),
+    ("od_rating", rc.calculate_od_rating),
+    ("pagerank", rc.calculate_pagerank),
+    ("markov_walker", rc.calculate_markov_walker),
+    ("lrmc", rc.calculate_lrmc),
+    ("park_newman", rc.calculate_park_newman),
+]
+
+
+def synthetic_league(n_teams: int, games_per_team: int, seed: int = 7):
+    """Random-pairing season with strength-driven scores, in week order."""
+    rng = random.Random(seed)
+    teams = [f"Team {i:03d}" for i in range(n_teams)]
+    strength = {t: rng.gauss(0, 10) for t in teams}
+    games = []
+    for _ in range(games_per_team):
+        order = teams[:]
+        rng.shuffle(order)
+        for home, away in zip(order[::2], order[1::2]):
+            edge = strength[home] - strength[away] + rng.gauss(2, 12)
+            games.append(rc.GameResult(
+                home_team=home,
+                away_team=away,
+                home_score=max(0, round(35 + edge / 2)),
+                away_score=max(0, round(35 - edge / 2)),
+            ))
+    return games
+
+
+def _time(fn, *args, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(team_counts, games_per_team: int, skip_python_above: int):
+    backends = [b for b in rc.LINALG_BACKENDS if b != "numpy" or rc._np is not None]
+    original = rc.get_linalg_backend()
+    try:
+        for n in team_counts:
+            games = synthetic_league(n, games_per_team)
+            print(f"\n{n} teams, {len(games)} games")
+            print(f"  {'method':<18}" + "".join(f"{b:>12}" for b in backends) + f"{'speedup':>10}")
+            rows = SOLVERS + [("composite (all)", rc.calculate_composite)]
+            for name, fn in rows:
+                timings = {}
+                for backend in backends:
+                    if backend == "python" and n > skip_python_above:
+                        continue
+                    rc.set_linalg_backend(backend)
+                    timings[backend] = _time(fn, games, repeat=1 if backend == "python" else 3)
+                cells = "".join(
+                    f"{timings[b] * 1000:>10.1f}ms" if b in timings else f"{'—':>12}"
+                    for b in backends
+                )
+                speedup = ""
+                if "numpy" in timings and "python" in timings and timings["numpy"] > 0:
+                    speedup = f"{timings['python'] / timings['numpy']:>9.1f}x"
+                print(f"  {name:<18}{cells}{speedup:>10}")
+    finally:
+        rc.set_linalg_backend(original)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--teams", type=int, nargs="+", default=[24, 187, 500])
+    parser.add_argument("--games", type=int, default=12, help="games per team")
+    parser.add_argument("--skip-python-above", type=int, default=10_000,
+                        help="skip the pure-Python backend for leagues larger than this")
+    args = parser.parse_args()
+    run(args.teams, args.games, args.skip_python_above)
+
+
+if __name__ == "__main__":
+    main()
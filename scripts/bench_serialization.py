@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Serialization throughput benchmark.
+
+Encodes and decodes real save payloads with the stdlib json backend and
+with orjson (when installed) through engine.serialization, and times the
+stdlib ``json.dumps(default=str)`` path saves used before for reference:
+
+  - dynasty: every dynasty in --db (the saves database), or one built from
+    data/teams with --history-years of simulated history and the teams'
+    coaching staffs
+  - box score: full_result of a simulated game
+  - coaching staffs: CoachCard objects handed to the encoder as they are,
+    against calling to_dict() on each first
+
+Usage:
+    python scripts/bench_serialization.py
+    python scripts/bench_serialization.py --db data/viperball.db --repeat 20
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from engine import db, serialization
+
+TEAMS_DIR = Path(__file__).parent.parent / "data" / "teams"
+
+
+def _built_dynasty(history_years: int):
+    from engine.dynasty import create_dynasty
+    from engine.geography import get_geographic_conference_defaults
+    from engine.season import load_coaching_staffs_from_directory, load_teams_with_states
+
+    teams, _ = load_teams_with_states(str(TEAMS_DIR), fresh=True)
+    names = list(teams)
+    dynasty = create_dynasty("Bench Dynasty", "Coach", names[0])
+    for conf, members in get_geographic_conference_defaults(str(TEAMS_DIR), names, 12).items():
+        dynasty.add_conference(conf, members)
+    dynasty.simulate_history(history_years, str(TEAMS_DIR))
+    dynasty._coaching_staffs = load_coaching_staffs_from_directory(str(TEAMS_DIR))
+    return dynasty
+
+
+def _payloads(db_path, history_years: int):
+    payloads = {}
+    if db_path:
+        db.set_db_path(db_path)
+        for meta in db.list_dynasties():
+            payloads[f"dynasty {meta['save_key']}"] = db.load_blob("dynasty", meta["save_key"])
+    if not payloads:
+        dynasty = _built_dynasty(history_years)
+        payloads[f"dynasty ({history_years}y history)"] = db.serialize_dynasty(dynasty)
+    else:
+        dynasty = _built_dynasty(1)
+
+    from engine import ViperballEngine, load_team_from_json
+    teams = sorted(TEAMS_DIR.glob("*.json"))[:2]
+    engine = ViperballEngine(load_team_from_json(str(teams[0])), load_team_from_json(str(teams[1])), seed=7)
+    payloads["box score"] = engine.simulate_game()
+    return payloads, dynasty._coaching_staffs
+
+
+def _time(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def _row(label, size, timings):
+    cells = "".join(f"{size / t / 1e6:>12.1f}" if t else f"{'-':>12}" for t in timings)
+    print(f"  {label:<34}{cells}")
+
+
+def run(db_path, history_years: int, repeat: int):
+    payloads, staffs = _payloads(db_path, history_years)
+    backends = ["json"] + (["orjson"] if serialization._orjson is not None else [])
+    original = serialization.BACKEND
+    print(f"MB/s (median of {repeat}); payload size is its stdlib JSON length")
+    print(f"  {'payload / operation':<34}{'dumps(str)':>12}" + "".join(f"{b:>12}" for b in backends))
+    try:
+        for label, doc in payloads.items():
+            text = json.dumps(doc, default=str)
+            size = len(text.encode("utf-8"))
+            print(f"  {label} — {size / 1e6:.2f} MB")
+            enc, dec = [_time(lambda: json.dumps(doc, default=str), repeat)], [_time(lambda: json.loads(text), repeat)]
+            for backend in backends:
+                serialization.BACKEND = backend
+                raw = serialization.dumpb(doc)
+                assert serialization.loads(raw) == json.loads(text)
+                enc.append(_time(lambda: serialization.dumpb(doc), repeat))
+                dec.append(_time(lambda: serialization.loads(raw), repeat))
+            _row("encode", size, enc)
+            _row("decode", size, dec)
+
+        size = len(json.dumps({t: {r: c.to_dict() for r, c in s.items()} for t, s in staffs.items()}))
+        print(f"  coaching staffs (CoachCard) — {size / 1e6:.2f} MB")
+        for mode, doc_fn in (("to_dict first", lambda: {t: {r: c.to_dict() for r, c in s.items()}
+                                                        for t, s in staffs.items()}),
+                             ("objects to the encoder", lambda: staffs)):
+            timings = [_time(lambda: json.dumps(doc_fn(), default=str), repeat) if mode == "to_dict first" else 0]
+            for backend in backends:
+                serialization.BACKEND = backend
+                timings.append(_time(lambda: serialization.dumpb(doc_fn()), repeat))
+            _row(f"encode, {mode}", size, timings)
+    finally:
+        serialization.BACKEND = original
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--db", help="saves database to read dynasty saves from")
+    parser.add_argument("--history-years", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    run(args.db, args.history_years, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Stand-in for the hub's side of saves DB changeset sync.
+
+Pulls /export/db/changes from a Viperball instance, keeps the latest
+version of every row it has been sent, and serves them back as one reset
+changeset at /download/viperball — what _restore_db_from_hub reads after
+a deploy.  Rows are held as opaque records (table, key, version, row),
+the way a hub with no knowledge of the schema would hold them; see
+engine.db CHANGESET SYNC for the format.  Used by the sync tests and for
+trying deploy restores locally.
+
+Usage:
+    python scripts/sync_hub.py --source http://localhost:8000 --port 8765
+    RESTORE_DB_URL=http://localhost:8765/download/viperball python main.py
+"""
+
+import argparse
+import json
+import threading
+import time
+import urllib.parse
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+class StandInHub:
+    """In-memory replica of one instance's saves DB, fed by changesets."""
+
+    def __init__(self):
+        self.db_id = None
+        self.version = 0
+        self.bytes_received = 0
+        self._rows = {}
+        self._lock = threading.Lock()
+
+    def cursor(self) -> dict:
+        """Query parameters for the next pull."""
+        with self._lock:
+            return {"since": self.version, "db": self.db_id} if self.db_id else {"since": 0}
+
+    def apply(self, lines) -> dict:
+        """Apply one changeset (NDJSON lines); nothing changes unless it is complete."""
+        records = (json.loads(line) for line in lines if line.strip())
+        begin = next(records)
+        with self._lock:
+            rows = {} if begin["reset"] else dict(self._rows)
+        applied, end = 0, None
+        for rec in records:
+            if rec["op"] == "end":
+                end = rec
+                break
+            if rec["op"] == "put":
+                rows[rec["t"], rec["k"]] = rec
+            else:
+                rows.pop((rec["t"], rec["k"]), None)
+            applied += 1
+        if end is None or end["count"] != applied:
+            raise ValueError("Changeset stream ended early")
+        with self._lock:
+            self._rows = rows
+            self.db_id = begin["db"]
+            self.version = end["version"]
+        return {"reset": begin["reset"], "applied": applied, "version": end["version"]}
+
+    def pull(self, fetch) -> dict:
+        """Pull once; ``fetch(params)`` returns the response's NDJSON lines."""
+        def counted(lines):
+            for line in lines:
+                self.bytes_received += len(line)
+                yield line
+        return self.apply(counted(fetch(self.cursor())))
+
+    def pull_url(self, source: str, token: str = None) -> dict:
+        def fetch(params):
+            url = f"{source.rstrip('/')}/export/db/changes?{urllib.parse.urlencode(params)}"
+            headers = {"Authorization": f"Bearer {token}"} if token else {}
+            with urllib.request.urlopen(urllib.request.Request(url, headers=headers), timeout=120) as resp:
+                yield from resp
+        return self.pull(fetch)
+
+    def rows(self) -> dict:
+        """``{(table, key): row}`` as the hub holds them."""
+        with self._lock:
+            return {k: rec["row"] for k, rec in self._rows.items()}
+
+    def snapshot(self):
+        """Everything held, as a reset changeset (NDJSON lines)."""
+        with self._lock:
+            db_id, version = self.db_id, self.version
+            puts = sorted(self._rows.values(), key=lambda rec: rec["v"])
+        yield json.dumps({"op": "begin", "db": db_id, "since": 0, "version": version,
+                          "reset": True}) + "\n"
+        for rec in puts:
+            yield json.dumps(rec) + "\n"
+        yield json.dumps({"op": "end", "version": version, "count": len(puts)}) + "\n"
+
+    def serve(self, host: str = "127.0.0.1", port: int = 0) -> ThreadingHTTPServer:
+        """Serve /download/viperball on a background thread; returns the server."""
+        hub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/download/viperball" or hub.db_id is None:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", NDJSON_MEDIA_TYPE)
+                self.end_headers()
+                for line in hub.snapshot():
+                    self.wfile.write(line.encode())
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True, name="sync-hub").start()
+        return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--source", required=True, help="base URL of the Viperball instance")
+    parser.add_argument("--token", help="EXPORT_TOKEN of the instance, if set")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--interval", type=float, default=60.0, help="seconds between pulls")
+    args = parser.parse_args()
+
+    hub = StandInHub()
+    server = hub.serve("0.0.0.0", args.port)
+    print(f"Serving http://localhost:{server.server_address[1]}/download/viperball")
+    while True:
+        try:
+            result = hub.pull_url(args.source, args.token)
+            print(f"pulled {result['applied']} changes -> version {result['version']}"
+                  f"{' (reset)' if result['reset'] else ''}, {hub.bytes_received} bytes total")
+        except Exception as exc:
+            print(f"pull failed: {exc}")
+        time.sleep(args.interval)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Stats-site result cache — a size-aware LRU shared by every router page.
+
+Entries are keyed by ``(id(season), label)`` and tagged with the season's
+``mutation_version``; a lookup whose tag no longer matches is a miss and the
+stale entry is dropped on the spot, so old versions never pile up waiting
+for eviction.
+
+Sizes come from the same deep-walk estimator the session memory accountant
+uses, ``engine.object_size`` (capped, so sizing a large player table costs
+a few milliseconds).  Eviction is least-recently-used until both the entry
+cap and the byte budget are satisfied.  Hit/miss/eviction counters are
+reported by ``/api/health``.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from engine.object_size import estimate_size
+
+# Objects walked when sizing one cached value; past this the size is
+# extrapolated from the mean object size seen.
+SIZE_WALK_OBJECTS = 50_000
+
+
+class SizedLRUCache:
+    """Thread-safe LRU keyed by hashable keys, bounded by count and bytes."""
+
+    def __init__(self, max_entries: int = 256, max_bytes: int = 256 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, Tuple[Any, Any, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.stale = 0
+        self.oversize = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, version: Any = None) -> Optional[Any]:
+        """Cached value for ``key`` at ``version``, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, entry_version, size = entry
+            if entry_version != version:
+                del self._entries[key]
+                self._bytes -= size
+                self.stale += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, version: Any = None) -> None:
+        size, _, _ = estimate_size(value, max_objects=SIZE_WALK_OBJECTS)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[2]
+            if size > self.max_bytes:
+                self.oversize += 1
+                return
+            self._entries[key] = (value, version, size)
+            self._bytes += size
+            while self._entries and (len(self._entries) > self.max_entries
+                                     or self._bytes > self.max_bytes):
+                _, (_, _, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+                "evictions": self.evictions,
+                "stale": self.stale,
+                "oversize": self.oversize,
+            }
+
+
+season_cache = SizedLRUCache(
+    max_entries=int(os.environ.get("STATS_CACHE_ENTRIES", "256") or 256),
+    max_bytes=int(os.environ.get("STATS_CACHE_MB", "256") or 256) * 1024 * 1024,
+)
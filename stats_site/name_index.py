@@ -0,0 +1,83 @@
+"""
+Cross-league name index — player name → every roster the name appears on.
+
+Player profile pages link to the same name in other leagues (CVL sessions,
+pro leagues, WVL sessions, FIV national teams).  Finding those links used to
+mean walking every roster of every live session on each page view.  Here
+each source (one session, or the FIV cycle) is indexed separately and
+tagged with a signature the caller derives from it cheaply; a source is
+only re-walked when its signature changes, and sources that disappear are
+dropped, so a lookup is a dict probe per indexed source.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Callable, Dict, Hashable, Iterable, List, Tuple
+
+# A source's links as {player name: [link dict, ...]}.
+SourceLinks = Dict[str, List[dict]]
+
+
+class CrossLeagueNameIndex:
+    """Thread-safe name → links index built from independently versioned sources."""
+
+    def __init__(self):
+        self._sources: Dict[Hashable, Tuple[Hashable, str, SourceLinks]] = {}
+        self._lock = threading.Lock()
+        self.rebuilds = 0
+        # Bumped whenever any lookup's answer may have changed (a source
+        # re-indexed or dropped); pages that show links key on it.
+        self.generation = 0
+
+    def refresh(self, source: Hashable, signature: Hashable, kind: str,
+                build: Callable[[], SourceLinks]) -> None:
+        """Re-index ``source`` with ``build()`` if its signature has changed."""
+        with self._lock:
+            entry = self._sources.get(source)
+            if entry is not None and entry[0] == signature:
+                return
+        links = build()
+        with self._lock:
+            self._sources[source] = (signature, kind, links)
+            self.rebuilds += 1
+            self.generation += 1
+
+    def retain(self, live_sources: Iterable[Hashable]) -> None:
+        """Forget every source not in ``live_sources``."""
+        live = set(live_sources)
+        with self._lock:
+            for source in [s for s in self._sources if s not in live]:
+                del self._sources[source]
+                self.generation += 1
+
+    def lookup(self, name: str) -> List[Tuple[Hashable, str, dict]]:
+        """``(source, kind, link)`` for every roster entry named ``name``."""
+        with self._lock:
+            entries = list(self._sources.items())
+        found = []
+        for source, (_, kind, links) in entries:
+            for link in links.get(name, ()):
+                found.append((source, kind, link))
+        return found
+
+    def __len__(self) -> int:
+        return len(self._sources)
+
+
+def roster_links(teams: Iterable[Tuple[str, Iterable[str]]],
+                 make_link: Callable[[str], dict]) -> SourceLinks:
+    """Index ``(team, player names)`` pairs, one link per name per team."""
+    out: SourceLinks = {}
+    for team, names in teams:
+        link = None
+        for name in set(names):
+            if not name:
+                continue
+            if link is None:
+                link = make_link(team)
+            out.setdefault(name, []).append(link)
+    return out
+
+
+name_index = CrossLeagueNameIndex()
@@ -5,11 +5,19 @@ Mounts as a sub-application on the main FastAPI app under /stats/.
 All data comes from the in-memory sessions/pro_sessions/FIV state — no extra HTTP calls.
 """
 
+import functools
+import hashlib
 import os
+import time
+from typing import Optional
+
 from fastapi import APIRouter, Request, HTTPException
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, RedirectResponse, Response
 from starlette.templating import Jinja2Templates
 
+from stats_site.cache import season_cache as _season_cache
+from stats_site.name_index import name_index as _name_index, roster_links
+
 router = APIRouter()
 
 # ─── Deprecated: /stats recruiting hub ───────────────────────────
@@ -290,54 +298,164 @@ def _conf_abbrev(name: str) -> str:
 
 
 # ── season-aware cache ───────────────────────────────────────────────────
-# Keys on (id(season), completed_game_count) so results auto-invalidate
-# when new games finish but avoid re-aggregating on every page load.
-
-_season_cache: dict = {}
-_CACHE_MAX_ENTRIES = 64  # cap total entries to bound memory
-
-
-def _season_cache_key(season, label: str):
-    """Build a cache key from season identity + completion state."""
+# Entries are keyed on (id(season), label) and tagged with the season's
+# mutation_version, so results invalidate as soon as the season changes
+# without rescanning its games.  Storage is the shared size-aware LRU in
+# stats_site/cache.py.
+
+def _season_version(season):
+    """O(1) state version; falls back to counting completed games."""
+    version = getattr(season, "mutation_version", None)
+    if version is not None:
+        return version
     completed = sum(1 for g in season.schedule if g.completed)
-    # Also count playoff/bowl completions for postseason accuracy
     playoff_done = sum(1 for g in (season.playoff_bracket or []) if g.completed)
     bowl_done = sum(1 for bg in (season.bowl_games or []) if bg.game.completed)
-    return (id(season), completed + playoff_done + bowl_done, label)
+    return ("games", completed + playoff_done + bowl_done)
 
 
 def _cache_get(season, label: str):
     """Return cached value or None."""
-    key = _season_cache_key(season, label)
-    return _season_cache.get(key)
+    return _season_cache.get((id(season), label), _season_version(season))
 
 
 def _cache_set(season, label: str, value):
-    """Store value in cache, evicting oldest entries if over limit."""
-    if len(_season_cache) >= _CACHE_MAX_ENTRIES:
-        # Drop the oldest half
-        keys = list(_season_cache.keys())
-        for k in keys[: len(keys) // 2]:
-            del _season_cache[k]
-    key = _season_cache_key(season, label)
-    _season_cache[key] = value
+    """Store value in the shared LRU at the season's current version."""
+    _season_cache.set((id(season), label), value, _season_version(season))
 
 
-# Pro-league cache uses (id(season), current_week)
-def _pro_cache_key(season, label: str):
-    return (id(season), getattr(season, "current_week", 0), label)
+# Pro-league cache: same LRU, version falls back to current_week
+def _pro_version(season):
+    return (getattr(season, "mutation_version", 0), getattr(season, "current_week", 0))
 
 
 def _pro_cache_get(season, label: str):
-    return _season_cache.get(_pro_cache_key(season, label))
+    return _season_cache.get((id(season), "pro", label), _pro_version(season))
 
 
 def _pro_cache_set(season, label: str, value):
-    if len(_season_cache) >= _CACHE_MAX_ENTRIES:
-        keys = list(_season_cache.keys())
-        for k in keys[: len(keys) // 2]:
-            del _season_cache[k]
-    _season_cache[_pro_cache_key(season, label)] = value
+    _season_cache.set((id(season), "pro", label), value, _pro_version(season))
+
+
+# ── conditional responses / rendered-page cache ─────────────────────────
+# Pages built purely from a season answer If-None-Match with 304 using an
+# ETag derived from the season version, template and query; heavy pages
+# also keep their rendered HTML in the shared LRU.  Archive pages key on the
+# archive's last write, so they skip loading the snapshot blob entirely on a
+# hit.  _BOOT_TOKEN changes per process so a deploy with new templates never
+# matches ETags issued by the old one.
+
+_BOOT_TOKEN = f"{os.getpid()}-{time.time_ns()}"
+
+# Session phases in which rosters are edited outside the season object, so
+# the season version alone does not describe what a page shows.
+_UNVERSIONED_PHASES = frozenset({"setup", "portal", "offseason"})
+
+# Only archives saved under a key that is never written again may be cached
+# without revalidating; autosaves and re-imports rewrite theirs in place.
+_IMMUTABLE_ARCHIVE_CACHE_CONTROL = "public, max-age=604800"
+_ARCHIVE_CACHE_CONTROL = "public, no-cache"
+_LIVE_CACHE_CONTROL = "private, no-cache"
+
+
+def _make_etag(*parts) -> str:
+    digest = hashlib.sha1(repr((_BOOT_TOKEN,) + parts).encode()).hexdigest()[:24]
+    return f'W/"{digest}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    bare = etag[2:] if etag.startswith("W/") else etag
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == bare:
+            return True
+    return False
+
+
+def _page_key(request: Request):
+    return (request.url.path, tuple(sorted(request.query_params.multi_items())))
+
+
+def _conditional_response(request, fn, args, kwargs, etag, cache_control,
+                          cache_key=None, version=None):
+    """304 on a matching ETag, cached HTML if present, else render and tag."""
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    if cache_key is not None:
+        body = _season_cache.get(cache_key, version)
+        if body is not None:
+            return HTMLResponse(body, headers=headers)
+    response = fn(*args, **kwargs)
+    if isinstance(response, HTMLResponse) and response.status_code == 200:
+        response.headers.update(headers)
+        if cache_key is not None:
+            _season_cache.set(cache_key, bytes(response.body), version)
+    return response
+
+
+def _college_page(template: str, cache_html: bool = False, extra_version=None):
+    """ETag/304 (and optionally rendered-HTML caching) for a college page.
+
+    The wrapped route must take ``request`` and ``session_id`` and build its
+    output from the session's season.  Pages that also show state from
+    outside the season pass ``extra_version(sess)`` to version it.
+    """
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            request = kwargs["request"]
+            session_id = kwargs["session_id"]
+            api = _get_api()
+            sess = api["get_session"](session_id)
+            season = api["require_season"](sess)
+            if sess.get("phase") in _UNVERSIONED_PHASES:
+                return fn(*args, **kwargs)
+            version = (_season_version(season), id(sess.get("dynasty")), sess.get("phase"))
+            if extra_version is not None:
+                version += extra_version(sess)
+            key = _page_key(request)
+            etag = _make_etag(template, session_id, id(season), version, key)
+            cache_key = (id(season), "page", key) if cache_html else None
+            return _conditional_response(request, fn, args, kwargs, etag,
+                                         _LIVE_CACHE_CONTROL, cache_key, version)
+        return wrapper
+    return decorate
+
+
+def _archive_page(fn):
+    """ETag/304 plus rendered-HTML caching for an archived-season page.
+
+    Archives saved as immutable are also sent with a long-lived
+    Cache-Control; everything else revalidates against the ETag.
+    """
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        request = kwargs["request"]
+        archive_key = kwargs["archive_key"]
+        try:
+            from engine.db import season_archive_updated_at
+            stamp = season_archive_updated_at(archive_key)
+        except Exception:
+            stamp = None
+        if stamp is None:
+            return fn(*args, **kwargs)
+        meta_fn = _get_archive_meta()
+        meta = (meta_fn(archive_key) if meta_fn else None) or {}
+        key = _page_key(request)
+        etag = _make_etag("archive", archive_key, stamp, key)
+        cache_control = (_IMMUTABLE_ARCHIVE_CACHE_CONTROL if meta.get("immutable")
+                         else _ARCHIVE_CACHE_CONTROL)
+        return _conditional_response(request, fn, args, kwargs, etag, cache_control,
+                                     ("archive", archive_key, key), stamp)
+    return wrapper
 
 
 # ── helpers ──────────────────────────────────────────────────────────────
@@ -453,52 +571,129 @@ def _normalize_box_score_stats(full_result: dict):
             side_stats["epa"] = epa_val.get("total_epa", epa_val.get("total_vpa"))
 
 
-def _find_cross_league_links(player_name: str, exclude_college_session: str = None, exclude_nation: str = None):
-    """Find appearances of a player across college sessions and international teams.
+def _roster_signature(teams) -> tuple:
+    """Cheap change detector for a ``{team: team_obj}`` roster map."""
+    return tuple((key, len(getattr(team, "players", ()) or ())) for key, team in teams.items())
 
-    Returns a dict with:
-      college: list of {"session_id", "team_name", "season_name"}
-      international: list of {"nation_code", "nation_name"}
-    """
-    links = {"college": [], "international": []}
 
-    # Check college sessions
+def _fiv_roster_name(entry) -> str:
+    p = entry.get("player", entry) if isinstance(entry, dict) else entry
+    return p.get("name", "") if isinstance(p, dict) else getattr(p, "name", "")
+
+
+def _college_name_links(sid, season):
+    season_name = getattr(season, "name", "Season")
+    return roster_links(
+        ((t, (p.name for p in team.players)) for t, team in season.teams.items()),
+        lambda t: {"session_id": sid, "team_name": t, "season_name": season_name},
+    )
+
+
+def _pro_name_links(key, season):
+    league_id, sess_id = key.rsplit("_", 1)
+    league_name = season.config.league_name
+    return roster_links(
+        ((t, (p.name for p in getattr(team, "players", []))) for t, team in season.teams.items()),
+        lambda t: {"league_id": league_id, "session_id": sess_id,
+                   "league_name": league_name, "team_key": t,
+                   "team_name": getattr(season.teams[t], "name", t)},
+    )
+
+
+def _wvl_name_links(sid, data):
+    tiers = data["season"].tier_seasons
+    label = data.get("dynasty_name", "WVL") + f" (Year {data.get('year', '?')})"
+    return roster_links(
+        (((n, k), (p.name for p in team.players))
+         for n in sorted(tiers) for k, team in tiers[n].teams.items()),
+        lambda nk: {"session_id": sid, "session_label": label, "tier": nk[0],
+                    "team_key": nk[1],
+                    "team_name": getattr(tiers[nk[0]].teams[nk[1]], "name", nk[1])},
+    )
+
+
+def _fiv_name_links(national_teams):
+    return roster_links(
+        ((code, (_fiv_roster_name(e) for e in td.get("roster", [])))
+         for code, td in national_teams.items()),
+        lambda code: {"nation_code": code,
+                      "nation_name": national_teams[code].get("name", code)},
+    )
+
+
+def _refresh_name_index():
+    """Bring the cross-league name index up to date with every live source.
+
+    Each source is re-walked only when its signature (season identity,
+    mutation version, roster sizes) moves.
+    """
     api = _get_api()
+    live = []
+
     for sid, sess in api["sessions"].items():
-        if sid == exclude_college_session:
-            continue
         season = sess.get("season")
         if not season:
             continue
-        for team_name, team in season.teams.items():
-            for p in team.players:
-                if p.name == player_name:
-                    links["college"].append({
-                        "session_id": sid,
-                        "team_name": team_name,
-                        "season_name": getattr(season, "name", "Season"),
-                    })
-                    break
+        live.append(("college", sid))
+        _name_index.refresh(
+            ("college", sid),
+            (id(season), _season_version(season), _roster_signature(season.teams)),
+            "college", functools.partial(_college_name_links, sid, season),
+        )
+
+    for key, season in api["pro_sessions"].items():
+        live.append(("pro", key))
+        _name_index.refresh(
+            ("pro", key),
+            (id(season), _pro_version(season), _roster_signature(season.teams)),
+            "pro", functools.partial(_pro_name_links, key, season),
+        )
+
+    for sid, data in api["wvl_sessions"].items():
+        season = data.get("season")
+        if not season:
+            continue
+        live.append(("wvl", sid))
+        tiers = season.tier_seasons
+        _name_index.refresh(
+            ("wvl", sid),
+            (id(season), getattr(season, "mutation_version", 0),
+             tuple((n, _roster_signature(tiers[n].teams)) for n in sorted(tiers))),
+            "wvl", functools.partial(_wvl_name_links, sid, data),
+        )
 
-    # Check international/FIV
     fiv_data = _get_fiv_data()
     if fiv_data:
         national_teams = fiv_data.get("national_teams", {})
-        for code, team_data in national_teams.items():
-            if code == exclude_nation:
-                continue
-            roster = team_data.get("roster", [])
-            for entry in roster:
-                p = entry.get("player", entry) if isinstance(entry, dict) else entry
-                pname = p.get("name", "") if isinstance(p, dict) else getattr(p, "name", "")
-                if pname == player_name:
-                    nation_name = team_data.get("name", code)
-                    links["international"].append({
-                        "nation_code": code,
-                        "nation_name": nation_name,
-                    })
-                    break
+        live.append(("international",))
+        _name_index.refresh(
+            ("international",),
+            (id(fiv_data), tuple((code, len(td.get("roster", [])))
+                                 for code, td in national_teams.items())),
+            "international", functools.partial(_fiv_name_links, national_teams),
+        )
 
+    _name_index.retain(live)
+
+
+def _find_cross_league_links(player_name: str, exclude_college_session: str = None, exclude_nation: str = None):
+    """Find appearances of a player across college, pro and WVL sessions and
+    international teams.
+
+    Returns a dict with:
+      college: list of {"session_id", "team_name", "season_name"}
+      pro: list of {"league_id", "session_id", "league_name", "team_key", "team_name"}
+      wvl: list of {"session_id", "session_label", "tier", "team_key", "team_name"}
+      international: list of {"nation_code", "nation_name"}
+    """
+    links = {"college": [], "pro": [], "wvl": [], "international": []}
+    _refresh_name_index()
+    for _, kind, link in _name_index.lookup(player_name):
+        if kind == "college" and link["session_id"] == exclude_college_session:
+            continue
+        if kind == "international" and link["nation_code"] == exclude_nation:
+            continue
+        links[kind].append(link)
     return links
 
 
@@ -671,44 +866,61 @@ def _game_benchmarks_from_season(season):
 # ── HOME ─────────────────────────────────────────────────────────────────
 
 @router.get("/export/sessions.json")
-def export_sessions():
+def export_sessions(format: str = "json", limit: Optional[int] = None,
+                    cursor: Optional[str] = None, fields: Optional[str] = None):
     """Active session ids (college + pro). For the vroomtv hub: gives it
-    handles to ask /export/<sid>/standings.json against."""
+    handles to ask /export/<sid>/standings.json against.
+
+    ``limit``/``cursor`` page through the college list; ``format=ndjson``
+    streams one college session per line."""
+    from api.streaming import paginate, parse_fields, stream_records
     api = _get_api()
+    college = [(sid, s["season"]) for sid, s in list(api["sessions"].items())
+               if s.get("season") is not None]
+    page, next_cursor = paginate(college, len(college), cursor, limit)
+    rows = ({"session_id": sid, "name": getattr(season, "name", "Season")}
+            for sid, season in page)
+    tail = {"pro": [{"key": k} for k in list(api["pro_sessions"])]}
+    if limit is not None:
+        tail["next_cursor"] = next_cursor
+    return stream_records(rows, fmt=format, key="college", tail=tail,
+                          next_cursor=next_cursor, fields=parse_fields(fields))
+
+
+def _export_standings_row(s: dict) -> dict:
+    kp = s.get("kenpom", {})
     return {
-        "college": [{"session_id": sid, "name": getattr(s.get("season"), "name", "Season")}
-                    for sid, s in api["sessions"].items() if s.get("season") is not None],
-        "pro": [{"key": k} for k in api["pro_sessions"]],
+        "team": s.get("team") or s.get("team_name"),
+        "conference": s.get("conference", ""),
+        "wins": s.get("wins", 0), "losses": s.get("losses", 0),
+        "raw_o": kp.get("raw_o"), "raw_d": kp.get("raw_d"),
+        "adj_o": kp.get("adj_o"), "adj_d": kp.get("adj_d"),
+        "tempo": kp.get("tempo"), "luck": kp.get("luck"),
+        "em": kp.get("em"),  # efficiency margin
     }
 
 
 @router.get("/export/college/{session_id}/standings.json")
-def export_college_standings(session_id: str):
+def export_college_standings(session_id: str, format: str = "json",
+                             limit: Optional[int] = None, cursor: Optional[str] = None,
+                             fields: Optional[str] = None):
     """Computed KenPom-style standings — adjusted offensive/defensive
     efficiency, tempo, luck. Pre-rolled the same way kenpom.html renders;
-    avoids re-deriving them in the hub."""
+    avoids re-deriving them in the hub.  Pageable and streamable like
+    /export/sessions.json."""
+    from api.streaming import paginate, parse_fields, stream_records
     api = _get_api()
     sess = api["get_session"](session_id)
     if not sess:
-        from fastapi import HTTPException
         raise HTTPException(status_code=404)
     season = api["require_season"](sess)
     rows = api["serialize_standings"](season)
-    out = []
-    for s in rows:
-        kp = s.get("kenpom", {})
-        out.append({
-            "team": s.get("team") or s.get("team_name"),
-            "conference": s.get("conference", ""),
-            "wins": s.get("wins", 0), "losses": s.get("losses", 0),
-            "raw_o": kp.get("raw_o"), "raw_d": kp.get("raw_d"),
-            "adj_o": kp.get("adj_o"), "adj_d": kp.get("adj_d"),
-            "tempo": kp.get("tempo"), "luck": kp.get("luck"),
-            "em": kp.get("em"),  # efficiency margin
-        })
-    return {"session_id": session_id,
-            "season": getattr(season, "name", "Season"),
-            "standings": out}
+    page, next_cursor = paginate(rows, len(rows), cursor, limit)
+    head = {"session_id": session_id, "season": getattr(season, "name", "Season")}
+    tail = {"next_cursor": next_cursor} if limit is not None else None
+    return stream_records((_export_standings_row(s) for s in page), fmt=format,
+                          key="standings", head=head, tail=tail,
+                          next_cursor=next_cursor, fields=parse_fields(fields))
 
 
 @router.get("/", response_class=HTMLResponse)
@@ -815,7 +1027,7 @@ async def college_import_dynasty(request: Request):
         import uuid
         archive_key = f"import_{uuid.uuid4().hex[:8]}_{year}"
         snapshot["label"] = f"{dynasty_name} ({year})"
-        save_season_archive(archive_key, snapshot)
+        save_season_archive(archive_key, snapshot, immutable=True)
         return RedirectResponse(f"/stats/archives/{archive_key}/", status_code=303)
 
     # No season snapshot — show an error page
@@ -888,6 +1100,7 @@ def college_season(request: Request, session_id: str):
 
 
 @router.get("/college/{session_id}/standings", response_class=HTMLResponse)
+@_college_page("college/standings.html")
 def college_standings(request: Request, session_id: str):
     api = _get_api()
     sess = api["get_session"](session_id)
@@ -906,6 +1119,7 @@ def college_standings(request: Request, session_id: str):
 
 
 @router.get("/college/{session_id}/kenpom", response_class=HTMLResponse)
+@_college_page("college/kenpom.html", cache_html=True)
 def college_kenpom(request: Request, session_id: str, sort: str = "raw_o", conference: str = ""):
     api = _get_api()
     sess = api["get_session"](session_id)
@@ -928,6 +1142,7 @@ def college_kenpom(request: Request, session_id: str, sort: str = "raw_o", confe
 
 
 @router.get("/college/{session_id}/luck", response_class=HTMLResponse)
+@_college_page("college/luck.html")
 def college_luck(request: Request, session_id: str, sort: str = "dtw_luck", conference: str = ""):
     api = _get_api()
     sess = api["get_session"](session_id)
@@ -961,6 +1176,7 @@ def college_luck(request: Request, session_id: str, sort: str = "dtw_luck", conf
 
 
 @router.get("/college/{session_id}/schedule", response_class=HTMLResponse)
+@_college_page("college/schedule.html")
 def college_schedule(request: Request, session_id: str, week: int = 0):
     api = _get_api()
     sess = api["get_session"](session_id)
@@ -1032,6 +1248,7 @@ def college_schedule(request: Request, session_id: str, week: int = 0):
 
 
 @router.get("/college/{session_id}/polls", response_class=HTMLResponse)
+@_college_page("college/polls.html")
 def college_polls(request: Request, session_id: str, week: int = 0):
     api = _get_api()
     sess = api["get_session"](session_id)
@@ -1075,7 +1292,23 @@ def _all_college_games(season) -> list:
     return games
 
 
+def _week_game_slots(season) -> dict:
+    """(week, home, away) -> index within its week, as the box-score route counts."""
+    cached = _cache_get(season, "week_slots")
+    if cached is not None:
+        return cached
+    counters = {}
+    slots = {}
+    for g in _all_college_games(season):
+        idx = counters.get(g.week, 0)
+        slots[(g.week, g.home_team, g.away_team)] = idx
+        counters[g.week] = idx + 1
+    _cache_set(season, "week_slots", slots)
+    return slots
+
+
 @router.get("/college/{session_id}/team/{team_name}", response_class=HTMLResponse)
+@_college_page("college/team.html", cache_html=True)
 def college_team(request: Request, session_id: str, team_name: str, sort: str = "yards"):
     api = _get_api()
     sess = api["get_session"](session_id)
@@ -1723,6 +1956,7 @@ def college_team(request: Request, session_id: str, team_name: str, sort: str =
 
 
 @router.get("/college/{session_id}/coach/{team_name}/{coach_role}", response_class=HTMLResponse)
+@_college_page("college/coach.html")
 def college_coach(request: Request, session_id: str, team_name: str, coach_role: str):
     api = _get_api()
     sess = api["get_session"](session_id)
@@ -1805,6 +2039,7 @@ def college_coach(request: Request, session_id: str, team_name: str, coach_role:
 
 
 @router.get("/college/{session_id}/game/{week}/{game_idx}", response_class=HTMLResponse)
+@_college_page("college/game.html")
 def college_game(request: Request, session_id: str, week: int, game_idx: int):
     api = _get_api()
     sess = api["get_session"](session_id)
@@ -1881,69 +2116,44 @@ def college_game(request: Request, session_id: str, week: int, game_idx: int):
     ))
 
 
+_PLAYER_TOTAL_STATS = (
+    "touches", "yards", "rushing_yards", "lateral_yards",
+    "tds", "fumbles", "laterals_thrown",
+    "kick_att", "kick_made", "pk_att", "pk_made",
+    "dk_att", "dk_made", "tackles", "tfl", "sacks", "hurries",
+    "kick_pass_yards", "kick_pass_tds",
+    "kick_passes_thrown", "kick_passes_completed",
+    "kick_return_yards", "punt_return_yards",
+    "rush_carries", "rushing_tds",
+    "lateral_receptions", "lateral_assists", "lateral_tds",
+    "kick_pass_interceptions_thrown", "kick_pass_receptions",
+    "kick_pass_ints",
+    "kick_returns", "kick_return_tds",
+    "punt_returns", "punt_return_tds",
+    "muffs", "st_tackles",
+    "keeper_tackles", "keeper_bells",
+    "kick_deflections", "coverage_snaps",
+    "keeper_return_yards",
+    "points_allowed_in_coverage",
+    "completions_allowed_in_coverage",
+    "blocks", "pancakes",
+    "offensive_snaps", "defensive_snaps",
+    "wpa", "plays_involved",
+)
+
+
 def _aggregate_player_season_totals(season, team_name, player_name):
-    """Aggregate season totals for a player from game logs (same logic as college_player)."""
-    season_totals = {
-        "games": 0, "touches": 0, "yards": 0, "rushing_yards": 0,
-        "lateral_yards": 0, "tds": 0, "fumbles": 0, "laterals_thrown": 0,
-        "kick_att": 0, "kick_made": 0, "pk_att": 0, "pk_made": 0,
-        "dk_att": 0, "dk_made": 0, "tackles": 0, "tfl": 0, "sacks": 0,
-        "hurries": 0, "kick_pass_yards": 0, "kick_pass_tds": 0,
-        "kick_passes_thrown": 0, "kick_passes_completed": 0,
-        "kick_return_yards": 0, "punt_return_yards": 0,
-        "rush_carries": 0, "rushing_tds": 0,
-        "lateral_receptions": 0, "lateral_assists": 0, "lateral_tds": 0,
-        "kick_pass_interceptions_thrown": 0, "kick_pass_receptions": 0,
-        "kick_pass_ints": 0,
-        "kick_returns": 0, "kick_return_tds": 0,
-        "punt_returns": 0, "punt_return_tds": 0,
-        "muffs": 0, "st_tackles": 0,
-        "keeper_tackles": 0, "keeper_bells": 0,
-        "kick_deflections": 0, "coverage_snaps": 0,
-        "keeper_return_yards": 0,
-        "points_allowed_in_coverage": 0.0,
-        "completions_allowed_in_coverage": 0,
-        "blocks": 0, "pancakes": 0,
-        "offensive_snaps": 0, "defensive_snaps": 0,
-        "wpa": 0.0, "plays_involved": 0,
-    }
-    for game in _all_college_games(season):
-        if not game.completed or not getattr(game, "full_result", None):
-            continue
-        if game.home_team != team_name and game.away_team != team_name:
-            continue
-        side = "home" if game.home_team == team_name else "away"
-        fr = game.full_result
-        ps = fr.get("player_stats", {}).get(side, [])
-        for pg in ps:
-            if pg.get("name") == player_name:
-                season_totals["games"] += 1
-                for stat in [
-                    "touches", "yards", "rushing_yards", "lateral_yards",
-                    "tds", "fumbles", "laterals_thrown",
-                    "kick_att", "kick_made", "pk_att", "pk_made",
-                    "dk_att", "dk_made", "tackles", "tfl", "sacks", "hurries",
-                    "kick_pass_yards", "kick_pass_tds",
-                    "kick_passes_thrown", "kick_passes_completed",
-                    "kick_return_yards", "punt_return_yards",
-                    "rush_carries", "rushing_tds",
-                    "lateral_receptions", "lateral_assists", "lateral_tds",
-                    "kick_pass_interceptions_thrown", "kick_pass_receptions",
-                    "kick_pass_ints",
-                    "kick_returns", "kick_return_tds",
-                    "punt_returns", "punt_return_tds",
-                    "muffs", "st_tackles",
-                    "keeper_tackles", "keeper_bells",
-                    "kick_deflections", "coverage_snaps",
-                    "keeper_return_yards",
-                    "points_allowed_in_coverage",
-                    "completions_allowed_in_coverage",
-                    "blocks", "pancakes",
-                    "offensive_snaps", "defensive_snaps",
-                    "wpa", "plays_involved",
-                ]:
-                    season_totals[stat] += pg.get(stat, 0)
-                break
+    """Season totals for one player, read from the season aggregate store."""
+    from engine.season_aggregates import season_aggregates
+
+    season_totals = {"games": 0, **{stat: 0 for stat in _PLAYER_TOTAL_STATS}}
+    season_totals["points_allowed_in_coverage"] = 0.0
+    season_totals["wpa"] = 0.0
+    rec = season_aggregates(season).player(team_name, player_name)
+    if rec:
+        season_totals["games"] = rec["games"]
+        for stat in _PLAYER_TOTAL_STATS:
+            season_totals[stat] = rec[stat]
     # Ensure yard totals are integers
     for _yk in ("yards", "rushing_yards", "lateral_yards", "kick_pass_yards",
                 "kick_return_yards", "punt_return_yards", "keeper_return_yards"):
@@ -1965,6 +2175,7 @@ def _aggregate_player_season_totals(season, team_name, player_name):
 
 
 @router.get("/college/{session_id}/compare", response_class=HTMLResponse)
+@_college_page("college/compare.html")
 def college_compare(request: Request, session_id: str, type: str = "player", a: str = "", b: str = ""):
     api = _get_api()
     sess = api["get_session"](session_id)
@@ -1972,22 +2183,16 @@ def college_compare(request: Request, session_id: str, type: str = "player", a:
 
     all_teams = sorted(season.teams.keys())
     all_players = []
+    by_name = {}  # name -> (player, team); first roster match wins
     for tname, team in season.teams.items():
         for p in team.players:
             all_players.append({"name": p.name, "team": tname, "position": getattr(p, "position", ""), "overall": getattr(p, "overall", 0)})
+            by_name.setdefault(p.name, (p, tname))
 
     comparison = None
     if type == "player" and a and b:
-        # Find both players across all teams
-        def _find_player(name):
-            for tname, team in season.teams.items():
-                for p in team.players:
-                    if p.name == name:
-                        return p, tname
-            return None, None
-
-        player_a, team_a = _find_player(a)
-        player_b, team_b = _find_player(b)
+        player_a, team_a = by_name.get(a, (None, None))
+        player_b, team_b = by_name.get(b, (None, None))
         if player_a and player_b:
             stats_a = _aggregate_player_season_totals(season, team_a, a)
             stats_b = _aggregate_player_season_totals(season, team_b, b)
@@ -2018,6 +2223,7 @@ def college_compare(request: Request, session_id: str, type: str = "player", a:
 
 
 @router.get("/college/{session_id}/head-to-head", response_class=HTMLResponse)
+@_college_page("college/head_to_head.html")
 def college_head_to_head(request: Request, session_id: str, team1: str = "", team2: str = ""):
     api = _get_api()
     sess = api["get_session"](session_id)
@@ -2031,68 +2237,50 @@ def college_head_to_head(request: Request, session_id: str, team1: str = "", tea
     ties = 0
 
     if team1 and team2 and team1 != team2:
-        # Gather all games (regular + playoff + bowl)
-        reg_games = list(season.schedule)
-        playoff_games = list(season.playoff_bracket or [])
-        bowl_game_list = list(season.bowl_games or [])
-
-        bowl_game_map = {}
-        for bg in bowl_game_list:
-            bowl_game_map[id(bg.game)] = bg.name
+        from engine.season_index import season_index
 
-        all_games = reg_games + playoff_games + [bg.game for bg in bowl_game_list]
-
-        # Build per-week game index for box score links (over ALL games, not just matched)
-        week_counters = {}
-        game_idx_map = {}  # id(game) -> week_game_idx
-        for g in all_games:
-            w = g.week
-            idx = week_counters.get(w, 0)
-            game_idx_map[id(g)] = idx
-            week_counters[w] = idx + 1
+        bowl_game_map = {id(bg.game): bg.name for bg in (season.bowl_games or [])}
+        slots = _week_game_slots(season)
 
         round_labels = {
             995: "Play-In Round", 996: "First Round", 997: "Octofinals",
             998: "Quarterfinals", 999: "National Semifinals", 1000: "National Championship",
         }
 
-        # Filter to matchups between team1 and team2
-        pair = {team1, team2}
-        for g in all_games:
-            if {g.home_team, g.away_team} == pair and g.completed:
-                sg = api["serialize_game"](g)
-                sg["week_game_idx"] = game_idx_map[id(g)]
-                # Postseason metadata
-                bowl_name = bowl_game_map.get(id(g))
-                if bowl_name:
-                    sg["bowl_name"] = bowl_name
-                    sg["game_type"] = "bowl"
-                elif g.week >= 995:
-                    sg["game_type"] = "playoff"
-                    sg["round_label"] = round_labels.get(g.week, f"Playoff Wk {g.week}")
+        for g in season_index(season).matchup_games(team1, team2):
+            sg = api["serialize_game"](g)
+            sg["week_game_idx"] = slots.get((g.week, g.home_team, g.away_team), 0)
+            # Postseason metadata
+            bowl_name = bowl_game_map.get(id(g))
+            if bowl_name:
+                sg["bowl_name"] = bowl_name
+                sg["game_type"] = "bowl"
+            elif g.week >= 995:
+                sg["game_type"] = "playoff"
+                sg["round_label"] = round_labels.get(g.week, f"Playoff Wk {g.week}")
+            else:
+                sg["game_type"] = "regular"
+            games.append(sg)
+
+            # Tally record from team1's perspective
+            home = sg.get("home_team", "")
+            away = sg.get("away_team", "")
+            hs = sg.get("home_score", 0) or 0
+            aws = sg.get("away_score", 0) or 0
+            if home == team1:
+                if hs > aws:
+                    team1_wins += 1
+                elif aws > hs:
+                    team2_wins += 1
                 else:
-                    sg["game_type"] = "regular"
-                games.append(sg)
-
-                # Tally record from team1's perspective
-                home = sg.get("home_team", "")
-                away = sg.get("away_team", "")
-                hs = sg.get("home_score", 0) or 0
-                aws = sg.get("away_score", 0) or 0
-                if home == team1:
-                    if hs > aws:
-                        team1_wins += 1
-                    elif aws > hs:
-                        team2_wins += 1
-                    else:
-                        ties += 1
+                    ties += 1
+            else:
+                if aws > hs:
+                    team1_wins += 1
+                elif hs > aws:
+                    team2_wins += 1
                 else:
-                    if aws > hs:
-                        team1_wins += 1
-                    elif hs > aws:
-                        team2_wins += 1
-                    else:
-                        ties += 1
+                    ties += 1
 
     return templates.TemplateResponse("college/head_to_head.html", _ctx(
         request, section="college", session_id=session_id,
@@ -2102,7 +2290,16 @@ def college_head_to_head(request: Request, session_id: str, team1: str = "", tea
     ))
 
 
+def _player_links_version(sess) -> tuple:
+    """Version of what a player page shows from outside its season: the
+    cross-league links and the dynasty's career tracker."""
+    _refresh_name_index()
+    tracker = getattr(sess.get("dynasty"), "career_tracker", None)
+    return (_name_index.generation, id(tracker), getattr(tracker, "mutation_version", 0))
+
+
 @router.get("/college/{session_id}/player/{team_name}/{player_name}", response_class=HTMLResponse)
+@_college_page("college/player.html", cache_html=True, extra_version=_player_links_version)
 def college_player(request: Request, session_id: str, team_name: str, player_name: str):
     api = _get_api()
     sess = api["get_session"](session_id)
@@ -2166,55 +2363,47 @@ def college_player(request: Request, session_id: str, team_name: str, player_nam
         # Impact
         "wpa": 0.0, "plays_involved": 0,
     }
-    for game in _all_college_games(season):
-        if not game.completed or not getattr(game, "full_result", None):
-            continue
-        if game.home_team != team_name and game.away_team != team_name:
-            continue
-        side = "home" if game.home_team == team_name else "away"
+    from engine.season_index import season_index
+
+    for game, side, pg in season_index(season).player_games(team_name, player_name):
         opponent = game.away_team if side == "home" else game.home_team
         is_home = side == "home"
-        fr = game.full_result
-        ps = fr.get("player_stats", {}).get(side, [])
-        for pg in ps:
-            if pg.get("name") == player_name:
-                entry = {
-                    "week": game.week,
-                    "opponent": opponent,
-                    "is_home": is_home,
-                    "won": (game.home_score > game.away_score) == is_home,
-                    "team_score": game.home_score if is_home else game.away_score,
-                    "opp_score": game.away_score if is_home else game.home_score,
-                }
-                entry.update(pg)
-                game_log.append(entry)
-                season_totals["games"] += 1
-                for stat in [
-                    "touches", "yards", "rushing_yards", "lateral_yards",
-                    "tds", "fumbles", "laterals_thrown",
-                    "kick_att", "kick_made", "pk_att", "pk_made",
-                    "dk_att", "dk_made", "tackles", "tfl", "sacks", "hurries",
-                    "kick_pass_yards", "kick_pass_tds",
-                    "kick_passes_thrown", "kick_passes_completed",
-                    "kick_return_yards", "punt_return_yards",
-                    "rush_carries", "rushing_tds",
-                    "lateral_receptions", "lateral_assists", "lateral_tds",
-                    "kick_pass_interceptions_thrown", "kick_pass_receptions",
-                    "kick_pass_ints",
-                    "kick_returns", "kick_return_tds",
-                    "punt_returns", "punt_return_tds",
-                    "muffs", "st_tackles",
-                    "keeper_tackles", "keeper_bells",
-                    "kick_deflections", "coverage_snaps",
-                    "keeper_return_yards",
-                    "points_allowed_in_coverage",
-                    "completions_allowed_in_coverage",
-                    "blocks", "pancakes",
-                    "offensive_snaps", "defensive_snaps",
-                    "wpa", "plays_involved",
-                ]:
-                    season_totals[stat] += pg.get(stat, 0)
-                break
+        entry = {
+            "week": game.week,
+            "opponent": opponent,
+            "is_home": is_home,
+            "won": (game.home_score > game.away_score) == is_home,
+            "team_score": game.home_score if is_home else game.away_score,
+            "opp_score": game.away_score if is_home else game.home_score,
+        }
+        entry.update(pg)
+        game_log.append(entry)
+        season_totals["games"] += 1
+        for stat in [
+            "touches", "yards", "rushing_yards", "lateral_yards",
+            "tds", "fumbles", "laterals_thrown",
+            "kick_att", "kick_made", "pk_att", "pk_made",
+            "dk_att", "dk_made", "tackles", "tfl", "sacks", "hurries",
+            "kick_pass_yards", "kick_pass_tds",
+            "kick_passes_thrown", "kick_passes_completed",
+            "kick_return_yards", "punt_return_yards",
+            "rush_carries", "rushing_tds",
+            "lateral_receptions", "lateral_assists", "lateral_tds",
+            "kick_pass_interceptions_thrown", "kick_pass_receptions",
+            "kick_pass_ints",
+            "kick_returns", "kick_return_tds",
+            "punt_returns", "punt_return_tds",
+            "muffs", "st_tackles",
+            "keeper_tackles", "keeper_bells",
+            "kick_deflections", "coverage_snaps",
+            "keeper_return_yards",
+            "points_allowed_in_coverage",
+            "completions_allowed_in_coverage",
+            "blocks", "pancakes",
+            "offensive_snaps", "defensive_snaps",
+            "wpa", "plays_involved",
+        ]:
+            season_totals[stat] += pg.get(stat, 0)
 
     # Ensure yard totals are integers
     for _yk in ("yards", "rushing_yards", "lateral_yards", "kick_pass_yards",
@@ -2339,81 +2528,51 @@ def college_player(request: Request, session_id: str, team_name: str, player_nam
     ))
 
 
+_PLAYER_AGG_STATS = (
+    "touches", "yards",
+    "rushing_yards", "lateral_yards", "tds",
+    "fumbles", "kick_att", "kick_made",
+    "pk_att", "pk_made", "dk_att", "dk_made",
+    "tackles", "tfl", "sacks", "hurries",
+    "kick_pass_yards", "kick_pass_tds",
+    "kick_passes_thrown", "kick_passes_completed",
+    "keeper_bells", "laterals_thrown",
+    "kick_return_yards", "punt_return_yards",
+    "kick_return_tds", "punt_return_tds",
+    "rush_carries", "rushing_tds",
+    "lateral_receptions", "lateral_assists", "lateral_tds",
+    "kick_pass_interceptions", "kick_pass_receptions",
+    "kick_pass_ints",
+    "kick_returns", "punt_returns",
+    "muffs", "st_tackles",
+    "keeper_tackles", "kick_deflections",
+    "coverage_snaps", "blocks", "pancakes",
+    "wpa", "plays_involved",
+)
+
+
 def _cached_college_player_agg(season):
-    """Aggregate all player stats from completed games, with derived stats. Cached."""
+    """All player season totals from the aggregate store, with derived stats. Cached."""
     cached = _cache_get(season, "college_player_agg")
     if cached is not None:
         return cached
 
-    player_agg = {}
-    for game in _all_college_games(season):
-        if not game.completed or not getattr(game, "full_result", None):
-            continue
-        fr = game.full_result
-        ps = fr.get("player_stats", {})
-        for side, t_name in [("home", game.home_team), ("away", game.away_team)]:
-            conf = season.team_conferences.get(t_name, "")
-            for p in ps.get(side, []):
-                key = f"{t_name}|{p['name']}"
-                if key not in player_agg:
-                    player_agg[key] = {
-                        "name": p["name"], "team": t_name, "conference": conf,
-                        "tag": p.get("tag", ""), "archetype": p.get("archetype", ""),
-                        "position": p.get("position", ""),
-                        "games_played": 0, "touches": 0, "yards": 0,
-                        "rushing_yards": 0, "lateral_yards": 0, "tds": 0,
-                        "fumbles": 0, "kick_att": 0, "kick_made": 0,
-                        "pk_att": 0, "pk_made": 0, "dk_att": 0, "dk_made": 0,
-                        "tackles": 0, "tfl": 0, "sacks": 0, "hurries": 0,
-                        "kick_pass_yards": 0, "kick_pass_tds": 0,
-                        "kick_passes_thrown": 0, "kick_passes_completed": 0,
-                        "keeper_bells": 0, "laterals_thrown": 0,
-                        "kick_return_yards": 0, "punt_return_yards": 0,
-                        "kick_return_tds": 0, "punt_return_tds": 0,
-                        "rush_carries": 0, "rushing_tds": 0,
-                        "lateral_receptions": 0, "lateral_assists": 0, "lateral_tds": 0,
-                        "kick_pass_interceptions": 0, "kick_pass_receptions": 0,
-                        "kick_pass_ints": 0,
-                        "kick_returns": 0, "punt_returns": 0,
-                        "muffs": 0, "st_tackles": 0,
-                        "keeper_tackles": 0, "kick_deflections": 0,
-                        "coverage_snaps": 0, "blocks": 0, "pancakes": 0,
-                        "wpa": 0.0, "plays_involved": 0,
-                    }
-                agg = player_agg[key]
-                agg["games_played"] += 1
-                if not agg["tag"]:
-                    agg["tag"] = p.get("tag", "")
-                if not agg["archetype"] or agg["archetype"] == "—":
-                    agg["archetype"] = p.get("archetype", "")
-                if not agg["position"]:
-                    agg["position"] = p.get("position", "")
-                for stat in [
-                    "touches", "yards", "rushing_yards", "lateral_yards",
-                    "tds", "fumbles", "kick_att", "kick_made",
-                    "pk_att", "pk_made", "dk_att", "dk_made",
-                    "tackles", "tfl", "sacks", "hurries",
-                    "kick_pass_yards", "kick_pass_tds",
-                    "kick_passes_thrown", "kick_passes_completed",
-                    "keeper_bells", "laterals_thrown",
-                    "kick_return_yards", "punt_return_yards",
-                    "kick_return_tds", "punt_return_tds",
-                    "rush_carries", "rushing_tds",
-                    "lateral_receptions", "lateral_assists", "lateral_tds",
-                    "kick_pass_interceptions", "kick_pass_receptions",
-                    "kick_pass_ints",
-                    "kick_returns", "punt_returns",
-                    "muffs", "st_tackles",
-                    "keeper_tackles", "kick_deflections",
-                    "coverage_snaps", "blocks", "pancakes",
-                    "plays_involved",
-                ]:
-                    agg[stat] += p.get(stat, 0)
-                agg["wpa"] += p.get("wpa", 0.0)
+    from engine.season_aggregates import season_aggregates
+
+    players = []
+    for (t_name, _), rec in season_aggregates(season).player_totals().items():
+        agg = {
+            "name": rec["name"], "team": t_name,
+            "conference": season.team_conferences.get(t_name, ""),
+            "tag": rec["tag"], "archetype": rec["archetype"],
+            "position": rec["position"], "games_played": rec["games"],
+        }
+        for stat in _PLAYER_AGG_STATS:
+            agg[stat] = rec[stat]
+        players.append(agg)
 
     from engine.viperball_metrics import calculate_war, calculate_zbr, calculate_vpr
 
-    players = list(player_agg.values())
     for r in players:
         r["yards"] = int(round(r.get("yards", 0)))
         r["rushing_yards"] = int(round(r.get("rushing_yards", 0)))
@@ -2441,6 +2600,7 @@ def _cached_college_player_agg(season):
 # ── Referee Pages ────────────────────────────────────────────
 
 @router.get("/college/{session_id}/referees", response_class=HTMLResponse)
+@_college_page("college/referees.html")
 def college_referees(request: Request, session_id: str, sort: str = "games"):
     """Listing page for all referees with game activity."""
     api = _get_api()
@@ -2489,6 +2649,7 @@ def college_referees(request: Request, session_id: str, sort: str = "games"):
 
 
 @router.get("/college/{session_id}/referee/{referee_name:path}", response_class=HTMLResponse)
+@_college_page("college/referee.html")
 def college_referee_profile(request: Request, session_id: str, referee_name: str):
     """Individual referee profile with game log and season stats."""
     api = _get_api()
@@ -2506,6 +2667,16 @@ def college_referee_profile(request: Request, session_id: str, referee_name: str
     ref_data = card.to_dict()
     face_src = _ref_face_url_for(card.referee_id)
 
+    # Box-score links for the games this referee worked
+    from engine.season_index import season_index
+    slots = _week_game_slots(season)
+    worked = {(g.week, g.home_team, g.away_team)
+              for g in season_index(season).referee_games(referee_name)}
+    for g in ref_data.get("game_log", []):
+        key = (g.get("week"), g.get("home_team"), g.get("away_team"))
+        if key in worked and key in slots:
+            g["week_game_idx"] = slots[key]
+
     return templates.TemplateResponse("college/referee.html", _ctx(
         request, section="college", session_id=session_id,
         ref=ref_data,
@@ -2514,6 +2685,7 @@ def college_referee_profile(request: Request, session_id: str, referee_name: str
 
 
 @router.get("/college/{session_id}/players", response_class=HTMLResponse)
+@_college_page("college/players.html")
 def college_players(request: Request, session_id: str, sort: str = "yards", conference: str = ""):
     api = _get_api()
     sess = api["get_session"](session_id)
@@ -2699,6 +2871,7 @@ def college_alumni_profile(request: Request, session_id: str, player_name: str):
 
 
 @router.get("/college/{session_id}/analytics", response_class=HTMLResponse)
+@_college_page("college/analytics.html", cache_html=True)
 def college_analytics(request: Request, session_id: str, sort: str = "war", conference: str = ""):
     api = _get_api()
     sess = api["get_session"](session_id)
@@ -2738,6 +2911,39 @@ def college_analytics(request: Request, session_id: str, sort: str = "war", conf
 
 # ── RATINGS (Composite Rankings) ─────────────────────────────────────────
 
+# Composite method execution: a small thread pool, and an optional
+# per-method time limit (seconds) after which a method is left out of the
+# page rather than holding it up.
+_RATINGS_WORKERS = int(os.environ.get("RATINGS_WORKERS", "4") or 0)
+_RATINGS_METHOD_TIMEOUT = float(os.environ.get("RATINGS_METHOD_TIMEOUT", "0") or 0) or None
+
+def _composite_game_result(game):
+    """GameResult for a completed game, with cumulative quarter scores."""
+    from engine.ranking_composite import GameResult
+
+    from engine.viperball_metrics import game_quarter_scores
+
+    home_q = None
+    away_q = None
+    fr = getattr(game, "full_result", None)
+    qs = game_quarter_scores(fr) if fr and isinstance(fr, dict) else None
+    if qs:
+        # Cumulative quarter scores for ranking_composite
+        h, a = qs["home"], qs["away"]
+        home_q = [h[0], h[0]+h[1], h[0]+h[1]+h[2], h[0]+h[1]+h[2]+h[3]]
+        away_q = [a[0], a[0]+a[1], a[0]+a[1]+a[2], a[0]+a[1]+a[2]+a[3]]
+
+    return GameResult(
+        home_team=game.home_team,
+        away_team=game.away_team,
+        home_score=game.home_score,
+        away_score=game.away_score,
+        neutral_site=False,
+        home_q_scores=home_q,
+        away_q_scores=away_q,
+    )
+
+
 def _cached_composite_rankings(season):
     """Build composite rankings from season data. Cached per season state."""
     cached = _cache_get(season, "composite_rankings")
@@ -2745,48 +2951,14 @@ def _cached_composite_rankings(season):
         return cached
 
     from engine.ranking_composite import (
-        GameResult, TeamSeasonStats, calculate_composite,
-        calculate_conference_rankings, METHOD_KEYS,
+        TeamSeasonStats, calculate_composite, calculate_conference_rankings,
     )
 
     # ── Build GameResult list from completed games ──
-    game_results = []
-    for game in _all_college_games(season):
-        if not game.completed or game.home_score is None:
-            continue
-
-        # Extract quarter scores from play-by-play if available
-        home_q = None
-        away_q = None
-        fr = getattr(game, "full_result", None)
-        if fr and isinstance(fr, dict):
-            pbp = fr.get("play_by_play", [])
-            if pbp and isinstance(pbp, list) and pbp and "home_score" in pbp[0]:
-                h_q = {1: 0.0, 2: 0.0, 3: 0.0, 4: 0.0}
-                a_q = {1: 0.0, 2: 0.0, 3: 0.0, 4: 0.0}
-                prev_h, prev_a = 0.0, 0.0
-                for play in pbp:
-                    q = play.get("quarter", 0)
-                    if q not in h_q:
-                        continue
-                    cur_h = play.get("home_score", prev_h)
-                    cur_a = play.get("away_score", prev_a)
-                    h_q[q] += cur_h - prev_h
-                    a_q[q] += cur_a - prev_a
-                    prev_h, prev_a = cur_h, cur_a
-                # Cumulative quarter scores for ranking_composite
-                home_q = [h_q[1], h_q[1]+h_q[2], h_q[1]+h_q[2]+h_q[3], h_q[1]+h_q[2]+h_q[3]+h_q[4]]
-                away_q = [a_q[1], a_q[1]+a_q[2], a_q[1]+a_q[2]+a_q[3], a_q[1]+a_q[2]+a_q[3]+a_q[4]]
-
-        game_results.append(GameResult(
-            home_team=game.home_team,
-            away_team=game.away_team,
-            home_score=game.home_score,
-            away_score=game.away_score,
-            neutral_site=False,
-            home_q_scores=home_q,
-            away_q_scores=away_q,
-        ))
+    game_results = [
+        _composite_game_result(game) for game in _all_college_games(season)
+        if game.completed and game.home_score is not None
+    ]
 
     if len(game_results) < 4:
         _cache_set(season, "composite_rankings", [])
@@ -2855,10 +3027,18 @@ def _cached_composite_rankings(season):
     conferences = getattr(season, "team_conferences", {})
 
     # ── Run composite ──
+    method_timings = {}
     composites = calculate_composite(
         game_results,
         team_conferences=conferences,
         team_stats=team_stats,
+        workers=_RATINGS_WORKERS or None,
+        method_timeout=_RATINGS_METHOD_TIMEOUT,
+        timings=method_timings,
+    )
+    timings = sorted(
+        (t.to_dict() for t in method_timings.values()),
+        key=lambda t: t["ms"], reverse=True,
     )
 
     # ── Serialize to dicts for template ──
@@ -2915,10 +3095,12 @@ def _cached_composite_rankings(season):
 
     _cache_set(season, "composite_rankings", result)
     _cache_set(season, "conference_rankings", conf_result)
+    _cache_set(season, "composite_timings", timings)
     return result
 
 
 @router.get("/college/{session_id}/ratings", response_class=HTMLResponse)
+@_college_page("college/ratings.html", cache_html=True)
 def college_ratings(request: Request, session_id: str, top: int = 50, sort: str = "composite", dir: str = ""):
     api = _get_api()
     sess = api["get_session"](session_id)
@@ -2926,6 +3108,7 @@ def college_ratings(request: Request, session_id: str, top: int = 50, sort: str
 
     composites = _cached_composite_rankings(season)
     conf_rankings = _cache_get(season, "conference_rankings") or []
+    method_timings = _cache_get(season, "composite_timings") or []
 
     from engine.ranking_composite import METHOD_KEYS
 
@@ -2971,6 +3154,7 @@ def college_ratings(request: Request, session_id: str, top: int = 50, sort: str
         sort_dir=dir,
         method_keys=METHOD_KEYS,
         conference_rankings=conf_rankings,
+        method_timings=method_timings,
         season_name=getattr(season, "name", "Season"),
     ))
 
@@ -3054,193 +3238,19 @@ def college_ratings_glossary(request: Request):
     ))
 
 
-_TEAM_INIT_FIELDS = {
-    "games": 0,
-    # Scoring
-    "points_for": 0.0, "points_against": 0.0,
-    "q1_pf": 0.0, "q2_pf": 0.0, "q3_pf": 0.0, "q4_pf": 0.0,
-    "q1_pa": 0.0, "q2_pa": 0.0, "q3_pa": 0.0, "q4_pa": 0.0,
-    # Offense
-    "total_yards": 0, "total_plays": 0, "touchdowns": 0,
-    "rushing_yards": 0, "rushing_carries": 0, "rushing_tds": 0,
-    "kp_yards": 0, "kp_att": 0, "kp_comp": 0, "kp_tds": 0, "kp_ints": 0,
-    "lateral_chains": 0, "lateral_yards": 0, "successful_laterals": 0,
-    "dk_made": 0, "dk_att": 0, "pk_made": 0, "pk_att": 0,
-    # Special teams offense
-    "kr_yards": 0, "kr_count": 0, "kr_tds": 0,
-    "pr_yards": 0, "pr_count": 0, "pr_tds": 0,
-    "muffs": 0,
-    # Defense (opponent stats)
-    "opp_total_yards": 0, "opp_total_plays": 0, "opp_touchdowns": 0,
-    "opp_rushing_yards": 0, "opp_rushing_carries": 0, "opp_rushing_tds": 0,
-    "opp_kp_yards": 0, "opp_kp_att": 0, "opp_kp_comp": 0, "opp_kp_tds": 0, "opp_kp_ints": 0,
-    "opp_lateral_yards": 0, "opp_lateral_chains": 0,
-    # Special teams defense (opponent returns)
-    "opp_kr_yards": 0, "opp_kr_count": 0, "opp_kr_tds": 0,
-    "opp_pr_yards": 0, "opp_pr_count": 0, "opp_pr_tds": 0,
-    # Turnovers
-    "fumbles": 0, "tod": 0,
-    "opp_fumbles": 0, "opp_tod": 0,
-    # Penalties
-    "penalties": 0, "penalty_yards": 0,
-    "opp_penalties": 0, "opp_penalty_yards": 0,
-    # Efficiency / Delta / Bonus
-    "delta_yards": 0, "bonus_possessions": 0, "bonus_scores": 0,
-    "bonus_yards": 0, "delta_drives": 0, "delta_scores": 0,
-    "epa": 0, "viper_eff_sum": 0, "team_rating_sum": 0,
-    "viper_eff_n": 0, "team_rating_n": 0,
-    "down_4_att": 0, "down_4_conv": 0,
-    "down_5_att": 0, "down_5_conv": 0,
-    "down_6_att": 0, "down_6_conv": 0,
-}
-
-
 def _cached_college_team_agg(season):
-    """Aggregate team stats from all completed games (including postseason). Cached."""
+    """Team season totals from the aggregate store, with derived stats. Cached."""
     cached = _cache_get(season, "college_team_agg")
     if cached is not None:
         return cached
 
-    team_agg = {}
+    from engine.season_aggregates import season_aggregates
 
-    for game in _all_college_games(season):
-        if not game.completed or not getattr(game, "full_result", None):
-            continue
-        fr = game.full_result
-        stats = fr.get("stats", {})
-        pbp = fr.get("play_by_play", [])
-
-        # Build quarter scoring from play-by-play
-        home_q = {1: 0.0, 2: 0.0, 3: 0.0, 4: 0.0}
-        away_q = {1: 0.0, 2: 0.0, 3: 0.0, 4: 0.0}
-        if pbp and isinstance(pbp, list) and pbp and "home_score" in pbp[0]:
-            prev_home = 0.0
-            prev_away = 0.0
-            for play in pbp:
-                q = play.get("quarter", 0)
-                if q not in home_q:
-                    continue
-                cur_home = play.get("home_score", prev_home)
-                cur_away = play.get("away_score", prev_away)
-                home_q[q] += cur_home - prev_home
-                away_q[q] += cur_away - prev_away
-                prev_home = cur_home
-                prev_away = cur_away
-
-        for side, opp_side, t_name in [("home", "away", game.home_team), ("away", "home", game.away_team)]:
-            conf = season.team_conferences.get(t_name, "")
-            s = stats.get(side)
-            opp_s = stats.get(opp_side)
-            if not s:
-                continue
-            if t_name not in team_agg:
-                team_agg[t_name] = {"team": t_name, "conference": conf, **{k: v for k, v in _TEAM_INIT_FIELDS.items()}}
-            a = team_agg[t_name]
-            a["games"] += 1
-
-            # Scoring
-            my_score = game.home_score if side == "home" else game.away_score
-            opp_score = game.away_score if side == "home" else game.home_score
-            a["points_for"] += my_score if my_score else 0
-            a["points_against"] += opp_score if opp_score else 0
-
-            # Quarter scoring
-            my_q = home_q if side == "home" else away_q
-            opp_q_scores = away_q if side == "home" else home_q
-            for q in [1, 2, 3, 4]:
-                a[f"q{q}_pf"] += my_q.get(q, 0)
-                a[f"q{q}_pa"] += opp_q_scores.get(q, 0)
-
-            # ── Offensive stats ──
-            a["total_yards"] += s.get("total_yards", 0)
-            a["total_plays"] += s.get("total_plays", 0)
-            a["touchdowns"] += s.get("touchdowns", 0)
-            a["rushing_yards"] += s.get("rushing_yards", 0)
-            a["rushing_carries"] += s.get("rushing_carries", 0)
-            a["rushing_tds"] += s.get("rushing_touchdowns", 0)
-            a["kp_yards"] += s.get("kick_pass_yards", 0)
-            a["kp_att"] += s.get("kick_passes_attempted", 0)
-            a["kp_comp"] += s.get("kick_passes_completed", 0)
-            a["kp_tds"] += s.get("kick_pass_tds", 0)
-            a["kp_ints"] += s.get("kick_pass_interceptions", 0)
-            a["lateral_chains"] += s.get("lateral_chains", 0)
-            a["lateral_yards"] += s.get("lateral_yards", 0)
-            a["successful_laterals"] += s.get("successful_laterals", 0)
-            a["dk_made"] += s.get("drop_kicks_made", 0)
-            a["dk_att"] += s.get("drop_kicks_attempted", 0)
-            a["pk_made"] += s.get("place_kicks_made", 0)
-            a["pk_att"] += s.get("place_kicks_attempted", 0)
-
-            # ── Special teams offense ──
-            a["kr_yards"] += s.get("kick_return_yards", 0)
-            a["kr_count"] += s.get("kick_returns", 0)
-            a["kr_tds"] += s.get("kick_return_tds", 0)
-            a["pr_yards"] += s.get("punt_return_yards", 0)
-            a["pr_count"] += s.get("punt_returns", 0)
-            a["pr_tds"] += s.get("punt_return_tds", 0)
-            a["muffs"] += s.get("muffs", 0)
-
-            # ── Defensive stats (opponent offensive numbers) ──
-            if opp_s:
-                a["opp_total_yards"] += opp_s.get("total_yards", 0)
-                a["opp_total_plays"] += opp_s.get("total_plays", 0)
-                a["opp_touchdowns"] += opp_s.get("touchdowns", 0)
-                a["opp_rushing_yards"] += opp_s.get("rushing_yards", 0)
-                a["opp_rushing_carries"] += opp_s.get("rushing_carries", 0)
-                a["opp_rushing_tds"] += opp_s.get("rushing_touchdowns", 0)
-                a["opp_kp_yards"] += opp_s.get("kick_pass_yards", 0)
-                a["opp_kp_att"] += opp_s.get("kick_passes_attempted", 0)
-                a["opp_kp_comp"] += opp_s.get("kick_passes_completed", 0)
-                a["opp_kp_tds"] += opp_s.get("kick_pass_tds", 0)
-                a["opp_kp_ints"] += opp_s.get("kick_pass_interceptions", 0)
-                a["opp_lateral_yards"] += opp_s.get("lateral_yards", 0)
-                a["opp_lateral_chains"] += opp_s.get("lateral_chains", 0)
-                a["opp_kr_yards"] += opp_s.get("kick_return_yards", 0)
-                a["opp_kr_count"] += opp_s.get("kick_returns", 0)
-                a["opp_kr_tds"] += opp_s.get("kick_return_tds", 0)
-                a["opp_pr_yards"] += opp_s.get("punt_return_yards", 0)
-                a["opp_pr_count"] += opp_s.get("punt_returns", 0)
-                a["opp_pr_tds"] += opp_s.get("punt_return_tds", 0)
-                a["opp_fumbles"] += opp_s.get("fumbles_lost", 0)
-                a["opp_tod"] += opp_s.get("turnovers_on_downs", 0)
-                a["opp_penalties"] += opp_s.get("penalties", 0)
-                a["opp_penalty_yards"] += opp_s.get("penalty_yards", 0)
-
-            # ── Turnovers / Penalties ──
-            a["fumbles"] += s.get("fumbles_lost", 0)
-            a["tod"] += s.get("turnovers_on_downs", 0)
-            a["penalties"] += s.get("penalties", 0)
-            a["penalty_yards"] += s.get("penalty_yards", 0)
-
-            # ── Efficiency / Delta / Bonus ──
-            a["delta_yards"] += s.get("delta_yards", 0)
-            a["delta_drives"] += s.get("delta_drives", 0)
-            a["delta_scores"] += s.get("delta_scores", 0)
-            a["bonus_possessions"] += s.get("bonus_possessions", 0)
-            a["bonus_scores"] += s.get("bonus_possession_scores", 0)
-            a["bonus_yards"] += s.get("bonus_possession_yards", 0)
-            epa_val = s.get("epa", 0)
-            if isinstance(epa_val, dict):
-                a["epa"] += epa_val.get("total_epa", epa_val.get("wpa", 0))
-            elif isinstance(epa_val, (int, float)):
-                a["epa"] += epa_val
-            ve = s.get("viper_efficiency")
-            if ve is not None:
-                a["viper_eff_sum"] += ve
-                a["viper_eff_n"] += 1
-            vm = s.get("viperball_metrics", {})
-            tr = vm.get("team_rating") if vm else None
-            if tr is not None:
-                a["team_rating_sum"] += tr
-                a["team_rating_n"] += 1
-            dc = s.get("down_conversions", {})
-            for d in [4, 5, 6]:
-                dd = dc.get(d, dc.get(str(d), {}))
-                a[f"down_{d}_att"] += dd.get("attempts", 0)
-                a[f"down_{d}_conv"] += dd.get("converted", 0)
+    teams = []
+    for t_name, a in season_aggregates(season).team_totals().items():
+        teams.append({"team": t_name, "conference": season.team_conferences.get(t_name, ""), **a})
 
     # ── Compute derived stats ──
-    teams = list(team_agg.values())
     for t in teams:
         n = max(1, t["games"])
         # Scoring
@@ -3318,6 +3328,7 @@ def _cached_college_team_agg(season):
 
 
 @router.get("/college/{session_id}/team-stats", response_class=HTMLResponse)
+@_college_page("college/team_stats.html")
 def college_team_stats(request: Request, session_id: str, sort: str = "total_yards", conference: str = ""):
     api = _get_api()
     sess = api["get_session"](session_id)
@@ -3435,6 +3446,7 @@ def college_injuries(request: Request, session_id: str):
 
 
 @router.get("/college/{session_id}/playoffs", response_class=HTMLResponse)
+@_college_page("college/playoffs.html")
 def college_playoffs(request: Request, session_id: str):
     api = _get_api()
     sess = api["get_session"](session_id)
@@ -3520,6 +3532,7 @@ def college_playoffs(request: Request, session_id: str):
 
 
 @router.get("/college/{session_id}/bracketology", response_class=HTMLResponse)
+@_college_page("college/bracketology.html")
 def college_bracketology(request: Request, session_id: str):
     api = _get_api()
     sess = api["get_session"](session_id)
@@ -3541,6 +3554,7 @@ def college_bracketology(request: Request, session_id: str):
 
 
 @router.get("/college/{session_id}/awards", response_class=HTMLResponse)
+@_college_page("college/awards.html")
 def college_awards(request: Request, session_id: str):
     api = _get_api()
     sess = api["get_session"](session_id)
@@ -3657,8 +3671,8 @@ def college_data(request: Request, session_id: str):
 
 @router.get("/college/{session_id}/data/download")
 def college_data_download(request: Request, session_id: str):
-    import json as _json
-    from fastapi.responses import Response
+    from fastapi.responses import StreamingResponse
+    from api.streaming import iter_json_document
     from engine.db import serialize_dynasty
     from api.main import _build_college_archive
 
@@ -3678,10 +3692,9 @@ def college_data_download(request: Request, session_id: str):
         except Exception:
             pass
 
-    content = _json.dumps(data, indent=2, default=str)
     filename = f"{dynasty.dynasty_name.replace(' ', '_')}_Y{dynasty.current_year}.json"
-    return Response(
-        content=content,
+    return StreamingResponse(
+        iter_json_document(data, indent=2),
         media_type="application/json",
         headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
@@ -5063,6 +5076,7 @@ def archives_index(request: Request):
 
 
 @router.get("/archives/{archive_key}/", response_class=HTMLResponse)
+@_archive_page
 def archive_detail(request: Request, archive_key: str):
     """View an archived season."""
     _, load_fn = _get_archives()
@@ -5087,6 +5101,7 @@ def archive_detail(request: Request, archive_key: str):
 
 
 @router.get("/archives/{archive_key}/standings", response_class=HTMLResponse)
+@_archive_page
 def archive_standings(request: Request, archive_key: str):
     _, load_fn = _get_archives()
     if not load_fn:
@@ -5118,6 +5133,7 @@ def archive_standings(request: Request, archive_key: str):
 
 
 @router.get("/archives/{archive_key}/schedule", response_class=HTMLResponse)
+@_archive_page
 def archive_schedule(request: Request, archive_key: str, week: int = 0):
     _, load_fn = _get_archives()
     if not load_fn:
@@ -5144,6 +5160,7 @@ def archive_schedule(request: Request, archive_key: str, week: int = 0):
 
 
 @router.get("/archives/{archive_key}/polls", response_class=HTMLResponse)
+@_archive_page
 def archive_polls(request: Request, archive_key: str, week: int = 0):
     _, load_fn = _get_archives()
     if not load_fn:
@@ -5170,6 +5187,7 @@ def archive_polls(request: Request, archive_key: str, week: int = 0):
 
 
 @router.get("/archives/{archive_key}/team/{team_name}", response_class=HTMLResponse)
+@_archive_page
 def archive_team(request: Request, archive_key: str, team_name: str):
     _, load_fn = _get_archives()
     if not load_fn:
@@ -5206,6 +5224,7 @@ def archive_team(request: Request, archive_key: str, team_name: str):
 
 
 @router.get("/archives/{archive_key}/playoffs", response_class=HTMLResponse)
+@_archive_page
 def archive_playoffs(request: Request, archive_key: str):
     _, load_fn = _get_archives()
     if not load_fn:
@@ -5223,6 +5242,7 @@ def archive_playoffs(request: Request, archive_key: str):
 
 
 @router.get("/archives/{archive_key}/awards", response_class=HTMLResponse)
+@_archive_page
 def archive_awards(request: Request, archive_key: str):
     _, load_fn = _get_archives()
     if not load_fn:
@@ -5586,8 +5606,8 @@ def recruiting_draft_classes(request: Request):
     if session_id:
         # Try to load specific session
         try:
-            from api.main import sessions
-            sess = sessions.get(session_id, {})
+            from api.main import _find_session
+            sess = _find_session(session_id) or {}
             dynasty = sess.get("dynasty", dynasty)
             season = sess.get("season", season)
             sid = session_id
@@ -0,0 +1,90 @@
+"""Compressed save blobs — per-row encodings, history, legacy rows, migration."""
+
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+
+from engine import db
+
+
+@pytest.fixture
+def store(tmp_path):
+    original_path, original_codec = db.get_db_path(), db.get_blob_codec()
+    db.set_db_path(tmp_path / "saves.db")
+    db.init_db()
+    try:
+        yield tmp_path / "saves.db"
+    finally:
+        db.set_db_path(original_path)
+        db.set_blob_codec(original_codec)
+
+
+def _doc(n=400):
+    return {"teams": [{"name": f"Team {i}", "wins": i % 12, "roster": ["x"] * 5} for i in range(n)]}
+
+
+def _encodings(path, table="saves"):
+    conn = sqlite3.connect(path)
+    try:
+        return {k: e for k, e in conn.execute(f"SELECT save_key, encoding FROM {table}")}
+    finally:
+        conn.close()
+
+
+@pytest.mark.parametrize("codec", db.BLOB_ENCODINGS)
+def test_round_trip_under_every_codec(store, codec):
+    db.set_blob_codec(codec)
+    db.save_blob("dynasty", "big", _doc())
+    db.save_blob("user_prefs", "small", {"theme": "dark"})
+    assert db.load_blob("dynasty", "big") == _doc()
+    assert db.load_blob("user_prefs", "small") == {"theme": "dark"}
+    assert _encodings(store) == {"big": codec, "small": "json"}
+    if codec != "json":
+        sizes = {m["save_key"]: m["data_size"] for m in db.list_saves("dynasty")}
+        assert sizes["big"] * 4 < len(db.json.dumps(_doc()))
+
+
+def test_history_round_trips_across_codecs(store):
+    db.set_blob_codec("json")
+    db.save_blob("dynasty", "d", _doc(300))
+    db.set_blob_codec("lzma")
+    db.save_blob("dynasty", "d", _doc(310))
+    (entry,) = db.list_save_history("dynasty", "d")
+    assert db.load_save_history_entry(entry["id"]) == _doc(300)
+    assert db.restore_save_from_history(entry["id"])
+    assert db.load_blob("dynasty", "d") == _doc(300)
+    assert _encodings(store) == {"d": "lzma"}
+
+
+def test_legacy_database_gains_encoding_column(tmp_path):
+    path = tmp_path / "old.db"
+    conn = sqlite3.connect(path)
+    conn.execute("""CREATE TABLE saves (id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id TEXT NOT NULL DEFAULT 'default', save_type TEXT NOT NULL,
+        save_key TEXT NOT NULL, label TEXT NOT NULL DEFAULT '', data TEXT NOT NULL,
+        created_at REAL NOT NULL, updated_at REAL NOT NULL,
+        UNIQUE(user_id, save_type, save_key))""")
+    conn.execute("INSERT INTO saves (save_type, save_key, data, created_at, updated_at) "
+                 "VALUES ('dynasty', 'old', ?, 1, 2)", (db.json.dumps(_doc()),))
+    conn.commit()
+    conn.close()
+
+    original = db.get_db_path()
+    db.set_db_path(path)
+    try:
+        db.init_db()
+        assert db.load_blob("dynasty", "old") == _doc()
+        assert db.migrate_blob_encodings("zlib", batch_size=1) == 1
+        assert db.migrate_blob_encodings("zlib") == 0
+        assert _encodings(path) == {"old": "zlib"}
+        assert db.load_blob("dynasty", "old") == _doc()
+        assert db.blob_updated_at("dynasty", "old") == 2
+    finally:
+        db.set_db_path(original)
+
+
+def test_unknown_codec_rejected(store):
+    with pytest.raises(ValueError):
+        db.set_blob_codec("brotli")
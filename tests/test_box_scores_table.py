@@ -0,0 +1,80 @@
+"""Box scores in their own indexed table — saves, prune, fork, legacy migration."""
+
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+
+from engine import db
+
+
+@pytest.fixture
+def store(tmp_path):
+    original = db.get_db_path()
+    db.set_db_path(tmp_path / "saves.db")
+    db.init_db()
+    try:
+        yield tmp_path / "saves.db"
+    finally:
+        db.set_db_path(original)
+
+
+class _Game:
+    def __init__(self, week, home, away, completed=True):
+        self.week = week
+        self.home_team = home
+        self.away_team = away
+        self.completed = completed
+        self.full_result = {"score": [week, 3], "home": home}
+
+
+def _sessions(path):
+    conn = sqlite3.connect(path)
+    try:
+        return sorted(r[0] for r in conn.execute("SELECT DISTINCT session_id FROM box_scores"))
+    finally:
+        conn.close()
+
+
+def test_bulk_save_load_and_delete(store):
+    db.save_box_scores_bulk("s1", [_Game(1, "A", "B"), _Game(2, "B", "A"),
+                                   _Game(3, "A", "C", completed=False)])
+    db.save_box_score("s2", 1, "A", "B", {"score": [0, 0]})
+    assert db.load_box_score("s1", 2, "B", "A") == {"score": [2, 3], "home": "B"}
+    assert db.load_box_score("s1", 3, "A", "C") is None
+    db.delete_box_scores_for_session("s1")
+    assert _sessions(store) == ["s2"]
+
+
+def test_prune_keeps_only_live_sessions(store):
+    for sid in ("s1", "s2", "s3"):
+        db.save_box_score(sid, 1, "A", "B", {"sid": sid})
+    assert db.prune_orphan_box_scores(["s2", "gone"]) == 2
+    assert _sessions(store) == ["s2"]
+    assert db.prune_orphan_box_scores({"s2"}) == 0
+
+
+def test_fork_clones_box_scores(store):
+    db.save_blob("college", "s1", {"name": "run"})
+    db.save_box_score("s1", 4, "A", "B", {"w": 4})
+    assert db.fork_save("college", "s1", "s1b")
+    assert db.load_box_score("s1b", 4, "A", "B") == {"w": 4}
+
+
+def test_legacy_box_score_rows_move_to_table(store):
+    conn = sqlite3.connect(store)
+    rows = [("s9__w3__Owls_at_Gators", '{"w": 3}'), ("s9__w1001__Big Red_at_Owls", '{"w": 1001}'),
+            ("garbage", "{}")]
+    conn.executemany(
+        "INSERT INTO saves (save_type, save_key, data, created_at, updated_at) "
+        "VALUES ('box_score', ?, ?, 1, 1)", rows)
+    conn.commit()
+    conn.close()
+
+    db.init_db()
+    assert db.load_box_score("s9", 3, "Gators", "Owls") == {"w": 3}
+    assert db.load_box_score("s9", 1001, "Owls", "Big Red") == {"w": 1001}
+    assert [s["save_key"] for s in db.list_saves("box_score")] == ["garbage"]
+    db.init_db()
+    assert _sessions(store) == ["s9"]
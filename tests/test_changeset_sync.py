@@ -0,0 +1,149 @@
+"""Incremental saves DB sync — changesets out to a stand-in hub and back."""
+
+from __future__ import annotations
+
+import sqlite3
+from typing import Optional
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api import db_sync
+from engine import db
+from scripts.sync_hub import StandInHub
+
+
+@pytest.fixture
+def store(tmp_path):
+    original = db.get_db_path()
+    db.set_db_path(tmp_path / "saves.db")
+    db.init_db()
+    try:
+        yield tmp_path
+    finally:
+        db.set_db_path(original)
+
+
+@pytest.fixture
+def fetch():
+    app = FastAPI()
+
+    @app.get("/export/db/changes")
+    def changes(since: int = 0, db: Optional[str] = None):
+        return db_sync.changes_response(since, db)
+
+    client = TestClient(app)
+    return lambda params: client.get("/export/db/changes", params=params).iter_lines()
+
+
+def _season(week, filler="x"):
+    return {"week": week, "standings": {f"T{i}": [i, week] for i in range(40)}, "pad": filler * 4000}
+
+
+def _populate():
+    for n in range(10):
+        db.save_blob("college", f"league{n}", _season(1))
+    db.save_blob("college", "league0", _season(2))
+    for week in range(1, 4):
+        db.save_box_score("league0", week, "Home", "Away", {"week": week, "plays": list(range(500))})
+    db.save_sectioned_blob("dynasty", "d", {"year": 2030},
+                           {"histories": {"team_histories": {"A": list(range(2000))}}})
+
+
+def test_pull_sends_only_what_changed(store, fetch):
+    _populate()
+    hub = StandInHub()
+    first = hub.pull(fetch)
+    full_bytes = hub.bytes_received
+    assert first["reset"] and first["applied"] > 10
+
+    db.save_blob("college", "league3", _season(2))
+    db.delete_box_scores_for_session("league0")
+    second = hub.pull(fetch)
+    assert not second["reset"]
+    # The new league3 row and its history version (plus any new chunks) and
+    # three box score deletes.
+    assert second["applied"] < 10
+    assert (hub.bytes_received - full_bytes) * 5 < full_bytes
+    assert not any(table == "box_scores" for table, _ in hub.rows())
+
+    assert hub.pull(fetch) == {"reset": False, "applied": 0, "version": second["version"]}
+
+
+def test_restore_from_hub_continues_the_lineage(store, fetch):
+    _populate()
+    hub = StandInHub()
+    hub.pull(fetch)
+    server = hub.serve()
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/download/viperball"
+        restored = store / "restored" / "saves.db"
+        assert db_sync.restore_db(url, None, restored) == "changeset"
+    finally:
+        server.shutdown()
+
+    db.set_db_path(restored)
+    assert db.load_blob("college", "league0") == _season(2)
+    assert db.load_blob("dynasty", "d")["team_histories"] == {"A": list(range(2000))}
+    assert db.load_box_score("league0", 2, "Home", "Away")["week"] == 2
+    (older,) = db.list_save_history("college", "league0")
+    assert db.load_save_history_entry(older["id"]) == _season(1)
+    refs = sqlite3.connect(restored).execute("SELECT MIN(refs) FROM history_chunks").fetchone()[0]
+    assert refs >= 1
+
+    # The hub's next pull from the restored instance is incremental.
+    db.save_blob("college", "league9", _season(5))
+    result = hub.pull(fetch)
+    assert not result["reset"] and 0 < result["applied"] < 5
+    db.prune_save_history(keep_per_key=0)
+    hub.pull(fetch)
+    assert not any(table == "save_history" for table, _ in hub.rows())
+
+
+def test_cursor_from_another_lineage_gets_a_reset(store, fetch):
+    _populate()
+    hub = StandInHub()
+    hub.pull(fetch)
+    # The disk was wiped and nothing was restored: a new database.
+    db.set_db_path(store / "wiped.db")
+    db.init_db()
+    db.save_blob("college", "fresh", _season(1))
+    result = hub.pull(fetch)
+    assert result["reset"]
+    assert [row["save_key"] for (table, _), row in hub.rows().items() if table == "saves"] == ["fresh"]
+
+
+def test_forgotten_tombstones_force_a_reset(store, fetch):
+    _populate()
+    hub = StandInHub()
+    hub.pull(fetch)
+    db.delete_blob("college", "league1")
+    assert db.prune_sync_tombstones(max_age=-1) == 1
+    result = hub.pull(fetch)
+    assert result["reset"]
+    assert "league1" not in {row.get("save_key") for row in hub.rows().values()}
+
+
+def test_truncated_changeset_changes_nothing(store):
+    _populate()
+    records = list(db.iter_changeset())
+    target = store / "replica.db"
+    with pytest.raises(ValueError):
+        db.apply_changeset(records[:-3], path=target)
+    assert sqlite3.connect(target).execute("SELECT COUNT(*) FROM saves").fetchone()[0] == 0
+    assert db.apply_changeset(records, path=target)["applied"] == len(records) - 2
+    # An incremental changeset from another database is refused.
+    other = store / "other.db"
+    db.apply_changeset(records, path=other)
+    state = db.sync_state()
+    db.save_blob("prefs", "p", {"a": 1})
+    step = list(db.iter_changeset(state["version"], state["db_id"]))
+    db.set_db_path(store / "unrelated.db")
+    db.init_db()
+    with pytest.raises(ValueError):
+        db.apply_changeset(step)
+    assert db.apply_changeset(step, path=other)["applied"] == 1
@@ -0,0 +1,53 @@
+"""College editor endpoints invalidate the cached stats pages they change."""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+from fastapi.testclient import TestClient
+
+from engine import db
+
+
+@pytest.fixture
+def api(tmp_path, monkeypatch):
+    import api.main as main
+
+    original = db.get_db_path()
+    db.set_db_path(tmp_path / "saves.db")
+    db.init_db()
+    monkeypatch.setattr(main, "sessions", {})
+    try:
+        yield main
+    finally:
+        db.set_db_path(original)
+
+
+def test_roster_edits_show_on_cached_team_page(api):
+    client = TestClient(api.app)
+    sid = client.post("/sessions").json()["session_id"]
+    assert client.post(f"/sessions/{sid}/season", json={"ai_seed": 1}).status_code == 200
+    assert client.post(f"/sessions/{sid}/season/simulate-week", json={}).status_code == 200
+    team = api.sessions[sid]["season"].teams["Gonzaga"]
+    old_name = team.players[0].name
+
+    page = client.get(f"/stats/college/{sid}/team/Gonzaga")
+    assert page.status_code == 200 and old_name in page.text
+    edited = client.patch(f"/sessions/{sid}/season/player/Gonzaga/{old_name}",
+                          json={"fields": {"name": "Renamed Player"}})
+    assert edited.json()["updated"] == ["name"]
+
+    again = client.get(f"/stats/college/{sid}/team/Gonzaga",
+                       headers={"If-None-Match": page.headers["etag"]})
+    assert again.status_code == 200
+    assert "Renamed Player" in again.text
+    assert "Renamed Player" in client.get(f"/stats/college/{sid}/team/Gonzaga").text
+
+    moved = team.players[-1].name
+    assert client.post(f"/sessions/{sid}/season/player/move",
+                       json={"player_name": moved, "from_team": "Gonzaga",
+                             "to_team": "Yale"}).status_code == 200
+    assert moved not in client.get(f"/stats/college/{sid}/team/Gonzaga",
+                                   headers={"If-None-Match": again.headers["etag"]}).text
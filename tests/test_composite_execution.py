@@ -0,0 +1,95 @@
+"""calculate_composite — method execution on a worker pool, timings and timeouts."""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+
+import pytest
+
+from engine import ranking_composite as rc
+
+
+def _weeks(n_teams: int = 16, weeks: int = 6, seed: int = 11):
+    rng = random.Random(seed)
+    teams = [f"T{i}" for i in range(n_teams)]
+    strength = {t: rng.gauss(0, 10) for t in teams}
+    schedule = []
+    for _ in range(weeks):
+        order = teams[:]
+        rng.shuffle(order)
+        week = []
+        for home, away in zip(order[::2], order[1::2]):
+            edge = strength[home] - strength[away] + rng.gauss(0, 12)
+            week.append(rc.GameResult(
+                home, away, max(0, round(30 + edge / 2)), max(0, round(30 - edge / 2)),
+            ))
+        schedule.append(week)
+    return schedule
+
+
+def test_parallel_run_matches_inline_and_reports_timings():
+    games = [g for week in _weeks() for g in week]
+    inline_timings: dict = {}
+    inline = rc.calculate_composite(games, timings=inline_timings)
+    pooled_timings: dict = {}
+    pooled = rc.calculate_composite(games, workers=4, timings=pooled_timings)
+
+    assert [c.team for c in pooled] == [c.team for c in inline]
+    assert set(pooled_timings) == set(inline_timings) == set(inline[0].method_ratings)
+    assert all(t.status == "ok" and t.seconds >= 0 for t in pooled_timings.values())
+
+
+def test_slow_method_is_dropped_after_timeout(monkeypatch):
+    def slow_sor(games, elos, n_simulations=1000, deadline=None):
+        time.sleep(1.0)  # ignores its deadline; abandoned instead
+        return {}
+
+    monkeypatch.setattr(rc, "calculate_sor", slow_sor)
+    games = [g for week in _weeks() for g in week]
+    timings: dict = {}
+    composites = rc.calculate_composite(games, workers=4, method_timeout=0.2, timings=timings)
+
+    assert timings["sor"].status == "timeout"
+    assert "sor" not in composites[0].method_ratings
+    assert "colley" in composites[0].method_ratings
+
+
+def test_deadline_methods_stop_themselves(monkeypatch):
+    stopped = threading.Event()
+    real_sor = rc.calculate_sor
+
+    def endless_sor(games, elos, n_simulations=1000, deadline=None):
+        try:
+            while True:
+                real_sor(games, elos, n_simulations=10, deadline=deadline)
+        finally:
+            stopped.set()
+
+    monkeypatch.setattr(rc, "calculate_sor", endless_sor)
+    games = [g for week in _weeks() for g in week]
+    timings: dict = {}
+    rc.calculate_composite(games, workers=2, method_timeout=0.2, timings=timings)
+
+    assert timings["sor"].status == "timeout"
+    assert stopped.wait(2)
+
+
+def test_expired_deadline_raises():
+    games = [g for week in _weeks() for g in week]
+    past = time.perf_counter() - 1
+    with pytest.raises(rc.MethodTimeout):
+        rc.calculate_sor(games, {}, deadline=past)
+    with pytest.raises(rc.MethodTimeout):
+        rc.calculate_least_violations(games, deadline=past)
+
+
+def test_pool_is_shared_across_runs():
+    games = [g for week in _weeks() for g in week]
+    rc.calculate_composite(games, workers=2)
+    pool = rc._method_pool
+    rc.calculate_composite(games, workers=2)
+    assert rc._method_pool is pool
+    rc.calculate_composite(games, workers=1)
+    assert rc._method_pool is pool
@@ -0,0 +1,80 @@
+"""Pooled SQLite connections — reuse, overflow, path switches, transactions."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from engine import db
+
+
+@pytest.fixture
+def store(tmp_path):
+    original_path, original_size = db.get_db_path(), db.pool_stats()["size"]
+    db.set_db_path(tmp_path / "a.db")
+    db.set_pool_size(2)
+    db.init_db()
+    try:
+        yield tmp_path
+    finally:
+        db.set_pool_size(original_size)
+        db.set_db_path(original_path)
+
+
+def test_connections_are_reused(store):
+    before = db.pool_stats()
+    for i in range(20):
+        db.save_blob("prefs", f"k{i}", {"i": i})
+        assert db.load_blob("prefs", f"k{i}") == {"i": i}
+    after = db.pool_stats()
+    assert after["opened"] == before["opened"]
+    assert after["reused"] - before["reused"] == 40
+    assert after["in_use"] == 0
+
+
+def test_nested_checkouts_overflow_instead_of_blocking(store):
+    held = [db._connect() for _ in range(3)]
+    stats = db.pool_stats()
+    assert stats["in_use"] == 3 and stats["overflow"] >= 1
+    for conn in held:
+        conn.close()
+    stats = db.pool_stats()
+    assert stats["in_use"] == 0 and stats["idle"] == 2
+
+
+def test_uncommitted_work_is_rolled_back_on_release(store):
+    conn = db._connect()
+    conn.execute("INSERT INTO saves (save_type, save_key, data, created_at, updated_at) "
+                 "VALUES ('prefs', 'ghost', '{}', 0, 0)")
+    conn.close()
+    assert db.load_blob("prefs", "ghost") is None
+
+
+def test_switching_db_path_drops_idle_connections(store):
+    db.save_blob("prefs", "k", {"where": "a"})
+    db.set_db_path(store / "b.db")
+    db.init_db()
+    assert db.load_blob("prefs", "k") is None
+    db.set_db_path(store / "a.db")
+    assert db.load_blob("prefs", "k") == {"where": "a"}
+
+
+def test_threads_share_the_pool(store):
+    errors = []
+
+    def worker(n):
+        try:
+            for i in range(25):
+                db.save_blob("prefs", f"t{n}", {"i": i})
+                assert db.load_blob("prefs", f"t{n}") == {"i": i}
+        except Exception as exc:  # pragma: no cover - surfaced below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert not errors
+    assert db.pool_stats()["in_use"] == 0
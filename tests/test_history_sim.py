@@ -0,0 +1,76 @@
+"""Vectorized history generation — invariants and TeamHistory write-back."""
+
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from engine.dynasty import Coach, Dynasty
+from engine.history_sim import simulate_history_arrays
+
+
+def _league(n_confs=6, size=10):
+    conferences = {f"Conf {c}": [f"C{c}T{i}" for i in range(size)] for c in range(n_confs)}
+    names = [t for members in conferences.values() for t in members]
+    ratings = {name: 55 + (i * 13) % 35 for i, name in enumerate(names)}
+    return names, ratings, conferences
+
+
+def test_history_arrays_invariants():
+    names, ratings, confs = _league()
+    years = list(range(1950, 2026))
+    h = simulate_history_arrays(names, ratings, confs, years, games_per_team=12, playoff_size=8, seed=5)
+
+    n_years, n = len(years), len(names)
+    assert h.wins.shape == (n_years, n)
+    # Every game has exactly one winner and one loser.
+    assert (h.wins.sum(axis=1) == h.losses.sum(axis=1)).all()
+    assert ((h.wins + h.losses) <= 12).all()
+    assert np.allclose(h.points_for.sum(axis=1), h.points_against.sum(axis=1))
+    # One champion per conference, all of them in an 8-team field when 6 conferences.
+    assert (h.conf_champ.sum(axis=1) == len(confs)).all()
+    assert (h.playoff.sum(axis=1) == 8).all()
+    assert (h.playoff[h.conf_champ]).all()
+    # Champion and finalists come from the playoff field and are distinct.
+    rows = np.arange(n_years)
+    assert h.playoff[rows, h.champion].all()
+    assert (h.champion != h.runner_up).all()
+    for y in range(n_years):
+        ff = h.final_four[y]
+        assert len(set(ff.tolist())) == 4
+        assert h.playoff[y, ff].all()
+
+
+def test_history_is_seeded_and_rating_sensitive():
+    names, ratings, confs = _league()
+    years = list(range(1926, 2026))
+    a = simulate_history_arrays(names, ratings, confs, years, seed=9)
+    b = simulate_history_arrays(names, ratings, confs, years, seed=9)
+    assert (a.wins == b.wins).all() and (a.champion == b.champion).all()
+
+    strong = max(ratings, key=ratings.get)
+    weak = min(ratings, key=ratings.get)
+    assert a.wins[:, names.index(strong)].mean() > a.wins[:, names.index(weak)].mean() + 2
+
+
+def test_apply_history_arrays_populates_team_histories():
+    names, ratings, confs = _league(n_confs=4, size=9)
+    years = list(range(2000, 2026))
+    arrays = simulate_history_arrays(names, ratings, confs, years, seed=1)
+
+    dynasty = Dynasty(dynasty_name="Test", coach=Coach(name="C", team_name="C0T0"), current_year=2026)
+    for conf, members in confs.items():
+        dynasty.add_conference(conf, members)
+    dynasty._apply_history_arrays(arrays)
+
+    total_titles = sum(h.total_championships for h in dynasty.team_histories.values())
+    assert total_titles == len(years)
+    for t, name in enumerate(names):
+        hist = dynasty.team_histories[name]
+        assert hist.total_wins == int(arrays.wins[:, t].sum())
+        assert sorted(hist.season_records) == years
+        assert hist.season_records[years[0]]["wins"] == int(arrays.wins[0, t])
+        if hist.best_season_year is not None:
+            assert hist.season_records[hist.best_season_year]["wins"] == hist.best_season_wins
+        assert len(hist.conference_title_years) == int(arrays.conf_champ[:, t].sum())
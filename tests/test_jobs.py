@@ -0,0 +1,211 @@
+"""Background jobs — progress, cancellation, limits, and the event stream."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from api.jobs import JobConflictError, JobLimitError, JobManager, iter_events
+
+
+class _HTTPError(Exception):
+    def __init__(self, status_code, detail):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+@pytest.fixture
+def executor():
+    pool = ThreadPoolExecutor(max_workers=1)
+    yield pool
+    pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _blocking(gate: threading.Event, weeks: int = 3):
+    def fn(job):
+        for week in range(1, weeks + 1):
+            gate.wait(5)
+            job.progress(week, weeks)
+        return {"weeks": weeks}
+    return fn
+
+
+def _wait_running(job):
+    while job.status == "queued":
+        threading.Event().wait(0.01)
+
+
+def test_job_reports_progress_and_result(executor):
+    def sim(job):
+        for week in range(1, 5):
+            job.progress(week, 4, f"week {week}")
+        return "done"
+
+    jobs = JobManager(executor)
+    job = jobs.submit("sim", sim)
+    job.future.result(5)
+    assert job.status == "succeeded"
+    state = job.to_dict()
+    assert state["result"] == "done"
+    assert state["progress"] == {"done": 4, "total": 4, "message": "week 4"}
+
+
+def test_cancel_queued_and_interruptible_jobs(executor):
+    gate = threading.Event()
+    jobs = JobManager(executor, per_user=5)
+    running = jobs.submit("sim", _blocking(gate), interruptible=True)
+    queued = jobs.submit("sim", _blocking(gate))
+    _wait_running(running)
+    jobs.cancel(queued.id)
+    assert queued.status == "cancelled"
+    jobs.cancel(running.id)
+    gate.set()
+    running.future.result(5)
+    queued.future.result(5)
+    assert running.status == "cancelled" and running.done == 1
+    assert queued.started_at is None
+
+
+def test_uninterruptible_job_runs_to_the_end(executor):
+    gate = threading.Event()
+    jobs = JobManager(executor)
+    job = jobs.submit("advance", _blocking(gate))
+    _wait_running(job)
+    assert jobs.cancel(job.id).cancel_requested
+    gate.set()
+    job.future.result(5)
+    assert job.status == "succeeded" and job.result == {"weeks": 3}
+
+
+def test_limits_and_keys(executor):
+    gate = threading.Event()
+    jobs = JobManager(executor, per_user=1)
+    first = jobs.submit("sim", _blocking(gate), owner="a", key=("college", "s1"))
+    assert jobs.is_active(("college", "s1"))
+    # The same job on the same state is joined, not run twice.
+    assert jobs.submit("sim", _blocking(gate), owner="b", key=("college", "s1")) is first
+    with pytest.raises(JobConflictError):
+        jobs.submit("advance", _blocking(gate), owner="b", key=("college", "s1"))
+    with pytest.raises(JobLimitError):
+        jobs.submit("sim", _blocking(gate), owner="a", key=("college", "s2"))
+    other = jobs.submit("sim", _blocking(gate), owner="b", key=("college", "s2"))
+    gate.set()
+    first.future.result(5)
+    other.future.result(5)
+    assert not jobs.is_active(("college", "s1"))
+    assert [j.id for j in jobs.list(owner="a")] == [first.id]
+    assert jobs.stats()["joined"] == 1 and jobs.stats()["refused"] == 2
+
+
+def test_failure_keeps_client_status(executor):
+    jobs = JobManager(executor)
+
+    def fail(job):
+        raise _HTTPError(400, "Advance failed: no season")
+
+    job = jobs.submit("advance", fail)
+    job.future.result(5)
+    assert job.status == "failed"
+    assert job.to_dict()["error"] == "Advance failed: no season"
+    assert job.error_status == 400 and isinstance(job.exception, _HTTPError)
+
+
+def test_event_stream_ends_with_done(executor):
+    gate = threading.Event()
+    jobs = JobManager(executor)
+    job = jobs.submit("sim", _blocking(gate, weeks=2))
+
+    async def collect():
+        events = []
+        async for event in iter_events(job, interval=0.01):
+            events.append(event.split("\n", 1)[0])
+            gate.set()
+        return events
+
+    events = asyncio.run(collect())
+    assert events[0] == "event: progress"
+    assert events[-1] == "event: done"
+    assert job.status == "succeeded"
+
+
+def test_session_changes_wait_for_its_job(executor, monkeypatch):
+    pytest.importorskip("fastapi")
+    from fastapi.testclient import TestClient
+
+    import api.main as main
+
+    gate = threading.Event()
+    jobs = JobManager(executor)
+    monkeypatch.setattr(main, "jobs", jobs)
+    monkeypatch.setattr(main, "sessions", {})
+    client = TestClient(main.app)
+    sid = client.post("/sessions").json()["session_id"]
+    job = jobs.submit("simulate_rest", _blocking(gate), key=("college", sid))
+    jobs.submit("pro_sim_all", _blocking(gate), key=("pro", "la_league_p1"))
+    _wait_running(job)
+
+    assert client.post(f"/sessions/{sid}/season/simulate-week").status_code == 409
+    assert client.post(f"/sessions/{sid}/season/bowls").status_code == 409
+    assert client.delete(f"/sessions/{sid}").status_code == 409
+    assert client.post("/api/pro/LA_LEAGUE/p1/sim-week").status_code == 409
+    assert client.get(f"/sessions/{sid}").status_code == 200
+    main.sessions[sid].update(season=object(), phase="regular")
+    # Starting the same job again joins the running one
+    joined = client.post(f"/sessions/{sid}/season/simulate-rest?background=true")
+    assert joined.status_code == 202 and joined.json()["id"] == job.id
+
+    gate.set()
+    job.future.result(5)
+    assert client.delete(f"/sessions/{sid}").json() == {"deleted": True}
+
+
+def test_fiv_changes_wait_for_the_fiv_job(executor, monkeypatch):
+    pytest.importorskip("fastapi")
+    from fastapi.testclient import TestClient
+
+    import api.main as main
+
+    gate = threading.Event()
+    jobs = JobManager(executor)
+    monkeypatch.setattr(main, "jobs", jobs)
+    client = TestClient(main.app)
+    job = jobs.submit("fiv_continental", _blocking(gate), key=("fiv",))
+    _wait_running(job)
+
+    assert client.post("/api/fiv/cycle/new").status_code == 409
+    assert client.post("/api/fiv/worldcup/sim-stage").status_code == 409
+    # The sim-all endpoints join the running job through _run_job
+    for path in ("/api/fiv/continental/sim-all", "/api/fiv/continental/CAF/sim-all",
+                 "/api/fiv/playoff/sim-all"):
+        assert main._busy_job_key("POST", path) is None
+
+    gate.set()
+    job.future.result(5)
+    assert main._busy_job_key("POST", "/api/fiv/cycle/new") is None
+
+
+def test_job_owner_ignores_client_supplied_forwarding(monkeypatch):
+    pytest.importorskip("fastapi")
+    from starlette.requests import Request
+
+    import api.main as main
+
+    def request(host, **headers):
+        return Request({"type": "http", "client": (host, 1234),
+                        "headers": [(k.replace("_", "-").encode(), v.encode())
+                                    for k, v in headers.items()]})
+
+    monkeypatch.setattr(main, "_CLIENT_IP_HEADER", "")
+    assert main._job_owner(request("203.0.113.9", x_forwarded_for="1.2.3.4")) == "ip:203.0.113.9"
+    assert main._job_owner(request("203.0.113.9", fly_client_ip="1.2.3.4")) == "ip:203.0.113.9"
+    # The in-process UI is charged per session, not as one shared address
+    assert main._job_owner(request("127.0.0.1"), ("college", "s1")) == "ui:college:s1"
+    assert main._job_owner(request("127.0.0.1", x_forwarded_for="127.0.0.1")) == "ip:127.0.0.1"
+
+    monkeypatch.setattr(main, "_CLIENT_IP_HEADER", "fly-client-ip")
+    assert main._job_owner(request("172.16.0.2", fly_client_ip="1.2.3.4")) == "ip:1.2.3.4"
+    assert main._job_owner(request("127.0.0.1"), ("college", "s1")) == "ui:college:s1"
@@ -0,0 +1,99 @@
+"""Least Violations — O(1) swap deltas plus insertion moves."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from engine.ranking_composite import GameResult, calculate_least_violations
+
+
+def _season(n_teams: int, weeks: int, seed: int):
+    rng = random.Random(seed)
+    teams = [f"T{i}" for i in range(n_teams)]
+    strength = {t: rng.gauss(0, 10) for t in teams}
+    games = []
+    for _ in range(weeks):
+        order = teams[:]
+        rng.shuffle(order)
+        for home, away in zip(order[::2], order[1::2]):
+            edge = strength[home] - strength[away] + rng.gauss(0, 14)
+            games.append(GameResult(home, away, 30 + edge / 2, 30 - edge / 2))
+    return games
+
+
+def _violations(games, ratings) -> int:
+    total = 0
+    for g in games:
+        if g.home_score > g.away_score and ratings[g.home_team] < ratings[g.away_team]:
+            total += 1
+        elif g.away_score > g.home_score and ratings[g.away_team] < ratings[g.home_team]:
+            total += 1
+    return total
+
+
+def _adjacent_swap_reference(games, max_passes=100):
+    """The original O(n²)-per-swap hill climb, for comparison."""
+    teams, idx = [], {}
+    for g in games:
+        for t in (g.home_team, g.away_team):
+            if t not in idx:
+                idx[t] = len(teams)
+                teams.append(t)
+    n = len(teams)
+    wins, played = [0] * n, [0] * n
+    h2h = [[0] * n for _ in range(n)]
+    for g in games:
+        h, a = idx[g.home_team], idx[g.away_team]
+        played[h] += 1
+        played[a] += 1
+        if g.home_score > g.away_score:
+            wins[h] += 1
+            h2h[h][a] += 1
+        elif g.away_score > g.home_score:
+            wins[a] += 1
+            h2h[a][h] += 1
+    order = sorted(range(n), key=lambda i: wins[i] / played[i] if played[i] else 0.0,
+                   reverse=True)
+
+    def count(o):
+        pos = {t: r for r, t in enumerate(o)}
+        return sum(h2h[w][l] for w in range(n) for l in range(n) if h2h[w][l] and pos[w] > pos[l])
+
+    for _ in range(max_passes):
+        improved = False
+        for i in range(n - 1):
+            o2 = order[:]
+            o2[i], o2[i + 1] = o2[i + 1], o2[i]
+            if count(o2) < count(order):
+                order = o2
+                improved = True
+        if not improved:
+            break
+    return {teams[order[i]]: float(n - i) for i in range(n)}
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_never_worse_than_adjacent_swaps(seed):
+    games = _season(30, 8, seed)
+    reference = _adjacent_swap_reference(games)
+    ratings = calculate_least_violations(games)
+    assert _violations(games, ratings) <= _violations(games, reference)
+
+
+def test_ratings_are_a_full_ordering():
+    games = _season(40, 10, 9)
+    ratings = calculate_least_violations(games)
+    assert sorted(ratings.values()) == [float(i) for i in range(1, 41)]
+
+
+def test_zero_budget_still_matches_swap_phase():
+    games = _season(30, 8, 4)
+    reference = _adjacent_swap_reference(games)
+    ratings = calculate_least_violations(games, time_budget=0.0)
+    assert _violations(games, ratings) <= _violations(games, reference)
+
+
+def test_empty():
+    assert calculate_least_violations([]) == {}
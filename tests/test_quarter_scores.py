@@ -0,0 +1,61 @@
+"""Per-quarter points recorded at sim time and read back by consumers."""
+
+from __future__ import annotations
+
+import glob
+
+import pytest
+
+from engine.viperball_metrics import (
+    calculate_quarter_scoring,
+    game_quarter_scores,
+    quarter_points,
+)
+
+_PLAYS = [
+    {"quarter": 1, "home_score": 0, "away_score": 0},
+    {"quarter": 1, "home_score": 9, "away_score": 0},
+    {"quarter": 2, "home_score": 9, "away_score": 5},
+    {"quarter": 4, "home_score": 12, "away_score": 5.5},
+    {"quarter": 5, "home_score": 21, "away_score": 5.5},  # overtime
+]
+
+
+def test_quarter_points_skip_overtime_and_empty_quarters():
+    qs = quarter_points(_PLAYS)
+    assert qs == {"home": [9.0, 0.0, 0.0, 3.0], "away": [0.0, 5.0, 0.0, 0.5]}
+
+
+def test_recorded_quarters_win_over_play_by_play():
+    recorded = {"home": [1.0, 2.0, 3.0, 4.0], "away": [0.0, 0.0, 0.0, 0.0]}
+    assert game_quarter_scores({"quarter_scores": recorded, "play_by_play": _PLAYS}) is recorded
+    assert game_quarter_scores({"play_by_play": _PLAYS}) == quarter_points(_PLAYS)
+    assert game_quarter_scores({"play_by_play": []}) is None
+
+
+def test_quarter_scoring_same_with_or_without_precomputed_lines():
+    qs = quarter_points(_PLAYS)
+    for team in ("home", "away"):
+        assert calculate_quarter_scoring([], team, qs) == calculate_quarter_scoring(_PLAYS, team)
+    home = calculate_quarter_scoring(_PLAYS, "home")
+    assert home["quarters_won"] == 2 and home["quarters_lost"] == 1
+
+
+def test_fast_sim_quarters_add_up_to_regulation_score():
+    from engine.fast_sim import fast_sim_game
+    from engine.game_engine import load_team_from_json
+
+    files = sorted(glob.glob("data/teams/*.json"))[:2]
+    if len(files) < 2:
+        pytest.skip("team data not available")
+    home, away = (load_team_from_json(f) for f in files)
+    for seed in range(1, 30):
+        result = fast_sim_game(home, away, seed=seed)
+        h = sum(result["quarter_scores"]["home"])
+        a = sum(result["quarter_scores"]["away"])
+        final_h = result["final_score"]["home"]["score"]
+        final_a = result["final_score"]["away"]["score"]
+        # Only the overtime tiebreaker TD is left out of the quarters.
+        assert (final_h - h, final_a - a) in ((0, 0), (9, 0), (0, 9))
+        if (final_h - h, final_a - a) != (0, 0):
+            assert h == a
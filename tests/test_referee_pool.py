@@ -0,0 +1,84 @@
+"""Referee pool — indexed crew assignment and batched game logging."""
+
+from __future__ import annotations
+
+import random
+
+from engine.referee_card import RefereePool
+
+
+def _pool(count: int = 60) -> RefereePool:
+    pool = RefereePool(seed=7)
+    pool.generate(count)
+    return pool
+
+
+def _game(week: int, pen_on: str = "home") -> dict:
+    return {
+        "week": week,
+        "final_score": {
+            "home": {"team": "Home U", "score": 31},
+            "away": {"team": "Away St", "score": 24},
+        },
+        "referee": {"blown_calls": 1, "challenged_calls": 2, "overturned_calls": 1},
+        "play_by_play": [
+            {"quarter": 1, "penalty": {"yards": 5, "on_team": pen_on}},
+            {"quarter": 2, "penalty": {"yards": 10, "on_team": "away", "declined": True}},
+            {"quarter": 5},
+        ],
+    }
+
+
+def test_crew_profile_matches_member_averages():
+    pool = _pool()
+    for idx, crew in enumerate(pool._crews):
+        cards = [pool.cards[n] for n in crew]
+        acc, favor, con = pool.crew_profile(idx)
+        assert abs(acc - sum(c.accuracy for c in cards) / len(cards)) < 1e-12
+        assert abs(favor - sum(c.home_favor for c in cards) / len(cards)) < 1e-12
+        assert abs(con - sum(c.consistency for c in cards) / len(cards)) < 1e-12
+        assert pool.get_crew_accuracy(crew) == acc
+
+
+def test_indexed_assignment_draws_like_choice():
+    pool = _pool()
+    by_acc = sorted(
+        pool._crews,
+        key=lambda c: sum(pool.cards[n].accuracy for n in c) / len(c),
+        reverse=True,
+    )
+    top = by_acc[:max(1, len(by_acc) // 3)]
+    for is_playoff, crews in ((False, pool._crews), (True, top)):
+        a, b = random.Random(99), random.Random(99)
+        for _ in range(50):
+            assert pool.crew_names(pool.assign_crew_index(a, is_playoff)) == b.choice(crews)
+
+
+def test_record_games_matches_per_game_logging():
+    batched = _pool()
+    single = RefereePool.from_dict(batched.to_dict())
+    rng = random.Random(3)
+    games = [
+        (batched._crews[rng.randrange(len(batched._crews))], _game(w, "home" if w % 2 else "away"))
+        for w in range(1, 9)
+    ]
+    batched.record_games(games, year=2030)
+    for crew, game in games:
+        single.record_game(crew, game, year=2030)
+
+    for name, card in batched.cards.items():
+        assert card.to_dict() == single.cards[name].to_dict()
+
+    crew, _ = games[0]
+    season = batched.cards[crew[0]].career_seasons[0]
+    assert season.total_penalties >= 1 and season.overtime_games >= 1
+
+
+def test_round_trip_rebuilds_crew_index():
+    pool = _pool()
+    restored = RefereePool.from_dict(pool.to_dict())
+    assert restored._crews == pool._crews
+    for idx, crew in enumerate(restored._crews):
+        cards = [restored.cards[n] for n in crew]
+        assert restored.crew_profile(idx)[0] == sum(c.accuracy for c in cards) / len(cards)
+    assert len(restored._playoff_crews) == max(1, len(restored._crews) // 3)
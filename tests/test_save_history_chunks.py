@@ -0,0 +1,179 @@
+"""Save history as content-addressed chunks — dedup, restore, prune, legacy rows."""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import zlib
+
+import pytest
+
+from engine import db
+
+
+@pytest.fixture
+def store(tmp_path):
+    original = db.get_db_path()
+    db.set_db_path(tmp_path / "saves.db")
+    db.init_db()
+    try:
+        yield tmp_path / "saves.db"
+    finally:
+        db.set_db_path(original)
+
+
+def _dynasty(year, changed_team=None):
+    teams = {f"Team {i:03d}": {"id": i, "notes": hashlib.sha256(b"%d" % i).hexdigest() * 3,
+                               "seasons": [{"year": y, "wins": (i + y) % 12}
+                                           for y in range(2020, year)]}
+             for i in range(60)}
+    if changed_team:
+        teams[changed_team]["notes"] = f"changed in {year}"
+    return {"current_year": year, "team_histories": teams,
+            "record_book": {"most_wins": ["Team 001", 12]}, "empty": {}}
+
+
+def _chunk_stats(path):
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute("SELECT COUNT(*), COALESCE(SUM(length(data)), 0), "
+                            "COALESCE(SUM(refs), 0) FROM history_chunks").fetchone()
+    finally:
+        conn.close()
+
+
+def test_chunk_round_trip_preserves_order_and_values():
+    doc = _dynasty(2030, "Team 007")
+    doc["schedule"] = [{"week": w, "game": g, "pad": "y" * 40} for w in range(12) for g in range(40)]
+    manifest, chunks = db._chunk_document(doc)
+    assert "d" in manifest and len(chunks) > 8
+
+    def build(node):
+        if not isinstance(node, dict):
+            return db.json.loads(chunks[node])
+        if "l" in node:
+            return [item for child in node["l"] for item in build(child)]
+        out = {}
+        for child in node["d"]:
+            out.update({child["k"]: build(child["v"])} if isinstance(child, dict) else build(child))
+        return out
+
+    rebuilt = build(manifest)
+    assert rebuilt == doc and list(rebuilt) == list(doc)
+    assert list(rebuilt["team_histories"]) == list(doc["team_histories"])
+    (schedule,) = [c["v"] for c in manifest["d"] if isinstance(c, dict) and c["k"] == "schedule"]
+    assert len(schedule["l"]) == 480 // db._list_run(480)
+    assert db._chunk_document([1, 2])[0] in db._chunk_document([1, 2])[1]
+
+
+def test_versions_share_unchanged_sections(store):
+    db.save_blob("dynasty", "d", _dynasty(2030))
+    db.save_blob("dynasty", "d", _dynasty(2030, "Team 001"))
+    count_one, bytes_one, _ = _chunk_stats(store)
+    db.save_blob("dynasty", "d", _dynasty(2030, "Team 002"))
+    count_two, bytes_two, _ = _chunk_stats(store)
+    # The second superseded version only adds the run holding its changed team.
+    assert count_two - count_one == 1
+    whole_copy = len(zlib.compress(db.json.dumps(_dynasty(2030, "Team 001")).encode()))
+    assert (bytes_two - bytes_one) * 4 < whole_copy
+
+    entries = db.list_save_history("dynasty", "d")
+    assert [db.load_save_history_entry(e["id"]) for e in entries] == [
+        _dynasty(2030, "Team 001"), _dynasty(2030)]
+    assert db.restore_save_from_history(entries[-1]["id"])
+    assert db.load_blob("dynasty", "d") == _dynasty(2030)
+
+
+def test_prune_releases_chunks(store):
+    for n in range(5):
+        db.save_blob("dynasty", "d", _dynasty(2030, f"Team {n:03d}"))
+    db.save_blob("prefs", "p", {"a": 1})
+    db.save_blob("prefs", "p", {"a": 2})
+    db.prune_save_history(keep_per_key=1)
+    (latest,) = db.list_save_history("dynasty", "d")
+    assert db.load_save_history_entry(latest["id"]) == _dynasty(2030, "Team 003")
+    manifests = _chunk_stats(store)
+    db.prune_save_history(keep_per_key=0)
+    assert manifests[0] > 0 and _chunk_stats(store) == (0, 0, 0)
+
+
+def test_legacy_whole_document_rows_are_chunked(store):
+    conn = sqlite3.connect(store)
+    conn.execute("INSERT INTO save_history (save_type, save_key, data, saved_at, superseded_at) "
+                 "VALUES ('dynasty', 'old', ?, 1, 2)", (db.json.dumps(_dynasty(2025)),))
+    conn.commit()
+    conn.close()
+    (entry,) = db.list_save_history("dynasty", "old")
+    assert db.load_save_history_entry(entry["id"]) == _dynasty(2025)
+    assert db.chunk_legacy_history() == 1
+    assert db.chunk_legacy_history() == 0
+    assert db.load_save_history_entry(entry["id"]) == _dynasty(2025)
+
+
+def _refs_match_manifests(path):
+    conn = sqlite3.connect(path)
+    try:
+        expected: dict[int, int] = {}
+        for (data,) in conn.execute("SELECT data FROM save_history WHERE encoding = 'chunks'"):
+            for chunk_id in db._manifest_leaves(db.json.loads(data), []):
+                expected[chunk_id] = expected.get(chunk_id, 0) + 1
+        return dict(conn.execute("SELECT id, refs FROM history_chunks")) == expected
+    finally:
+        conn.close()
+
+
+def test_concurrent_saves_keep_chunk_refs_consistent(store):
+    import threading
+
+    db.save_blob("dynasty", "d", _dynasty(2030))
+
+    def save(n):
+        for year in range(3):
+            db.save_blob("dynasty", "d", _dynasty(2030 + year, f"Team {n:03d}"))
+
+    threads = [threading.Thread(target=save, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(db.list_save_history("dynasty", "d")) == 12
+    assert _refs_match_manifests(store)
+
+
+def _prepare(key):
+    conn = db._connect()
+    try:
+        return db._prepare_snapshot(conn, "default", "dynasty", key)
+    finally:
+        conn.close()
+
+
+def _write(key, doc, prepared):
+    conn = db._connect()
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        db._write_blob(conn, "default", "dynasty", key, "", db.json.dumps(doc), "json",
+                       db.time.time(), prepared)
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def test_snapshots_prepared_outside_the_lock(store):
+    db.save_blob("dynasty", "d", _dynasty(2030))
+    db.save_blob("dynasty", "d", _dynasty(2030, "Team 001"))
+    prepared = _prepare("d")
+    # A prune between preparing and storing drops chunks the prepared rows
+    # took as already stored; the upsert stores them again.
+    db.prune_save_history(keep_per_key=0)
+    _write("d", {"v": 3}, prepared)
+    (entry,) = db.list_save_history("dynasty", "d")
+    assert db.load_save_history_entry(entry["id"]) == _dynasty(2030, "Team 001")
+
+    # Prepared from a row another save has since replaced: chunked again.
+    stale = _prepare("d")
+    db.save_blob("dynasty", "d", _dynasty(2031))
+    _write("d", {"v": 4}, stale)
+    latest = db.list_save_history("dynasty", "d")[0]
+    assert db.load_save_history_entry(latest["id"]) == _dynasty(2031)
+    assert _refs_match_manifests(store)
@@ -0,0 +1,121 @@
+"""Schedule templates — cached pairings filled with rotated team assignments."""
+
+from __future__ import annotations
+
+import random
+from collections import Counter
+
+import pytest
+
+from engine import season as season_mod
+from engine.season import MAX_CONFERENCE_GAMES, Season, clear_schedule_template_cache
+
+
+class _StubTeam:
+    def __init__(self, name: str, prestige: int):
+        self.name = name
+        self.prestige = prestige
+
+
+def _league(conf_sizes=(12, 12, 10, 10, 14)):
+    conferences = {}
+    teams = {}
+    for c, size in enumerate(conf_sizes):
+        members = [f"C{c}T{i}" for i in range(size)]
+        conferences[f"Conf {c}"] = members
+        for i, name in enumerate(members):
+            teams[name] = _StubTeam(name, 40 + (i * 7) % 50)
+    return teams, conferences
+
+
+def _season(teams, conferences, rivalries=None):
+    season = Season(
+        name="Test",
+        teams=teams,
+        conferences={c: list(m) for c, m in conferences.items()},
+        team_conferences={t: c for c, m in conferences.items() for t in m},
+    )
+    season.rivalries = rivalries or {}
+    return season
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_schedule_template_cache()
+    yield
+    clear_schedule_template_cache()
+
+
+def _counts(schedule):
+    total, conf = Counter(), Counter()
+    for g in schedule:
+        total[g.home_team] += 1
+        total[g.away_team] += 1
+        if g.is_conference_game:
+            conf[g.home_team] += 1
+            conf[g.away_team] += 1
+    return total, conf
+
+
+def test_templated_schedule_is_valid():
+    random.seed(7)
+    teams, confs = _league()
+    season = _season(teams, confs)
+    season.generate_schedule(games_per_team=12)
+
+    pairs = [tuple(sorted((g.home_team, g.away_team))) for g in season.schedule]
+    assert len(pairs) == len(set(pairs))
+    total, conf = _counts(season.schedule)
+    assert all(total[t] == 12 for t in teams)
+    assert max(conf.values()) <= MAX_CONFERENCE_GAMES
+    for g in season.schedule:
+        same = season.team_conferences[g.home_team] == season.team_conferences[g.away_team]
+        assert g.is_conference_game == same
+    # No team plays twice in a week.
+    by_week = Counter()
+    for g in season.schedule:
+        by_week[(g.week, g.home_team)] += 1
+        by_week[(g.week, g.away_team)] += 1
+    assert max(by_week.values()) == 1
+
+
+def test_template_is_cached_and_rotated():
+    random.seed(11)
+    teams, confs = _league()
+    first = _season(teams, confs)
+    first.generate_schedule(games_per_team=12, dynasty_year=2026)
+    assert len(season_mod._SCHEDULE_TEMPLATE_CACHE) == 1
+
+    second = _season(teams, confs)
+    second.generate_schedule(games_per_team=12, dynasty_year=2027)
+    assert len(season_mod._SCHEDULE_TEMPLATE_CACHE) == 1
+
+    def nonconf(s):
+        return {tuple(sorted((g.home_team, g.away_team)))
+                for g in s.schedule if not g.is_conference_game}
+    assert nonconf(first) != nonconf(second)
+
+
+def test_rivalries_and_pinned_games_survive_template_fill():
+    random.seed(3)
+    teams, confs = _league()
+    rivalries = {
+        "C0T0": {"conference": "C0T5", "non_conference": ["C1T3", "C4T9"]},
+        "C2T2": {"conference": None, "non_conference": "C3T7"},
+        "C4T1": {"conference": ["C4T2", "C4T13"], "non_conference": None},
+    }
+    pinned = [("C1T0", "C2T9"), ("C3T4", "C0T11")]
+    season = _season(teams, confs, rivalries)
+    season.generate_schedule(games_per_team=12, pinned_matchups=pinned)
+
+    scheduled = {tuple(sorted((g.home_team, g.away_team))): g for g in season.schedule}
+    for team, rivals in rivalries.items():
+        for kind in ("conference", "non_conference"):
+            for rival in Season._rivalry_list(rivals[kind]):
+                game = scheduled[tuple(sorted((team, rival)))]
+                assert game.is_rivalry_game
+    for home, away in pinned:
+        game = scheduled[tuple(sorted((home, away)))]
+        assert (game.home_team, game.away_team) == (home, away)
+    total, _ = _counts(season.schedule)
+    assert max(total.values()) <= 12
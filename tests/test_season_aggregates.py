@@ -0,0 +1,139 @@
+"""Season aggregate store — incremental totals vs walking every box score."""
+
+from __future__ import annotations
+
+import pytest
+
+from engine.season_aggregates import (
+    PHASE_PLAYOFF,
+    PHASE_REGULAR,
+    SeasonAggregates,
+    season_aggregates,
+)
+
+
+class _Game:
+    def __init__(self, week, home, away, home_score, away_score, lines):
+        self.week = week
+        self.home_team = home
+        self.away_team = away
+        self.home_score = home_score
+        self.away_score = away_score
+        self.completed = True
+        self.full_result = {
+            "player_stats": lines,
+            "stats": {
+                "home": {"total_yards": 300, "touchdowns": 3, "kick_pass_interceptions": 1},
+                "away": {"total_yards": 250, "touchdowns": 2},
+            },
+            "play_by_play": [
+                {"quarter": 1, "home_score": 7, "away_score": 0},
+                {"quarter": 3, "home_score": 7, "away_score": 9},
+            ],
+        }
+
+
+class _Bowl:
+    def __init__(self, game):
+        self.game = game
+
+
+class _Season:
+    def __init__(self, schedule, playoff_bracket=(), bowl_games=()):
+        self.schedule = list(schedule)
+        self.playoff_bracket = list(playoff_bracket)
+        self.bowl_games = list(bowl_games)
+
+
+def _line(name, **stats):
+    return {"name": name, "tag": "ZB1", "position": "Zeroback", **stats}
+
+
+def _season():
+    reg = _Game(1, "A", "B", 21, 14, {
+        "home": [_line("Ann", yards=80.4, tds=1, wpa=0.25)],
+        "away": [_line("Bea", tackles=6)],
+    })
+    playoff = _Game(999, "B", "A", 10, 20, {
+        "home": [_line("Bea", tackles=4)],
+        "away": [_line("Ann", yards=40.0, wpa=0.5)],
+    })
+    bowl = _Game(1001, "A", "B", 30, 3, {
+        "home": [_line("Ann", yards=100.0)],
+        "away": [],
+    })
+    return _Season([reg], [playoff], [_Bowl(bowl)])
+
+
+def test_backfill_applies_each_game_once():
+    season = _season()
+    store = season_aggregates(season)
+    assert len(store) == 3
+    assert season_aggregates(season) is store
+    assert len(store) == 3
+
+    ann = store.player("A", "Ann")
+    assert ann["games"] == 3
+    assert ann["yards"] == 220.4
+    assert ann["wpa"] == 0.75
+
+
+def test_phases_can_be_excluded():
+    store = season_aggregates(_season())
+    ann = store.player("A", "Ann", phases=(PHASE_REGULAR, PHASE_PLAYOFF))
+    assert ann["games"] == 2
+    assert ann["yards"] == 120.4
+    assert store.player("B", "Bea", phases=(PHASE_REGULAR,))["tackles"] == 6
+
+
+def test_team_totals_include_opponent_and_quarter_lines():
+    store = SeasonAggregates()
+    season = _season()
+    store.apply_game(season.schedule[0])
+    a = store.team_totals()["A"]
+    b = store.team_totals()["B"]
+    assert a["games"] == 1 and a["points_for"] == 21
+    assert a["total_yards"] == 300 and a["opp_total_yards"] == 250
+    assert b["opp_kp_ints"] == 1
+    assert a["q1_pf"] == 7 and a["q3_pa"] == 9
+
+
+def test_incomplete_games_wait_for_completion():
+    season = _season()
+    game = season.schedule[0]
+    game.completed = False
+    store = SeasonAggregates()
+    assert not store.apply_game(game)
+    game.completed = True
+    assert store.apply_game(game)
+    assert not store.apply_game(game)
+
+
+def test_returned_totals_are_copies():
+    store = season_aggregates(_season())
+    store.player_totals()[("A", "Ann")]["yards"] = 0
+    store.team_totals()["A"]["games"] = 0
+    assert store.player("A", "Ann")["yards"] == 220.4
+    assert store.team_totals()["A"]["games"] == 3
+
+
+def test_team_rename_rebuilds_totals_under_the_new_name():
+    pytest.importorskip("fastapi")
+    from api.main import _rename_team_everywhere
+
+    class _Team:
+        def __init__(self, name):
+            self.name = name
+
+    season = _season()
+    season.teams = {"A": _Team("A"), "B": _Team("B")}
+    season.mark_mutated = lambda: None
+    before = season_aggregates(season).team_totals()["A"]
+
+    _rename_team_everywhere(season, "A", "Z")
+    store = season_aggregates(season)
+    assert sorted(store.team_totals()) == ["B", "Z"]
+    assert store.team_totals()["Z"] == before
+    assert store.player("A", "Ann") is None
+    assert store.player("Z", "Ann")["yards"] == 220.4
+    assert {team for team, _ in store.player_totals()} == {"B", "Z"}
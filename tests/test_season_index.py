@@ -0,0 +1,183 @@
+"""Season game index and the cross-league name index."""
+
+from __future__ import annotations
+
+import pytest
+
+from engine.season_index import SeasonIndex, season_index
+from stats_site.name_index import CrossLeagueNameIndex, roster_links
+
+
+class _Game:
+    def __init__(self, week, home, away, lines=None, crew="", completed=True):
+        self.week = week
+        self.home_team = home
+        self.away_team = away
+        self.home_score = 14
+        self.away_score = 7
+        self.completed = completed
+        self.full_result = {
+            "player_stats": lines or {"home": [], "away": []},
+            "referee": {"name": crew},
+        }
+
+
+class _Bowl:
+    def __init__(self, game):
+        self.game = game
+
+
+class _Season:
+    def __init__(self, schedule, playoff_bracket=(), bowl_games=()):
+        self.schedule = list(schedule)
+        self.playoff_bracket = list(playoff_bracket)
+        self.bowl_games = list(bowl_games)
+
+
+def _season():
+    wk2 = _Game(2, "B", "A", {"home": [], "away": [{"name": "Ann", "yards": 30}]},
+                crew="Pat Ro, Sam Oh, Lee Wu")
+    wk1 = _Game(1, "A", "B", {"home": [{"name": "Ann", "yards": 10}], "away": []},
+                crew="Pat Ro, Kim Vo, Jo Yu")
+    other = _Game(1, "C", "D", crew="Sam Oh, Kim Vo, Jo Yu")
+    bowl = _Game(1001, "A", "B", {"home": [{"name": "Ann", "yards": 50}], "away": []})
+    later = _Game(3, "A", "C", completed=False)
+    return _Season([wk2, wk1, other, later], bowl_games=[_Bowl(bowl)])
+
+
+def test_lookups_cover_only_matching_completed_games_in_week_order():
+    season = _season()
+    index = season_index(season)
+    assert len(index) == 4
+    assert season_index(season) is index
+
+    assert [g.week for g in index.matchup_games("B", "A")] == [1, 2, 1001]
+    assert [g.week for g in index.team_games("C")] == [1]
+    assert [(g.week, side, line["yards"]) for g, side, line in index.player_games("A", "Ann")] == [
+        (1, "home", 10), (2, "away", 30), (1001, "home", 50),
+    ]
+    assert index.player_games("B", "Ann") == []
+    assert [g.home_team for g in index.referee_games("Pat Ro")] == ["A", "B"]
+
+
+def test_games_are_indexed_once_when_they_complete():
+    season = _season()
+    index = SeasonIndex()
+    later = season.schedule[-1]
+    assert not index.apply_game(later)
+    later.completed = True
+    assert index.apply_game(later)
+    assert not index.apply_game(later)
+    assert index.sync(season.schedule) == 3
+    assert [g.week for g in index.matchup_games("A", "C")] == [3]
+
+
+def test_renamed_team_is_indexed_once_under_its_new_name():
+    pytest.importorskip("fastapi")
+    from api.main import _rename_team_everywhere
+
+    class _Team:
+        def __init__(self, name):
+            self.name = name
+
+    season = _season()
+    season.teams = {t: _Team(t) for t in "ABCD"}
+    season.mark_mutated = lambda: None
+    assert len(season_index(season)) == 4
+
+    _rename_team_everywhere(season, "A", "Z")
+    index = season_index(season)
+    assert len(index) == 4
+    assert index.team_games("A") == []
+    assert [g.week for g in index.matchup_games("Z", "B")] == [1, 2, 1001]
+
+
+def test_name_index_rebuilds_only_changed_sources():
+    index = CrossLeagueNameIndex()
+    rosters = {"Owls": ["Ann", "Bea"], "Gators": ["Ann"]}
+
+    def build():
+        return roster_links(rosters.items(), lambda t: {"team_name": t})
+
+    index.refresh("s1", 1, "college", build)
+    index.refresh("s1", 1, "college", build)
+    assert index.rebuilds == 1
+    assert [link["team_name"] for _, _, link in index.lookup("Ann")] == ["Owls", "Gators"]
+
+    rosters["Gators"].append("Cal")
+    index.refresh("s1", 2, "college", build)
+    assert index.rebuilds == 2
+    assert index.lookup("Cal") == [("s1", "college", {"team_name": "Gators"})]
+
+    assert index.generation == 2
+    index.retain(["s1"])
+    assert index.generation == 2
+    index.retain([])
+    assert index.lookup("Ann") == [] and len(index) == 0
+    assert index.generation == 3
+
+
+def test_cross_league_links_span_every_league(monkeypatch):
+    pytest.importorskip("fastapi")
+    from stats_site import router as stats_router
+
+    class _Player:
+        def __init__(self, name):
+            self.name = name
+
+    class _Team:
+        def __init__(self, *names):
+            self.players = [_Player(n) for n in names]
+
+    class _College:
+        name = "2031 Season"
+        mutation_version = 0
+        schedule = []
+
+        def __init__(self, teams):
+            self.teams = teams
+
+    class _Pro:
+        mutation_version = 0
+
+        class config:
+            league_name = "Pro League"
+
+        def __init__(self, teams):
+            self.teams = teams
+
+    class _Tier:
+        def __init__(self, teams):
+            self.teams = teams
+
+    class _WVL:
+        mutation_version = 0
+
+        def __init__(self, tiers):
+            self.tier_seasons = tiers
+
+    api = {
+        "sessions": {
+            "s1": {"season": _College({"Owls": _Team("Ann Lee")})},
+            "s2": {"season": _College({"Gators": _Team("Ann Lee", "Bo")})},
+        },
+        "pro_sessions": {"nvl_p1": _Pro({"WAS": _Team("Ann Lee")}),
+                         "la_league_p2": _Pro({"MEX": _Team("Bo")})},
+        "wvl_sessions": {"w1": {"season": _WVL({1: _Tier({"ber": _Team("Ann Lee")})}),
+                                "dynasty_name": "Euro", "year": 3}},
+    }
+    fiv = {"national_teams": {"USA": {"name": "United States",
+                                      "roster": [{"player": {"name": "Ann Lee"}}]}}}
+    monkeypatch.setattr(stats_router, "_get_api", lambda: api)
+    monkeypatch.setattr(stats_router, "_get_fiv_data", lambda: fiv)
+    monkeypatch.setattr(stats_router, "_name_index", CrossLeagueNameIndex())
+
+    links = stats_router._find_cross_league_links("Ann Lee", exclude_college_session="s1")
+    assert links["college"] == [{"session_id": "s2", "team_name": "Gators", "season_name": "2031 Season"}]
+    assert links["pro"][0]["league_id"] == "nvl" and links["pro"][0]["team_key"] == "WAS"
+    assert links["wvl"][0]["team_key"] == "ber" and links["wvl"][0]["tier"] == 1
+    assert links["international"] == [{"nation_code": "USA", "nation_name": "United States"}]
+    assert stats_router._find_cross_league_links("Bo", exclude_college_session="s2")["college"] == []
+    # League ids may contain underscores; the session id never does
+    bo_pro = stats_router._find_cross_league_links("Bo")["pro"]
+    assert [(p["league_id"], p["session_id"]) for p in bo_pro] == [("la_league", "p2")]
@@ -0,0 +1,131 @@
+"""Sectioned dynasty / WVL saves — lazy sections, section reuse, history, pruning."""
+
+from __future__ import annotations
+
+import copy
+import sqlite3
+
+import pytest
+
+from engine import db
+from engine.dynasty import Coach, Dynasty, SeasonAwards
+
+
+@pytest.fixture
+def store(tmp_path):
+    original = db.get_db_path()
+    db.set_db_path(tmp_path / "saves.db")
+    db.init_db()
+    try:
+        yield tmp_path / "saves.db"
+    finally:
+        db.set_db_path(original)
+
+
+def _dynasty(years=30):
+    dynasty = Dynasty(dynasty_name="Test", coach=Coach(name="C", team_name="T0"), current_year=2026)
+    for c in range(4):
+        dynasty.add_conference(f"Conf {c}", [f"T{c * 10 + i}" for i in range(10)])
+    for y in range(2026 - years, 2026):
+        for n, hist in enumerate(dynasty.team_histories.values()):
+            hist.season_records[y] = {"wins": (n + y) % 12, "losses": 12 - (n + y) % 12}
+        dynasty.awards_history[y] = SeasonAwards(y, "T1", "T2", "T3", "T4", "T5", "T6", "T7")
+        dynasty.recruiting_history[y] = {"T1": [f"Recruit {y}-{i}" for i in range(20)]}
+    dynasty.team_prestige = {name: 50 for name in dynasty.team_histories}
+    return dynasty
+
+
+def _doc(dynasty):
+    """The dynasty's whole document as it reads back from JSON."""
+    return db.json.loads(db.json.dumps(db.serialize_dynasty(dynasty)))
+
+
+def _section_count(path):
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute("SELECT COUNT(*) FROM save_sections").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_round_trip_matches_whole_document(store):
+    dynasty = _dynasty()
+    db.save_dynasty(dynasty, "d")
+    loaded = db.load_dynasty("d")
+    assert _doc(loaded) == _doc(dynasty)
+    assert loaded.team_histories["T3"].season_records[2000] == dynasty.team_histories["T3"].season_records[2000]
+    # Generic readers still see the whole document.
+    assert db.load_blob("dynasty", "d") == _doc(dynasty)
+
+
+def test_sections_load_on_first_access(store):
+    db.save_dynasty(_dynasty(), "d")
+    loaded = db.load_dynasty("d")
+    assert loaded.dynasty_name == "Test" and loaded.team_prestige["T1"] == 50
+    assert "team_histories" not in vars(loaded) and "awards_history" not in vars(loaded)
+    assert len(loaded.team_histories) == 40
+    assert "record_book" in vars(loaded)  # loaded with its section
+    assert "awards_history" not in vars(loaded)
+    assert loaded.pending_section("histories") is None
+    assert loaded.pending_section("awards") is not None
+    assert loaded.awards_history[2020].champion == "T1"
+    clone = copy.deepcopy(db.load_dynasty("d"))
+    assert "_lazy_sections" not in vars(clone) and len(clone.recruiting_history) == 30
+
+
+def test_resave_writes_only_changed_sections(store):
+    db.save_dynasty(_dynasty(), "d")
+    written = _section_count(store)
+    assert written == len(db._DYNASTY_SECTIONS)
+
+    loaded = db.load_dynasty("d")
+    db.save_dynasty(loaded, "d")  # nothing loaded, nothing changed
+    assert _section_count(store) == written
+
+    loaded.team_histories["T5"].season_records[2026] = {"wins": 12, "losses": 0}
+    db.save_dynasty(loaded, "d")
+    assert _section_count(store) == written + 1
+    assert "awards_history" not in vars(loaded)
+    assert db.load_dynasty("d").team_histories["T5"].season_records[2026]["wins"] == 12
+
+
+def test_history_restore_and_section_pruning(store):
+    db.save_dynasty(_dynasty(), "d")
+    changed = db.load_dynasty("d")
+    changed.current_year = 2027
+    changed.recruiting_history[2026] = {"T1": ["New"]}
+    db.save_dynasty(changed, "d")
+    (entry,) = db.list_save_history("dynasty", "d")
+    assert db.load_save_history_entry(entry["id"]) == _doc(_dynasty())
+
+    assert db.prune_save_sections() == 0  # history still refers to the old archives
+    db.prune_save_history(keep_per_key=0)
+    assert _section_count(store) == len(db._DYNASTY_SECTIONS)
+    assert db.load_dynasty("d").recruiting_history[2026] == {"T1": ["New"]}
+
+    db.save_dynasty(_dynasty(), "d")
+    (entry,) = db.list_save_history("dynasty", "d")
+    assert db.restore_save_from_history(entry["id"])
+    assert db.load_dynasty("d").current_year == 2027
+    assert db.fork_save("dynasty", "d", "fork")
+    assert db.load_dynasty("fork").recruiting_history[2026] == {"T1": ["New"]}
+
+
+def test_whole_document_saves_still_load(store):
+    dynasty = _dynasty(5)
+    db.save_blob("dynasty", "legacy", db.serialize_dynasty(dynasty), label="Test")
+    loaded = db.load_dynasty("legacy")
+    assert "_lazy_sections" not in vars(loaded)
+    assert _doc(loaded) == _doc(dynasty)
+
+
+def test_wvl_tiers_are_a_lazy_section(store):
+    from engine.wvl_season import WVLMultiTierSeason
+
+    wvl = WVLMultiTierSeason.__new__(WVLMultiTierSeason)
+    wvl.tier_assignments, wvl.tier_seasons = {"a": 1}, {}
+    wvl.phase, wvl.current_week, wvl.promotion_result = "regular_season", 3, None
+    db.save_wvl_season(wvl)
+    loaded = db.load_wvl_season()
+    assert loaded.current_week == 3 and loaded.pending_section("tiers") is not None
+    assert loaded.tier_seasons == {} and loaded.pending_section("tiers") is None
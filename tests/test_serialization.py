@@ -0,0 +1,113 @@
+"""Serialization backends — same documents from stdlib json and orjson."""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import enum
+import json
+import random
+
+import pytest
+
+from engine import serialization
+from engine.coaching import generate_coach_card
+from engine.injuries import Injury
+
+BACKENDS = ["json"] + (["orjson"] if serialization._orjson is not None else [])
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request, monkeypatch):
+    monkeypatch.setattr(serialization, "BACKEND", request.param)
+    return request.param
+
+
+class Colour(enum.Enum):
+    RED = "red"
+
+
+@dataclasses.dataclass
+class Plain:
+    name: str
+    tags: list
+
+
+def _injury():
+    return Injury(player_name="A B", team_name="T", position="Zeroback", tier="minor",
+                  category="soft_tissue", description="hamstring", body_part="leg",
+                  week_injured=3, weeks_out=2, week_return=5)
+
+
+def _document():
+    return {
+        "text": "Bjørk ✓", "int": 2 ** 40, "float": 0.1, "none": None, "bool": True,
+        "nested": {"list": [1, 2.5, "x"], "tuple": (1, 2)},
+        1: "int key", 2.5: "float key",
+        "when": datetime.datetime(2026, 3, 1, 12, 30),
+        "colour": Colour.RED, "set": {1},
+        "plain": Plain("p", ["a"]),
+        "injury": _injury(),
+        "coach": generate_coach_card(role="head_coach", team_name="T", rng=random.Random(3)),
+    }
+
+
+def _reference(doc):
+    """What the stdlib made of the same document with to_dict() applied first."""
+    def prepare(v):
+        if isinstance(v, dict):
+            return {k: prepare(x) for k, x in v.items()}
+        if isinstance(v, (list, tuple)):
+            return [prepare(x) for x in v]
+        if hasattr(v, "to_dict"):
+            return prepare(v.to_dict())
+        if dataclasses.is_dataclass(v):
+            return prepare(dataclasses.asdict(v))
+        if isinstance(v, enum.Enum):
+            return v.value
+        return v
+    return json.loads(json.dumps(prepare(doc), default=str))
+
+
+def test_backends_produce_the_same_document(backend):
+    doc = _document()
+    assert serialization.loads(serialization.dumpb(doc)) == _reference(doc)
+    assert serialization.loads(serialization.dumps(doc)) == _reference(doc)
+    assert serialization.loads(serialization.dumps(doc, indent=2)) == _reference(doc)
+    assert "\n" in serialization.dumps(doc, indent=2) and "\n" not in serialization.dumps(doc)
+
+
+def test_dataclass_round_trips_through_from_dict(backend):
+    coach = generate_coach_card(role="oc", team_name="T", rng=random.Random(5))
+    staff = serialization.loads(serialization.dumpb({"oc": coach}))
+    assert type(coach).from_dict(staff["oc"]).to_dict() == coach.to_dict()
+
+
+def test_values_outside_orjson_fall_back_to_stdlib(backend):
+    big = {"id": 2 ** 70, "n": [float("nan")]}
+    out = serialization.loads(serialization.dumpb(big))
+    assert out["id"] == 2 ** 70
+    # Text the stdlib wrote with NaN literals still parses.
+    assert serialization.loads(json.dumps({"x": float("inf")})) == {"x": float("inf")}
+    assert serialization.loads(memoryview(b'{"a": [1]}')) == {"a": [1]}
+
+
+def test_non_finite_floats_become_null(backend):
+    doc = {"nan": float("nan"), "inf": [float("inf"), -float("inf"), 1.5],
+           "plain": Plain("p", [float("nan")])}
+    expected = {"nan": None, "inf": [None, None, 1.5], "plain": {"name": "p", "tags": [None]}}
+    assert json.loads(serialization.dumps(doc)) == expected
+    assert json.loads(serialization.dumps(doc, indent=2)) == expected
+    assert json.loads("".join(serialization.iterencode(doc))) == expected
+    assert serialization.loads(serialization.dumpb(doc)) == expected
+
+
+def test_registered_encoder_wins(backend, monkeypatch):
+    monkeypatch.setitem(serialization._ENCODERS, Plain, lambda p: p.name.upper())
+    assert serialization.loads(serialization.dumps([Plain("x", [])])) == ["X"]
+
+
+def test_numpy_scalars_keep_stdlib_behaviour(backend):
+    np = pytest.importorskip("numpy")
+    assert serialization.loads(serialization.dumps({"f": np.float64(1.5), "i": np.int64(3)})) == \
+        json.loads(json.dumps({"f": np.float64(1.5), "i": np.int64(3)}, default=str))
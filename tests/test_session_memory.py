@@ -0,0 +1,123 @@
+"""Session memory accounting — size estimates and budget eviction."""
+
+from __future__ import annotations
+
+import time
+
+from api.session_memory import SessionMemoryAccountant
+from engine.object_size import estimate_size
+
+
+class _Box:
+    def __init__(self, payload):
+        self.payload = payload
+
+
+class _Slotted:
+    __slots__ = ("payload",)
+
+    def __init__(self, payload):
+        self.payload = payload
+
+
+def test_estimate_grows_with_payload():
+    small, _, _ = estimate_size({"games": ["x" * 10]})
+    big, _, _ = estimate_size({"games": ["x" * 10_000 for _ in range(50)]})
+    assert big > small * 100
+
+
+def test_estimate_walks_objects_and_slots():
+    blob = "y" * 50_000
+    assert estimate_size(_Box(blob))[0] > 50_000
+    assert estimate_size(_Slotted(blob))[0] > 50_000
+
+
+def test_shared_objects_counted_once():
+    blob = "z" * 100_000
+    once, _, _ = estimate_size([blob])
+    twice, _, _ = estimate_size([blob, blob])
+    assert twice - once < 100
+
+
+def test_truncated_walk_extrapolates():
+    data = [[i] for i in range(1000)]
+    full, _, truncated = estimate_size(data)
+    capped, visited, capped_truncated = estimate_size(data, max_objects=100)
+    assert not truncated
+    assert capped_truncated and visited == 100
+    assert capped > full * 0.3
+
+
+def _accountant(store, budget):
+    acct = SessionMemoryAccountant(budget_bytes=budget, min_idle_seconds=60)
+    evicted = []
+
+    def entries():
+        for sid, (root, ts) in list(store.items()):
+            yield sid, root, ts
+
+    def evict(sid):
+        evicted.append(sid)
+        return store.pop(sid, None) is not None
+
+    acct.register_pool("cvl", entries, evict)
+    return acct, evicted
+
+
+def test_enforce_evicts_largest_idle_first():
+    old = time.time() - 3600
+    store = {
+        "small": (["a" * 1_000], old),
+        "huge": (["b" * 2_000_000], old),
+        "medium": (["c" * 500_000], old),
+    }
+    acct, evicted = _accountant(store, budget=1_000_000)
+    acct.enforce()
+    assert evicted == ["huge"]
+    assert set(store) == {"small", "medium"}
+    assert acct.summary()["evictions"] == 1
+
+
+def test_enforce_skips_recently_used_sessions():
+    store = {
+        "busy": (["b" * 2_000_000], time.time()),
+        "idle": (["c" * 500_000], time.time() - 3600),
+    }
+    acct, evicted = _accountant(store, budget=100_000)
+    acct.enforce()
+    assert evicted == ["idle"]
+    assert "busy" in store
+
+
+def test_measure_reuses_estimate_for_untouched_sessions():
+    old = time.time() - 3600
+    payload = ["d" * 10_000]
+    store = {"s": (payload, old)}
+    acct, _ = _accountant(store, budget=0)
+    first = acct.measure()[0]
+    payload.append("e" * 100_000)
+    assert acct.measure()[0].bytes == first.bytes
+    store["s"] = (payload, time.time())
+    assert acct.measure()[0].bytes > first.bytes
+
+
+def test_new_pro_league_is_not_idle(tmp_path, monkeypatch):
+    import pytest
+
+    pytest.importorskip("fastapi")
+    from fastapi.testclient import TestClient
+
+    import api.main as main
+    from engine import db
+
+    original = db.get_db_path()
+    db.set_db_path(tmp_path / "saves.db")
+    db.init_db()
+    monkeypatch.setattr(main, "pro_sessions", {})
+    monkeypatch.setattr(main, "_pro_session_accessed", {})
+    try:
+        key = TestClient(main.app).post("/api/pro/nvl/new").json()["key"]
+        ((entry_key, _, accessed),) = main._pro_memory_entries()
+        assert entry_key == key and time.time() - accessed < 60
+    finally:
+        db.set_db_path(original)
@@ -0,0 +1,196 @@
+"""Evicted college sessions spill to the DB and rehydrate on next access."""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+from fastapi.testclient import TestClient
+
+from engine import db
+
+
+class StubSeason:
+    name = "Spill Test Season"
+    champion = None
+
+    def __init__(self):
+        self.teams = {"A": object(), "B": object()}
+        self.week = 3
+
+    def get_last_completed_week(self):
+        return self.week
+
+    def get_total_weeks(self):
+        return 12
+
+
+@pytest.fixture
+def api(tmp_path, monkeypatch):
+    import api.main as main
+
+    original = db.get_db_path()
+    db.set_db_path(tmp_path / "saves.db")
+    db.init_db()
+    monkeypatch.setattr(main, "sessions", {})
+    try:
+        yield main
+    finally:
+        db.set_db_path(original)
+
+
+def _session(main, client, season=None):
+    sid = client.post("/sessions").json()["session_id"]
+    main.sessions[sid]["season"] = season
+    return sid
+
+
+def test_evicted_session_comes_back(api):
+    client = TestClient(api.app)
+    sid = _session(api, client, StubSeason())
+    api.sessions[sid]["season"].week = 7
+    db.save_box_score(sid, 7, "A", "B", {"week": 7})
+
+    assert api._evict_cvl_session(sid)
+    assert sid not in api.sessions
+    listed = client.get("/api/sessions/college").json()["sessions"]
+    assert [(s["session_id"], s["current_week"]) for s in listed] == [(sid, 7)]
+    # Creating sessions prunes orphaned box scores; a spilled session's stay.
+    _session(api, client)
+    assert db.load_box_score(sid, 7, "A", "B") == {"week": 7}
+
+    session = api._get_session(sid)
+    assert session["season"].week == 7
+    assert db.list_spilled_sessions("college") == []
+
+
+def test_cap_and_ttl_spill_instead_of_dropping(api, monkeypatch):
+    monkeypatch.setattr(api, "MAX_SESSIONS", 2)
+    client = TestClient(api.app)
+    first = _session(api, client)
+    api.sessions[first]["phase"] = "regular"
+    api.sessions[first]["last_accessed"] -= 10
+    _session(api, client)
+    _session(api, client)
+    assert first not in api.sessions and len(api.sessions) == 2
+    assert client.get(f"/sessions/{first}").json()["phase"] == "regular"
+    assert len(api.sessions) == 2
+
+    for session in api.sessions.values():
+        session["last_accessed"] = time.time() - api.SESSION_TTL_SECONDS - 1
+    api._expire_idle_sessions()
+    assert api.sessions == {}
+    assert len(db.list_spilled_sessions("college")) == 3
+
+
+def test_delete_removes_spilled_session(api):
+    client = TestClient(api.app)
+    sid = _session(api, client)
+    api._evict_cvl_session(sid)
+    assert client.delete(f"/sessions/{sid}").json() == {"deleted": True}
+    assert client.get(f"/sessions/{sid}").status_code == 404
+    assert client.delete(f"/sessions/{sid}").status_code == 404
+
+
+def test_unloadable_spill_falls_back_to_the_autosave(api):
+    client = TestClient(api.app)
+    sid = _session(api, client)
+    lost = _session(api, client)
+    for key in (sid, lost):
+        api._evict_cvl_session(key)
+        # Spilled by a build whose session classes have since changed
+        db.spill_session("college", key, b"not a pickle")
+    db.save_season_archive(f"college_{sid}", {"type": "college", "label": "Autosave"})
+
+    assert client.get(f"/sessions/{lost}").status_code == 404
+    session = client.get(f"/sessions/{sid}").json()
+    assert session["archive_key"] == f"college_{sid}"
+    assert not session["has_season"]
+    # The payloads are kept for a build that can still read them
+    assert sorted(r["session_key"] for r in db.list_spilled_sessions("college")) == sorted([sid, lost])
+
+
+def test_spills_stay_out_of_the_saves_db(api):
+    client = TestClient(api.app)
+    sid = _session(api, client, StubSeason())
+    api._evict_cvl_session(sid)
+
+    saves = sqlite3.connect(db.get_db_path())
+    tables = {r[0] for r in saves.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+    saves.close()
+    assert "session_spill" not in tables
+    assert db.spill_db_path().exists()
+    assert [row["session_key"] for row in db.list_spilled_sessions("college")] == [sid]
+
+
+
+def test_restore_from_hub_drops_spills(api, tmp_path, monkeypatch):
+    from api import db_sync
+
+    client = TestClient(api.app)
+    sid = _session(api, client, StubSeason())
+    api._evict_cvl_session(sid)
+
+    def restore(url, token, path):
+        # A hub copy exported before spills moved out of the saves DB
+        legacy = sqlite3.connect(path)
+        legacy.execute("CREATE TABLE session_spill (session_key TEXT, data BLOB)")
+        legacy.execute("INSERT INTO session_spill VALUES ('old', x'00')")
+        legacy.commit()
+        legacy.close()
+        return "snapshot"
+
+    # The saves DB is gone (the restore case); the spill store is still there
+    restored_path = tmp_path / "restored" / "saves.db"
+    restored_path.parent.mkdir()
+    spill_path = db.spill_db_path()
+    db.set_db_path(restored_path)
+    spill_path.rename(db.spill_db_path())
+    monkeypatch.setenv("RESTORE_DB_URL", "http://hub.invalid/download")
+    monkeypatch.setattr(db_sync, "restore_db", restore)
+    api._restore_db_from_hub()
+
+    restored = sqlite3.connect(db.get_db_path())
+    assert not restored.execute(
+        "SELECT 1 FROM sqlite_master WHERE name='session_spill'").fetchall()
+    restored.close()
+    assert db.list_spilled_sessions("college") == []
+    assert client.get(f"/sessions/{sid}").status_code == 404
+
+
+def test_real_dynasty_session_sims_on_after_rehydrating(api):
+    from engine.season_aggregates import SeasonAggregates, season_aggregates, season_games
+    from engine.season_index import season_index
+
+    client = TestClient(api.app)
+    sid = client.post("/sessions").json()["session_id"]
+    assert client.post(f"/sessions/{sid}/dynasty",
+                       json={"coach_team": "Gonzaga", "dynasty_name": "Spill"}).status_code == 200
+    # 205 programs: retire one so the league is even (this also saves it)
+    assert client.post(f"/sessions/{sid}/dynasty/program/retire", json={"team": "Yale"}).status_code == 200
+    assert client.post(f"/sessions/{sid}/dynasty/load", params={"save_key": sid}).status_code == 200
+    assert api.sessions[sid]["dynasty"].pending_section("awards") is not None
+    assert client.post(f"/sessions/{sid}/dynasty/start-season", json={"ai_seed": 1}).status_code == 200
+    assert client.post(f"/sessions/{sid}/season/simulate-week", json={}).status_code == 200
+    season = api.sessions[sid]["season"]
+    season_aggregates(season)
+    season_index(season)
+
+    assert api._evict_cvl_session(sid)
+    assert sid not in api.sessions
+    week = client.post(f"/sessions/{sid}/season/simulate-week", json={})
+    assert week.status_code == 200 and week.json()["week"] == 2
+
+    session = api.sessions[sid]
+    season = session["season"]
+    assert session["dynasty"].awards_history == {}
+    fresh = SeasonAggregates()
+    fresh.sync(season_games(season))
+    assert season_aggregates(season).team_totals() == fresh.team_totals()
+    played = [g for g in season.schedule if g.completed]
+    indexed = {id(g) for team in season.teams for g in season_index(season).team_games(team)}
+    assert indexed == {id(g) for g in played}
@@ -0,0 +1,69 @@
+"""Simulation worker pool — process workers, the in-process fallback, metrics."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import signal
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from api.sim_pool import GameBatch, GameRequest, SimPool, SimWorkerError, simulate_batch
+
+GAME = GameRequest("alabama", "Air Force", seed=7)
+
+
+@pytest.fixture
+def fallback():
+    pool = ThreadPoolExecutor(max_workers=1)
+    yield pool
+    pool.shutdown(wait=True)
+
+
+@pytest.fixture
+def procs(fallback):
+    pool = SimPool(workers=1, fallback=fallback)
+    yield pool
+    pool.close()
+
+
+def test_worker_matches_in_process_sim(procs, fallback):
+    batch = GameBatch.single(GAME)
+    remote = asyncio.run(procs.run(batch))
+    local = simulate_batch(batch)
+    assert remote.worker != os.getpid()
+    assert remote.results[0].keys() == local.results[0].keys()
+    assert remote.results[0]["final_score"]["away"]["team"] == local.results[0]["final_score"]["away"]["team"]
+    stats = procs.stats()
+    assert stats["mode"] == "process" and stats["completed"] == 1 and stats["in_flight"] == 0
+
+
+def test_run_many_splits_across_workers(fallback):
+    pool = SimPool(workers=0, fallback=fallback)
+    results = asyncio.run(pool.run_many(GameBatch(GAME.home, GAME.away, seeds=(1, 2, 3))))
+    assert len(results) == 3
+    assert pool.stats()["mode"] == "thread" and pool.stats()["submitted"] == 1
+    assert asyncio.run(pool.run_many(GameBatch(GAME.home, GAME.away, seeds=()))) == []
+
+    procs = SimPool(workers=2, fallback=fallback)
+    try:
+        results = asyncio.run(procs.run_many(GameBatch(GAME.home, GAME.away, seeds=(1, 2, 3, 4, 5))))
+        assert len(results) == 5 and procs.stats()["submitted"] == 2
+    finally:
+        procs.close()
+
+
+def test_dead_worker_is_replaced(procs):
+    procs.start()
+    pid = asyncio.run(procs.run(GameBatch.single(GAME))).worker
+    os.kill(pid, signal.SIGKILL)
+    outcomes = []
+    for _ in range(5):
+        try:
+            outcomes.append(asyncio.run(procs.run(GameBatch.single(GAME))).worker)
+            break
+        except SimWorkerError:
+            outcomes.append(None)
+    assert outcomes[-1] not in (None, pid)
+    assert procs.stats()["restarts"] == 1
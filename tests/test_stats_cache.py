@@ -0,0 +1,63 @@
+"""Stats-site LRU — versioned entries, size-aware eviction, counters."""
+
+from __future__ import annotations
+
+from engine.pro_league import ProLeagueSeason
+from stats_site.cache import SizedLRUCache
+
+
+def test_hit_miss_and_stale_version():
+    cache = SizedLRUCache(max_entries=8)
+    assert cache.get("k", 1) is None
+    cache.set("k", [1, 2, 3], 1)
+    assert cache.get("k", 1) == [1, 2, 3]
+    # A newer season version invalidates and drops the entry.
+    assert cache.get("k", 2) is None
+    assert len(cache) == 0
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["stale"]) == (1, 2, 1)
+    assert stats["bytes"] == 0
+
+
+def test_least_recently_used_is_evicted_first():
+    cache = SizedLRUCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_byte_budget_evicts_and_rejects_oversize():
+    blob = "x" * 10_000
+    cache = SizedLRUCache(max_entries=100, max_bytes=25_000)
+    cache.set("a", blob + "a")
+    cache.set("b", blob + "b")
+    cache.set("c", blob + "c")
+    assert cache.get("a") is None
+    assert cache.stats()["bytes"] <= 25_000
+
+    cache.set("huge", "y" * 100_000)
+    assert cache.get("huge") is None
+    assert cache.stats()["oversize"] == 1
+
+
+def test_replacing_a_key_keeps_byte_count_exact():
+    cache = SizedLRUCache()
+    cache.set("k", "a" * 1000)
+    cache.set("k", "b" * 1000)
+    assert len(cache) == 1
+    cache.clear()
+    assert cache.stats()["bytes"] == 0
+
+
+def test_pro_season_version_without_init():
+    season = ProLeagueSeason.__new__(ProLeagueSeason)
+    assert season.mutation_version == 0
+    season.mark_mutated()
+    season.mark_mutated()
+    assert season.mutation_version == 2
+    assert ProLeagueSeason.mutation_version == 0
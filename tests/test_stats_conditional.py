@@ -0,0 +1,119 @@
+"""Stats site — ETag/304 and rendered-page caching, live and archived."""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from engine import db
+from stats_site import router as stats_router
+
+
+@pytest.fixture
+def client(tmp_path):
+    original = db.get_db_path()
+    db.set_db_path(tmp_path / "stats.db")
+    db.init_db()
+    app = FastAPI()
+    app.include_router(stats_router.router, prefix="/stats")
+    try:
+        yield TestClient(app)
+    finally:
+        db.set_db_path(original)
+
+
+def _archive(champion=None):
+    return {
+        "type": "college", "label": "2031 Season", "champion": champion,
+        "team_count": 2, "games_played": 1, "total_games": 2,
+        "playoff_bracket": [], "bowl_games": [],
+    }
+
+
+def test_archive_etag_round_trip(client):
+    db.save_season_archive("a2031", _archive(champion="Gators"), immutable=True)
+    first = client.get("/stats/archives/a2031/playoffs")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"] == "public, max-age=604800"
+
+    again = client.get("/stats/archives/a2031/playoffs", headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.headers["etag"] == etag
+    assert again.content == b""
+
+
+def test_rewritten_archive_gets_new_etag(client):
+    db.save_season_archive("a2032", _archive())
+    first = client.get("/stats/archives/a2032/playoffs")
+    assert first.headers["cache-control"] == "public, no-cache"
+
+    db.save_season_archive("a2032", _archive(champion="Owls"))
+    second = client.get("/stats/archives/a2032/playoffs",
+                        headers={"If-None-Match": first.headers["etag"]})
+    assert second.status_code == 200
+    assert second.headers["etag"] != first.headers["etag"]
+
+
+def test_rewritable_archives_revalidate(client):
+    # An autosave is finished but rewritten in place on its next save
+    db.save_season_archive("college_s1", _archive(champion="Gators"))
+    page = client.get("/stats/archives/college_s1/playoffs")
+    assert page.headers["cache-control"] == "public, no-cache"
+
+    # Saving over an existing key is a rewrite, whatever the caller says
+    db.save_season_archive("college_s1", _archive(champion="Owls"), immutable=True)
+    page = client.get("/stats/archives/college_s1/playoffs")
+    assert page.headers["cache-control"] == "public, no-cache"
+
+
+def test_missing_archive_still_404s(client):
+    assert client.get("/stats/archives/nope/playoffs").status_code == 404
+
+
+def test_if_none_match_list_and_weak_forms():
+    from starlette.requests import Request
+
+    etag = stats_router._make_etag("x", 1)
+
+    def request(value):
+        return Request({"type": "http", "headers": [(b"if-none-match", value.encode())]})
+
+    assert stats_router._etag_matches(request(f'"nope", {etag}'), etag)
+    assert stats_router._etag_matches(request(etag[2:]), etag)
+    assert stats_router._etag_matches(request("*"), etag)
+    assert not stats_router._etag_matches(request('W/"other"'), etag)
+
+
+def test_player_page_follows_links_and_career_data(client, monkeypatch):
+    from types import SimpleNamespace
+
+    import api.main as main
+    from engine.player_career_tracker import PlayerCareerTracker
+
+    monkeypatch.setattr(main, "sessions", {})
+    api = TestClient(main.app)
+    sid = api.post("/sessions").json()["session_id"]
+    assert api.post(f"/sessions/{sid}/season", json={"ai_seed": 1}).status_code == 200
+    assert api.post(f"/sessions/{sid}/season/simulate-week", json={}).status_code == 200
+    sess = main.sessions[sid]
+    sess["dynasty"] = SimpleNamespace(career_tracker=PlayerCareerTracker(), team_prestige={})
+    name = sess["season"].teams["Gonzaga"].players[0].name
+    url = f"/stats/college/{sid}/player/Gonzaga/{name}"
+    first = api.get(url)
+    assert first.status_code == 200 and "International Career" not in first.text
+
+    sess["dynasty"].career_tracker.record_fiv_cycle({name: {"nation": "NZL", "caps": 3}}, 2026)
+    second = api.get(url, headers={"If-None-Match": first.headers["etag"]})
+    assert second.status_code == 200 and "International Career" in second.text
+
+    # The same roster turns up in another session
+    other = api.post("/sessions").json()["session_id"]
+    main.sessions[other]["season"] = sess["season"]
+    third = api.get(url, headers={"If-None-Match": second.headers["etag"]})
+    assert third.status_code == 200 and f"/stats/college/{other}/player/" in third.text
+    assert api.get(url, headers={"If-None-Match": third.headers["etag"]}).status_code == 304
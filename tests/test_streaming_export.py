@@ -0,0 +1,113 @@
+"""Streaming NDJSON / paginated JSON export endpoints."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from api import streaming
+from engine.season_aggregates import SeasonAggregates
+from stats_site import router as stats_router
+
+
+class _Season:
+    name = "2031 Season"
+
+
+def _standing(i):
+    return {"team": f"T{i:02d}", "conference": "East", "wins": i, "losses": 10 - i,
+            "kenpom": {"adj_o": 100 + i, "adj_d": 90, "em": i}}
+
+
+@pytest.fixture
+def client(monkeypatch):
+    season = _Season()
+    rows = [_standing(i) for i in range(10)]
+    api = {
+        "sessions": {f"s{i}": {"season": season} for i in range(5)},
+        "pro_sessions": {"nvl_p1": object()},
+        "get_session": lambda sid: {"season": season} if sid == "s1" else None,
+        "require_season": lambda sess: sess["season"],
+        "serialize_standings": lambda s: rows,
+    }
+    monkeypatch.setattr(stats_router, "_get_api", lambda: api)
+    app = FastAPI()
+    app.include_router(stats_router.router, prefix="/stats")
+    return TestClient(app)
+
+
+def test_cursor_round_trip_and_rejects_garbage():
+    assert streaming.decode_cursor(streaming.encode_cursor(1234)) == 1234
+    assert streaming.decode_cursor(None) == 0
+    with pytest.raises(HTTPException):
+        streaming.decode_cursor("not a cursor!")
+    with pytest.raises(HTTPException):
+        streaming.paginate([], 0, None, streaming.MAX_PAGE_SIZE + 1)
+
+
+def test_json_object_stream_matches_json_dumps(monkeypatch):
+    monkeypatch.setattr(streaming, "CHUNK_BYTES", 16)
+    records = [{"n": i, "name": f"p{i}"} for i in range(50)]
+    chunks = list(streaming.iter_json_object({"a": 1}, "rows", iter(records), {"count": 50}))
+    assert len(chunks) > 1
+    assert json.loads(b"".join(chunks)) == {"a": 1, "rows": records, "count": 50}
+    doc = {"x": [1, 2, {"y": None}]}
+    assert b"".join(streaming.iter_json_document(doc, indent=2)).decode() == json.dumps(doc, indent=2)
+
+
+def test_standings_default_shape_unchanged(client):
+    body = client.get("/stats/export/college/s1/standings.json").json()
+    assert body["session_id"] == "s1" and body["season"] == "2031 Season"
+    assert [r["team"] for r in body["standings"]] == [f"T{i:02d}" for i in range(10)]
+    assert body["standings"][3]["adj_o"] == 103 and body["standings"][3]["tempo"] is None
+    assert "next_cursor" not in body
+    assert client.get("/stats/export/college/zz/standings.json").status_code == 404
+
+
+def test_standings_pages_cover_every_row_once(client):
+    teams, cursor = [], None
+    while True:
+        params = {"limit": 4, "fields": "team,em"}
+        if cursor:
+            params["cursor"] = cursor
+        body = client.get("/stats/export/college/s1/standings.json", params=params).json()
+        assert all(set(r) == {"team", "em"} for r in body["standings"])
+        teams += [r["team"] for r in body["standings"]]
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+    assert teams == [f"T{i:02d}" for i in range(10)]
+
+
+def test_ndjson_carries_cursor_in_header(client):
+    resp = client.get("/stats/export/sessions.json", params={"format": "ndjson", "limit": 3})
+    assert resp.headers["content-type"] == streaming.NDJSON_MEDIA_TYPE
+    lines = [json.loads(line) for line in resp.text.splitlines()]
+    assert [r["session_id"] for r in lines] == ["s0", "s1", "s2"]
+    nxt = client.get("/stats/export/sessions.json",
+                     params={"limit": 3, "cursor": resp.headers["x-next-cursor"]}).json()
+    assert [r["session_id"] for r in nxt["college"]] == ["s3", "s4"]
+    assert nxt["pro"] == [{"key": "nvl_p1"}] and nxt["next_cursor"] is None
+    assert client.get("/stats/export/sessions.json", params={"format": "csv"}).status_code == 400
+
+
+def test_iter_player_totals_matches_player_totals():
+    class _Game:
+        def __init__(self, week, lines):
+            self.week, self.home_team, self.away_team = week, "A", "B"
+            self.home_score, self.away_score, self.completed = 7, 3, True
+            self.full_result = {"player_stats": lines, "stats": {}}
+
+    store = SeasonAggregates()
+    store.apply_game(_Game(1, {"home": [{"name": "Ann", "yards": 10}],
+                               "away": [{"name": "Bea", "tackles": 2}]}))
+    store.apply_game(_Game(999, {"home": [{"name": "Ann", "yards": 5}],
+                                 "away": [{"name": "Cal", "yards": 1}]}))
+    assert dict(store.iter_player_totals()) == store.player_totals()
+    assert [k for k, _ in store.iter_player_totals()] == list(store.player_totals())
@@ -0,0 +1,111 @@
+"""Write-behind persistence queue — coalescing, batching, overflow, flush."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from api.write_behind import WriteBehindQueue
+
+
+def _blocked(queue):
+    """Occupy the worker until the returned event is set."""
+    started, release = threading.Event(), threading.Event()
+
+    def hold():
+        started.set()
+        release.wait(5)
+
+    queue.submit("hold", hold)
+    assert started.wait(5)
+    return release
+
+
+def test_repeated_submits_coalesce_into_one_run():
+    queue = WriteBehindQueue()
+    release = _blocked(queue)
+    calls = []
+    for n in range(5):
+        queue.submit(("autosave", "s1"), lambda n=n: calls.append(n))
+    assert queue.stats()["depth"] == 1
+    release.set()
+    assert queue.flush(timeout=5)
+    assert calls == [4]
+    stats = queue.stats()
+    assert stats["coalesced"] == 4 and stats["completed"] == 2 and stats["depth"] == 0
+
+
+def test_items_merge_into_one_batch():
+    queue = WriteBehindQueue()
+    release = _blocked(queue)
+    batches = []
+    queue.submit("box", batches.append, {(1, "A", "B"): "wk1"})
+    queue.submit("box", batches.append, {(2, "A", "C"): "wk2", (1, "A", "B"): "wk1 again"})
+    release.set()
+    assert queue.flush(timeout=5)
+    assert batches == [["wk1 again", "wk2"]]
+
+
+def test_full_queue_runs_inline():
+    queue = WriteBehindQueue(max_pending=1)
+    release = _blocked(queue)
+    ran_on = []
+    queue.submit("a", lambda: ran_on.append(threading.current_thread().name))
+    queue.submit("b", lambda: ran_on.append(threading.current_thread().name))
+    assert ran_on == [threading.current_thread().name]
+    assert queue.stats()["inline"] == 1
+    release.set()
+    assert queue.flush(timeout=5)
+    assert ran_on[-1] == queue.name
+
+
+def test_discard_and_failure_accounting():
+    queue = WriteBehindQueue()
+    release = _blocked(queue)
+    calls = []
+    queue.submit("gone", lambda: calls.append("gone"))
+    queue.submit("boom", lambda: 1 / 0)
+    assert queue.discard("gone") and not queue.discard("gone")
+    assert queue.stats()["oldest_pending_seconds"] >= 0
+    release.set()
+    assert queue.flush(timeout=5)
+    assert calls == [] and queue.stats()["failed"] == 1
+
+
+def test_close_flushes_then_runs_inline():
+    queue = WriteBehindQueue()
+    calls = []
+    queue.submit("k", lambda: calls.append("queued"))
+    assert queue.close(timeout=5)
+    queue.submit("k", lambda: calls.append("late"))
+    assert calls == ["queued", "late"]
+    assert queue.stats()["depth"] == 0
+
+
+def test_autosave_snapshot_is_taken_by_the_simming_thread(monkeypatch):
+    pytest.importorskip("fastapi")
+    import api.main as main
+    from engine import db
+
+    built_on, written = [], []
+
+    def build(session, session_id, include_full_result=True):
+        built_on.append(threading.current_thread().name)
+        return {"label": f"week {session['season']}"}
+
+    queue = WriteBehindQueue()
+    monkeypatch.setattr(main, "persistence", queue)
+    monkeypatch.setattr(main, "sessions", {"s1": {"season": 1}})
+    monkeypatch.setattr(main, "_build_college_archive", build)
+    monkeypatch.setattr(db, "save_season_archive",
+                        lambda key, snapshot: written.append((key, snapshot["label"])))
+
+    release = _blocked(queue)
+    main._persist_box_scores("s1", [])
+    main.sessions["s1"]["season"] = 2
+    main._persist_box_scores("s1", [])
+    release.set()
+    assert queue.flush(timeout=5)
+    assert built_on == [threading.current_thread().name] * 2
+    assert written == [("college_s1", "week 2")]
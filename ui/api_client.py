@@ -103,6 +103,29 @@ def _post(path: str, json: Optional[dict] = None, timeout: int = 300) -> Any:
     return _request("POST", path, json=json, timeout=timeout)
 
 
+def _run_job(path: str, json: Optional[dict] = None, poll: float = 1.0,
+             timeout: int = 1800) -> Any:
+    """POST a long sim as a background job and poll until it finishes.
+
+    Returns the job's result — the same body the endpoint returns when run
+    synchronously — without holding one request open for the whole sim.
+    """
+    invalidate_cache()
+    job = _request("POST", path, params={"background": "true"}, json=json)
+    deadline = time.monotonic() + timeout
+    while job["status"] in ("queued", "running"):
+        if time.monotonic() > deadline:
+            raise APIError(504, f"Job timed out: {path}")
+        time.sleep(poll)
+        job = _request("GET", f"/api/jobs/{job['id']}")
+    invalidate_cache()
+    if job["status"] == "failed":
+        raise APIError(job.get("error_status") or 500, job.get("error") or "Job failed")
+    if job["status"] == "cancelled":
+        raise APIError(409, f"Job cancelled: {path}")
+    return job["result"]
+
+
 def _put(path: str, json: Optional[Any] = None, timeout: int = 120) -> Any:
     invalidate_cache()
     return _request("PUT", path, json=json, timeout=timeout)
@@ -222,7 +245,7 @@ def simulate_through_week(session_id: str, target_week: int, fast_sim: bool = Tr
 
 
 def simulate_rest(session_id: str, fast_sim: bool = True) -> dict:
-    return _post(f"/sessions/{session_id}/season/simulate-rest", json={"fast_sim": fast_sim})
+    return _run_job(f"/sessions/{session_id}/season/simulate-rest", json={"fast_sim": fast_sim})
 
 
 def run_playoffs(session_id: str) -> dict:
@@ -393,7 +416,7 @@ def dynasty_start_season(session_id: str, games_per_team: int = 10,
 
 
 def dynasty_advance(session_id: str) -> dict:
-    return _post(f"/sessions/{session_id}/dynasty/advance")
+    return _run_job(f"/sessions/{session_id}/dynasty/advance")
 
 
 def get_dynasty_status(session_id: str) -> dict:
@@ -736,7 +759,7 @@ def pro_league_sim_week(league: str, session_id: str) -> dict:
 
 
 def pro_league_sim_all(league: str, session_id: str) -> dict:
-    return _post(f"/api/pro/{league}/{session_id}/sim-all")
+    return _run_job(f"/api/pro/{league}/{session_id}/sim-all")
 
 
 def pro_league_box_score(league: str, session_id: str, week: int, matchup: str) -> dict:
@@ -793,11 +816,11 @@ def fiv_rankings() -> dict:
 
 
 def fiv_sim_continental(conf: str) -> dict:
-    return _post(f"/api/fiv/continental/{conf}/sim-all")
+    return _run_job(f"/api/fiv/continental/{conf}/sim-all")
 
 
 def fiv_sim_all_continental() -> dict:
-    return _post("/api/fiv/continental/sim-all")
+    return _run_job("/api/fiv/continental/sim-all")
 
 
 def fiv_continental_standings(conf: str) -> dict:
@@ -813,7 +836,7 @@ def fiv_continental_game(conf: str, match_id: str) -> dict:
 
 
 def fiv_sim_playoff() -> dict:
-    return _post("/api/fiv/playoff/sim-all")
+    return _run_job("/api/fiv/playoff/sim-all")
 
 
 def fiv_world_cup_draw() -> dict:
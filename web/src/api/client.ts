@@ -49,3 +49,42 @@ export async function apiSend<T>(
   const text = await res.text();
   return (text ? JSON.parse(text) : undefined) as T;
 }
+
+export interface JobProgress {
+  done: number;
+  total: number | null;
+  message: string;
+}
+
+interface JobState {
+  id: string;
+  status: "queued" | "running" | "succeeded" | "failed" | "cancelled";
+  progress: JobProgress;
+  result?: unknown;
+  error?: string;
+  error_status?: number;
+}
+
+// Long sims (simulate-rest, dynasty advance, sim-all…) run as server jobs:
+// start one with ?background=true, then poll /api/jobs/{id} until it ends, so
+// no request is held open for the whole sim. Resolves with the job's result —
+// what the endpoint returns when called without ?background.
+export async function apiJob<T>(
+  path: string,
+  body?: unknown,
+  onProgress?: (p: JobProgress) => void,
+  pollMs = 1000,
+): Promise<T> {
+  const sep = path.includes("?") ? "&" : "?";
+  let job = await apiSend<JobState>("POST", `${path}${sep}background=true`, body);
+  while (job.status === "queued" || job.status === "running") {
+    onProgress?.(job.progress);
+    await new Promise((r) => setTimeout(r, pollMs));
+    job = await apiGet<JobState>(`/api/jobs/${job.id}`);
+  }
+  if (job.status === "failed") throw new ApiError(job.error_status ?? 500, job.error ?? "Job failed");
+  if (job.status === "cancelled") throw new ApiError(409, "Cancelled");
+  return job.result as T;
+}
+
+export const cancelJob = (id: string) => apiSend("POST", `/api/jobs/${id}/cancel`);
@@ -1,5 +1,5 @@
 // Dynasty API — saved multi-year careers, loaded into a session to browse.
-import { apiGet, apiSend } from "./client";
+import { apiGet, apiJob, apiSend } from "./client";
 
 export interface DynastySave {
   save_key: string;
@@ -180,7 +180,7 @@ export const dynastyCreateApi = {
   startSeason: (sid: string, cfg: StartSeasonConfig) =>
     apiSend("POST", `/sessions/${sid}/dynasty/start-season`, cfg),
 
-  advance: (sid: string) => apiSend("POST", `/sessions/${sid}/dynasty/advance`),
+  advance: (sid: string) => apiJob(`/sessions/${sid}/dynasty/advance`),
 };
 
 // ─── Offseason loop ──────────────────────────────────────────────
@@ -1,5 +1,5 @@
 // International / FIV API. One global cycle at a time (World Cup + rankings).
-import { apiGet, apiSend } from "./client";
+import { apiGet, apiJob, apiSend } from "./client";
 
 export interface FivRanking {
   rank: number;
@@ -76,7 +76,7 @@ export const fivApi = {
     apiGet<{ knockout_rounds: FivBracketRound[]; champion: string | null }>(
       `/api/fiv/continental/${conf}/bracket`,
     ).catch(() => ({ knockout_rounds: [], champion: null })),
-  confSimAll: (conf: string) => apiSend("POST", `/api/fiv/continental/${conf}/sim-all`),
+  confSimAll: (conf: string) => apiJob(`/api/fiv/continental/${conf}/sim-all`),
   worldcupStats: () =>
     apiGet<{ golden_boot: StatLeader | null; mvp: StatLeader | null }>(
       "/api/fiv/worldcup/stats",
@@ -1,5 +1,5 @@
 // Pro Leagues API. Five fixed leagues; sessions are created on demand.
-import { apiGet, apiSend } from "./client";
+import { apiGet, apiJob, apiSend } from "./client";
 
 export const PRO_LEAGUES: { id: string; name: string }[] = [
   { id: "nvl", name: "National Viperball League" },
@@ -132,5 +132,5 @@ export const proApi = {
   simWeek: (league: string, sid: string) =>
     apiSend("POST", `/api/pro/${league}/${sid}/sim-week`),
   simAll: (league: string, sid: string) =>
-    apiSend("POST", `/api/pro/${league}/${sid}/sim-all`),
+    apiJob(`/api/pro/${league}/${sid}/sim-all`),
 };
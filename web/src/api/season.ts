@@ -1,5 +1,5 @@
 // College season API — the live, in-memory season endpoints the League Hub renders.
-import { apiGet, apiSend } from "./client";
+import { apiGet, apiJob, apiSend } from "./client";
 
 const enc = encodeURIComponent;
 
@@ -218,7 +218,7 @@ export const seasonApi = {
   simWeek: (sid: string, fastSim: boolean) =>
     apiSend("POST", `/sessions/${sid}/season/simulate-week`, { fast_sim: fastSim }),
   simRest: (sid: string, fastSim: boolean) =>
-    apiSend("POST", `/sessions/${sid}/season/simulate-rest`, { fast_sim: fastSim }),
+    apiJob(`/sessions/${sid}/season/simulate-rest`, { fast_sim: fastSim }),
 
   // Pre-season transfer portal (phase "portal" before "regular").
   portal: (sid: string) =>
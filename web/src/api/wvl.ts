@@ -1,6 +1,6 @@
 // WVL — Career League. The destination for CVL graduates: the same player
 // cards are imported and their careers persist, simulated game-by-game.
-import { apiGet, apiSend } from "./client";
+import { apiGet, apiJob, apiSend } from "./client";
 
 export interface WVLStatus {
   league_id: string;
@@ -138,7 +138,7 @@ export const wvlApi = {
   simAll: (id: string) =>
     apiSend<{ result: any; status: WVLStatus }>("POST", `/api/wvl/${id}/sim-all`),
   advanceSeason: (id: string) =>
-    apiSend<{ result: any; status: WVLStatus }>("POST", `/api/wvl/${id}/advance-season`),
+    apiJob<{ result: any; status: WVLStatus }>(`/api/wvl/${id}/advance-season`),
   importGraduates: (id: string) =>
     apiSend<{ result: any; status: WVLStatus }>("POST", `/api/wvl/${id}/import-graduates`),
 };